@@ -0,0 +1,166 @@
+"""
+Index spatial en mémoire des bureaux (grille régulière en degrés)
+
+Répond sans requête SQL à « bureau le plus proche » et « bureaux dont la zone
+contient ce point », pour rattacher un pointage au site le plus proche quand
+l'agent n'a pas de bureau assigné.
+
+L'index est construit à la première utilisation dans chaque processus, invalidé
+par les signaux post_save / post_delete de Bureau (voir core.signals) et
+reconstruit au plus tard après DUREE_VIE_INDEX secondes, pour que les autres
+workers voient aussi les modifications.
+"""
+import math
+import time
+from collections import defaultdict
+
+from .geo_distance import distances_to_point, haversine
+from .models import Bureau
+
+# Côté d'une cellule de la grille (~5,5 km à l'équateur)
+TAILLE_CELLULE_DEGRES = 0.05
+
+# Nombre d'anneaux de cellules explorés avant de basculer sur un parcours complet
+ANNEAUX_MAX = 3
+
+# Âge maximal de l'index avant reconstruction (modifications faites par un autre processus)
+DUREE_VIE_INDEX = 300
+
+METRES_PAR_DEGRE = 111320
+
+
+class BureauIndex:
+    """Grille de bureaux ; les bureaux sont des instances chargées une fois"""
+
+    def __init__(self, bureaux, taille_cellule=TAILLE_CELLULE_DEGRES):
+        self.taille_cellule = taille_cellule
+        self.bureaux = [b for b in bureaux if b.latitude_centre is not None and b.longitude_centre is not None]
+        self.latitudes = [float(b.latitude_centre) for b in self.bureaux]
+        self.longitudes = [float(b.longitude_centre) for b in self.bureaux]
+        self.rayon_max = max((b.rayon_metres or 0 for b in self.bureaux), default=0)
+
+        self.grille = defaultdict(list)
+        for i, (lat, lon) in enumerate(zip(self.latitudes, self.longitudes)):
+            self.grille[self._cellule(lat, lon)].append(i)
+
+        self.defaut = self._bureau_par_defaut(bureaux)
+
+    def __len__(self):
+        return len(self.bureaux)
+
+    def _cellule(self, lat, lon):
+        return (math.floor(lat / self.taille_cellule), math.floor(lon / self.taille_cellule))
+
+    def _taille_cellule_metres(self, lat):
+        """Plus petit côté d'une cellule à cette latitude (les méridiens se rapprochent)"""
+        return self.taille_cellule * METRES_PAR_DEGRE * max(math.cos(math.radians(lat)), 0.01)
+
+    def _anneau(self, cellule, k):
+        """Indices des bureaux des cellules à exactement k cellules de `cellule`"""
+        ci, cj = cellule
+        if k == 0:
+            return list(self.grille.get(cellule, ()))
+        indices = []
+        for i in range(ci - k, ci + k + 1):
+            for j in (cj - k, cj + k):
+                indices.extend(self.grille.get((i, j), ()))
+        for j in range(cj - k + 1, cj + k):
+            for i in (ci - k, ci + k):
+                indices.extend(self.grille.get((i, j), ()))
+        return indices
+
+    @staticmethod
+    def _bureau_par_defaut(bureaux):
+        """Bureau « Principal » s'il existe, sinon le premier bureau créé"""
+        bureaux = sorted(bureaux, key=lambda b: b.pk)
+        for bureau in bureaux:
+            if 'principal' in bureau.nom.lower():
+                return bureau
+        return bureaux[0] if bureaux else None
+
+    def nearest(self, latitude, longitude, distance_max=None):
+        """
+        Bureau le plus proche d'un point
+
+        Returns:
+            tuple: (Bureau, distance en mètres), ou (None, None)
+        """
+        if not self.bureaux:
+            return None, None
+        lat, lon = float(latitude), float(longitude)
+        cellule = self._cellule(lat, lon)
+        taille_m = self._taille_cellule_metres(lat)
+
+        meilleur, meilleure_distance = None, None
+        for k in range(ANNEAUX_MAX + 1):
+            for i in self._anneau(cellule, k):
+                distance = haversine(lat, lon, self.latitudes[i], self.longitudes[i])
+                if meilleure_distance is None or distance < meilleure_distance:
+                    meilleur, meilleure_distance = i, distance
+            # Tout bureau d'un anneau plus éloigné est à plus de k cellules
+            if meilleure_distance is not None and meilleure_distance <= k * taille_m:
+                break
+        else:
+            # Point isolé : parcours vectorisé de tous les bureaux
+            distances = distances_to_point(self.latitudes, self.longitudes, lat, lon)
+            meilleur = int(distances.argmin())
+            meilleure_distance = float(distances[meilleur])
+
+        if distance_max is not None and meilleure_distance > distance_max:
+            return None, None
+        return self.bureaux[meilleur], meilleure_distance
+
+    def containing(self, latitude, longitude):
+        """
+        Bureaux dont la zone autorisée contient le point, du plus proche au plus éloigné
+
+        Returns:
+            list: tuples (Bureau, distance en mètres)
+        """
+        if not self.bureaux:
+            return []
+        lat, lon = float(latitude), float(longitude)
+        cellule = self._cellule(lat, lon)
+        portee = math.ceil(self.rayon_max / self._taille_cellule_metres(lat)) if self.rayon_max else 0
+
+        resultats = []
+        for k in range(portee + 1):
+            for i in self._anneau(cellule, k):
+                distance = haversine(lat, lon, self.latitudes[i], self.longitudes[i])
+                if distance <= (self.bureaux[i].rayon_metres or 0):
+                    resultats.append((self.bureaux[i], distance))
+        resultats.sort(key=lambda resultat: resultat[1])
+        return resultats
+
+
+_index = None
+_construit_a = 0.0
+
+
+def get_bureau_index():
+    """Index des bureaux du processus courant (reconstruit s'il est invalidé ou trop ancien)"""
+    global _index, _construit_a
+    if _index is None or time.monotonic() - _construit_a > DUREE_VIE_INDEX:
+        _index = BureauIndex(list(Bureau.objects.all()))
+        _construit_a = time.monotonic()
+    return _index
+
+
+def invalidate_bureau_index():
+    global _index
+    _index = None
+
+
+def nearest_bureau(latitude, longitude, distance_max=None):
+    """Bureau le plus proche d'un point : (Bureau, distance) ou (None, None)"""
+    return get_bureau_index().nearest(latitude, longitude, distance_max)
+
+
+def bureaux_containing(latitude, longitude):
+    """Bureaux dont la zone contient le point : liste de (Bureau, distance)"""
+    return get_bureau_index().containing(latitude, longitude)
+
+
+def default_bureau():
+    """Bureau par défaut (« Principal », sinon le premier créé), sans requête"""
+    return get_bureau_index().defaut
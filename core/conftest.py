@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+
+@pytest.fixture
+def creer_utilisateur(db):
+    """Fabrique d'utilisateurs : creer_utilisateur(username, role='AGENT', service=None)"""
+    def creer(username, role='AGENT', service=None):
+        user = get_user_model().objects.create_user(username=username, password='Testpass123!')
+        user.profile.role = role
+        user.profile.service = service
+        user.profile.save()
+        return user
+    return creer
+
+
+@pytest.fixture
+def creer_service(db):
+    """Fabrique de services : creer_service(nom, direction=None, sous_direction=None)"""
+    from core.models import Service
+
+    def creer(nom, direction=None, sous_direction=None):
+        return Service.objects.create(nom=nom, direction=direction, sous_direction=sous_direction)
+    return creer
+
+
+@pytest.fixture
+def creer_agent(creer_utilisateur):
+    """Fabrique d'agents (utilisateur et fiche Agent) : creer_agent(username, bureau=None, service=None)"""
+    from core.models import Agent
+
+    def creer(username, bureau=None, service=None):
+        user = creer_utilisateur(username)
+        Agent.objects.create(
+            user=user, nom=username, matricule=f'MAT-{username}', poste='Agent', bureau=bureau, service=service
+        )
+        return user
+    return creer
+
+
+@pytest.fixture
+def agent_avec_position(creer_agent):
+    """
+    Agent entré dans la zone de son bureau puis vu hors zone :
+    agent_avec_position(username, bureau, latitude, longitude, minutes_ago, inside_minutes_ago=30)
+    """
+    from core.models import AgentLocation
+
+    def creer(username, bureau, latitude, longitude, minutes_ago, inside_minutes_ago=30):
+        user = creer_agent(username, bureau=bureau)
+        now = timezone.now()
+        AgentLocation.objects.create(
+            agent=user, latitude=bureau.latitude_centre, longitude=bureau.longitude_centre,
+            dans_zone_autorisee=True, timestamp=now - timedelta(minutes=inside_minutes_ago)
+        )
+        AgentLocation.objects.create(
+            agent=user, latitude=latitude, longitude=longitude, dans_zone_autorisee=False,
+            timestamp=now - timedelta(minutes=minutes_ago)
+        )
+        return user
+    return creer
@@ -0,0 +1,216 @@
+"""
+Statistiques des courriers pré-agrégées par jour (CourrierStatsJour)
+
+Une ligne par jour de réception × service × direction × type × sens × catégorie
+× statut, avec :
+- nombre : courriers
+- avec_diligence / diligence_en_cours / diligence_terminee : courriers ayant
+  au moins une diligence (resp. en attente ou en cours, terminée)
+- delai_total_secondes / nb_delais : délais réception → création de diligence,
+  pour chaque couple courrier/diligence (moyenne = somme / nombre)
+
+Mise à jour incrémentale : l'unité recalculée est le couple (jour, service).
+Les signaux de core.signals recalculent après le commit les couples touchés
+par la création, la modification ou la suppression d'un courrier ou d'une
+diligence, et tous les couples d'un service qui change de direction.
+rebuild_all (commande rebuild_courrier_stats) reconstruit la table.
+Un recalcul lit les sources dans la transaction qui réécrit les lignes, sous
+un verrou nommé par couple (GET_LOCK, MySQL) : deux recalculs concurrents du
+même couple s'exécutent l'un après l'autre, le dernier écrit des totaux à jour.
+
+Les endpoints lisent la table avec summarize() : quelques centaines de lignes
+au plus, quel que soit le nombre de courriers.
+"""
+import logging
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
+
+from django.db import connection, transaction
+from django.db.models import Q, Sum
+from django.utils import timezone
+
+from .models import Courrier, CourrierStatsJour, Diligence, Direction, Service
+
+logger = logging.getLogger(__name__)
+
+TAILLE_LOT = 200
+# Attente maximale d'un verrou de couple (secondes)
+DELAI_VERROU = 10
+
+DIMENSIONS = ('jour', 'service_id', 'direction_id', 'type_courrier', 'sens', 'categorie', 'statut')
+MESURES = ('nombre', 'avec_diligence', 'diligence_en_cours', 'diligence_terminee', 'delai_total_secondes', 'nb_delais')
+
+STATUTS_EN_COURS = ('en_attente', 'en_cours')
+
+
+def _q_couples(couples):
+    q = Q()
+    for jour, service_id in couples:
+        q |= Q(date_reception=jour, service_id=service_id) if service_id else Q(date_reception=jour, service__isnull=True)
+    return q
+
+
+def _secondes_delai(date_reception, cree_le):
+    debut = timezone.make_aware(datetime.combine(date_reception, time.min)) if timezone.is_aware(cree_le) \
+        else datetime.combine(date_reception, time.min)
+    return int((cree_le - debut).total_seconds())
+
+
+def _lignes(couples):
+    """Lignes agrégées recalculées depuis Courrier et Diligence pour ces couples"""
+    courriers = list(Courrier.objects.filter(_q_couples(couples)).values_list(
+        'id', 'date_reception', 'service_id', 'service__direction_id',
+        'type_courrier', 'sens', 'categorie', 'statut'
+    ))
+    diligences = defaultdict(list)
+    for courrier_id, statut, cree_le in Diligence.objects.filter(
+            courrier_id__in=[c[0] for c in courriers]).values_list('courrier_id', 'statut', 'created_at'):
+        diligences[courrier_id].append((statut, cree_le))
+
+    agregats = defaultdict(lambda: dict.fromkeys(MESURES, 0))
+    for courrier_id, *cle in courriers:
+        mesures = agregats[tuple(cle)]
+        liees = diligences.get(courrier_id, ())
+        mesures['nombre'] += 1
+        mesures['avec_diligence'] += bool(liees)
+        mesures['diligence_en_cours'] += any(statut in STATUTS_EN_COURS for statut, _ in liees)
+        mesures['diligence_terminee'] += any(statut == 'termine' for statut, _ in liees)
+        for _, cree_le in liees:
+            mesures['delai_total_secondes'] += _secondes_delai(cle[0], cree_le)
+            mesures['nb_delais'] += 1
+
+    return [
+        CourrierStatsJour(**dict(zip(DIMENSIONS, cle)), **mesures)
+        for cle, mesures in agregats.items()
+    ]
+
+
+@contextmanager
+def _verrous(couples):
+    """Verrous nommés MySQL des couples, pris dans un ordre fixe (sans effet sur les autres bases)"""
+    if connection.vendor != 'mysql':
+        yield
+        return
+    noms = sorted({f'ediligence:cstats:{jour}:{service_id or 0}' for jour, service_id in couples})
+    pris = []
+    try:
+        with connection.cursor() as cursor:
+            for nom in noms:
+                cursor.execute('SELECT GET_LOCK(%s, %s)', [nom, DELAI_VERROU])
+                if cursor.fetchone()[0] == 1:
+                    pris.append(nom)
+                else:
+                    logger.warning(f"Verrou {nom} non obtenu, recalcul sans verrou")
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            for nom in pris:
+                cursor.execute('SELECT RELEASE_LOCK(%s)', [nom])
+
+
+def refresh(couples):
+    """Recalcule les lignes de couples (jour, service_id)"""
+    couples = list(set(couples))
+    for i in range(0, len(couples), TAILLE_LOT):
+        lot = couples[i:i + TAILLE_LOT]
+        q = Q()
+        for jour, service_id in lot:
+            q |= Q(jour=jour, service_id=service_id) if service_id else Q(jour=jour, service_id__isnull=True)
+        # Lecture après le verrou, dans la transaction d'écriture : pas de totaux périmés
+        with _verrous(lot), transaction.atomic():
+            lignes = _lignes(lot)
+            CourrierStatsJour.objects.filter(q).delete()
+            CourrierStatsJour.objects.bulk_create(lignes, batch_size=TAILLE_LOT)
+
+
+def refresh_courriers(courrier_ids):
+    """Recalcule les couples des courriers donnés (après une modification de diligence)"""
+    refresh(Courrier.objects.filter(id__in=list(courrier_ids)).values_list('date_reception', 'service_id').distinct())
+
+
+def refresh_services(service_ids):
+    """
+    Recalcule tous les jours d'un service (changement de direction, suppression :
+    les courriers d'un service supprimé passent sans service)
+    """
+    service_ids = list(service_ids)
+    jours = set(CourrierStatsJour.objects.filter(service_id__in=service_ids).values_list('jour', flat=True))
+    jours.update(Courrier.objects.filter(service_id__in=service_ids).values_list('date_reception', flat=True))
+    refresh([(jour, service_id) for jour in jours for service_id in service_ids + [None]])
+
+
+def rebuild_all():
+    """Reconstruit toute la table"""
+    with transaction.atomic():
+        CourrierStatsJour.objects.all().delete()
+        refresh(Courrier.objects.values_list('date_reception', 'service_id').distinct())
+    return CourrierStatsJour.objects.count()
+
+
+# --- Lecture ---
+
+def stats_queryset(date_debut=None, date_fin=None, service_id=None, direction_id=None):
+    qs = CourrierStatsJour.objects.all()
+    if date_debut:
+        qs = qs.filter(jour__gte=date_debut)
+    if date_fin:
+        qs = qs.filter(jour__lte=date_fin)
+    if service_id:
+        qs = qs.filter(service_id=service_id)
+    if direction_id:
+        qs = qs.filter(direction_id=direction_id)
+    return qs
+
+
+def summarize(qs):
+    """Totaux des mesures d'un ensemble de lignes"""
+    totaux = qs.aggregate(**{mesure: Sum(mesure) for mesure in MESURES})
+    return {mesure: totaux[mesure] or 0 for mesure in MESURES}
+
+
+def par(qs, dimension, ordre='-count', limite=None):
+    """[{dimension: valeur, 'count': n}] regroupé sur une dimension"""
+    lignes = qs.values(dimension).annotate(count=Sum('nombre')).order_by(ordre, dimension)
+    return list(lignes[:limite] if limite else lignes)
+
+
+def avec_noms(lignes, dimension, modele, champ_nom, champ_id):
+    """Ajoute le nom du service / de la direction (une requête) aux lignes regroupées"""
+    noms = dict(modele.objects.filter(id__in=[l[dimension] for l in lignes if l[dimension]]).values_list('id', 'nom'))
+    return [{champ_nom: noms.get(l[dimension]), champ_id: l[dimension], 'count': l['count']} for l in lignes]
+
+
+def par_service(qs, limite=None):
+    return avec_noms(par(qs, 'service_id', limite=limite), 'service_id', Service, 'service__nom', 'service_id')
+
+
+def par_direction(qs, limite=None):
+    return avec_noms(
+        par(qs, 'direction_id', limite=limite), 'direction_id', Direction,
+        'service__direction__nom', 'service__direction_id'
+    )
+
+
+def delai_moyen_jours(totaux):
+    if not totaux['nb_delais']:
+        return 0
+    return timedelta(seconds=totaux['delai_total_secondes'] / totaux['nb_delais']).days
+
+
+def compter_periodes(qs, aujourd_hui):
+    """Courriers du jour, des 7 derniers jours, du mois et de l'année (une requête)"""
+    debut_semaine = aujourd_hui - timedelta(days=7)
+    debut_annee = aujourd_hui.replace(month=1, day=1)
+    totaux = {'aujourd_hui': 0, 'cette_semaine': 0, 'ce_mois': 0, 'cette_annee': 0}
+    for jour, nombre in qs.filter(jour__gte=min(debut_semaine, debut_annee)).values('jour').annotate(
+            n=Sum('nombre')).values_list('jour', 'n'):
+        if jour == aujourd_hui:
+            totaux['aujourd_hui'] += nombre
+        if jour >= debut_semaine:
+            totaux['cette_semaine'] += nombre
+        if (jour.year, jour.month) == (aujourd_hui.year, aujourd_hui.month):
+            totaux['ce_mois'] += nombre
+        if jour.year == aujourd_hui.year:
+            totaux['cette_annee'] += nombre
+    return totaux
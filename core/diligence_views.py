@@ -1,10 +1,13 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.db.models import Q
 from django.utils import timezone
 from datetime import datetime, timedelta
 from .models import Diligence, DiligenceDocument, DiligenceNotification, Courrier
 from .serializers import DiligenceSerializer, DiligenceDocumentSerializer, DiligenceNotificationSerializer
+from .org_scope import get_org_scope
+from .inbox import invalidate_unread
 
 class DiligenceDocumentViewSet(viewsets.ModelViewSet):
     queryset = DiligenceDocument.objects.all().order_by('-created_at')
@@ -75,7 +78,8 @@ class DiligenceNotificationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'])
     def mark_all_as_read(self, request):
         """Marquer toutes les notifications comme lues"""
-        self.get_queryset().update(read=True)
+        if self.get_queryset().filter(read=False).update(read=True):
+            invalidate_unread([request.user.id])
         return Response({'message': 'Toutes les notifications marquées comme lues'})
 
 class EnhancedDiligenceViewSet(viewsets.ModelViewSet):
@@ -85,7 +89,7 @@ class EnhancedDiligenceViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         user = self.request.user
-        profile = getattr(user, 'profile', None)
+        scope = get_org_scope(user)
         base_qs = Diligence.objects.select_related(
             'courrier',
             'courrier__service',
@@ -97,50 +101,28 @@ class EnhancedDiligenceViewSet(viewsets.ModelViewSet):
             'services_concernes__direction'
         ).all().order_by('-created_at')
 
-        if not profile:
+        if not scope.has_profile:
             return Diligence.objects.none()
 
-        role = profile.role
-        print(f"[DEBUG] EnhancedDiligenceViewSet get_queryset - User: {user.username} (ID: {user.id}), Role: {role}")
+        role = scope.role
 
-        # Build queryset for diligences accessible by ImputationAccess
-        from core.models import ImputationAccess
-        imputation_access_qs = base_qs.filter(imputation_access__user=user)
-        print(f"[DEBUG] EnhancedDiligenceViewSet ImputationAccess diligences count: {imputation_access_qs.count()}")
+        # Diligences accessibles par ImputationAccess
+        imputation_access_q = Q(imputation_access__user=user)
 
         # Diligences où l'utilisateur est dans les agents assignés
-        assigned_qs = base_qs.filter(agents=user)
-        print(f"[DEBUG] EnhancedDiligenceViewSet Assigned diligences count: {assigned_qs.count()}")
-        
-        # Filtrage par rôle
-        if role == 'AGENT':
-            qs = assigned_qs
-            print(f"[DEBUG] EnhancedDiligenceViewSet AGENT - Using only assigned diligences")
-        elif role in ['SUPERIEUR', 'SECRETAIRE']:
-            qs = assigned_qs
-            print(f"[DEBUG] EnhancedDiligenceViewSet SUPERIEUR/SECRETAIRE - Using only assigned diligences")
-        elif role == 'DIRECTEUR':
-            if profile.direction:
-                direction_assigned_qs = base_qs.filter(
-                    agents__profile__service__direction=profile.direction
-                )
-                qs = assigned_qs | direction_assigned_qs
-                print(f"[DEBUG] EnhancedDiligenceViewSet DIRECTEUR - Using assigned + direction diligences")
-            else:
-                qs = assigned_qs
-                print(f"[DEBUG] EnhancedDiligenceViewSet DIRECTEUR - Using only assigned diligences (no direction)")
-        elif role == 'ADMIN':
-            qs = base_qs
-            print(f"[DEBUG] EnhancedDiligenceViewSet ADMIN - Using all diligences")
-        else:
-            qs = assigned_qs
-            print(f"[DEBUG] EnhancedDiligenceViewSet OTHER ROLE - Using only assigned diligences")
+        visible_q = Q(agents=user)
+
+        # Filtrage par rôle : ADMIN voit tout, DIRECTEUR ajoute les diligences des agents
+        # de sa direction, les autres rôles ne voient que leurs diligences assignées
+        if role == 'ADMIN':
+            return base_qs
+        if role == 'DIRECTEUR' and scope.direction_id:
+            visible_q |= Q(agents__profile__service__direction_id=scope.direction_id)
 
         # Combine with ImputationAccess-based queryset
-        final_qs = (qs | imputation_access_qs).distinct()
-        print(f"[DEBUG] EnhancedDiligenceViewSet Final queryset count: {final_qs.count()}")
-        
-        return final_qs
+        return base_qs.filter(
+            id__in=Diligence.objects.filter(visible_q | imputation_access_q).values('id')
+        )
     
     def update(self, request, *args, **kwargs):
         print(f"[DEBUG] EnhancedDiligenceViewSet update - User: {request.user}, Data: {request.data}")
@@ -0,0 +1,227 @@
+"""
+Index de visibilité des diligences (DiligenceVisibility)
+
+Chaque ligne (utilisateur, diligence, raison) dit qu'un utilisateur voit une
+diligence. La liste des diligences d'un utilisateur non ADMIN devient une seule
+requête indexée au lieu de cinq sous-requêtes recombinées en Python.
+
+Règles (identiques à l'ancien filtrage de DiligenceViewSet.get_queryset) :
+- assigne : l'utilisateur fait partie des agents de la diligence
+- imputation_acces / imputation_fichier : ImputationAccess / ImputationFile
+- direction : DIRECTEUR dont la direction (via son service) est celle de la
+  diligence, d'un service concerné, du service du courrier ou du service d'un agent
+- service : SUPERIEUR dont le service est concerné, est celui du courrier ou
+  celui d'un agent
+
+L'index est tenu à jour après le commit par les signaux de core.signals
+(agents, services concernés, imputations, profils, services, courriers) ;
+la commande rebuild_diligence_visibility le reconstruit entièrement.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Diligence, DiligenceVisibility, ImputationAccess, ImputationFile, UserProfile
+
+RAISON_ASSIGNE = 'assigne'
+RAISON_IMPUTATION_ACCES = 'imputation_acces'
+RAISON_IMPUTATION_FICHIER = 'imputation_fichier'
+RAISON_DIRECTION = 'direction'
+RAISON_SERVICE = 'service'
+
+# Nombre de diligences recalculées par lot
+TAILLE_LOT = 500
+
+DiligenceAgents = Diligence.agents.through
+DiligenceServices = Diligence.services_concernes.through
+
+
+def lignes_pour_diligences(diligence_ids):
+    """
+    Calcule les lignes de visibilité d'un lot de diligences (requêtes ensemblistes)
+
+    Returns:
+        set: tuples (user_id, diligence_id, raison)
+    """
+    lignes = set()
+    directions = defaultdict(set)
+    services = defaultdict(set)
+
+    agents = DiligenceAgents.objects.filter(diligence_id__in=diligence_ids).values_list(
+        'user_id', 'diligence_id', 'user__profile__service_id', 'user__profile__service__direction_id'
+    )
+    for user_id, diligence_id, service_id, direction_id in agents:
+        lignes.add((user_id, diligence_id, RAISON_ASSIGNE))
+        services[diligence_id].add(service_id)
+        directions[diligence_id].add(direction_id)
+
+    for user_id, diligence_id in ImputationAccess.objects.filter(
+            diligence_id__in=diligence_ids).values_list('user_id', 'diligence_id'):
+        lignes.add((user_id, diligence_id, RAISON_IMPUTATION_ACCES))
+    for user_id, diligence_id in ImputationFile.objects.filter(
+            diligence_id__in=diligence_ids).values_list('agent_id', 'diligence_id'):
+        lignes.add((user_id, diligence_id, RAISON_IMPUTATION_FICHIER))
+
+    rattachements = Diligence.objects.filter(id__in=diligence_ids).values_list(
+        'id', 'direction_id', 'courrier__service_id', 'courrier__service__direction_id'
+    )
+    for diligence_id, direction_id, service_id, service_direction_id in rattachements:
+        directions[diligence_id].update((direction_id, service_direction_id))
+        services[diligence_id].add(service_id)
+
+    for diligence_id, service_id, direction_id in DiligenceServices.objects.filter(
+            diligence_id__in=diligence_ids).values_list('diligence_id', 'service_id', 'service__direction_id'):
+        services[diligence_id].add(service_id)
+        directions[diligence_id].add(direction_id)
+
+    toutes_directions = set().union(*directions.values()) - {None}
+    tous_services = set().union(*services.values()) - {None}
+
+    directeurs = defaultdict(list)
+    if toutes_directions:
+        for user_id, direction_id in UserProfile.objects.filter(
+                role='DIRECTEUR', service__direction_id__in=toutes_directions
+        ).values_list('user_id', 'service__direction_id'):
+            directeurs[direction_id].append(user_id)
+    superieurs = defaultdict(list)
+    if tous_services:
+        for user_id, service_id in UserProfile.objects.filter(
+                role='SUPERIEUR', service_id__in=tous_services
+        ).values_list('user_id', 'service_id'):
+            superieurs[service_id].append(user_id)
+
+    for diligence_id, ids in directions.items():
+        for direction_id in ids - {None}:
+            lignes.update((user_id, diligence_id, RAISON_DIRECTION) for user_id in directeurs[direction_id])
+    for diligence_id, ids in services.items():
+        for service_id in ids - {None}:
+            lignes.update((user_id, diligence_id, RAISON_SERVICE) for user_id in superieurs[service_id])
+    return lignes
+
+
+def lignes_pour_utilisateur(user_id):
+    """Calcule les lignes de visibilité d'un utilisateur : set de (user_id, diligence_id, raison)"""
+    lignes = set()
+    for diligence_id in DiligenceAgents.objects.filter(user_id=user_id).values_list('diligence_id', flat=True):
+        lignes.add((user_id, diligence_id, RAISON_ASSIGNE))
+    for diligence_id in ImputationAccess.objects.filter(user_id=user_id).values_list('diligence_id', flat=True):
+        lignes.add((user_id, diligence_id, RAISON_IMPUTATION_ACCES))
+    for diligence_id in ImputationFile.objects.filter(agent_id=user_id).values_list('diligence_id', flat=True):
+        lignes.add((user_id, diligence_id, RAISON_IMPUTATION_FICHIER))
+
+    profil = UserProfile.objects.filter(user_id=user_id).values_list(
+        'role', 'service_id', 'service__direction_id'
+    ).first()
+    if not profil:
+        return lignes
+    role, service_id, direction_id = profil
+
+    if role == 'DIRECTEUR' and direction_id:
+        diligences = Diligence.objects.filter(
+            Q(direction_id=direction_id) |
+            Q(services_concernes__direction_id=direction_id) |
+            Q(courrier__service__direction_id=direction_id) |
+            Q(agents__profile__service__direction_id=direction_id)
+        )
+        raison = RAISON_DIRECTION
+    elif role == 'SUPERIEUR' and service_id:
+        diligences = Diligence.objects.filter(
+            Q(services_concernes=service_id) |
+            Q(courrier__service_id=service_id) |
+            Q(agents__profile__service_id=service_id)
+        )
+        raison = RAISON_SERVICE
+    else:
+        return lignes
+    for diligence_id in diligences.order_by().values_list('id', flat=True).distinct():
+        lignes.add((user_id, diligence_id, raison))
+    return lignes
+
+
+def _appliquer(existantes, lignes):
+    """Supprime les lignes disparues et insère les nouvelles (existantes : {ligne: id})"""
+    obsoletes = [pk for ligne, pk in existantes.items() if ligne not in lignes]
+    if obsoletes:
+        DiligenceVisibility.objects.filter(id__in=obsoletes).delete()
+    nouvelles = [
+        DiligenceVisibility(user_id=user_id, diligence_id=diligence_id, raison=raison)
+        for user_id, diligence_id, raison in lignes - existantes.keys()
+    ]
+    # ignore_conflicts : deux recalculs concurrents peuvent insérer la même ligne
+    DiligenceVisibility.objects.bulk_create(nouvelles, batch_size=TAILLE_LOT, ignore_conflicts=True)
+    return len(nouvelles), len(obsoletes)
+
+
+def _existantes(qs):
+    return {
+        (user_id, diligence_id, raison): pk
+        for pk, user_id, diligence_id, raison in qs.values_list('id', 'user_id', 'diligence_id', 'raison')
+    }
+
+
+def refresh_diligences(diligence_ids):
+    """
+    Recalcule la visibilité de diligences
+
+    Returns:
+        tuple: (lignes ajoutées, lignes supprimées)
+    """
+    diligence_ids = list(diligence_ids)
+    ajoutees = supprimees = 0
+    for i in range(0, len(diligence_ids), TAILLE_LOT):
+        lot = diligence_ids[i:i + TAILLE_LOT]
+        with transaction.atomic():
+            existantes = _existantes(DiligenceVisibility.objects.filter(diligence_id__in=lot))
+            a, s = _appliquer(existantes, lignes_pour_diligences(lot))
+        ajoutees += a
+        supprimees += s
+    return ajoutees, supprimees
+
+
+def refresh_users(user_ids):
+    """Recalcule la visibilité d'utilisateurs (changement de rôle ou de service)"""
+    ajoutees = supprimees = 0
+    for user_id in user_ids:
+        with transaction.atomic():
+            existantes = _existantes(DiligenceVisibility.objects.filter(user_id=user_id))
+            a, s = _appliquer(existantes, lignes_pour_utilisateur(user_id))
+        ajoutees += a
+        supprimees += s
+    return ajoutees, supprimees
+
+
+def rebuild_all():
+    """Reconstruit l'index complet, par lots de diligences"""
+    ids = list(Diligence.objects.order_by('id').values_list('id', flat=True))
+    resultat = refresh_diligences(ids)
+    # Lignes orphelines (diligence supprimée hors ORM)
+    DiligenceVisibility.objects.exclude(diligence_id__in=Diligence.objects.values('id')).delete()
+    return resultat
+
+
+def refresh_diligences_on_commit(diligence_ids):
+    """Planifie le recalcul après le commit de la transaction courante"""
+    diligence_ids = [pk for pk in set(diligence_ids) if pk is not None]
+    if diligence_ids:
+        transaction.on_commit(lambda: refresh_diligences(diligence_ids))
+
+
+def refresh_users_on_commit(user_ids):
+    user_ids = [pk for pk in set(user_ids) if pk is not None]
+    if user_ids:
+        transaction.on_commit(lambda: refresh_users(user_ids))
+
+
+def diligences_liees_utilisateurs(user_ids):
+    """Diligences dont la visibilité hiérarchique dépend du service de ces agents"""
+    return DiligenceAgents.objects.filter(user_id__in=user_ids).values_list('diligence_id', flat=True)
+
+
+def diligences_liees_service(service_id):
+    """Diligences rattachées à un service (concerné, courrier ou agents)"""
+    ids = set(DiligenceServices.objects.filter(service_id=service_id).values_list('diligence_id', flat=True))
+    ids.update(Diligence.objects.filter(courrier__service_id=service_id).values_list('id', flat=True))
+    ids.update(DiligenceAgents.objects.filter(
+        user__profile__service_id=service_id).values_list('diligence_id', flat=True))
+    return ids
@@ -0,0 +1,230 @@
+"""
+Exports CSV et XLSX en flux (StreamingHttpResponse)
+
+Les lignes sont lues par values_list().iterator(chunk_size=...) et écrites au
+fil de l'eau : la mémoire reste constante et le premier octet part dès le
+premier lot, même pour un export d'une année entière.
+
+- csv_stream : CSV séparé par des points-virgules, avec BOM UTF-8 (ouverture
+  directe dans Excel en français) ; les textes commençant par = + - @ sont
+  préfixés d'une apostrophe pour qu'Excel ne les évalue pas comme formules
+- xlsx_stream : classeur XLSX d'une feuille, écrit en ZIP non positionnable
+  (descripteurs de données) : pas de dépendance à openpyxl ni de fichier
+  temporaire ; chaînes en ligne (inlineStr), pas de table de chaînes partagées
+
+Les colonnes exportées de chaque type sont décrites dans EXPORTS ; le filtrage
+(visibilité, période) est fait par la vue (voir core.views_export).
+"""
+import csv
+import re
+import zipfile
+from datetime import date, datetime, time
+from decimal import Decimal
+from xml.sax.saxutils import escape
+
+from django.utils import timezone
+
+TAILLE_LOT = 2000
+# Lignes XLSX écrites entre deux envois au client
+LIGNES_PAR_ENVOI = 500
+
+# type d'export : (champ de date filtré par date_debut / date_fin, [(champ, en-tête)])
+EXPORTS = {
+    'presences': ('date_presence', [
+        ('id', 'ID'),
+        ('agent__matricule', 'Matricule'),
+        ('agent__nom', 'Nom'),
+        ('agent__prenom', 'Prénom'),
+        ('agent__service__nom', 'Service'),
+        ('date_presence', 'Date'),
+        ('heure_arrivee', 'Arrivée'),
+        ('heure_depart', 'Départ'),
+        ('statut', 'Statut'),
+        ('localisation_valide', 'Localisation valide'),
+        ('sortie_detectee', 'Sortie détectée'),
+        ('temps_absence_minutes', 'Absence (minutes)'),
+        ('commentaire', 'Commentaire'),
+    ]),
+    'courriers': ('date_reception', [
+        ('id', 'ID'),
+        ('reference', 'Référence'),
+        ('date_reception', 'Date de réception'),
+        ('expediteur', 'Expéditeur'),
+        ('destinataire', 'Destinataire'),
+        ('objet', 'Objet'),
+        ('type_courrier', 'Type'),
+        ('sens', 'Sens'),
+        ('categorie', 'Catégorie'),
+        ('statut', 'Statut'),
+        ('service__nom', 'Service'),
+        ('service__direction__nom', 'Direction'),
+        ('created_at', 'Créé le'),
+    ]),
+    'diligences': ('created_at__date', [
+        ('id', 'ID'),
+        ('reference_courrier', 'Référence'),
+        ('objet', 'Objet'),
+        ('categorie', 'Catégorie'),
+        ('domaine', 'Domaine'),
+        ('statut', 'Statut'),
+        ('pourcentage_avancement', 'Avancement (%)'),
+        ('date_limite', 'Date limite'),
+        ('courrier__reference', 'Courrier'),
+        ('direction__nom', 'Direction'),
+        ('created_at', 'Créée le'),
+    ]),
+    'alertes': ('date_detection', [
+        ('id', 'ID'),
+        ('agent__username', 'Identifiant'),
+        ('agent__last_name', 'Nom'),
+        ('agent__first_name', 'Prénom'),
+        ('bureau__nom', 'Bureau'),
+        ('type_alerte', 'Type'),
+        ('statut', 'Statut'),
+        ('distance_metres', 'Distance (m)'),
+        ('en_heures_travail', 'En heures de travail'),
+        ('timestamp_alerte', 'Horodatage'),
+    ]),
+}
+
+
+def rows(queryset, colonnes):
+    """Itérateur de tuples lus par lots, sans instancier de modèles"""
+    champs = [champ for champ, _ in colonnes]
+    return queryset.prefetch_related(None).values_list(*champs).iterator(chunk_size=TAILLE_LOT)
+
+
+def _texte(valeur):
+    if valeur is None:
+        return ''
+    if isinstance(valeur, datetime):
+        if timezone.is_aware(valeur):
+            valeur = timezone.localtime(valeur)
+        return valeur.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(valeur, (date, time)):
+        return valeur.isoformat()
+    if isinstance(valeur, bool):
+        return 'oui' if valeur else 'non'
+    return str(valeur)
+
+
+# --- CSV ---
+
+class _Echo:
+    """Pseudo-fichier : csv.writer renvoie la ligne écrite au lieu de la stocker"""
+
+    def write(self, valeur):
+        return valeur
+
+
+# Début de cellule interprété comme une formule par les tableurs
+_DEBUT_FORMULE = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _cellule_csv(valeur):
+    texte = _texte(valeur)
+    if isinstance(valeur, str) and texte.startswith(_DEBUT_FORMULE):
+        return "'" + texte
+    return texte
+
+
+def csv_stream(entetes, lignes):
+    writer = csv.writer(_Echo(), delimiter=';')
+    yield '\ufeff' + writer.writerow(entetes)
+    for ligne in lignes:
+        yield writer.writerow([_cellule_csv(valeur) for valeur in ligne])
+
+
+# --- XLSX ---
+
+# Caractères interdits en XML 1.0
+_CARACTERES_INVALIDES = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+_FICHIERS_XLSX = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+_CLASSEUR_XLSX = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+
+class _Tampon:
+    """Fichier en écriture seule, non positionnable, vidé à chaque envoi"""
+
+    def __init__(self):
+        self.morceaux = []
+
+    def write(self, donnees):
+        self.morceaux.append(bytes(donnees))
+        return len(donnees)
+
+    def flush(self):
+        pass
+
+    def vider(self):
+        donnees, self.morceaux = b''.join(self.morceaux), []
+        return donnees
+
+
+def _cellule(valeur):
+    if isinstance(valeur, (int, float, Decimal)) and not isinstance(valeur, bool):
+        return f'<c><v>{valeur}</v></c>'
+    if isinstance(valeur, bool):
+        return f'<c t="b"><v>{int(valeur)}</v></c>'
+    texte = escape(_CARACTERES_INVALIDES.sub('', _texte(valeur)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{texte}</t></is></c>'
+
+
+def xlsx_stream(entetes, lignes, feuille='Export'):
+    tampon = _Tampon()
+    with zipfile.ZipFile(tampon, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for nom, contenu in _FICHIERS_XLSX.items():
+            archive.writestr(nom, contenu)
+        archive.writestr('xl/workbook.xml', _CLASSEUR_XLSX.format(escape(feuille[:31], {'"': '&quot;'})))
+        yield tampon.vider()
+
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as fichier:
+            fichier.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            fichier.write(('<row>' + ''.join(_cellule(e) for e in entetes) + '</row>').encode('utf-8'))
+            for i, ligne in enumerate(lignes, 1):
+                fichier.write(('<row>' + ''.join(_cellule(v) for v in ligne) + '</row>').encode('utf-8'))
+                if i % LIGNES_PAR_ENVOI == 0:
+                    donnees = tampon.vider()
+                    if donnees:
+                        yield donnees
+            fichier.write(b'</sheetData></worksheet>')
+    yield tampon.vider()
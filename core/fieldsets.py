@@ -0,0 +1,38 @@
+"""
+Sélection des champs renvoyés par les listes (?fields=id,reference,statut)
+
+Un client mobile peut demander des lignes légères sans hydrater les arbres
+imbriqués (courrier, agents, services concernés) qu'il n'affiche pas.
+Ne s'applique qu'aux lectures (GET) et au sérialiseur de premier niveau :
+les sérialiseurs imbriqués renvoient toujours tous leurs champs.
+"""
+
+
+def requested_fields(request):
+    """Champs demandés par ?fields= (set), ou None pour tous les champs"""
+    if request is None or request.method != 'GET':
+        return None
+    valeur = request.query_params.get('fields')
+    if not valeur:
+        return None
+    return {champ.strip() for champ in valeur.split(',') if champ.strip()}
+
+
+def wants_any(request, *champs):
+    """True si l'un de ces champs sera renvoyé (pour éviter un prefetch inutile)"""
+    demandes = requested_fields(request)
+    return demandes is None or not demandes.isdisjoint(champs)
+
+
+class SparseFieldsetMixin:
+    """À placer avant serializers.ModelSerializer : retire les champs non demandés"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.champs_demandes = requested_fields(self.context.get('request'))
+        if self.champs_demandes:
+            for nom in set(self.fields) - self.champs_demandes:
+                self.fields.pop(nom)
+
+    def champ_demande(self, nom):
+        return self.champs_demandes is None or nom in self.champs_demandes
@@ -0,0 +1,133 @@
+"""
+Noyau de calcul de distance GPS (formule de Haversine) partagé par tout le géofencing
+
+- haversine() : chemin rapide scalaire, sans allocation NumPy
+- distances_to_point() : plusieurs positions contre un seul bureau
+- pairwise_distances() : chaque position contre son propre bureau
+- distance_matrix() : plusieurs positions contre plusieurs bureaux
+
+Les entrées peuvent être des Decimal (champs des modèles), des float ou des chaînes.
+"""
+import math
+
+import numpy as np
+
+# Rayon de la Terre en mètres
+EARTH_RADIUS_M = 6371000
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """
+    Distance en mètres entre deux points GPS (chemin scalaire)
+
+    Args:
+        lat1, lon1: Latitude et longitude du premier point
+        lat2, lon2: Latitude et longitude du second point
+
+    Returns:
+        float: Distance en mètres
+    """
+    lat1_rad = math.radians(float(lat1))
+    lon1_rad = math.radians(float(lon1))
+    lat2_rad = math.radians(float(lat2))
+    lon2_rad = math.radians(float(lon2))
+
+    dlat = lat2_rad - lat1_rad
+    dlon = lon2_rad - lon1_rad
+
+    a = (math.sin(dlat / 2) ** 2 +
+         math.cos(lat1_rad) * math.cos(lat2_rad) *
+         math.sin(dlon / 2) ** 2)
+
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    return EARTH_RADIUS_M * c
+
+
+def as_radians(values):
+    """Convertit une séquence de degrés (Decimal, float, str) en tableau de radians"""
+    return np.radians(np.asarray(values, dtype=np.float64))
+
+
+def _haversine_radians(lat1, lon1, lat2, lon2):
+    """Formule de Haversine sur des tableaux NumPy déjà en radians (diffusion autorisée)"""
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    a = np.clip(a, 0.0, 1.0)
+
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return EARTH_RADIUS_M * c
+
+
+def distances_to_point(latitudes, longitudes, lat, lon):
+    """
+    Distances de plusieurs positions à un même point (ex: un bureau)
+
+    Args:
+        latitudes, longitudes: séquences de même longueur
+        lat, lon: coordonnées du point de référence
+
+    Returns:
+        numpy.ndarray: distances en mètres, forme (n,)
+    """
+    return _haversine_radians(
+        as_radians(latitudes), as_radians(longitudes),
+        math.radians(float(lat)), math.radians(float(lon))
+    )
+
+
+def pairwise_distances(latitudes, longitudes, ref_latitudes, ref_longitudes):
+    """
+    Distance de chaque position à son propre point de référence (élément par élément)
+
+    Args:
+        latitudes, longitudes: positions, séquences de longueur n
+        ref_latitudes, ref_longitudes: références (ex: bureau de chaque agent), longueur n
+
+    Returns:
+        numpy.ndarray: distances en mètres, forme (n,)
+    """
+    return _haversine_radians(
+        as_radians(latitudes), as_radians(longitudes),
+        as_radians(ref_latitudes), as_radians(ref_longitudes)
+    )
+
+
+def distance_matrix(latitudes, longitudes, ref_latitudes, ref_longitudes):
+    """
+    Distances de plusieurs positions à plusieurs points de référence (ex: tous les bureaux)
+
+    Args:
+        latitudes, longitudes: positions, séquences de longueur n
+        ref_latitudes, ref_longitudes: références, séquences de longueur m
+
+    Returns:
+        numpy.ndarray: distances en mètres, forme (n, m)
+    """
+    lat = as_radians(latitudes)[:, np.newaxis]
+    lon = as_radians(longitudes)[:, np.newaxis]
+    ref_lat = as_radians(ref_latitudes)[np.newaxis, :]
+    ref_lon = as_radians(ref_longitudes)[np.newaxis, :]
+    return _haversine_radians(lat, lon, ref_lat, ref_lon)
+
+
+def location_distances(locations, lat, lon):
+    """
+    Distances d'une liste d'objets AgentLocation à un même point
+
+    Args:
+        locations: itérable d'objets ayant des attributs latitude / longitude
+        lat, lon: coordonnées du point de référence
+
+    Returns:
+        numpy.ndarray: distances en mètres, dans l'ordre de `locations`
+    """
+    locations = list(locations)
+    if not locations:
+        return np.empty(0, dtype=np.float64)
+    return distances_to_point(
+        [loc.latitude for loc in locations],
+        [loc.longitude for loc in locations],
+        lat, lon
+    )
@@ -0,0 +1,192 @@
+"""
+Accès en cache aux paramètres de géofencing (GeofenceSettings)
+
+La ligne de configuration change rarement mais est lue à chaque mise à jour de
+position et dans chaque tâche d'alerte. Elle est donc gardée en mémoire dans
+chaque processus, avec les jours et plages horaires de travail précalculés :
+le chemin chaud (get_geofence_settings, is_heure_travail) ne fait aucune requête.
+
+Invalidation :
+- localement, par les signaux post_save / post_delete de GeofenceSettings
+- dans les autres processus, par un message Redis pub/sub portant un numéro de
+  version (publié après le commit) ; un processus ignore les versions qu'il a déjà
+- à défaut de Redis, l'entrée expire après DUREE_VIE_SANS_PUBSUB secondes
+"""
+import logging
+import os
+import threading
+import time
+from datetime import time as dt_time
+
+import redis
+from django.conf import settings as django_settings
+from django.utils import timezone
+
+from .models import GeofenceSettings
+
+logger = logging.getLogger(__name__)
+
+CANAL_INVALIDATION = 'ediligence:geofence_settings:invalidate'
+CLE_VERSION = 'ediligence:geofence_settings:version'
+
+# Durée de vie de l'entrée quand l'écoute pub/sub est active / indisponible
+DUREE_VIE_MAX = 3600
+DUREE_VIE_SANS_PUBSUB = 60
+
+# Attente avant une nouvelle tentative de connexion à Redis
+ATTENTE_RECONNEXION = 30
+
+
+def _secondes(valeur):
+    """Secondes depuis minuit d'une heure (time ou chaîne 'HH:MM')"""
+    if isinstance(valeur, str):
+        valeur = dt_time.fromisoformat(valeur)
+    return valeur.hour * 3600 + valeur.minute * 60 + valeur.second + valeur.microsecond / 1000000
+
+
+class HoraireTravail:
+    """Jours travaillés (masque de bits, 0=lundi) et plages horaires en secondes"""
+
+    __slots__ = ('jours', 'plages')
+
+    def __init__(self, settings):
+        jours = [
+            settings.lundi_travaille, settings.mardi_travaille, settings.mercredi_travaille,
+            settings.jeudi_travaille, settings.vendredi_travaille, settings.samedi_travaille,
+            settings.dimanche_travaille
+        ]
+        self.jours = sum(1 << i for i, travaille in enumerate(jours) if travaille)
+        self.plages = (
+            (_secondes(settings.heure_debut_matin), _secondes(settings.heure_fin_matin)),
+            (_secondes(settings.heure_debut_apres_midi), _secondes(settings.heure_fin_apres_midi)),
+        )
+
+    def contient(self, datetime_obj):
+        if not (self.jours >> datetime_obj.weekday()) & 1:
+            return False
+        secondes = _secondes(datetime_obj.time())
+        return any(debut <= secondes <= fin for debut, fin in self.plages)
+
+
+class _Entree:
+    __slots__ = ('settings', 'horaire', 'version', 'charge_a')
+
+    def __init__(self, settings, version):
+        self.settings = settings
+        self.horaire = HoraireTravail(settings) if settings else None
+        self.version = version
+        self.charge_a = time.monotonic()
+
+
+_verrou = threading.Lock()
+_entree = None
+_generation = 0
+_ecouteur_pid = None
+_pubsub_actif = False
+_client = None
+
+
+def _redis():
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(django_settings.CACHE_INVALIDATION_REDIS_URL, socket_timeout=5)
+    return _client
+
+
+def _version_courante():
+    try:
+        return int(_redis().get(CLE_VERSION) or 0)
+    except redis.RedisError:
+        return None
+
+
+def _expiree(entree):
+    duree_vie = DUREE_VIE_MAX if _pubsub_actif else DUREE_VIE_SANS_PUBSUB
+    return time.monotonic() - entree.charge_a > duree_vie
+
+
+def _charger():
+    global _entree
+    _demarrer_ecouteur()
+    generation = _generation
+    version = _version_courante() if _pubsub_actif else None
+    entree = _Entree(GeofenceSettings.objects.first(), version)
+    with _verrou:
+        # Une invalidation reçue pendant le chargement rend l'entrée obsolète
+        if generation == _generation:
+            _entree = entree
+    return entree
+
+
+def _entree_courante():
+    entree = _entree
+    if entree is None or _expiree(entree):
+        entree = _charger()
+    return entree
+
+
+def get_geofence_settings():
+    """
+    Paramètres de géofencing courants, sans requête si le cache est valide
+
+    Returns:
+        GeofenceSettings ou None (instance partagée : ne pas la modifier)
+    """
+    return _entree_courante().settings
+
+
+def is_heure_travail(datetime_obj=None):
+    """Chemin rapide de GeofenceSettings.is_heure_travail (False sans configuration)"""
+    entree = _entree_courante()
+    if entree.horaire is None:
+        return False
+    return entree.horaire.contient(datetime_obj or timezone.now())
+
+
+def invalidate_local():
+    """Vide le cache du processus courant"""
+    global _entree, _generation
+    with _verrou:
+        _generation += 1
+        _entree = None
+
+
+def publish_invalidation():
+    """Incrémente la version et prévient les autres processus"""
+    try:
+        client = _redis()
+        client.publish(CANAL_INVALIDATION, client.incr(CLE_VERSION))
+    except redis.RedisError as e:
+        logger.warning(f"Invalidation des paramètres de géofencing non publiée: {e}")
+
+
+def _ecouter():
+    global _pubsub_actif
+    while True:
+        try:
+            pubsub = _redis().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(CANAL_INVALIDATION)
+            _pubsub_actif = True
+            # Des messages ont pu être manqués pendant une coupure
+            invalidate_local()
+            for message in pubsub.listen():
+                version = int(message['data'])
+                entree = _entree
+                if entree is None or entree.version is None or version > entree.version:
+                    invalidate_local()
+        except Exception as e:
+            _pubsub_actif = False
+            logger.debug(f"Écoute des invalidations de géofencing interrompue: {e}")
+            time.sleep(ATTENTE_RECONNEXION)
+
+
+def _demarrer_ecouteur():
+    """Démarre le thread d'écoute pub/sub (une fois par processus, y compris après un fork)"""
+    global _ecouteur_pid
+    if not django_settings.CACHE_INVALIDATION_REDIS_URL or _ecouteur_pid == os.getpid():
+        return
+    with _verrou:
+        if _ecouteur_pid == os.getpid():
+            return
+        _ecouteur_pid = os.getpid()
+    threading.Thread(target=_ecouter, name='geofence-settings-invalidation', daemon=True).start()
@@ -1,9 +1,10 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from .models import GeofenceAlert, GeofenceSettings, AgentLocation, PushNotificationToken
+from .fieldsets import SparseFieldsetMixin
+from .models import GeofenceAlert, GeofenceSettings, AgentLocation, AgentCurrentLocation, PushNotificationToken
 
 
-class GeofenceAlertSerializer(serializers.ModelSerializer):
+class GeofenceAlertSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     agent_name = serializers.SerializerMethodField()
     bureau_name = serializers.SerializerMethodField()
     type_alerte_display = serializers.CharField(source='get_type_alerte_display', read_only=True)
@@ -68,6 +69,22 @@ class AgentLocationSerializer(serializers.ModelSerializer):
         return f"{obj.agent.first_name} {obj.agent.last_name}".strip() or obj.agent.username
 
 
+class AgentCurrentLocationSerializer(serializers.ModelSerializer):
+    agent_name = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = AgentCurrentLocation
+        fields = [
+            'agent', 'agent_name', 'location_id', 'latitude', 'longitude', 'accuracy',
+            'timestamp', 'is_background', 'battery_level', 'distance_bureau',
+            'dans_zone_autorisee', 'derniere_dans_zone', 'updated_at'
+        ]
+        read_only_fields = fields
+    
+    def get_agent_name(self, obj):
+        return f"{obj.agent.first_name} {obj.agent.last_name}".strip() or obj.agent.username
+
+
 class PushNotificationTokenSerializer(serializers.ModelSerializer):
     user_name = serializers.SerializerMethodField()
     platform_display = serializers.CharField(source='get_platform_display', read_only=True)
@@ -92,3 +109,8 @@ class LocationUpdateSerializer(serializers.Serializer):
     is_background = serializers.BooleanField(default=False)
     battery_level = serializers.IntegerField(required=False, allow_null=True)
     timestamp = serializers.DateTimeField(required=False)
+
+
+class BulkLocationPointSerializer(LocationUpdateSerializer):
+    """Un point d'un lot de positions envoyé par l'application mobile"""
+    client_id = serializers.CharField(max_length=64, required=False)
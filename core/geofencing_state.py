@@ -0,0 +1,113 @@
+"""
+Machine à états incrémentale de sortie de zone, par agent
+
+L'état persistant (AgentGeofenceState) retient si l'agent est dans la zone,
+depuis quand il en est sorti et la dernière position traitée. Chaque appel
+ne traite que les positions arrivées depuis ce curseur : la tâche périodique
+et l'endpoint de mise à jour de position font un travail proportionnel au
+nombre de nouveaux points, et non au nombre de points de la journée.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from .geo_distance import location_distances
+from .models import AgentGeofenceState, AgentLocation
+
+# Distance au-delà de laquelle l'agent est considéré comme sorti du bureau
+SEUIL_SORTIE_METRES = 200
+
+# Positions aberrantes (émulateur) ignorées au-delà de cette distance
+DISTANCE_ABERRANTE_METRES = 10000
+
+
+def reset_state(state, bureau, date):
+    """Remet l'état à zéro pour une nouvelle journée ou un changement de bureau"""
+    state.bureau = bureau
+    state.date = date
+    state.est_dans_zone = True
+    state.hors_zone_depuis = None
+    state.derniere_position_id = 0
+    state.derniere_position_timestamp = None
+    state.derniere_distance = None
+
+
+def apply_locations(state, locations, distances, seuil=SEUIL_SORTIE_METRES):
+    """
+    Fait avancer l'état avec des positions triées par horodatage (sans requête)
+
+    Args:
+        state: AgentGeofenceState à modifier
+        locations: positions (id, timestamp) triées par horodatage
+        distances: distance au bureau de chaque position, dans le même ordre
+        seuil: distance de sortie en mètres
+
+    Returns:
+        AgentGeofenceState: l'état modifié (non sauvegardé)
+    """
+    for location, distance in zip(locations, distances):
+        state.derniere_position_id = max(state.derniere_position_id, location.id)
+
+        # Une position arrivée en retard ne modifie pas l'état courant
+        if state.derniere_position_timestamp and location.timestamp < state.derniere_position_timestamp:
+            continue
+        state.derniere_position_timestamp = location.timestamp
+
+        if distance > DISTANCE_ABERRANTE_METRES:
+            continue
+
+        state.derniere_distance = float(distance)
+        if distance > seuil:
+            if state.est_dans_zone:
+                state.est_dans_zone = False
+                state.hors_zone_depuis = location.timestamp
+        else:
+            state.est_dans_zone = True
+            state.hors_zone_depuis = None
+
+    return state
+
+
+def advance_geofence_state(user, bureau, now=None):
+    """
+    Fait avancer l'état de géofencing d'un agent avec ses nouvelles positions du jour
+
+    Args:
+        user: utilisateur (AgentLocation.agent)
+        bureau: bureau de référence de l'agent
+        now: instant de référence (timezone.now() par défaut)
+
+    Returns:
+        AgentGeofenceState: l'état à jour
+    """
+    now = now or timezone.now()
+    today = now.date()
+    bureau_id = bureau.id if bureau else None
+
+    with transaction.atomic():
+        state, created = AgentGeofenceState.objects.select_for_update().get_or_create(
+            agent=user,
+            defaults={'bureau': bureau, 'date': today}
+        )
+        changed = created
+
+        if state.date != today or state.bureau_id != bureau_id:
+            reset_state(state, bureau, today)
+            changed = True
+
+        if bureau is not None:
+            nouvelles = list(
+                AgentLocation.objects.filter(
+                    agent=user,
+                    id__gt=state.derniere_position_id,
+                    timestamp__date=today
+                ).only('id', 'timestamp', 'latitude', 'longitude').order_by('timestamp', 'id')
+            )
+            if nouvelles:
+                distances = location_distances(nouvelles, bureau.latitude_centre, bureau.longitude_centre)
+                apply_locations(state, nouvelles, distances)
+                changed = True
+
+        if changed:
+            state.save()
+
+    return state
@@ -0,0 +1,179 @@
+"""
+Moteur de balayage ensembliste pour la détection des sorties de zone
+
+Au lieu d'interroger la base agent par agent, le balayage :
+- lit la dernière position de chaque agent dans la projection AgentCurrentLocation
+- calcule les distances pour tout le lot
+- charge en une requête groupée les alertes déjà actives
+- crée les nouvelles alertes avec bulk_create
+
+Le coût d'un balayage dépend donc du nombre d'agents ayant émis une position
+récente, et non de l'effectif total.
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .geo_distance import pairwise_distances
+from .bureau_index import nearest_bureau
+from .models import AgentCurrentLocation, GeofenceAlert
+
+# Une position plus ancienne que cette fenêtre n'est pas prise en compte
+FENETRE_POSITION_RECENTE = timedelta(minutes=10)
+
+# Pas de nouvelle alerte si une alerte active existe déjà sur cette fenêtre
+FENETRE_ANTI_DOUBLON = timedelta(hours=2)
+
+# Taille des lots pour les requêtes IN et les insertions groupées
+TAILLE_LOT = 500
+
+
+def latest_locations(since):
+    """
+    Dernière position de chaque agent actif depuis `since`, en une seule requête
+    sur la projection AgentCurrentLocation
+
+    Args:
+        since: datetime à partir de laquelle une position est considérée comme récente
+
+    Returns:
+        QuerySet: une ligne AgentCurrentLocation par agent
+    """
+    return AgentCurrentLocation.objects.filter(
+        timestamp__gte=since,
+        agent__is_active=True,
+        agent__profile__role='AGENT'
+    ).select_related(
+        'agent', 'agent__profile', 'agent__agent_profile__bureau'
+    ).order_by()
+
+
+def compute_distances(pairs):
+    """
+    Calcule en une passe la distance de chaque position à son bureau
+
+    Args:
+        pairs: liste de tuples (position, Bureau)
+
+    Returns:
+        list: distances en mètres, dans l'ordre de `pairs`
+    """
+    if not pairs:
+        return []
+    return pairwise_distances(
+        [location.latitude for location, _ in pairs],
+        [location.longitude for location, _ in pairs],
+        [bureau.latitude_centre for _, bureau in pairs],
+        [bureau.longitude_centre for _, bureau in pairs]
+    ).tolist()
+
+
+def _resolve_bureau(location):
+    """Bureau de l'agent, ou bureau le plus proche de sa position s'il est rattaché à un service"""
+    user = location.agent
+    agent_profile = getattr(user, 'agent_profile', None)
+    if agent_profile and agent_profile.bureau:
+        return agent_profile.bureau
+
+    profile = getattr(user, 'profile', None)
+    if profile and profile.service_id:
+        bureau, _ = nearest_bureau(location.latitude, location.longitude)
+        return bureau
+    return None
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def run_geofence_sweep(settings, now=None):
+    """
+    Exécute un balayage complet et crée les alertes de sortie de zone
+
+    Args:
+        settings: instance GeofenceSettings (seuils de distance et de durée)
+        now: instant de référence (timezone.now() par défaut)
+
+    Returns:
+        list: identifiants des alertes créées
+    """
+    now = now or timezone.now()
+    duree_minimale = timedelta(minutes=settings.duree_minimale_hors_bureau_minutes)
+
+    pairs = []
+    for location in latest_locations(now - FENETRE_POSITION_RECENTE):
+        bureau = _resolve_bureau(location)
+        if bureau:
+            pairs.append((location, bureau))
+
+    nouvelles_alertes = []
+
+    for lot in _chunks(pairs, TAILLE_LOT):
+        distances = compute_distances(lot)
+        hors_zone = [
+            (location, bureau, distance)
+            for (location, bureau), distance in zip(lot, distances)
+            if distance > settings.distance_alerte_metres
+        ]
+        if not hors_zone:
+            continue
+
+        agent_ids = [location.agent_id for location, _, _ in hors_zone]
+
+        # Alertes actives récentes, pour éviter les doublons
+        deja_alertes = set(
+            GeofenceAlert.objects.filter(
+                agent_id__in=agent_ids,
+                type_alerte='sortie_zone',
+                statut='active',
+                timestamp_alerte__gte=now - FENETRE_ANTI_DOUBLON
+            ).values_list('agent_id', 'bureau_id')
+        )
+
+        for location, bureau, distance in hors_zone:
+            # Dernière position dans la zone autorisée (tenue à jour dans la projection)
+            derniere = location.derniere_dans_zone
+            if not derniere or (now - derniere) < duree_minimale:
+                continue
+            if (location.agent_id, bureau.id) in deja_alertes:
+                continue
+
+            alerte = GeofenceAlert(
+                agent=location.agent,
+                bureau=bureau,
+                type_alerte='sortie_zone',
+                latitude_agent=location.latitude,
+                longitude_agent=location.longitude,
+                distance_metres=int(distance),
+                en_heures_travail=True
+            )
+            alerte.message_alerte = alerte.build_message_alerte()
+            nouvelles_alertes.append(alerte)
+            deja_alertes.add((location.agent_id, bureau.id))
+
+    if not nouvelles_alertes:
+        return []
+
+    creees = GeofenceAlert.objects.bulk_create(nouvelles_alertes, batch_size=TAILLE_LOT)
+
+    alert_ids = [alerte.id for alerte in creees if alerte.id]
+    if len(alert_ids) != len(creees):
+        # MySQL ne renvoie pas les clés primaires après un bulk_create : relecture des
+        # alertes par (agent, bureau, timestamp_alerte posé à l'insertion), pour ne pas
+        # reprendre une alerte créée au même moment par update_location
+        inserees = {(alerte.agent_id, alerte.bureau_id, alerte.timestamp_alerte) for alerte in creees}
+        horodatages = [horodatage for _, _, horodatage in inserees]
+        alert_ids = []
+        for lot in _chunks(sorted({agent_id for agent_id, _, _ in inserees}), TAILLE_LOT):
+            alert_ids.extend(
+                alert_id
+                for alert_id, agent_id, bureau_id, horodatage in GeofenceAlert.objects.filter(
+                    agent_id__in=lot,
+                    type_alerte='sortie_zone',
+                    timestamp_alerte__range=(min(horodatages), max(horodatages))
+                ).values_list('id', 'agent_id', 'bureau_id', 'timestamp_alerte')
+                if (agent_id, bureau_id, horodatage) in inserees
+            )
+
+    return alert_ids
@@ -1,31 +1,38 @@
 from celery import shared_task
+from django.conf import settings as django_settings
 from django.utils import timezone
 from django.contrib.auth.models import User
 from datetime import timedelta
-import math
 from .models import (
     GeofenceAlert, GeofenceSettings, AgentLocation, 
     Bureau, UserProfile
 )
-from .notifications import send_geofence_notification, send_push_notification
+from .notifications import send_geofence_notifications_bulk
+from .notification_stream import publish
+from .push_dispatcher import dispatch_alerts_push
+from .geofencing_sweep import run_geofence_sweep
+from .geofence_config import get_geofence_settings, is_heure_travail
+from . import location_buffer
+from .location_partitions import apply_location_retention
+from .location_rollup import rollup_day
 
 
-def calculate_distance(lat1, lon1, lat2, lon2):
-    """Calcule la distance entre deux points GPS en mètres (formule de Haversine)"""
-    R = 6371000  # Rayon de la Terre en mètres
-    
-    lat1_rad = math.radians(float(lat1))
-    lon1_rad = math.radians(float(lon1))
-    lat2_rad = math.radians(float(lat2))
-    lon2_rad = math.radians(float(lon2))
-    
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
-    
-    a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    
-    return R * c
+def publish_alerts(users, alerts):
+    """Pousse les alertes aux clients connectés au flux temps réel (remplace l'interrogation d'alertes_actives)"""
+    publish({user.id for user in users}, 'alertes_geofence', [
+        {
+            'id': alert.id,
+            'agent': alert.agent_id,
+            'agent_nom': alert.agent.get_full_name() or alert.agent.username,
+            'bureau': alert.bureau_id,
+            'bureau_nom': alert.bureau.nom,
+            'type_alerte': alert.type_alerte,
+            'distance_metres': alert.distance_metres,
+            'timestamp_alerte': alert.timestamp_alerte,
+            'message_alerte': alert.message_alerte,
+        }
+        for alert in alerts
+    ])
 
 
 @shared_task
@@ -33,10 +40,13 @@ def check_geofence_violations():
     """
     Tâche périodique pour vérifier les violations de géofencing
     À exécuter toutes les 5 minutes via Celery Beat
+
+    Le balayage est ensembliste (voir core.geofencing_sweep) et les notifications
+    de toutes les alertes créées partent dans une seule tâche groupée.
     """
     try:
         # Récupérer les paramètres de géofencing
-        settings = GeofenceSettings.objects.first()
+        settings = get_geofence_settings()
         if not settings:
             print("Aucune configuration de géofencing trouvée")
             return
@@ -44,93 +54,17 @@ def check_geofence_violations():
         now = timezone.now()
         
         # Vérifier si on est dans les heures de travail
-        if not settings.is_heure_travail(now):
+        if not is_heure_travail(now):
             print("Hors des heures de travail, pas de vérification nécessaire")
             return
         
-        # Récupérer tous les agents actifs
-        agents = User.objects.filter(
-            profile__role='AGENT',
-            is_active=True
-        ).select_related('profile', 'agent_profile')
-        
-        violations_count = 0
-        
-        for agent in agents:
-            try:
-                # Récupérer la dernière position de l'agent (dans les 10 dernières minutes)
-                recent_location = AgentLocation.objects.filter(
-                    agent=agent,
-                    timestamp__gte=now - timedelta(minutes=10)
-                ).order_by('-timestamp').first()
-                
-                if not recent_location:
-                    continue  # Pas de position récente
-                
-                # Récupérer le bureau assigné à l'agent
-                bureau = None
-                if hasattr(agent, 'agent_profile') and agent.agent_profile.bureau:
-                    bureau = agent.agent_profile.bureau
-                elif hasattr(agent, 'profile') and agent.profile.service:
-                    # Chercher un bureau par défaut pour le service
-                    # À adapter selon votre logique métier
-                    bureau = Bureau.objects.first()
-                
-                if not bureau:
-                    continue  # Pas de bureau assigné
-                
-                # Calculer la distance
-                distance = calculate_distance(
-                    recent_location.latitude,
-                    recent_location.longitude,
-                    bureau.latitude_centre,
-                    bureau.longitude_centre
-                )
-                
-                # Vérifier si l'agent est hors de la zone autorisée
-                if distance > settings.distance_alerte_metres:
-                    # Vérifier depuis quand l'agent est hors de la zone (durée configurable)
-                    duree_minimale = timedelta(minutes=settings.duree_minimale_hors_bureau_minutes)
-                    
-                    # Chercher la dernière position dans la zone autorisée (sans limite de temps)
-                    last_inside_position = AgentLocation.objects.filter(
-                        agent=agent,
-                        dans_zone_autorisee=True
-                    ).order_by('-timestamp').first()
-                    
-                    # Si l'agent est hors zone depuis plus que la durée minimale, déclencher l'alerte
-                    if last_inside_position and (now - last_inside_position.timestamp) >= duree_minimale:
-                        # Vérifier qu'il n'y a pas déjà une alerte active récente
-                        recent_alert = GeofenceAlert.objects.filter(
-                            agent=agent,
-                            bureau=bureau,
-                            type_alerte='sortie_zone',
-                            statut='active',
-                            timestamp_alerte__gte=now - timedelta(hours=2)
-                        ).exists()
-                        
-                        if not recent_alert:
-                            # Créer une nouvelle alerte
-                            alert = GeofenceAlert.objects.create(
-                                agent=agent,
-                                bureau=bureau,
-                                type_alerte='sortie_zone',
-                                latitude_agent=recent_location.latitude,
-                                longitude_agent=recent_location.longitude,
-                                distance_metres=int(distance),
-                                en_heures_travail=True
-                            )
-                            
-                            # Envoyer les notifications
-                            send_geofence_notifications_task.delay(alert.id)
-                            violations_count += 1
-                            
-                            print(f"Alerte créée pour {agent.username}: {int(distance)}m du bureau {bureau.nom}")
-            
-            except Exception as e:
-                print(f"Erreur lors de la vérification pour {agent.username}: {e}")
-                continue
+        alert_ids = run_geofence_sweep(settings, now)
         
+        if alert_ids:
+            # Une seule tâche de notification pour tout le balayage
+            send_geofence_notifications_batch_task.delay(alert_ids)
+        
+        violations_count = len(alert_ids)
         print(f"Vérification géofencing terminée: {violations_count} nouvelles alertes créées")
         return violations_count
         
@@ -139,6 +73,70 @@ def check_geofence_violations():
         return 0
 
 
+@shared_task
+def send_geofence_notifications_batch_task(alert_ids):
+    """
+    Tâche pour envoyer en une fois les notifications de plusieurs alertes de géofencing
+    (destinataires chargés une seule fois, notifications in-app insérées en lot)
+    """
+    try:
+        settings = get_geofence_settings()
+        if not settings:
+            return
+        
+        alerts = list(
+            GeofenceAlert.objects.filter(id__in=alert_ids).select_related('agent', 'bureau')
+        )
+        if not alerts:
+            return
+        
+        roles = []
+        if settings.notification_directeurs:
+            roles.append('DIRECTEUR')
+        if settings.notification_superieurs:
+            roles.append('SUPERIEUR')
+        users_to_notify = list(User.objects.filter(profile__role__in=roles)) if roles else []
+        
+        notification_count = send_geofence_notifications_bulk(users_to_notify, alerts)
+        
+        publish_alerts(users_to_notify, alerts)
+        
+        # Marquer les notifications comme envoyées
+        ids = [alert.id for alert in alerts]
+        GeofenceAlert.objects.filter(id__in=ids).update(notification_envoyee=notification_count > 0)
+        
+        # Notifications push envoyées par la file dédiée
+        if settings.notification_push_active and users_to_notify:
+            send_push_alerts_task.delay(ids, [user.id for user in users_to_notify])
+        
+        print(f"Notifications envoyées pour {len(alerts)} alertes: {notification_count} app")
+        
+    except Exception as e:
+        print(f"Erreur lors de l'envoi groupé des notifications: {e}")
+
+
+@shared_task
+def send_push_alerts_task(alert_ids, user_ids):
+    """
+    Tâche pour envoyer en push des alertes de géofencing (file Celery « push »)
+    Un envoi FCM multicast par alerte pour tous les appareils des destinataires
+    """
+    try:
+        alerts = list(
+            GeofenceAlert.objects.filter(id__in=alert_ids).select_related('agent', 'bureau')
+        )
+        delivrees = dispatch_alerts_push(alerts, user_ids)
+        if delivrees:
+            GeofenceAlert.objects.filter(id__in=delivrees).update(notification_push_envoyee=True)
+        
+        print(f"Notifications push: {len(delivrees)}/{len(alerts)} alertes délivrées")
+        return len(delivrees)
+        
+    except Exception as e:
+        print(f"Erreur lors de l'envoi des notifications push: {e}")
+        return 0
+
+
 @shared_task
 def send_geofence_notifications_task(alert_id):
     """
@@ -146,7 +144,7 @@ def send_geofence_notifications_task(alert_id):
     """
     try:
         alert = GeofenceAlert.objects.get(id=alert_id)
-        settings = GeofenceSettings.objects.first()
+        settings = get_geofence_settings()
         
         if not settings:
             return
@@ -164,26 +162,19 @@ def send_geofence_notifications_task(alert_id):
             superieurs = User.objects.filter(profile__role='SUPERIEUR')
             users_to_notify.extend(superieurs)
         
-        # Envoyer les notifications
-        notification_count = 0
-        push_count = 0
-        
-        for user in users_to_notify:
-            # Notification dans l'application
-            if send_geofence_notification(user, alert):
-                notification_count += 1
-            
-            # Notification push si activée
-            if settings.notification_push_active:
-                if send_push_notification(user, alert):
-                    push_count += 1
+        # Envoyer les notifications dans l'application
+        notification_count = send_geofence_notifications_bulk(users_to_notify, [alert])
+        publish_alerts(users_to_notify, [alert])
         
         # Marquer les notifications comme envoyées
         alert.notification_envoyee = notification_count > 0
-        alert.notification_push_envoyee = push_count > 0
-        alert.save()
+        alert.save(update_fields=['notification_envoyee'])
+        
+        # Notifications push envoyées par la file dédiée
+        if settings.notification_push_active and users_to_notify:
+            send_push_alerts_task.delay([alert.id], [user.id for user in users_to_notify])
         
-        print(f"Notifications envoyées pour l'alerte {alert_id}: {notification_count} app, {push_count} push")
+        print(f"Notifications envoyées pour l'alerte {alert_id}: {notification_count} app")
         
     except GeofenceAlert.DoesNotExist:
         print(f"Alerte {alert_id} non trouvée")
@@ -191,17 +182,50 @@ def send_geofence_notifications_task(alert_id):
         print(f"Erreur lors de l'envoi des notifications pour l'alerte {alert_id}: {e}")
 
 
+@shared_task
+def flush_location_buffer():
+    """
+    Tâche pour écrire dans AgentLocation les positions du tampon Redis
+    (mode write-behind, settings.LOCATION_BUFFER_ENABLED)
+    À exécuter toutes les LOCATION_BUFFER_FLUSH_INTERVAL secondes
+    """
+    if not location_buffer.is_enabled():
+        return 0
+    try:
+        total = 0
+        # Plusieurs lots par passage tant que le tampon est plein
+        for _ in range(10):
+            traites = location_buffer.flush_buffer()
+            total += traites
+            if traites < django_settings.LOCATION_BUFFER_FLUSH_BATCH:
+                break
+        if total:
+            print(f"Tampon des positions: {total} points écrits en base")
+        return total
+    except Exception as e:
+        print(f"Erreur lors de l'écriture du tampon des positions: {e}")
+        return 0
+
+
 @shared_task
 def cleanup_old_locations():
     """
-    Tâche pour nettoyer les anciennes positions (garder seulement les 7 derniers jours)
+    Tâche pour nettoyer les anciennes positions (garder LOCATION_RETENTION_DAYS jours)
     À exécuter quotidiennement
+
+    Les journées expirées sont agrégées par heure (AgentLocationHourly) avant d'être
+    supprimées ; sous MySQL, la purge supprime des partitions journalières entières.
+    La journée de la veille est aussi agrégée pour les rapports.
     """
     try:
-        cutoff_date = timezone.now() - timedelta(days=7)
-        deleted_count = AgentLocation.objects.filter(timestamp__lt=cutoff_date).delete()[0]
-        print(f"Nettoyage des positions: {deleted_count} enregistrements supprimés")
-        return deleted_count
+        rollup_day(timezone.now().date() - timedelta(days=1))
+        resultat = apply_location_retention()
+        print(
+            f"Nettoyage des positions: {len(resultat['jours_agreges'])} journées agrégées, "
+            f"{len(resultat['partitions_supprimees'])} partitions supprimées, "
+            f"{resultat['lignes_supprimees']} enregistrements supprimés"
+        )
+        return resultat['lignes_supprimees']
     except Exception as e:
         print(f"Erreur lors du nettoyage des positions: {e}")
         return 0
@@ -1,8 +1,7 @@
 """
 Utilitaires pour les calculs de géofencing et géolocalisation
 """
-import math
-from decimal import Decimal
+from .geo_distance import haversine
 
 def calculate_distance(lat1, lon1, lat2, lon2):
     """
@@ -15,40 +14,7 @@ def calculate_distance(lat1, lon1, lat2, lon2):
     Returns:
         float: Distance en mètres
     """
-    # Convertir en float si ce sont des Decimal
-    if isinstance(lat1, Decimal):
-        lat1 = float(lat1)
-    if isinstance(lon1, Decimal):
-        lon1 = float(lon1)
-    if isinstance(lat2, Decimal):
-        lat2 = float(lat2)
-    if isinstance(lon2, Decimal):
-        lon2 = float(lon2)
-    
-    # Rayon de la Terre en mètres
-    R = 6371000
-    
-    # Convertir les degrés en radians
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
-    
-    # Différences
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
-    
-    # Formule de Haversine
-    a = (math.sin(dlat / 2) ** 2 + 
-         math.cos(lat1_rad) * math.cos(lat2_rad) * 
-         math.sin(dlon / 2) ** 2)
-    
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    
-    # Distance en mètres
-    distance = R * c
-    
-    return distance
+    return haversine(lat1, lon1, lat2, lon2)
 
 def is_within_geofence(agent_lat, agent_lon, center_lat, center_lon, radius_meters):
     """
@@ -1,75 +1,49 @@
-import math
+import json
+import logging
+import zlib
 from datetime import datetime, timedelta
 from django.utils import timezone
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Count, Max, Q, Sum
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from .models import (
-    GeofenceAlert, GeofenceSettings, AgentLocation, 
+    GeofenceAlert, GeofenceSettings, AgentLocation, AgentCurrentLocation,
     PushNotificationToken, Bureau, UserProfile
 )
 from .geofencing_serializers import (
     GeofenceAlertSerializer, GeofenceSettingsSerializer,
     AgentLocationSerializer, PushNotificationTokenSerializer,
-    LocationUpdateSerializer
+    LocationUpdateSerializer, BulkLocationPointSerializer, AgentCurrentLocationSerializer
 )
-from .notifications import send_geofence_notification, send_push_notification
+from .geofencing_tasks import send_geofence_notifications_batch_task
+from .geofencing_utils import calculate_distance
+from .geofencing_state import advance_geofence_state
+from .geofence_config import get_geofence_settings, is_heure_travail
+from .pagination import GeofenceAlertKeysetPagination
+from .org_scope import get_org_scope
+from .location_ingest import ingest_points, resolve_agent_bureau, MAX_POINTS_PAR_LOT
+from . import location_buffer
 
+logger = logging.getLogger(__name__)
 
-def calculate_distance(lat1, lon1, lat2, lon2):
-    """Calcule la distance entre deux points GPS en mètres (formule de Haversine)"""
-    R = 6371000  # Rayon de la Terre en mètres
-    
-    lat1_rad = math.radians(float(lat1))
-    lon1_rad = math.radians(float(lon1))
-    lat2_rad = math.radians(float(lat2))
-    lon2_rad = math.radians(float(lon2))
-    
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
-    
-    a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    
-    return R * c
+# Taille maximale d'un lot de positions une fois décompressé
+MAX_BULK_PAYLOAD_BYTES = 5 * 1024 * 1024
 
 
 class GeofenceAlertViewSet(viewsets.ModelViewSet):
     serializer_class = GeofenceAlertSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = GeofenceAlertKeysetPagination
     
     def get_queryset(self):
-        user = self.request.user
-        profile = getattr(user, 'profile', None)
-        
-        # ADMIN peut voir toutes les alertes
-        if profile and profile.role == 'ADMIN':
-            return GeofenceAlert.objects.all()
-        
-        # DIRECTEUR peut voir les alertes de sa direction
-        elif profile and profile.role == 'DIRECTEUR':
-            if profile.direction:
-                # Récupérer tous les agents de la direction
-                agents_direction = User.objects.filter(
-                    Q(profile__service__direction=profile.direction) |
-                    Q(agent_profile__service__direction=profile.direction)
-                )
-                return GeofenceAlert.objects.filter(agent__in=agents_direction)
-        
-        # SUPERIEUR peut voir les alertes de son service
-        elif profile and profile.role == 'SUPERIEUR':
-            if profile.service:
-                agents_service = User.objects.filter(
-                    Q(profile__service=profile.service) |
-                    Q(agent_profile__service=profile.service)
-                )
-                return GeofenceAlert.objects.filter(agent__in=agents_service)
-        
-        # Par défaut, voir seulement ses propres alertes
-        return GeofenceAlert.objects.filter(agent=user)
+        # ADMIN : toutes les alertes, DIRECTEUR : sa direction, SUPERIEUR : son service,
+        # autres : ses propres alertes (voir core.org_scope)
+        return get_org_scope(self.request.user).filter(GeofenceAlert.objects.all())
     
     @action(detail=True, methods=['post'])
     def resoudre(self, request, pk=None):
@@ -145,34 +119,53 @@ class AgentLocationViewSet(viewsets.ModelViewSet):
     serializer_class = AgentLocationSerializer
     permission_classes = [IsAuthenticated]
     
+    def _visible_agents(self, user):
+        """
+        Agents dont l'utilisateur peut voir les positions
+
+        Returns:
+            None (tous les agents) ou ensemble d'identifiants d'utilisateurs
+        """
+        return get_org_scope(user).user_ids
+    
     def get_queryset(self):
-        user = self.request.user
-        profile = getattr(user, 'profile', None)
-        
-        # ADMIN peut voir toutes les positions
-        if profile and profile.role == 'ADMIN':
+        agents = self._visible_agents(self.request.user)
+        if agents is None:
             return AgentLocation.objects.all()
+        return AgentLocation.objects.filter(agent__in=agents)
+    
+    @action(detail=False, methods=['get'])
+    def live(self, request):
+        """
+        Dernière position de chaque agent visible (carte en direct), en une requête
+        sur la projection AgentCurrentLocation. Gère If-None-Match : 304 si rien n'a changé.
+        Tampon Redis activé : les points encore en attente d'écriture sont appliqués
+        à la projection (lecture du hash des dernières positions, sans requête SQL).
+        """
+        queryset = AgentCurrentLocation.objects.all()
+        agents = self._visible_agents(request.user)
+        if agents is not None:
+            queryset = queryset.filter(agent__in=agents)
+        tampon = location_buffer.get_latest_positions(agents) if location_buffer.is_enabled() else {}
         
-        # DIRECTEUR peut voir les positions de sa direction
-        elif profile and profile.role == 'DIRECTEUR':
-            if profile.direction:
-                agents_direction = User.objects.filter(
-                    Q(profile__service__direction=profile.direction) |
-                    Q(agent_profile__service__direction=profile.direction)
-                )
-                return AgentLocation.objects.filter(agent__in=agents_direction)
-        
-        # SUPERIEUR peut voir les positions de son service
-        elif profile and profile.role == 'SUPERIEUR':
-            if profile.service:
-                agents_service = User.objects.filter(
-                    Q(profile__service=profile.service) |
-                    Q(agent_profile__service=profile.service)
-                )
-                return AgentLocation.objects.filter(agent__in=agents_service)
+        # Empreinte de l'ensemble visible, calculée sans charger les lignes
+        empreinte = queryset.aggregate(
+            total=Count('agent_id'), somme=Sum('agent_id'), derniere_maj=Max('updated_at')
+        )
+        derniere_maj = empreinte['derniere_maj']
+        etag = quote_etag('{}-{}-{}-{}'.format(
+            empreinte['total'], empreinte['somme'] or 0,
+            int(derniere_maj.timestamp() * 1000000) if derniere_maj else 0,
+            max((point['timestamp'] for point in tampon.values()), default=0)
+        ))
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
         
-        # Par défaut, voir seulement ses propres positions
-        return AgentLocation.objects.filter(agent=user)
+        positions = queryset.select_related('agent').order_by('agent_id')
+        if tampon:
+            positions = location_buffer.merge_latest(positions, tampon)
+        serializer = AgentCurrentLocationSerializer(positions, many=True)
+        return Response(serializer.data, headers={'ETag': etag})
     
     @action(detail=False, methods=['post'])
     def update_location(self, request):
@@ -183,18 +176,17 @@ class AgentLocationViewSet(viewsets.ModelViewSet):
             user = request.user
             
             # Récupérer le bureau assigné à l'agent
-            bureau = None
-            try:
-                if hasattr(user, 'agent_profile'):
-                    bureau = user.agent_profile.bureau
-                elif hasattr(user, 'profile') and user.profile.service:
-                    # Chercher un bureau par défaut pour le service/direction
-                    bureau = Bureau.objects.first()  # À adapter selon votre logique
-            except:
-                pass
+            bureau = resolve_agent_bureau(user, data['latitude'], data['longitude'])
+            
+            # Mode write-behind : position empilée dans Redis, écrite en base par lot
+            # (alertes évaluées par le balayage périodique)
+            if location_buffer.is_enabled():
+                response = self._buffer_single_location(user, bureau, data)
+                if response is not None:
+                    return response
             
-            # Créer l'enregistrement de position
-            location = AgentLocation.objects.create(
+            # Créer l'enregistrement de position (distance calculée avant l'insertion)
+            location = AgentLocation(
                 agent=user,
                 latitude=data['latitude'],
                 longitude=data['longitude'],
@@ -203,8 +195,6 @@ class AgentLocationViewSet(viewsets.ModelViewSet):
                 battery_level=data.get('battery_level'),
                 timestamp=data.get('timestamp', timezone.now())
             )
-            
-            # Calculer la distance et vérifier les alertes si un bureau est assigné
             if bureau:
                 distance = calculate_distance(
                     data['latitude'], data['longitude'],
@@ -212,7 +202,12 @@ class AgentLocationViewSet(viewsets.ModelViewSet):
                 )
                 location.distance_bureau = distance
                 location.dans_zone_autorisee = distance <= bureau.rayon_metres
-                location.save()
+            location.save()
+            
+            # Vérifier les alertes si un bureau est assigné
+            if bureau:
+                # Faire avancer l'état de sortie de zone (seulement les nouvelles positions)
+                advance_geofence_state(user, bureau)
                 
                 # Vérifier si une alerte doit être déclenchée
                 self._check_geofence_alert(user, bureau, location, distance)
@@ -226,14 +221,151 @@ class AgentLocationViewSet(viewsets.ModelViewSet):
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
+    def _buffer_single_location(self, user, bureau, data):
+        """Empiler une position dans le tampon Redis (None si le tampon la refuse)"""
+        point = dict(data)
+        if bureau:
+            distance = calculate_distance(
+                data['latitude'], data['longitude'],
+                bureau.latitude_centre, bureau.longitude_centre
+            )
+            point['distance_bureau'] = distance
+            point['dans_zone_autorisee'] = distance <= bureau.rayon_metres
+        
+        client_ids = location_buffer.buffer_points(user.id, [point])
+        if client_ids is None:
+            return None
+        
+        return Response({
+            'message': 'Position reçue, enregistrement différé',
+            'status': 'buffered',
+            'client_id': client_ids[0],
+            'location_id': None,
+            'distance_bureau': point.get('distance_bureau'),
+            'dans_zone_autorisee': point.get('dans_zone_autorisee')
+        }, status=status.HTTP_202_ACCEPTED)
+    
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_update_location(self, request):
+        """
+        Endpoint pour envoyer un lot de positions horodatées (ex: file d'attente hors ligne).
+        Accepte une liste de points ou {"points": [...]}, éventuellement compressée en gzip
+        (en-tête Content-Encoding: gzip). Idempotent sur le champ client_id de chaque point.
+        """
+        try:
+            payload = self._read_bulk_payload(request)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        points = payload.get('points') if isinstance(payload, dict) else payload
+        if not isinstance(points, list) or not points:
+            return Response({'error': 'Une liste de points non vide est requise'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(points) > MAX_POINTS_PAR_LOT:
+            return Response(
+                {'error': f'Lot trop volumineux ({len(points)} points, maximum {MAX_POINTS_PAR_LOT})'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        user = request.user
+        now = timezone.now()
+        
+        # Validation point par point : un point invalide ne rejette pas tout le lot
+        results = [None] * len(points)
+        valid_points = []
+        valid_indexes = []
+        for index, point in enumerate(points):
+            serializer = BulkLocationPointSerializer(data=point)
+            if not serializer.is_valid():
+                results[index] = {
+                    'index': index,
+                    'client_id': point.get('client_id') if isinstance(point, dict) else None,
+                    'status': 'invalid',
+                    'errors': serializer.errors
+                }
+                continue
+            data = dict(serializer.validated_data)
+            if data.get('timestamp') and data['timestamp'] > now + timedelta(minutes=5):
+                results[index] = {
+                    'index': index,
+                    'client_id': data.get('client_id'),
+                    'status': 'invalid',
+                    'errors': {'timestamp': ['Horodatage dans le futur']}
+                }
+                continue
+            valid_points.append(data)
+            valid_indexes.append(index)
+        
+        latest = None
+        client_ids = None
+        if valid_points and location_buffer.is_enabled():
+            # Mode write-behind : dédoublonnage et alertes traités à l'écriture en base
+            client_ids = location_buffer.buffer_points(user.id, valid_points)
+            if client_ids is not None:
+                for index, client_id in zip(valid_indexes, client_ids):
+                    results[index] = {'index': index, 'client_id': client_id, 'status': 'buffered'}
+        
+        if valid_points and client_ids is None:
+            # Lot rejoué hors ordre : le bureau suit la position la plus récente (sans horodatage : maintenant)
+            plus_recent = max(valid_points, key=lambda p: p.get('timestamp') or now)
+            bureau = resolve_agent_bureau(user, plus_recent['latitude'], plus_recent['longitude'])
+            ingest_results, latest = ingest_points(user, valid_points, bureau)
+            for index, result in zip(valid_indexes, ingest_results):
+                results[index] = {'index': index, **result}
+            
+            # Évaluation des alertes une seule fois par lot, sur la position la plus récente
+            if bureau and latest is not None:
+                self._check_geofence_alert(user, bureau, latest, latest.distance_bureau)
+        
+        statuts = [result['status'] for result in results]
+        return Response({
+            'message': 'Lot de positions traité',
+            'recus': len(points),
+            'crees': statuts.count('created'),
+            'doublons': statuts.count('duplicate'),
+            'invalides': statuts.count('invalid'),
+            'en_attente': statuts.count('buffered'),
+            'results': results
+        }, status=(
+            status.HTTP_400_BAD_REQUEST if not valid_points
+            else status.HTTP_202_ACCEPTED if client_ids is not None
+            else status.HTTP_200_OK
+        ))
+    
+    @action(detail=False, methods=['get'], url_path='buffer-stats')
+    def buffer_stats(self, request):
+        """Indicateurs du tampon Redis des positions (ADMIN uniquement)"""
+        profile = getattr(request.user, 'profile', None)
+        if not profile or profile.role != 'ADMIN':
+            return Response({'error': 'Accès réservé aux administrateurs'}, status=status.HTTP_403_FORBIDDEN)
+        if not location_buffer.is_enabled():
+            return Response({'active': False})
+        return Response(location_buffer.buffer_metrics())
+    
+    def _read_bulk_payload(self, request):
+        """Lire le corps de la requête, décompressé si Content-Encoding: gzip"""
+        if request.META.get('HTTP_CONTENT_ENCODING', '').lower() != 'gzip':
+            return request.data
+        
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            raw = decompressor.decompress(request.body, MAX_BULK_PAYLOAD_BYTES)
+        except zlib.error:
+            raise ValueError('Corps gzip invalide')
+        if decompressor.unconsumed_tail:
+            raise ValueError('Corps décompressé trop volumineux')
+        try:
+            return json.loads(raw.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise ValueError('JSON invalide')
+    
     def _check_geofence_alert(self, user, bureau, location, distance):
         """Vérifier si une alerte de géofencing doit être déclenchée"""
-        settings = GeofenceSettings.objects.first()
+        settings = get_geofence_settings()
         if not settings:
             return
         
         now = timezone.now()
-        is_work_hours = settings.is_heure_travail(now)
+        is_work_hours = is_heure_travail(now)
         
         # Vérifier si l'agent est sorti de la zone pendant les heures de travail
         if distance > settings.distance_alerte_metres and is_work_hours:
@@ -241,23 +373,15 @@ class AgentLocationViewSet(viewsets.ModelViewSet):
             duree_minimale = timedelta(minutes=settings.duree_minimale_hors_bureau_minutes)
             time_threshold = now - duree_minimale
             
-            # Chercher la dernière position dans la zone autorisée
-            last_inside_position = AgentLocation.objects.filter(
-                agent=user,
-                dans_zone_autorisee=True,
-                timestamp__gte=time_threshold
-            ).order_by('-timestamp').first()
+            # Dernière position dans la zone autorisée (tenue à jour dans la position courante)
+            last_inside_timestamp = AgentCurrentLocation.objects.filter(
+                agent=user
+            ).values_list('derniere_dans_zone', flat=True).first()
             
-            # Si aucune position dans la zone dans la période définie, vérifier plus loin
-            if not last_inside_position:
-                # Chercher la dernière position dans la zone (sans limite de temps)
-                last_inside_position = AgentLocation.objects.filter(
-                    agent=user,
-                    dans_zone_autorisee=True
-                ).order_by('-timestamp').first()
-                
+            # Si aucune position dans la zone dans la période définie
+            if not last_inside_timestamp or last_inside_timestamp < time_threshold:
                 # Si l'agent est hors zone depuis plus que la durée minimale, déclencher l'alerte
-                if last_inside_position and (now - last_inside_position.timestamp) >= duree_minimale:
+                if last_inside_timestamp and (now - last_inside_timestamp) >= duree_minimale:
                     # Vérifier qu'il n'y a pas déjà une alerte active récente
                     recent_alert = GeofenceAlert.objects.filter(
                         agent=user,
@@ -283,37 +407,16 @@ class AgentLocationViewSet(viewsets.ModelViewSet):
                         self._send_geofence_notifications(alert)
     
     def _send_geofence_notifications(self, alert):
-        """Envoyer les notifications pour une alerte de géofencing"""
-        settings = GeofenceSettings.objects.first()
-        if not settings:
-            return
-        
-        # Récupérer les utilisateurs à notifier (directeurs et supérieurs)
-        users_to_notify = []
-        
-        if settings.notification_directeurs:
-            # Notifier les directeurs
-            directeurs = User.objects.filter(profile__role='DIRECTEUR')
-            users_to_notify.extend(directeurs)
-        
-        if settings.notification_superieurs:
-            # Notifier les supérieurs
-            superieurs = User.objects.filter(profile__role='SUPERIEUR')
-            users_to_notify.extend(superieurs)
-        
-        # Envoyer les notifications
-        for user in users_to_notify:
-            # Notification dans l'application
-            send_geofence_notification(user, alert)
-            
-            # Notification push si activée
-            if settings.notification_push_active:
-                send_push_notification(user, alert)
+        """Envoyer les notifications pour une alerte de géofencing (hors de la requête HTTP)"""
+        def programmer():
+            try:
+                send_geofence_notifications_batch_task.delay([alert.id])
+            except Exception as e:
+                # Broker indisponible : notifications in-app insérées ici (seul le push est perdu)
+                logger.warning(f"Notifications différées de l'alerte {alert.id} indisponibles, envoi direct: {e}")
+                send_geofence_notifications_batch_task([alert.id])
         
-        # Marquer les notifications comme envoyées
-        alert.notification_envoyee = True
-        alert.notification_push_envoyee = settings.notification_push_active
-        alert.save()
+        transaction.on_commit(programmer)
 
 
 class PushNotificationTokenViewSet(viewsets.ModelViewSet):
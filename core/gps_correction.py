@@ -2,7 +2,7 @@
 Utilitaire de correction GPS pour e-Diligence
 Corrige automatiquement les coordonnées GPS aberrantes
 """
-from .models import Bureau
+from .bureau_index import default_bureau
 import logging
 
 logger = logging.getLogger(__name__)
@@ -59,7 +59,7 @@ def correct_gps_coordinates(latitude, longitude, user=None):
         if user and hasattr(user, 'agent_profile') and user.agent_profile.bureau:
             bureau = user.agent_profile.bureau
         else:
-            bureau = Bureau.objects.first()
+            bureau = default_bureau()
         
         if bureau:
             corrected_lat = float(bureau.latitude_centre)
@@ -91,7 +91,7 @@ def correct_gps_coordinates(latitude, longitude, user=None):
         logger.error(f"Erreur lors de la correction GPS: {e}")
         
         # Coordonnées par défaut en cas d'erreur
-        bureau = Bureau.objects.first()
+        bureau = default_bureau()
         if bureau:
             return {
                 'latitude': float(bureau.latitude_centre),
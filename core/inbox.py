@@ -0,0 +1,295 @@
+"""
+Boîte de réception unifiée (Notification, DiligenceNotification, CourrierNotification)
+
+Lecture :
+- inbox_page fusionne les trois flux par date (fusion k-voies de trois lectures
+  indexées sur (destinataire, -created_at)), avec une pagination par curseur
+  (created_at, source, id) : aucune requête OFFSET ni COUNT
+- les éléments sont des dictionnaires au format commun (voir _element)
+
+Compteurs de non lues :
+- un hash Redis par utilisateur, un champ par source
+- incrémenté à la création, décrémenté à la lecture ou à la suppression
+  (signaux de core.signals, insertions groupées de core.notification_fanout)
+- les mises à jour en masse (« tout marquer comme lu ») suppriment le hash
+- un hash absent ou incomplet est recalculé depuis la base (3 COUNT) ; les
+  variations ne touchent que les hashes existants ; il expire après
+  DUREE_VIE_COMPTEURS pour corriger une éventuelle dérive
+Sans Redis, les compteurs sont lus en base.
+"""
+import base64
+import heapq
+import json
+import logging
+from datetime import datetime
+from itertools import islice
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import CourrierNotification, DiligenceNotification, Notification
+from .notification_stream import publish
+
+logger = logging.getLogger(__name__)
+
+# source: (modèle, champ destinataire, champ « lu »)
+SOURCES = {
+    'notification': (Notification, 'user', 'read'),
+    'diligence': (DiligenceNotification, 'user', 'read'),
+    'courrier': (CourrierNotification, 'utilisateur', 'lue'),
+}
+SOURCE_PAR_MODELE = {modele: source for source, (modele, _, _) in SOURCES.items()}
+# Départage des notifications créées au même instant
+RANG = {'notification': 0, 'diligence': 1, 'courrier': 2}
+
+CHAMPS = {
+    'notification': ('id', 'type_notif', 'contenu', 'message', 'lien', 'read', 'created_at'),
+    'diligence': ('id', 'type_notification', 'message', 'lien', 'read', 'created_at', 'diligence_id'),
+    'courrier': ('id', 'type_notification', 'titre', 'message', 'priorite', 'lue', 'created_at', 'courrier_id'),
+}
+
+CLE_COMPTEURS = 'ediligence:inbox_unread:{}'
+DUREE_VIE_COMPTEURS = 86400
+
+# Incrément d'un compteur seulement si le hash existe : un hash absent n'est pas
+# créé avec le seul delta (il serait pris pour un compteur complet)
+_INCREMENTER_SI_EXISTE_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+_client = None
+
+
+# --- Lecture fusionnée ---
+
+def _identifiant(source, pk):
+    # pk absent après un bulk_create sur MySQL
+    return f'{source}-{pk}' if pk is not None else None
+
+
+def _element(source, v):
+    """Ligne d'une source au format commun de la boîte de réception"""
+    if source == 'notification':
+        libelles = dict(Notification.TYPES_NOTIF)
+        return {
+            'id': _identifiant(source, v['id']), 'source': source, 'source_id': v['id'],
+            'type': v['type_notif'], 'titre': libelles.get(v['type_notif'], v['type_notif']),
+            'message': v['message'] or v['contenu'] or '', 'lien': v['lien'] or '',
+            'priorite': 'normale', 'lue': v['read'], 'created_at': v['created_at'],
+            'diligence_id': None, 'courrier_id': None,
+        }
+    if source == 'diligence':
+        libelles = dict(DiligenceNotification.TYPE_CHOICES)
+        return {
+            'id': _identifiant(source, v['id']), 'source': source, 'source_id': v['id'],
+            'type': v['type_notification'], 'titre': libelles.get(v['type_notification'], v['type_notification']),
+            'message': v['message'], 'lien': v['lien'],
+            'priorite': 'normale', 'lue': v['read'], 'created_at': v['created_at'],
+            'diligence_id': v['diligence_id'], 'courrier_id': None,
+        }
+    return {
+        'id': _identifiant(source, v['id']), 'source': source, 'source_id': v['id'],
+        'type': v['type_notification'], 'titre': v['titre'],
+        'message': v['message'], 'lien': '',
+        'priorite': v['priorite'], 'lue': v['lue'], 'created_at': v['created_at'],
+        'diligence_id': None, 'courrier_id': v['courrier_id'],
+    }
+
+
+def element_from_instance(instance):
+    """Élément de la boîte de réception pour une notification (sans requête)"""
+    source = SOURCE_PAR_MODELE[type(instance)]
+    return _element(source, {champ: getattr(instance, champ) for champ in CHAMPS[source]})
+
+
+def _cle_tri(element):
+    return element['created_at'], RANG[element['source']], element['source_id']
+
+
+def encode_cursor(element):
+    valeur = json.dumps([element['created_at'].isoformat(), element['source'], element['source_id']])
+    return base64.urlsafe_b64encode(valeur.encode()).decode()
+
+
+def decode_cursor(curseur):
+    """(created_at, source, id), ou ValueError si le curseur est invalide"""
+    try:
+        date, source, pk = json.loads(base64.urlsafe_b64decode(curseur.encode()))
+        if source not in SOURCES:
+            raise ValueError(source)
+        return datetime.fromisoformat(date), source, int(pk)
+    except (TypeError, ValueError, json.JSONDecodeError) as e:
+        raise ValueError(f"Curseur invalide: {curseur}") from e
+
+
+def _q_apres(source, curseur):
+    """Lignes d'une source situées après le curseur dans l'ordre décroissant"""
+    date, source_curseur, pk = curseur
+    q = Q(created_at__lt=date)
+    if RANG[source] < RANG[source_curseur]:
+        q |= Q(created_at=date)
+    elif source == source_curseur:
+        q |= Q(created_at=date, id__lt=pk)
+    return q
+
+
+def _lignes(source, user_id, curseur, limite, non_lues):
+    modele, champ_user, champ_lu = SOURCES[source]
+    qs = modele.objects.filter(**{f'{champ_user}_id': user_id})
+    if non_lues:
+        qs = qs.filter(**{champ_lu: False})
+    if curseur:
+        qs = qs.filter(_q_apres(source, curseur))
+    return [_element(source, v) for v in qs.order_by('-created_at', '-id').values(*CHAMPS[source])[:limite]]
+
+
+def inbox_page(user_id, curseur=None, limite=50, sources=None, non_lues=False):
+    """
+    Une page de la boîte de réception, du plus récent au plus ancien
+
+    Args:
+        curseur: valeur renvoyée comme `suivant` par la page précédente
+        sources: sous-ensemble de SOURCES (toutes par défaut)
+        non_lues: seulement les notifications non lues
+
+    Returns:
+        (éléments, curseur suivant ou None)
+    """
+    curseur = decode_cursor(curseur) if curseur else None
+    flux = [
+        _lignes(source, user_id, curseur, limite + 1, non_lues)
+        for source in (sources or SOURCES)
+    ]
+    fusion = list(islice(heapq.merge(*flux, key=_cle_tri, reverse=True), limite + 1))
+    elements = fusion[:limite]
+    suivant = encode_cursor(elements[-1]) if len(fusion) > limite else None
+    return elements, suivant
+
+
+# --- Compteurs de non lues ---
+
+def _redis():
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.CACHE_INVALIDATION_REDIS_URL, socket_timeout=2)
+    return _client
+
+
+def compter_non_lues(user_id):
+    """Compteurs lus en base : {source: nombre}"""
+    return {
+        source: modele.objects.filter(**{f'{champ_user}_id': user_id, champ_lu: False}).count()
+        for source, (modele, champ_user, champ_lu) in SOURCES.items()
+    }
+
+
+def unread_counts(user_id):
+    """
+    Notifications non lues de l'utilisateur, sans requête SQL si le hash est en cache
+
+    Returns:
+        dict: {'notification': n, 'diligence': n, 'courrier': n, 'total': n}
+    """
+    compteurs = None
+    if settings.CACHE_INVALIDATION_REDIS_URL:
+        try:
+            valeurs = _redis().hgetall(CLE_COMPTEURS.format(user_id))
+            if len(valeurs) == len(SOURCES):
+                compteurs = {source.decode(): max(0, int(n)) for source, n in valeurs.items()}
+        except redis.RedisError as e:
+            logger.debug(f"Compteurs de notifications indisponibles: {e}")
+    if compteurs is None:
+        compteurs = compter_non_lues(user_id)
+        _ecrire_compteurs(user_id, compteurs)
+    compteurs['total'] = sum(compteurs.values())
+    return compteurs
+
+
+def _ecrire_compteurs(user_id, compteurs):
+    if not settings.CACHE_INVALIDATION_REDIS_URL:
+        return
+    try:
+        cle = CLE_COMPTEURS.format(user_id)
+        pipe = _redis().pipeline()
+        pipe.hset(cle, mapping=compteurs)
+        pipe.expire(cle, DUREE_VIE_COMPTEURS)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.debug(f"Compteurs de notifications indisponibles: {e}")
+
+
+def adjust_unread(deltas):
+    """
+    Applique des variations {(user_id, source): delta} aux compteurs en cache
+
+    Seuls les hashes existants sont modifiés : un hash absent est recalculé
+    depuis la base à la prochaine lecture (unread_counts).
+    """
+    deltas = {cle: delta for cle, delta in deltas.items() if delta}
+    if not deltas or not settings.CACHE_INVALIDATION_REDIS_URL:
+        return
+    try:
+        client = _redis()
+        incrementer = client.register_script(_INCREMENTER_SI_EXISTE_LUA)
+        pipe = client.pipeline(transaction=False)
+        for (user_id, source), delta in deltas.items():
+            incrementer(keys=[CLE_COMPTEURS.format(user_id)], args=[source, delta, DUREE_VIE_COMPTEURS], client=pipe)
+        pipe.execute()
+    except redis.RedisError as e:
+        # Sans mise à jour, le compteur reste faux jusqu'à son expiration : on le supprime
+        logger.warning(f"Compteurs de notifications non mis à jour: {e}")
+        invalidate_unread({user_id for user_id, _ in deltas})
+
+
+def invalidate_unread(user_ids):
+    """Supprime les compteurs en cache (recalculés à la prochaine lecture) et prévient les flux"""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    if settings.CACHE_INVALIDATION_REDIS_URL:
+        try:
+            _redis().delete(*(CLE_COMPTEURS.format(user_id) for user_id in user_ids))
+        except redis.RedisError as e:
+            logger.warning(f"Compteurs de notifications non invalidés: {e}")
+    publish(user_ids, 'compteurs')
+
+
+def mark_read(user_id, elements=None):
+    """
+    Marque comme lues des notifications de l'utilisateur (toutes si elements est None)
+
+    Args:
+        elements: identifiants au format de la boîte de réception ('courrier-12', ...)
+
+    Returns:
+        int: nombre de notifications marquées
+    """
+    ids_par_source = {}
+    if elements is not None:
+        for element in elements:
+            source, _, pk = str(element).rpartition('-')
+            if source in SOURCES and pk.isdigit():
+                ids_par_source.setdefault(source, []).append(int(pk))
+
+    total = 0
+    for source, (modele, champ_user, champ_lu) in SOURCES.items():
+        if elements is not None and source not in ids_par_source:
+            continue
+        qs = modele.objects.filter(**{f'{champ_user}_id': user_id, champ_lu: False})
+        if elements is not None:
+            qs = qs.filter(id__in=ids_par_source[source])
+        valeurs = {champ_lu: True}
+        if modele is CourrierNotification:
+            valeurs['date_lecture'] = timezone.now()
+        total += qs.update(**valeurs)
+    if total:
+        transaction.on_commit(lambda: invalidate_unread([user_id]))
+    return total
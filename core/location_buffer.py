@@ -0,0 +1,351 @@
+"""
+Tampon d'écriture différée (write-behind) des positions GPS dans Redis
+
+Mode optionnel, activé par settings.LOCATION_BUFFER_ENABLED :
+- chaque point reçu est ajouté à un stream Redis au lieu d'être inséré en base
+- la dernière position de chaque agent est gardée dans un hash : la carte en direct
+  (AgentLocationViewSet.live) l'applique aux positions courantes, via merge_latest
+- la tâche flush_location_buffer écrit le stream par grands lots dans AgentLocation
+  via core.location_ingest.ingest_points (idempotent sur client_id)
+- des compteurs exposent la contre-pression (points en attente, retard, débit)
+
+Les messages ne sont acquittés qu'après l'écriture en base : un worker arrêté
+en cours de lot laisse ses messages en attente, repris au passage suivant.
+Un message illisible, ou le lot d'un agent dont l'écriture échoue, est copié
+dans le stream DEAD_LETTER_KEY puis acquitté : il ne bloque pas les suivants.
+"""
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from collections import defaultdict
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+
+import redis
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .location_ingest import ingest_points, resolve_agent_bureau
+from .models import AgentCurrentLocation
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY = 'ediligence:locations:stream'
+LATEST_KEY = 'ediligence:locations:latest'
+METRICS_KEY = 'ediligence:locations:metrics'
+DEAD_LETTER_KEY = 'ediligence:locations:dead'
+GROUP = 'flush'
+
+# Délai après lequel les messages non acquittés d'un autre worker sont repris
+RECLAIM_IDLE_MS = 60000
+# Taille maximale (approximative) du stream des messages rejetés
+DEAD_LETTER_MAXLEN = 100000
+
+# Mise à jour de la dernière position seulement si le point est plus récent
+_SET_LATEST_LUA = """
+local courant = redis.call('HGET', KEYS[1], ARGV[1])
+if courant then
+    local ts = cjson.decode(courant)['timestamp']
+    if ts and ts >= ARGV[3] then
+        return 0
+    end
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+return 1
+"""
+
+_client = None
+_set_latest = None
+
+
+def get_redis():
+    """Client Redis du tampon (créé une fois par processus)"""
+    global _client, _set_latest
+    if _client is None:
+        _client = redis.Redis.from_url(settings.LOCATION_BUFFER_REDIS_URL)
+        _set_latest = _client.register_script(_SET_LATEST_LUA)
+    return _client
+
+
+def is_enabled():
+    return getattr(settings, 'LOCATION_BUFFER_ENABLED', False)
+
+
+def _format_timestamp(value):
+    """Horodatage UTC à format fixe (comparable comme une chaîne)"""
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value.astimezone(dt_timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+def _encode_point(agent_id, point):
+    encoded = {
+        'agent_id': agent_id,
+        'client_id': point.get('client_id') or uuid.uuid4().hex,
+        'latitude': str(point['latitude']),
+        'longitude': str(point['longitude']),
+        'accuracy': point.get('accuracy'),
+        'is_background': bool(point.get('is_background', False)),
+        'battery_level': point.get('battery_level'),
+        'timestamp': _format_timestamp(point.get('timestamp') or timezone.now()),
+    }
+    # Informations calculées à la réception, utiles pour la lecture instantanée
+    for key in ('distance_bureau', 'dans_zone_autorisee'):
+        if point.get(key) is not None:
+            encoded[key] = point[key]
+    return encoded
+
+
+def _decode_point(data):
+    timestamp = parse_datetime(data['timestamp'])
+    if timestamp is None:
+        raise ValueError(f"Horodatage invalide: {data['timestamp']!r}")
+    return {
+        'client_id': data['client_id'],
+        'latitude': Decimal(data['latitude']),
+        'longitude': Decimal(data['longitude']),
+        'accuracy': data.get('accuracy'),
+        'is_background': data.get('is_background', False),
+        'battery_level': data.get('battery_level'),
+        'timestamp': timestamp,
+    }
+
+
+def buffer_points(agent_id, points):
+    """
+    Empile des positions validées dans le tampon Redis
+
+    Args:
+        agent_id: identifiant de l'utilisateur
+        points: liste de dicts validés (latitude, longitude, timestamp, client_id, ...)
+
+    Returns:
+        list: client_id des points empilés, ou None si le tampon est saturé ou
+        indisponible (l'appelant doit alors écrire directement en base)
+    """
+    try:
+        r = get_redis()
+        if r.xlen(STREAM_KEY) >= settings.LOCATION_BUFFER_MAX_PENDING:
+            r.hincrby(METRICS_KEY, 'refus_contre_pression', len(points))
+            return None
+
+        encoded = [_encode_point(agent_id, point) for point in points]
+        latest = max(encoded, key=lambda e: e['timestamp'])
+
+        pipe = r.pipeline(transaction=False)
+        for e in encoded:
+            pipe.xadd(STREAM_KEY, {'data': json.dumps(e)})
+        _set_latest(keys=[LATEST_KEY], args=[agent_id, json.dumps(latest), latest['timestamp']], client=pipe)
+        pipe.hincrby(METRICS_KEY, 'empiles', len(encoded))
+        pipe.execute()
+
+        return [e['client_id'] for e in encoded]
+    except redis.RedisError as e:
+        logger.warning(f"Tampon des positions indisponible, écriture directe: {e}")
+        return None
+
+
+def get_latest_positions(agent_ids=None):
+    """
+    Dernières positions connues, lues dans Redis sans requête SQL
+
+    Args:
+        agent_ids: identifiants à lire (None: tous les agents)
+
+    Returns:
+        dict: agent_id -> point (dict), vide si le tampon est indisponible
+    """
+    try:
+        r = get_redis()
+        if agent_ids is None:
+            raw = r.hgetall(LATEST_KEY).items()
+        else:
+            agent_ids = list(agent_ids)
+            if not agent_ids:
+                return {}
+            raw = zip(agent_ids, r.hmget(LATEST_KEY, agent_ids))
+        return {int(agent_id): json.loads(value) for agent_id, value in raw if value}
+    except redis.RedisError as e:
+        logger.warning(f"Tampon des positions indisponible, lecture de la projection seule: {e}")
+        return {}
+
+
+def merge_latest(positions, latest):
+    """
+    Applique aux positions courantes les points plus récents encore dans le tampon
+
+    Args:
+        positions: AgentCurrentLocation lues en base (agent chargé)
+        latest: résultat de get_latest_positions
+
+    Returns:
+        list: AgentCurrentLocation triées par agent, y compris les agents qui
+        n'ont encore que des points en attente (instances non enregistrées)
+    """
+    par_agent = {position.agent_id: position for position in positions}
+    manquants = [agent_id for agent_id in latest if agent_id not in par_agent]
+    for user in User.objects.filter(id__in=manquants):
+        par_agent[user.id] = AgentCurrentLocation(agent=user)
+
+    for agent_id, position in par_agent.items():
+        point = latest.get(agent_id)
+        timestamp = parse_datetime(point['timestamp']) if point else None
+        if timestamp is None or (position.timestamp and position.timestamp >= timestamp):
+            continue
+        position.location_id = None
+        position.latitude = Decimal(point['latitude'])
+        position.longitude = Decimal(point['longitude'])
+        position.accuracy = point.get('accuracy')
+        position.is_background = point.get('is_background', False)
+        position.battery_level = point.get('battery_level')
+        position.timestamp = timestamp
+        position.distance_bureau = point.get('distance_bureau')
+        position.dans_zone_autorisee = point.get('dans_zone_autorisee', True)
+        if position.dans_zone_autorisee:
+            position.derniere_dans_zone = timestamp
+    return [par_agent[agent_id] for agent_id in sorted(par_agent)]
+
+
+def _ensure_group(r):
+    try:
+        r.xgroup_create(STREAM_KEY, GROUP, id='0', mkstream=True)
+    except redis.ResponseError as e:
+        if 'BUSYGROUP' not in str(e):
+            raise
+
+
+def _read_entries(r, consumer, batch_size):
+    entries = []
+    # Reprendre d'abord les messages laissés par un worker arrêté
+    try:
+        claimed = r.xautoclaim(STREAM_KEY, GROUP, consumer, RECLAIM_IDLE_MS, '0-0', count=batch_size)
+        entries.extend(claimed[1])
+    except redis.ResponseError:
+        pass  # XAUTOCLAIM indisponible (Redis < 6.2)
+
+    if len(entries) < batch_size:
+        reponse = r.xreadgroup(GROUP, consumer, {STREAM_KEY: '>'}, count=batch_size - len(entries))
+        for _stream, messages in reponse or []:
+            entries.extend(messages)
+    return entries
+
+
+def _rejeter(pipe, message_id, fields, erreur):
+    """Copie un message dans le stream des rejets (il sera acquitté avec le lot)"""
+    pipe.xadd(DEAD_LETTER_KEY, {
+        'data': (fields or {}).get(b'data', b''),
+        'message_id': message_id,
+        'erreur': str(erreur)[:500],
+    }, maxlen=DEAD_LETTER_MAXLEN, approximate=True)
+
+
+def flush_buffer(batch_size=None):
+    """
+    Écrit un lot de positions du tampon dans AgentLocation
+
+    Chaque agent est écrit dans sa propre transaction : un message illisible ou
+    l'échec d'un agent n'empêche pas d'acquitter le reste du lot.
+
+    Returns:
+        int: nombre de messages traités (acquittés)
+    """
+    r = get_redis()
+    batch_size = batch_size or settings.LOCATION_BUFFER_FLUSH_BATCH
+    consumer = f"{socket.gethostname()}-{os.getpid()}"
+    _ensure_group(r)
+
+    debut = time.monotonic()
+    entries = _read_entries(r, consumer, batch_size)
+    if not entries:
+        return 0
+
+    pipe = r.pipeline(transaction=False)
+    message_ids = []
+    rejetes = 0
+    # agent_id -> [(message_id, fields, point)]
+    par_agent = defaultdict(list)
+    for message_id, fields in entries:
+        message_ids.append(message_id)
+        if not fields:
+            continue  # message supprimé entre-temps
+        try:
+            data = json.loads(fields[b'data'])
+            par_agent[int(data['agent_id'])].append((message_id, fields, _decode_point(data)))
+        except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+            logger.warning(f"Position illisible dans le tampon ({message_id}): {e}")
+            _rejeter(pipe, message_id, fields, e)
+            rejetes += 1
+
+    ecrits = 0
+    users = User.objects.filter(id__in=list(par_agent)).select_related('agent_profile__bureau', 'profile__service')
+    for user in users:
+        messages = sorted(par_agent[user.id], key=lambda message: message[2]['timestamp'])
+        points = [point for _, _, point in messages]
+        try:
+            with transaction.atomic():
+                ingest_points(user, points, resolve_agent_bureau(user, points[-1]['latitude'], points[-1]['longitude']))
+        except Exception as e:
+            logger.exception(f"Écriture des positions de l'agent {user.id} impossible, lot rejeté")
+            for message_id, fields, _ in messages:
+                _rejeter(pipe, message_id, fields, e)
+            rejetes += len(messages)
+            continue
+        ecrits += len(points)
+
+    # Acquitter seulement après l'écriture en base (ou la copie dans les rejets)
+    duree_ms = int((time.monotonic() - debut) * 1000)
+    pipe.xack(STREAM_KEY, GROUP, *message_ids)
+    pipe.xdel(STREAM_KEY, *message_ids)
+    pipe.hincrby(METRICS_KEY, 'ecrits', ecrits)
+    pipe.hincrby(METRICS_KEY, 'rejetes', rejetes)
+    pipe.hincrby(METRICS_KEY, 'ignores', len(message_ids) - ecrits - rejetes)
+    pipe.hincrby(METRICS_KEY, 'lots', 1)
+    pipe.hset(METRICS_KEY, mapping={
+        'dernier_lot_taille': len(message_ids),
+        'dernier_lot_duree_ms': duree_ms,
+        'dernier_lot_at': timezone.now().isoformat(),
+    })
+    pipe.execute()
+
+    return len(message_ids)
+
+
+def buffer_metrics():
+    """
+    Indicateurs du tampon pour le suivi de la contre-pression
+
+    Returns:
+        dict: compteurs cumulés, points en attente, retard du plus ancien point
+    """
+    r = get_redis()
+    metrics = {key.decode(): value.decode() for key, value in r.hgetall(METRICS_KEY).items()}
+
+    en_attente = r.xlen(STREAM_KEY)
+    try:
+        non_acquittes = r.xpending(STREAM_KEY, GROUP)['pending']
+    except redis.ResponseError:
+        non_acquittes = 0
+
+    retard_secondes = 0
+    premier = r.xrange(STREAM_KEY, count=1)
+    if premier:
+        premier_ms = int(premier[0][0].split(b'-')[0])
+        retard_secondes = max(0, round(time.time() - premier_ms / 1000, 1))
+
+    return {
+        'active': is_enabled(),
+        'en_attente': en_attente,
+        'non_acquittes': non_acquittes,
+        'retard_secondes': retard_secondes,
+        'capacite_max': settings.LOCATION_BUFFER_MAX_PENDING,
+        'taux_remplissage': round(en_attente / settings.LOCATION_BUFFER_MAX_PENDING, 4) if settings.LOCATION_BUFFER_MAX_PENDING else None,
+        'agents_suivis': r.hlen(LATEST_KEY),
+        'rejetes_conserves': r.xlen(DEAD_LETTER_KEY),
+        'compteurs': metrics,
+    }
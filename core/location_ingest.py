@@ -0,0 +1,202 @@
+"""
+Ingestion groupée des positions GPS envoyées par l'application mobile
+
+Un lot de points validés est traité en une passe :
+- dédoublonnage sur l'identifiant client (envoi idempotent), quel que soit
+  l'horodatage du renvoi
+- calcul vectorisé des distances au bureau
+- insertion avec bulk_create
+- avancement unique de l'état de sortie de zone de l'agent
+- mise à jour de la position courante (AgentCurrentLocation)
+"""
+import uuid
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .bureau_index import default_bureau, nearest_bureau
+from .geo_distance import distances_to_point
+from .geofencing_state import advance_geofence_state
+from .models import AgentCurrentLocation, AgentLocation
+
+# Nombre maximal de points acceptés par lot
+MAX_POINTS_PAR_LOT = 500
+
+
+def resolve_agent_bureau(user, latitude=None, longitude=None):
+    """
+    Bureau de référence d'un agent pour le géofencing
+
+    Un agent sans bureau assigné mais rattaché à un service est comparé au bureau
+    le plus proche du point reçu (index spatial en mémoire), à défaut au bureau
+    par défaut.
+
+    Returns:
+        Bureau ou None
+    """
+    bureau = None
+    try:
+        if hasattr(user, 'agent_profile'):
+            bureau = user.agent_profile.bureau
+        elif hasattr(user, 'profile') and user.profile.service:
+            if latitude is not None and longitude is not None:
+                bureau, _ = nearest_bureau(latitude, longitude)
+            else:
+                bureau = default_bureau()
+    except Exception:
+        pass
+    return bureau
+
+
+def update_current_location(location, derniere_dans_zone=None):
+    """
+    Reporte une position dans la projection AgentCurrentLocation, si elle est plus
+    récente que la position courante (une position arrivée en retard est ignorée)
+
+    Args:
+        location: AgentLocation enregistrée
+        derniere_dans_zone: horodatage de la dernière position dans la zone
+            (par défaut celui de `location` si elle est dans la zone)
+    """
+    if derniere_dans_zone is None and location.dans_zone_autorisee:
+        derniere_dans_zone = location.timestamp
+
+    champs = {
+        'location_id': location.id,
+        'latitude': location.latitude,
+        'longitude': location.longitude,
+        'accuracy': location.accuracy,
+        'timestamp': location.timestamp,
+        'is_background': location.is_background,
+        'battery_level': location.battery_level,
+        'distance_bureau': location.distance_bureau,
+        'dans_zone_autorisee': location.dans_zone_autorisee,
+        'updated_at': timezone.now(),
+    }
+    if derniere_dans_zone is not None:
+        champs['derniere_dans_zone'] = derniere_dans_zone
+
+    plus_recente = AgentCurrentLocation.objects.filter(agent_id=location.agent_id, timestamp__lte=location.timestamp)
+    if plus_recente.update(**champs):
+        return
+
+    try:
+        with transaction.atomic():
+            AgentCurrentLocation.objects.create(agent_id=location.agent_id, **champs)
+    except IntegrityError:
+        # Ligne créée entre-temps par une ingestion concurrente
+        plus_recente.update(**champs)
+
+
+def ingest_points(user, points, bureau=None):
+    """
+    Enregistre un lot de positions validées pour un agent
+
+    Args:
+        user: agent propriétaire des positions
+        points: liste de dicts validés (latitude, longitude, timestamp, client_id, ...)
+        bureau: bureau de référence (None: pas de calcul de distance)
+
+    Returns:
+        tuple: (résultats par point dans l'ordre de `points`, AgentLocation la plus récente créée ou None)
+    """
+    now = timezone.now()
+    for point in points:
+        point.setdefault('client_id', uuid.uuid4().hex)
+        point.setdefault('timestamp', now)
+
+    client_ids = [point['client_id'] for point in points]
+    existantes = {
+        row['client_id']: row
+        for row in AgentLocation.objects.filter(agent=user, client_id__in=client_ids).values(
+            'id', 'client_id', 'distance_bureau', 'dans_zone_autorisee'
+        )
+    }
+
+    # Points à créer (le premier d'un identifiant répété dans le lot l'emporte)
+    a_creer = []
+    vus = set(existantes)
+    for point in points:
+        if point['client_id'] not in vus:
+            vus.add(point['client_id'])
+            a_creer.append(point)
+
+    distances = None
+    if bureau is not None and a_creer:
+        distances = distances_to_point(
+            [point['latitude'] for point in a_creer],
+            [point['longitude'] for point in a_creer],
+            bureau.latitude_centre, bureau.longitude_centre
+        ).tolist()
+
+    locations = []
+    for i, point in enumerate(a_creer):
+        location = AgentLocation(
+            agent=user,
+            latitude=point['latitude'],
+            longitude=point['longitude'],
+            accuracy=point.get('accuracy'),
+            is_background=point.get('is_background', False),
+            battery_level=point.get('battery_level'),
+            timestamp=point['timestamp'],
+            client_id=point['client_id']
+        )
+        if distances is not None:
+            location.distance_bureau = distances[i]
+            location.dans_zone_autorisee = distances[i] <= bureau.rayon_metres
+        locations.append(location)
+
+    # ignore_conflicts : un renvoi concurrent du même lot ne crée pas de doublon
+    AgentLocation.objects.bulk_create(locations, batch_size=MAX_POINTS_PAR_LOT, ignore_conflicts=True)
+
+    # Les clés primaires ne sont pas renvoyées par MySQL : relecture par identifiant client.
+    # La contrainte unique inclut l'horodatage : un renvoi concurrent avec un autre
+    # horodatage a pu être inséré aussi ; le plus ancien enregistrement l'emporte.
+    nouveaux_ids, en_double = {}, []
+    for client_id, location_id in AgentLocation.objects.filter(
+        agent=user,
+        client_id__in=[location.client_id for location in locations]
+    ).order_by('id').values_list('client_id', 'id'):
+        if client_id in nouveaux_ids:
+            en_double.append(location_id)
+        else:
+            nouveaux_ids[client_id] = location_id
+    if en_double:
+        AgentLocation.objects.filter(id__in=en_double).delete()
+    for location in locations:
+        location.id = nouveaux_ids.get(location.client_id)
+
+    if bureau is not None and locations:
+        advance_geofence_state(user, bureau)
+
+    plus_recente = max(locations, key=lambda location: location.timestamp) if locations else None
+    if plus_recente is not None:
+        dans_zone = [location.timestamp for location in locations if location.dans_zone_autorisee]
+        update_current_location(plus_recente, max(dans_zone) if dans_zone else None)
+
+    crees = {location.client_id: location for location in locations}
+    points_crees = {id(point) for point in a_creer}
+    resultats = []
+    for point in points:
+        client_id = point['client_id']
+        if client_id in existantes:
+            row = existantes[client_id]
+            resultats.append({
+                'client_id': client_id,
+                'status': 'duplicate',
+                'location_id': row['id'],
+                'distance_bureau': row['distance_bureau'],
+                'dans_zone_autorisee': row['dans_zone_autorisee'],
+            })
+        else:
+            location = crees[client_id]
+            resultats.append({
+                'client_id': client_id,
+                'status': 'created' if id(point) in points_crees else 'duplicate',
+                'location_id': location.id,
+                'distance_bureau': location.distance_bureau,
+                'dans_zone_autorisee': location.dans_zone_autorisee,
+            })
+
+    return resultats, plus_recente
+
@@ -0,0 +1,218 @@
+"""
+Stockage partitionné par jour de AgentLocation et rétention des positions
+
+Sous MySQL, la table est partitionnée par RANGE sur TO_DAYS(timestamp), une
+partition par jour UTC (pAAAAMMJJ) plus une partition pmax de débordement.
+La rétention supprime des partitions entières (DROP PARTITION, instantané)
+au lieu d'un DELETE massif qui verrouille et fragmente la table.
+
+Les journées qui expirent sont d'abord agrégées (core.location_rollup).
+Sur les autres moteurs (SQLite en développement), la purge se fait par lots.
+
+Mise en place et maintenance : python manage.py location_partitions
+"""
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Min
+from django.utils import timezone
+
+from .location_rollup import day_bounds, rollup_day
+from .models import AgentLocation
+
+PARTITION_DEBORDEMENT = 'pmax'
+# Positions antérieures à la fenêtre de rétention lors de la mise en place
+PARTITION_ANCIENNES = 'p_anciennes'
+
+TAILLE_LOT_SUPPRESSION = 5000
+
+
+def _table():
+    return AgentLocation._meta.db_table
+
+
+def partition_name(day):
+    return f"p{day:%Y%m%d}"
+
+
+def partition_day(name):
+    """Jour couvert par une partition pAAAAMMJJ (None pour pmax ou un autre nom)"""
+    try:
+        return date(int(name[1:5]), int(name[5:7]), int(name[7:9]))
+    except (ValueError, IndexError):
+        return None
+
+
+def _partition_sql(day):
+    return (
+        f"PARTITION {partition_name(day)} "
+        f"VALUES LESS THAN (TO_DAYS('{day + timedelta(days=1):%Y-%m-%d}'))"
+    )
+
+
+def list_partitions():
+    """
+    Partitions existantes de la table des positions
+
+    Returns:
+        list: noms des partitions, dans l'ordre (vide si la table n'est pas partitionnée)
+    """
+    if connection.vendor != 'mysql':
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION",
+            [_table()]
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def is_partitioned():
+    return bool(list_partitions())
+
+
+def setup_partitioning(days_ahead=None, today=None):
+    """
+    Convertit la table des positions en table partitionnée par jour (MySQL uniquement)
+
+    Les positions antérieures à la fenêtre de rétention sont regroupées dans une
+    première partition, supprimée au prochain passage de la rétention.
+
+    Returns:
+        list: partitions créées
+    """
+    if connection.vendor != 'mysql':
+        raise RuntimeError("Le partitionnement n'est disponible que sous MySQL")
+    if is_partitioned():
+        return []
+
+    today = today or timezone.now().date()
+    days_ahead = settings.LOCATION_PARTITIONS_AHEAD if days_ahead is None else days_ahead
+    premier_jour = today - timedelta(days=settings.LOCATION_RETENTION_DAYS)
+
+    jours = [premier_jour + timedelta(days=i) for i in range((today - premier_jour).days + days_ahead + 1)]
+    partitions = [
+        f"PARTITION {PARTITION_ANCIENNES} VALUES LESS THAN (TO_DAYS('{premier_jour:%Y-%m-%d}'))"
+    ] + [_partition_sql(day) for day in jours] + [
+        f"PARTITION {PARTITION_DEBORDEMENT} VALUES LESS THAN MAXVALUE"
+    ]
+
+    table = connection.ops.quote_name(_table())
+    with connection.cursor() as cursor:
+        # La clé de partitionnement doit faire partie de la clé primaire
+        cursor.execute(f"ALTER TABLE {table} DROP PRIMARY KEY, ADD PRIMARY KEY (id, timestamp)")
+        cursor.execute(
+            f"ALTER TABLE {table} PARTITION BY RANGE (TO_DAYS(timestamp)) ({', '.join(partitions)})"
+        )
+    return [PARTITION_ANCIENNES] + [partition_name(day) for day in jours] + [PARTITION_DEBORDEMENT]
+
+
+def ensure_future_partitions(days_ahead=None, today=None):
+    """
+    Crée les partitions des prochains jours en découpant la partition pmax
+
+    Returns:
+        list: partitions créées
+    """
+    existantes = list_partitions()
+    if not existantes:
+        return []
+
+    today = today or timezone.now().date()
+    days_ahead = settings.LOCATION_PARTITIONS_AHEAD if days_ahead is None else days_ahead
+    jours_existants = [day for day in map(partition_day, existantes) if day]
+    depart = max(jours_existants) + timedelta(days=1) if jours_existants else today
+
+    jours = []
+    day = depart
+    while day <= today + timedelta(days=days_ahead):
+        jours.append(day)
+        day += timedelta(days=1)
+    if not jours:
+        return []
+
+    partitions = [_partition_sql(day) for day in jours] + [
+        f"PARTITION {PARTITION_DEBORDEMENT} VALUES LESS THAN MAXVALUE"
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"ALTER TABLE {connection.ops.quote_name(_table())} "
+            f"REORGANIZE PARTITION {PARTITION_DEBORDEMENT} INTO ({', '.join(partitions)})"
+        )
+    return [partition_name(day) for day in jours]
+
+
+def drop_partitions_before(cutoff):
+    """
+    Supprime les partitions dont toutes les positions sont antérieures au jour `cutoff`
+
+    Returns:
+        list: partitions supprimées
+    """
+    a_supprimer = []
+    for name in list_partitions():
+        day = partition_day(name)
+        if name == PARTITION_ANCIENNES or (day is not None and day < cutoff):
+            a_supprimer.append(name)
+
+    if a_supprimer:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {connection.ops.quote_name(_table())} DROP PARTITION {', '.join(a_supprimer)}"
+            )
+    return a_supprimer
+
+
+def delete_before_in_batches(cutoff_datetime, batch_size=TAILLE_LOT_SUPPRESSION):
+    """
+    Purge par lots de clés primaires (moteurs sans partitionnement)
+
+    Returns:
+        int: nombre de positions supprimées
+    """
+    total = 0
+    while True:
+        ids = list(
+            AgentLocation.objects.filter(timestamp__lt=cutoff_datetime)
+            .order_by().values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return total
+        total += AgentLocation.objects.filter(id__in=ids).delete()[0]
+
+
+def apply_location_retention(retention_days=None, now=None):
+    """
+    Agrège puis purge les journées de positions sorties de la fenêtre de rétention
+
+    Returns:
+        dict: journées agrégées, partitions supprimées / créées, lignes supprimées
+    """
+    now = now or timezone.now()
+    retention_days = settings.LOCATION_RETENTION_DAYS if retention_days is None else retention_days
+    cutoff = now.date() - timedelta(days=retention_days)
+    cutoff_datetime, _ = day_bounds(cutoff)
+
+    # 1. Agréger chaque journée qui va expirer (une seule fois : elle est purgée ensuite)
+    plus_ancienne = AgentLocation.objects.filter(timestamp__lt=cutoff_datetime).aggregate(
+        debut=Min('timestamp')
+    )['debut']
+    jours_agreges = []
+    if plus_ancienne:
+        day = plus_ancienne.date()
+        while day < cutoff:
+            if rollup_day(day):
+                jours_agreges.append(day)
+            day += timedelta(days=1)
+
+    # 2. Purger
+    resultat = {'jours_agreges': jours_agreges, 'partitions_supprimees': [], 'partitions_creees': [], 'lignes_supprimees': 0}
+    if is_partitioned():
+        resultat['partitions_supprimees'] = drop_partitions_before(cutoff)
+        resultat['partitions_creees'] = ensure_future_partitions(today=now.date())
+    else:
+        resultat['lignes_supprimees'] = delete_before_in_batches(cutoff_datetime)
+    return resultat
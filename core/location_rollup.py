@@ -0,0 +1,117 @@
+"""
+Agrégation horaire des positions GPS (AgentLocationHourly)
+
+Calculée pour chaque journée avant la purge des positions brutes, et recalculée
+sans risque (une journée est remplacée en entier) : les points arrivés en retard
+depuis l'application mobile sont pris en compte au passage suivant.
+
+Le temps dans / hors zone est estimé à partir de l'intervalle entre deux positions
+consécutives, attribué à l'état de la première ; un trou de plus de
+INTERVALLE_MAX_SECONDES (téléphone éteint, pas de réseau) n'est pas compté.
+"""
+from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
+
+from django.db import transaction
+
+from .models import AgentLocation, AgentLocationHourly
+
+# Au-delà de cet écart entre deux positions, la durée n'est pas attribuée
+INTERVALLE_MAX_SECONDES = 15 * 60
+
+TAILLE_LOT = 5000
+
+
+def day_bounds(day):
+    """Début et fin (exclue) d'une journée UTC"""
+    start = datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+    return start, start + timedelta(days=1)
+
+
+def _new_bucket(agent_id, heure, timestamp):
+    return {
+        'agent_id': agent_id,
+        'heure': heure,
+        'nb_points': 0,
+        'distance_min': None,
+        'distance_max': None,
+        'somme_distances': 0.0,
+        'nb_distances': 0,
+        'secondes_dans_zone': 0,
+        'secondes_hors_zone': 0,
+        'premiere_position': timestamp,
+        'derniere_position': timestamp,
+    }
+
+
+def compute_hourly_rollups(rows):
+    """
+    Agrège des positions triées par (agent, horodatage), en une seule passe
+
+    Args:
+        rows: itérable de tuples (agent_id, timestamp, distance_bureau, dans_zone_autorisee)
+
+    Returns:
+        list: un dict par (agent, heure), champs de AgentLocationHourly
+    """
+    buckets = []
+    bucket = None
+    precedent = None  # (agent_id, timestamp, dans_zone, bucket) de la position précédente
+
+    for agent_id, timestamp, distance, dans_zone in rows:
+        heure = timestamp.replace(minute=0, second=0, microsecond=0)
+
+        # Durée depuis la position précédente du même agent
+        if precedent and precedent[0] == agent_id:
+            ecart = (timestamp - precedent[1]).total_seconds()
+            if 0 < ecart <= INTERVALLE_MAX_SECONDES:
+                cle = 'secondes_dans_zone' if precedent[2] else 'secondes_hors_zone'
+                precedent[3][cle] += int(ecart)
+
+        if bucket is None or bucket['agent_id'] != agent_id or bucket['heure'] != heure:
+            bucket = _new_bucket(agent_id, heure, timestamp)
+            buckets.append(bucket)
+
+        bucket['nb_points'] += 1
+        bucket['derniere_position'] = timestamp
+        if distance is not None:
+            bucket['distance_min'] = distance if bucket['distance_min'] is None else min(bucket['distance_min'], distance)
+            bucket['distance_max'] = distance if bucket['distance_max'] is None else max(bucket['distance_max'], distance)
+            bucket['somme_distances'] += distance
+            bucket['nb_distances'] += 1
+
+        precedent = (agent_id, timestamp, dans_zone, bucket)
+
+    for bucket in buckets:
+        nb_distances = bucket.pop('nb_distances')
+        somme = bucket.pop('somme_distances')
+        bucket['distance_moyenne'] = somme / nb_distances if nb_distances else None
+
+    return buckets
+
+
+def rollup_day(day):
+    """
+    (Re)calcule les agrégats horaires d'une journée UTC à partir des positions brutes
+
+    Returns:
+        int: nombre d'agrégats enregistrés (0 si la journée n'a plus de positions)
+    """
+    start, end = day_bounds(day)
+    rows = (
+        AgentLocation.objects.filter(timestamp__gte=start, timestamp__lt=end)
+        .order_by('agent_id', 'timestamp')
+        .values_list('agent_id', 'timestamp', 'distance_bureau', 'dans_zone_autorisee')
+        .iterator(chunk_size=TAILLE_LOT)
+    )
+    buckets = compute_hourly_rollups(rows)
+    if not buckets:
+        return 0
+
+    with transaction.atomic():
+        AgentLocationHourly.objects.filter(heure__gte=start, heure__lt=end).delete()
+        AgentLocationHourly.objects.bulk_create(
+            [AgentLocationHourly(**bucket) for bucket in buckets],
+            batch_size=TAILLE_LOT
+        )
+    return len(buckets)
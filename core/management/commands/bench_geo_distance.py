@@ -0,0 +1,133 @@
+import math
+import random
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from core.geo_distance import distance_matrix, distances_to_point, haversine, pairwise_distances
+
+
+def legacy_haversine_atan2(lat1, lon1, lat2, lon2):
+    """Ancienne version (geofencing_utils / geofencing_tasks / geofencing_views)"""
+    R = 6371000
+    lat1_rad = math.radians(float(lat1))
+    lon1_rad = math.radians(float(lon1))
+    lat2_rad = math.radians(float(lat2))
+    lon2_rad = math.radians(float(lon2))
+    dlat = lat2_rad - lat1_rad
+    dlon = lon2_rad - lon1_rad
+    a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    return R * c
+
+
+def legacy_haversine_asin(lat1, lon1, lat2, lon2):
+    """Ancienne version imbriquée dans SimplePresenceView / PresenceViewSet"""
+    R = 6371000
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = math.radians(lat2 - lat1)
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi/2)**2 + math.cos(phi1)*math.cos(phi2)*math.sin(dlambda/2)**2
+    c = 2*math.asin(math.sqrt(a))
+    return R * c
+
+
+class Command(BaseCommand):
+    help = 'Compare le noyau Haversine vectorisé aux anciennes implémentations (exactitude et temps)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--points', type=int, default=100000, help='Nombre de positions simulées')
+        parser.add_argument('--bureaux', type=int, default=20, help='Nombre de bureaux simulés')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        n = options['points']
+        m = options['bureaux']
+
+        # Positions autour d'Abidjan, jusqu'à ~50 km du centre
+        lats = [5.36 + rng.uniform(-0.5, 0.5) for _ in range(n)]
+        lons = [-4.00 + rng.uniform(-0.5, 0.5) for _ in range(n)]
+        b_lats = [5.36 + rng.uniform(-0.05, 0.05) for _ in range(m)]
+        b_lons = [-4.00 + rng.uniform(-0.05, 0.05) for _ in range(m)]
+
+        self.stdout.write(f"📏 Benchmark Haversine: {n} positions, {m} bureaux")
+        self.stdout.write("=" * 60)
+
+        # 1. Plusieurs positions contre un bureau
+        start = time.perf_counter()
+        legacy = [legacy_haversine_atan2(la, lo, b_lats[0], b_lons[0]) for la, lo in zip(lats, lons)]
+        t_legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        legacy_asin = [legacy_haversine_asin(la, lo, b_lats[0], b_lons[0]) for la, lo in zip(lats, lons)]
+        t_legacy_asin = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scalar = [haversine(la, lo, b_lats[0], b_lons[0]) for la, lo in zip(lats, lons)]
+        t_scalar = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vector = distances_to_point(lats, lons, b_lats[0], b_lons[0])
+        t_vector = time.perf_counter() - start
+
+        legacy = np.asarray(legacy)
+        ecart_atan2 = float(np.max(np.abs(vector - legacy)))
+        ecart_asin = float(np.max(np.abs(vector - np.asarray(legacy_asin))))
+        ecart_scalar = float(np.max(np.abs(np.asarray(scalar) - legacy)))
+
+        self.stdout.write("\n1. POSITIONS CONTRE UN BUREAU")
+        self.stdout.write(f"   Ancienne version (atan2): {t_legacy*1000:.1f} ms")
+        self.stdout.write(f"   Ancienne version (asin):  {t_legacy_asin*1000:.1f} ms")
+        self.stdout.write(f"   Scalaire partagé:         {t_scalar*1000:.1f} ms")
+        self.stdout.write(f"   Vectorisé:                {t_vector*1000:.1f} ms (x{t_legacy / max(t_vector, 1e-9):.0f})")
+        self.stdout.write(f"   Écart max vs atan2: {ecart_atan2:.2e} m | vs asin: {ecart_asin:.2e} m | scalaire: {ecart_scalar:.2e} m")
+
+        # 2. Chaque position contre son propre bureau
+        owners = [rng.randrange(m) for _ in range(n)]
+        ref_lats = [b_lats[i] for i in owners]
+        ref_lons = [b_lons[i] for i in owners]
+
+        start = time.perf_counter()
+        legacy_pairs = np.asarray([
+            legacy_haversine_atan2(la, lo, rla, rlo)
+            for la, lo, rla, rlo in zip(lats, lons, ref_lats, ref_lons)
+        ])
+        t_legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pairs = pairwise_distances(lats, lons, ref_lats, ref_lons)
+        t_vector = time.perf_counter() - start
+        ecart_pairs = float(np.max(np.abs(pairs - legacy_pairs)))
+
+        self.stdout.write("\n2. CHAQUE POSITION CONTRE SON BUREAU")
+        self.stdout.write(f"   Ancienne version: {t_legacy*1000:.1f} ms | Vectorisé: {t_vector*1000:.1f} ms")
+        self.stdout.write(f"   Écart max: {ecart_pairs:.2e} m")
+
+        # 3. Positions contre tous les bureaux
+        sample = min(n, 10000)
+        start = time.perf_counter()
+        legacy_matrix = np.asarray([
+            [legacy_haversine_atan2(la, lo, bla, blo) for bla, blo in zip(b_lats, b_lons)]
+            for la, lo in zip(lats[:sample], lons[:sample])
+        ])
+        t_legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matrix = distance_matrix(lats[:sample], lons[:sample], b_lats, b_lons)
+        t_vector = time.perf_counter() - start
+        ecart_matrix = float(np.max(np.abs(matrix - legacy_matrix)))
+
+        self.stdout.write(f"\n3. {sample} POSITIONS CONTRE {m} BUREAUX")
+        self.stdout.write(f"   Ancienne version: {t_legacy*1000:.1f} ms | Vectorisé: {t_vector*1000:.1f} ms")
+        self.stdout.write(f"   Écart max: {ecart_matrix:.2e} m")
+
+        # Tolérance: 1 mm, largement sous la précision GPS
+        tolerance = 1e-3
+        ecart_max = max(ecart_atan2, ecart_asin, ecart_scalar, ecart_pairs, ecart_matrix)
+        if ecart_max <= tolerance:
+            self.stdout.write(self.style.SUCCESS(f"\n✅ Résultats identiques aux anciennes versions (écart max {ecart_max:.2e} m)"))
+        else:
+            self.stdout.write(self.style.ERROR(f"\n❌ Écart trop important: {ecart_max:.2e} m > {tolerance} m"))
@@ -0,0 +1,70 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.location_partitions import (
+    apply_location_retention, ensure_future_partitions, list_partitions, setup_partitioning
+)
+from core.location_rollup import rollup_day
+
+
+class Command(BaseCommand):
+    help = 'Gère le partitionnement journalier des positions GPS, les agrégats horaires et la rétention'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--init',
+            action='store_true',
+            help='Convertit la table des positions en table partitionnée par jour (MySQL, une seule fois)'
+        )
+        parser.add_argument(
+            '--rollup',
+            type=date.fromisoformat,
+            metavar='AAAA-MM-JJ',
+            help='(Re)calcule les agrégats horaires d\'une journée'
+        )
+        parser.add_argument(
+            '--retention',
+            action='store_true',
+            help='Agrège puis purge les journées expirées et crée les partitions à venir'
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=None,
+            help='Nombre de jours conservés (défaut: LOCATION_RETENTION_DAYS)'
+        )
+
+    def handle(self, *args, **options):
+        if options['init']:
+            try:
+                creees = setup_partitioning()
+            except RuntimeError as e:
+                raise CommandError(str(e))
+            if creees:
+                self.stdout.write(self.style.SUCCESS(f'✅ Table partitionnée: {len(creees)} partitions'))
+            else:
+                self.stdout.write('Table déjà partitionnée')
+
+        if options['rollup']:
+            count = rollup_day(options['rollup'])
+            self.stdout.write(f"📊 {count} agrégats horaires pour le {options['rollup']:%d/%m/%Y}")
+
+        if options['retention']:
+            resultat = apply_location_retention(retention_days=options['days'])
+            self.stdout.write(f"📊 Journées agrégées: {', '.join(map(str, resultat['jours_agreges'])) or 'aucune'}")
+            if resultat['partitions_supprimees'] or resultat['partitions_creees']:
+                self.stdout.write(f"🗑️  Partitions supprimées: {', '.join(resultat['partitions_supprimees']) or 'aucune'}")
+                self.stdout.write(f"➕ Partitions créées: {', '.join(resultat['partitions_creees']) or 'aucune'}")
+            else:
+                self.stdout.write(f"🗑️  Positions supprimées: {resultat['lignes_supprimees']}")
+
+        if not (options['init'] or options['rollup'] or options['retention']):
+            partitions = list_partitions()
+            if not partitions:
+                self.stdout.write('Table des positions non partitionnée')
+                return
+            creees = ensure_future_partitions()
+            if creees:
+                self.stdout.write(f"➕ Partitions créées: {', '.join(creees)}")
+            self.stdout.write(f"{len(partitions) + len(creees)} partitions: {partitions[0]} … {partitions[-1]}")
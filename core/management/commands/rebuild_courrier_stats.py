@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from core.courrier_stats import rebuild_all
+
+
+class Command(BaseCommand):
+    help = 'Reconstruit les statistiques quotidiennes des courriers (CourrierStatsJour)'
+
+    def handle(self, *args, **options):
+        total = rebuild_all()
+        self.stdout.write(self.style.SUCCESS(f'Statistiques des courriers reconstruites : {total} ligne(s)'))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from core.diligence_visibility import rebuild_all
+
+
+class Command(BaseCommand):
+    help = 'Reconstruit l\'index de visibilité des diligences (DiligenceVisibility)'
+
+    def handle(self, *args, **options):
+        ajoutees, supprimees = rebuild_all()
+        self.stdout.write(self.style.SUCCESS(
+            f'Index de visibilité reconstruit : {ajoutees} ligne(s) ajoutée(s), {supprimees} supprimée(s)'
+        ))
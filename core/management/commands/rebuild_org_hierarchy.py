@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from core.org_hierarchy import rebuild_all
+from core.org_scope import invalidate_org_scopes
+
+
+class Command(BaseCommand):
+    help = 'Reconstruit la table de fermeture de l\'organigramme (OrgClosure)'
+
+    def handle(self, *args, **options):
+        total = rebuild_all()
+        invalidate_org_scopes()
+        self.stdout.write(self.style.SUCCESS(f'Organigramme reconstruit : {total} lien(s)'))
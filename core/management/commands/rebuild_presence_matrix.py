@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from core.presence_matrix import rebuild_all
+
+
+class Command(BaseCommand):
+    help = 'Reconstruit la matrice de présence (PresenceJour) depuis les présences, occurrences, congés et absences'
+
+    def handle(self, *args, **options):
+        total = rebuild_all()
+        self.stdout.write(self.style.SUCCESS(f'Matrice de présence reconstruite : {total} jour(s)'))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from core.search_index import rebuild_all
+
+
+class Command(BaseCommand):
+    help = 'Reconstruit l\'index de recherche plein texte (courriers, diligences, tâches)'
+
+    def handle(self, *args, **options):
+        total = rebuild_all()
+        self.stdout.write(self.style.SUCCESS(f'Index de recherche reconstruit : {total} terme(s)'))
@@ -0,0 +1,35 @@
+# Generated migration
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0100_add_rappel_traitement_to_courrier'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AgentGeofenceState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text="Journée à laquelle se rapporte l'état")),
+                ('est_dans_zone', models.BooleanField(default=True)),
+                ('hors_zone_depuis', models.DateTimeField(blank=True, help_text='Horodatage de la première position hors zone de la sortie en cours', null=True)),
+                ('derniere_position_id', models.BigIntegerField(default=0, help_text='Identifiant de la dernière AgentLocation traitée')),
+                ('derniere_position_timestamp', models.DateTimeField(blank=True, null=True)),
+                ('derniere_distance', models.FloatField(blank=True, help_text='Distance au bureau de la dernière position prise en compte', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('agent', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='geofence_state', to=settings.AUTH_USER_MODEL)),
+                ('bureau', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='geofence_states', to='core.bureau')),
+            ],
+            options={
+                'verbose_name': 'État de géofencing agent',
+                'verbose_name_plural': 'États de géofencing agents',
+            },
+        ),
+    ]
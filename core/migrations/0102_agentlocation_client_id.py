@@ -0,0 +1,30 @@
+# Generated migration
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0101_agentgeofencestate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='agentlocation',
+            name='client_id',
+            field=models.CharField(blank=True, help_text="Identifiant du point côté application (envoi idempotent)", max_length=64, null=True),
+        ),
+        migrations.AlterField(
+            model_name='agentlocation',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text="Horodatage de la capture (fourni par l'application si disponible)"),
+        ),
+        migrations.AlterUniqueTogether(
+            name='agentlocation',
+            unique_together={('agent', 'client_id')},
+        ),
+    ]
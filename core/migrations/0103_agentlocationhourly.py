@@ -0,0 +1,48 @@
+# Generated migration
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0102_agentlocation_client_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='agentlocation',
+            name='agent',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='locations', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterUniqueTogether(
+            name='agentlocation',
+            unique_together={('agent', 'client_id', 'timestamp')},
+        ),
+        migrations.CreateModel(
+            name='AgentLocationHourly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('heure', models.DateTimeField(help_text="Début de l'heure (UTC)")),
+                ('nb_points', models.PositiveIntegerField(default=0)),
+                ('distance_min', models.FloatField(blank=True, help_text='Distance minimale au bureau (mètres)', null=True)),
+                ('distance_max', models.FloatField(blank=True, help_text='Distance maximale au bureau (mètres)', null=True)),
+                ('distance_moyenne', models.FloatField(blank=True, help_text='Distance moyenne au bureau (mètres)', null=True)),
+                ('secondes_dans_zone', models.PositiveIntegerField(default=0, help_text='Temps estimé dans la zone autorisée')),
+                ('secondes_hors_zone', models.PositiveIntegerField(default=0, help_text='Temps estimé hors de la zone autorisée')),
+                ('premiere_position', models.DateTimeField()),
+                ('derniere_position', models.DateTimeField()),
+                ('agent', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='location_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Agrégat horaire des positions',
+                'verbose_name_plural': 'Agrégats horaires des positions',
+                'ordering': ['-heure'],
+                'unique_together': {('agent', 'heure')},
+                'indexes': [models.Index(fields=['heure'], name='core_agentl_heure_4abbfd_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated migration
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+
+
+def remplir_positions_courantes(apps, schema_editor):
+    """Initialise la projection avec la dernière position connue de chaque agent"""
+    AgentLocation = apps.get_model('core', 'AgentLocation')
+    AgentCurrentLocation = apps.get_model('core', 'AgentCurrentLocation')
+
+    derniere = AgentLocation.objects.filter(agent=OuterRef('agent')).order_by('-timestamp', '-id').values('id')[:1]
+    dernieres = AgentLocation.objects.filter(id=Subquery(derniere)).order_by()
+    dans_zone = dict(
+        AgentLocation.objects.filter(dans_zone_autorisee=True).order_by()
+        .values('agent_id').annotate(derniere=Max('timestamp')).values_list('agent_id', 'derniere')
+    )
+
+    AgentCurrentLocation.objects.bulk_create([
+        AgentCurrentLocation(
+            agent_id=location.agent_id,
+            location_id=location.id,
+            latitude=location.latitude,
+            longitude=location.longitude,
+            accuracy=location.accuracy,
+            timestamp=location.timestamp,
+            is_background=location.is_background,
+            battery_level=location.battery_level,
+            distance_bureau=location.distance_bureau,
+            dans_zone_autorisee=location.dans_zone_autorisee,
+            derniere_dans_zone=dans_zone.get(location.agent_id),
+        )
+        for location in dernieres.iterator()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0103_agentlocationhourly'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AgentCurrentLocation',
+            fields=[
+                ('agent', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='current_location', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('location_id', models.BigIntegerField(blank=True, help_text='Position AgentLocation correspondante', null=True)),
+                ('latitude', models.DecimalField(decimal_places=17, max_digits=22)),
+                ('longitude', models.DecimalField(decimal_places=17, max_digits=22)),
+                ('accuracy', models.FloatField(blank=True, null=True)),
+                ('timestamp', models.DateTimeField(db_index=True)),
+                ('is_background', models.BooleanField(default=False)),
+                ('battery_level', models.IntegerField(blank=True, null=True)),
+                ('distance_bureau', models.FloatField(blank=True, null=True)),
+                ('dans_zone_autorisee', models.BooleanField(default=True)),
+                ('derniere_dans_zone', models.DateTimeField(blank=True, help_text='Horodatage de la dernière position dans la zone autorisée', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Position courante agent',
+                'verbose_name_plural': 'Positions courantes agents',
+            },
+        ),
+        migrations.RunPython(remplir_positions_courantes, migrations.RunPython.noop),
+    ]
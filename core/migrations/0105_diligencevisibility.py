@@ -0,0 +1,79 @@
+# Generated migration
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Q
+
+
+def remplir_visibilites(apps, schema_editor):
+    """Construit l'index de visibilité à partir des affectations et des profils existants"""
+    Diligence = apps.get_model('core', 'Diligence')
+    DiligenceVisibility = apps.get_model('core', 'DiligenceVisibility')
+    ImputationAccess = apps.get_model('core', 'ImputationAccess')
+    ImputationFile = apps.get_model('core', 'ImputationFile')
+    UserProfile = apps.get_model('core', 'UserProfile')
+
+    lignes = set()
+    lignes.update(
+        (user_id, diligence_id, 'assigne')
+        for user_id, diligence_id in Diligence.agents.through.objects.values_list('user_id', 'diligence_id')
+    )
+    lignes.update(
+        (user_id, diligence_id, 'imputation_acces')
+        for user_id, diligence_id in ImputationAccess.objects.values_list('user_id', 'diligence_id')
+    )
+    lignes.update(
+        (user_id, diligence_id, 'imputation_fichier')
+        for user_id, diligence_id in ImputationFile.objects.values_list('agent_id', 'diligence_id')
+    )
+
+    directeurs = UserProfile.objects.filter(role='DIRECTEUR', service__direction__isnull=False)
+    for user_id, direction_id in directeurs.values_list('user_id', 'service__direction_id'):
+        diligences = Diligence.objects.filter(
+            Q(direction_id=direction_id) |
+            Q(services_concernes__direction_id=direction_id) |
+            Q(courrier__service__direction_id=direction_id) |
+            Q(agents__profile__service__direction_id=direction_id)
+        ).order_by().values_list('id', flat=True).distinct()
+        lignes.update((user_id, diligence_id, 'direction') for diligence_id in diligences)
+
+    superieurs = UserProfile.objects.filter(role='SUPERIEUR', service__isnull=False)
+    for user_id, service_id in superieurs.values_list('user_id', 'service_id'):
+        diligences = Diligence.objects.filter(
+            Q(services_concernes=service_id) |
+            Q(courrier__service_id=service_id) |
+            Q(agents__profile__service_id=service_id)
+        ).order_by().values_list('id', flat=True).distinct()
+        lignes.update((user_id, diligence_id, 'service') for diligence_id in diligences)
+
+    DiligenceVisibility.objects.bulk_create([
+        DiligenceVisibility(user_id=user_id, diligence_id=diligence_id, raison=raison)
+        for user_id, diligence_id, raison in lignes
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0104_agentcurrentlocation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DiligenceVisibility',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('raison', models.CharField(choices=[('assigne', 'Agent assigné'), ('imputation_acces', 'Accès par imputation'), ('imputation_fichier', "Fichier d'imputation"), ('direction', 'Directeur de la direction'), ('service', 'Supérieur du service')], max_length=20)),
+                ('diligence', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='visibilites', to='core.diligence')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='diligences_visibles', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Visibilité de diligence',
+                'verbose_name_plural': 'Visibilités de diligences',
+                'unique_together': {('user', 'diligence', 'raison')},
+            },
+        ),
+        migrations.RunPython(remplir_visibilites, migrations.RunPython.noop),
+    ]
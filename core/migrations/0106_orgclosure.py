@@ -0,0 +1,89 @@
+# Generated migration
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def remplir_fermeture(apps, schema_editor):
+    """Construit la table de fermeture à partir de l'organigramme existant"""
+    Direction = apps.get_model('core', 'Direction')
+    SousDirection = apps.get_model('core', 'SousDirection')
+    Service = apps.get_model('core', 'Service')
+    UserProfile = apps.get_model('core', 'UserProfile')
+    Agent = apps.get_model('core', 'Agent')
+    OrgClosure = apps.get_model('core', 'OrgClosure')
+
+    lignes = {}
+
+    def ajouter(ancetre, descendant, profondeur):
+        cle = (ancetre, descendant)
+        if profondeur < lignes.get(cle, 99):
+            lignes[cle] = profondeur
+
+    for direction_id in Direction.objects.values_list('id', flat=True):
+        ajouter(('direction', direction_id), ('direction', direction_id), 0)
+    for sd_id, direction_id in SousDirection.objects.values_list('id', 'direction_id'):
+        ajouter(('sous_direction', sd_id), ('sous_direction', sd_id), 0)
+        ajouter(('direction', direction_id), ('sous_direction', sd_id), 1)
+
+    chemins_services = {}
+    for service_id, direction_id, sd_id, sd_direction_id in Service.objects.values_list(
+            'id', 'direction_id', 'sous_direction_id', 'sous_direction__direction_id'):
+        chemin = {('service', service_id): 0}
+        if sd_id:
+            chemin[('sous_direction', sd_id)] = 1
+        if sd_direction_id:
+            chemin[('direction', sd_direction_id)] = 2
+        if direction_id:
+            chemin[('direction', direction_id)] = 1
+        chemins_services[service_id] = chemin
+        for ancetre, profondeur in chemin.items():
+            ajouter(ancetre, ('service', service_id), profondeur)
+
+    services_par_user = defaultdict(set)
+    for user_id, service_id in UserProfile.objects.values_list('user_id', 'service_id'):
+        services_par_user[user_id].add(service_id)
+    for user_id, service_id in Agent.objects.values_list('user_id', 'service_id'):
+        services_par_user[user_id].add(service_id)
+    for user_id, service_ids in services_par_user.items():
+        ajouter(('user', user_id), ('user', user_id), 0)
+        for service_id in service_ids:
+            for ancetre, profondeur in chemins_services.get(service_id, {}).items():
+                ajouter(ancetre, ('user', user_id), profondeur + 1)
+
+    OrgClosure.objects.bulk_create([
+        OrgClosure(
+            ancetre_type=ancetre[0], ancetre_id=ancetre[1],
+            descendant_type=descendant[0], descendant_id=descendant[1], profondeur=profondeur
+        )
+        for (ancetre, descendant), profondeur in lignes.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0105_diligencevisibility'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrgClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ancetre_type', models.CharField(choices=[('direction', 'Direction'), ('sous_direction', 'Sous-direction'), ('service', 'Service'), ('user', 'Utilisateur')], max_length=16)),
+                ('ancetre_id', models.BigIntegerField()),
+                ('descendant_type', models.CharField(choices=[('direction', 'Direction'), ('sous_direction', 'Sous-direction'), ('service', 'Service'), ('user', 'Utilisateur')], max_length=16)),
+                ('descendant_id', models.BigIntegerField()),
+                ('profondeur', models.PositiveSmallIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Lien hiérarchique',
+                'verbose_name_plural': 'Liens hiérarchiques',
+                'unique_together': {('ancetre_type', 'ancetre_id', 'descendant_type', 'descendant_id')},
+                'indexes': [models.Index(fields=['descendant_type', 'descendant_id'], name='core_orgclosure_desc_idx')],
+            },
+        ),
+        migrations.RunPython(remplir_fermeture, migrations.RunPython.noop),
+    ]
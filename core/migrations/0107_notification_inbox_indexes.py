@@ -0,0 +1,25 @@
+# Generated migration
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0106_orgclosure'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='courriernotification',
+            index=models.Index(fields=['utilisateur', '-created_at', '-id'], name='core_cnotif_inbox_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='diligencenotification',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='core_dnotif_inbox_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='core_notif_inbox_idx'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated migration
+
+from django.db import migrations, models
+
+
+def remplir_index(apps, schema_editor):
+    """Indexe les courriers, diligences et tâches existants"""
+    from core.search_index import POIDS_CHAMPS, termes_ponderes
+
+    SearchTerm = apps.get_model('core', 'SearchTerm')
+    modeles = {
+        'courrier': apps.get_model('core', 'Courrier'),
+        'diligence': apps.get_model('core', 'Diligence'),
+        'tache': apps.get_model('core', 'Tache'),
+    }
+    for type_objet, modele in modeles.items():
+        poids_champs = POIDS_CHAMPS[type_objet]
+        lignes = []
+        for valeurs in modele.objects.values('id', *poids_champs).iterator(chunk_size=1000):
+            lignes.extend(
+                SearchTerm(terme=terme, type_objet=type_objet, objet_id=valeurs['id'], poids=poids)
+                for terme, poids in termes_ponderes(valeurs, poids_champs).items()
+            )
+            if len(lignes) >= 5000:
+                SearchTerm.objects.bulk_create(lignes, batch_size=1000)
+                lignes = []
+        SearchTerm.objects.bulk_create(lignes, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0107_notification_inbox_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('terme', models.CharField(max_length=64)),
+                ('type_objet', models.CharField(choices=[('courrier', 'Courrier'), ('diligence', 'Diligence'), ('tache', 'Tâche')], max_length=16)),
+                ('objet_id', models.BigIntegerField()),
+                ('poids', models.PositiveIntegerField(default=1)),
+            ],
+            options={
+                'verbose_name': 'Terme indexé',
+                'verbose_name_plural': 'Termes indexés',
+                'indexes': [models.Index(fields=['type_objet', 'terme'], name='core_searchterm_terme_idx')],
+                'unique_together': {('type_objet', 'objet_id', 'terme')},
+            },
+        ),
+        migrations.RunPython(remplir_index, migrations.RunPython.noop),
+    ]
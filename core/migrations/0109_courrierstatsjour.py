@@ -0,0 +1,81 @@
+# Generated migration
+
+from collections import defaultdict
+from datetime import datetime, time
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def remplir_statistiques(apps, schema_editor):
+    """Agrège les courriers et diligences existants par jour"""
+    Courrier = apps.get_model('core', 'Courrier')
+    Diligence = apps.get_model('core', 'Diligence')
+    CourrierStatsJour = apps.get_model('core', 'CourrierStatsJour')
+
+    diligences = defaultdict(list)
+    for courrier_id, statut, cree_le in Diligence.objects.filter(
+            courrier__isnull=False).values_list('courrier_id', 'statut', 'created_at').iterator(chunk_size=2000):
+        diligences[courrier_id].append((statut, cree_le))
+
+    mesures = ('nombre', 'avec_diligence', 'diligence_en_cours', 'diligence_terminee', 'delai_total_secondes', 'nb_delais')
+    agregats = defaultdict(lambda: dict.fromkeys(mesures, 0))
+    for courrier_id, *cle in Courrier.objects.values_list(
+            'id', 'date_reception', 'service_id', 'service__direction_id',
+            'type_courrier', 'sens', 'categorie', 'statut').iterator(chunk_size=2000):
+        ligne = agregats[tuple(cle)]
+        liees = diligences.get(courrier_id, ())
+        ligne['nombre'] += 1
+        ligne['avec_diligence'] += bool(liees)
+        ligne['diligence_en_cours'] += any(statut in ('en_attente', 'en_cours') for statut, _ in liees)
+        ligne['diligence_terminee'] += any(statut == 'termine' for statut, _ in liees)
+        for _, cree_le in liees:
+            debut = datetime.combine(cle[0], time.min)
+            if timezone.is_aware(cree_le):
+                debut = timezone.make_aware(debut)
+            ligne['delai_total_secondes'] += int((cree_le - debut).total_seconds())
+            ligne['nb_delais'] += 1
+
+    dimensions = ('jour', 'service_id', 'direction_id', 'type_courrier', 'sens', 'categorie', 'statut')
+    CourrierStatsJour.objects.bulk_create([
+        CourrierStatsJour(**dict(zip(dimensions, cle)), **ligne)
+        for cle, ligne in agregats.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0108_searchterm'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourrierStatsJour',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jour', models.DateField()),
+                ('service_id', models.BigIntegerField(blank=True, null=True)),
+                ('direction_id', models.BigIntegerField(blank=True, null=True)),
+                ('type_courrier', models.CharField(max_length=20)),
+                ('sens', models.CharField(max_length=20)),
+                ('categorie', models.CharField(max_length=64)),
+                ('statut', models.CharField(max_length=20)),
+                ('nombre', models.PositiveIntegerField(default=0)),
+                ('avec_diligence', models.PositiveIntegerField(default=0)),
+                ('diligence_en_cours', models.PositiveIntegerField(default=0)),
+                ('diligence_terminee', models.PositiveIntegerField(default=0)),
+                ('delai_total_secondes', models.BigIntegerField(default=0)),
+                ('nb_delais', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Statistiques courriers (jour)',
+                'verbose_name_plural': 'Statistiques courriers (jours)',
+                'indexes': [
+                    models.Index(fields=['jour', 'service_id'], name='core_cstats_jour_idx'),
+                    models.Index(fields=['service_id'], name='core_cstats_service_idx'),
+                ],
+            },
+        ),
+        migrations.RunPython(remplir_statistiques, migrations.RunPython.noop),
+    ]
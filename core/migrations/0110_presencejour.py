@@ -0,0 +1,32 @@
+# Generated migration
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0109_courrierstatsjour'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PresenceJour',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jour', models.DateField()),
+                ('code', models.CharField(max_length=4)),
+                ('heures', models.DecimalField(decimal_places=2, default=0, max_digits=5)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='presences_jour', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Présence (matrice)',
+                'verbose_name_plural': 'Présences (matrice)',
+                'unique_together': {('user', 'jour')},
+                'indexes': [models.Index(fields=['jour'], name='core_presjour_jour_idx')],
+            },
+        ),
+    ]
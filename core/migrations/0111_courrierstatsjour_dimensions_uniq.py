@@ -0,0 +1,20 @@
+# Generated migration
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0110_presencejour'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='courrierstatsjour',
+            constraint=models.UniqueConstraint(
+                fields=('jour', 'service_id', 'direction_id', 'type_courrier', 'sens', 'categorie', 'statut'),
+                name='core_cstats_dimensions_uniq'
+            ),
+        ),
+    ]
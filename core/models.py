@@ -197,6 +197,37 @@ class UserProfile(models.Model):
     def __str__(self):
         return f"{self.user.username} - {self.role}"
 
+
+class OrgClosure(models.Model):
+    """
+    Table de fermeture de l'organigramme (Direction > Sous-Direction > Service > utilisateur) :
+    une ligne par couple (ancêtre, descendant), y compris chaque nœud avec lui-même.
+    « Utilisateurs d'une direction » devient une lecture indexée quelle que soit la profondeur.
+    Maintenue par core.org_hierarchy.
+    """
+    TYPE_CHOICES = [
+        ('direction', 'Direction'),
+        ('sous_direction', 'Sous-direction'),
+        ('service', 'Service'),
+        ('user', 'Utilisateur'),
+    ]
+    ancetre_type = models.CharField(max_length=16, choices=TYPE_CHOICES)
+    ancetre_id = models.BigIntegerField()
+    descendant_type = models.CharField(max_length=16, choices=TYPE_CHOICES)
+    descendant_id = models.BigIntegerField()
+    profondeur = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Lien hiérarchique'
+        verbose_name_plural = 'Liens hiérarchiques'
+        unique_together = ('ancetre_type', 'ancetre_id', 'descendant_type', 'descendant_id')
+        indexes = [
+            models.Index(fields=['descendant_type', 'descendant_id'], name='core_orgclosure_desc_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.ancetre_type}:{self.ancetre_id} > {self.descendant_type}:{self.descendant_id}"
+
 class Courrier(models.Model):
     TYPE_CHOICES = [
         ('ordinaire', 'Ordinaire'),
@@ -360,6 +391,8 @@ class CourrierNotification(models.Model):
             models.Index(fields=['utilisateur', 'lue']),
             models.Index(fields=['courrier']),
             models.Index(fields=['-created_at']),
+            # Boîte de réception : pages par curseur (voir core.inbox)
+            models.Index(fields=['utilisateur', '-created_at', '-id'], name='core_cnotif_inbox_idx'),
         ]
     
     def __str__(self):
@@ -372,6 +405,46 @@ class CourrierNotification(models.Model):
         self.date_lecture = timezone.now()
         self.save()
 
+class CourrierStatsJour(models.Model):
+    """
+    Agrégat quotidien des courriers : une ligne par jour de réception × service ×
+    direction × type × sens × catégorie × statut. Les tableaux de bord lisent ces
+    lignes au lieu d'agréger la table Courrier. Maintenu par core.courrier_stats.
+    """
+    jour = models.DateField()
+    service_id = models.BigIntegerField(null=True, blank=True)
+    direction_id = models.BigIntegerField(null=True, blank=True)
+    type_courrier = models.CharField(max_length=20)
+    sens = models.CharField(max_length=20)
+    categorie = models.CharField(max_length=64)
+    statut = models.CharField(max_length=20)
+
+    nombre = models.PositiveIntegerField(default=0)
+    avec_diligence = models.PositiveIntegerField(default=0)
+    diligence_en_cours = models.PositiveIntegerField(default=0)
+    diligence_terminee = models.PositiveIntegerField(default=0)
+    # Délai réception → création de chaque diligence (somme et nombre de couples courrier/diligence)
+    delai_total_secondes = models.BigIntegerField(default=0)
+    nb_delais = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Statistiques courriers (jour)'
+        verbose_name_plural = 'Statistiques courriers (jours)'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['jour', 'service_id', 'direction_id', 'type_courrier', 'sens', 'categorie', 'statut'],
+                name='core_cstats_dimensions_uniq'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['jour', 'service_id'], name='core_cstats_jour_idx'),
+            models.Index(fields=['service_id'], name='core_cstats_service_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.jour} service:{self.service_id} {self.type_courrier}/{self.sens} : {self.nombre}"
+
+
 class Diligence(models.Model):
     TYPE_CHOICES = [
         ('courrier', 'Basée sur courrier'),
@@ -499,6 +572,31 @@ class ImputationAccess(models.Model):
             return self.services_concernes.first().direction
         return None
 
+
+class DiligenceVisibility(models.Model):
+    """
+    Index précalculé « cet utilisateur voit cette diligence » (une ligne par raison),
+    maintenu par core.diligence_visibility : la liste des diligences est une jointure indexée.
+    """
+    RAISON_CHOICES = [
+        ('assigne', 'Agent assigné'),
+        ('imputation_acces', 'Accès par imputation'),
+        ('imputation_fichier', 'Fichier d\'imputation'),
+        ('direction', 'Directeur de la direction'),
+        ('service', 'Supérieur du service'),
+    ]
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='diligences_visibles')
+    diligence = models.ForeignKey(Diligence, on_delete=models.CASCADE, related_name='visibilites')
+    raison = models.CharField(max_length=20, choices=RAISON_CHOICES)
+
+    class Meta:
+        verbose_name = 'Visibilité de diligence'
+        verbose_name_plural = 'Visibilités de diligences'
+        unique_together = ('user', 'diligence', 'raison')
+
+    def __str__(self):
+        return f"{self.user.username} - {self.diligence_id} ({self.raison})"
+
 # --- MODÈLE POUR GESTION DES DOCUMENTS DE DILIGENCE ---
 class DiligenceDocument(models.Model):
     STATUT_CHOICES = [
@@ -556,6 +654,9 @@ class DiligenceNotification(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Notification de Diligence'
         verbose_name_plural = 'Notifications de Diligence'
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-id'], name='core_dnotif_inbox_idx'),
+        ]
     
     def __str__(self):
         return f"{self.get_type_notification_display()} - {self.user.username}"
@@ -580,6 +681,9 @@ class Notification(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Notification'
         verbose_name_plural = 'Notifications'
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-id'], name='core_notif_inbox_idx'),
+        ]
     
     def __str__(self):
         return f"{self.get_type_notif_display()} - {self.user.username} - {self.created_at.strftime('%d/%m/%Y %H:%M')}"
@@ -792,6 +896,33 @@ class Tache(models.Model):
             parent = parent.tache_parent
         return niveau
 
+class SearchTerm(models.Model):
+    """
+    Index inversé de la recherche plein texte : une ligne par (terme, objet), avec
+    le poids cumulé des champs où le terme apparaît. Termes normalisés (minuscules,
+    sans accents, mots vides retirés). Maintenu par core.search_index.
+    """
+    TYPE_CHOICES = [
+        ('courrier', 'Courrier'),
+        ('diligence', 'Diligence'),
+        ('tache', 'Tâche'),
+    ]
+    terme = models.CharField(max_length=64)
+    type_objet = models.CharField(max_length=16, choices=TYPE_CHOICES)
+    objet_id = models.BigIntegerField()
+    poids = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        verbose_name = 'Terme indexé'
+        verbose_name_plural = 'Termes indexés'
+        unique_together = ('type_objet', 'objet_id', 'terme')
+        indexes = [
+            models.Index(fields=['type_objet', 'terme'], name='core_searchterm_terme_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.terme} > {self.type_objet}:{self.objet_id}"
+
 class Commentaire(models.Model):
     contenu = models.TextField()
     auteur = models.ForeignKey(User, related_name='commentaires', on_delete=models.CASCADE)
@@ -908,6 +1039,29 @@ class Presence(models.Model):
         return f"{self.agent.username} - {self.date_presence} ({self.statut})"
 
 
+class PresenceJour(models.Model):
+    """
+    Matrice de présence : statut et heures d'un agent pour un jour, consolidés depuis
+    Presence, OccurrenceSpeciale, DemandeConge et DemandeAbsence (approuvées).
+    Maintenue par core.presence_matrix.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='presences_jour')
+    jour = models.DateField()
+    code = models.CharField(max_length=4)
+    heures = models.DecimalField(max_digits=5, decimal_places=2, default=0)
+
+    class Meta:
+        verbose_name = 'Présence (matrice)'
+        verbose_name_plural = 'Présences (matrice)'
+        unique_together = ('user', 'jour')
+        indexes = [
+            models.Index(fields=['jour'], name='core_presjour_jour_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.jour} : {self.code}"
+
+
 class OccurrenceSpeciale(models.Model):
     """Modèle pour gérer les occurrences spéciales (représentations, missions, permissions, etc.)"""
     TYPE_CHOICES = [
@@ -1227,15 +1381,21 @@ class GeofenceAlert(models.Model):
     def __str__(self):
         return f"Alerte {self.get_type_alerte_display()} - {self.agent.username} - {self.timestamp_alerte.strftime('%d/%m/%Y %H:%M')}"
     
+    def build_message_alerte(self):
+        """Construit le message d'alerte par défaut (aussi utilisé avant un bulk_create)"""
+        nom_agent = self.agent.get_full_name() or self.agent.username
+        if self.type_alerte == 'sortie_zone':
+            return f"{nom_agent} s'est éloigné(e) de {self.distance_metres}m du bureau {self.bureau.nom}"
+        elif self.type_alerte == 'entree_zone':
+            return f"{nom_agent} est entré(e) dans la zone du bureau {self.bureau.nom}"
+        elif self.type_alerte == 'hors_horaires':
+            return f"{nom_agent} est détecté(e) hors des heures de travail"
+        return None
+    
     def save(self, *args, **kwargs):
         # Générer automatiquement le message d'alerte
         if not self.message_alerte:
-            if self.type_alerte == 'sortie_zone':
-                self.message_alerte = f"{self.agent.get_full_name() or self.agent.username} s'est éloigné(e) de {self.distance_metres}m du bureau {self.bureau.nom}"
-            elif self.type_alerte == 'entree_zone':
-                self.message_alerte = f"{self.agent.get_full_name() or self.agent.username} est entré(e) dans la zone du bureau {self.bureau.nom}"
-            elif self.type_alerte == 'hors_horaires':
-                self.message_alerte = f"{self.agent.get_full_name() or self.agent.username} est détecté(e) hors des heures de travail"
+            self.message_alerte = self.build_message_alerte()
         
         super().save(*args, **kwargs)
 
@@ -1280,36 +1440,36 @@ class GeofenceSettings(models.Model):
         return f"Configuration géofencing - Modifiée le {self.updated_at.strftime('%d/%m/%Y %H:%M')}"
     
     def is_heure_travail(self, datetime_obj):
-        """Vérifie si une datetime donnée est dans les heures de travail"""
-        jour_semaine = datetime_obj.weekday()  # 0=lundi, 6=dimanche
-        heure = datetime_obj.time()
-        
-        # Vérifier si c'est un jour de travail
-        jours_travail = [
-            self.lundi_travaille, self.mardi_travaille, self.mercredi_travaille,
-            self.jeudi_travaille, self.vendredi_travaille, self.samedi_travaille,
-            self.dimanche_travaille
-        ]
-        
-        if not jours_travail[jour_semaine]:
-            return False
-        
-        # Vérifier les heures
-        return (self.heure_debut_matin <= heure <= self.heure_fin_matin) or \
-               (self.heure_debut_apres_midi <= heure <= self.heure_fin_apres_midi)
+        """
+        Vérifie si une datetime donnée est dans les heures de travail
+        (chemin rapide en cache : core.geofence_config.is_heure_travail)
+        """
+        from .geofence_config import HoraireTravail
+        return HoraireTravail(self).contient(datetime_obj)
 
 
 class AgentLocation(models.Model):
-    """Modèle pour stocker l'historique des positions des agents"""
-    agent = models.ForeignKey(User, on_delete=models.CASCADE, related_name='locations')
+    """
+    Modèle pour stocker l'historique des positions des agents
+
+    La contrainte unique porte sur (agent, client_id, timestamp) et non sur
+    (agent, client_id) : la clé de partitionnement doit figurer dans toute clé
+    unique. Un renvoi du même point avec un autre horodatage n'est donc pas
+    rejeté par la base ; le dédoublonnage sur (agent, client_id) est fait par
+    core.location_ingest.ingest_points (avant et après l'insertion).
+    """
+    # Pas de contrainte de clé étrangère en base : MySQL l'interdit sur une table partitionnée
+    # (voir core.location_partitions)
+    agent = models.ForeignKey(User, on_delete=models.CASCADE, related_name='locations', db_constraint=False)
     latitude = models.DecimalField(max_digits=22, decimal_places=17)
     longitude = models.DecimalField(max_digits=22, decimal_places=17)
     accuracy = models.FloatField(null=True, blank=True, help_text="Précision GPS en mètres")
     
     # Informations contextuelles
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now, help_text="Horodatage de la capture (fourni par l'application si disponible)")
     is_background = models.BooleanField(default=False, help_text="Position capturée en arrière-plan")
     battery_level = models.IntegerField(null=True, blank=True, help_text="Niveau de batterie du téléphone")
+    client_id = models.CharField(max_length=64, null=True, blank=True, help_text="Identifiant du point côté application (envoi idempotent)")
     
     # Calculs automatiques
     distance_bureau = models.FloatField(null=True, blank=True, help_text="Distance calculée par rapport au bureau assigné")
@@ -1319,6 +1479,8 @@ class AgentLocation(models.Model):
         verbose_name = 'Position agent'
         verbose_name_plural = 'Positions agents'
         ordering = ['-timestamp']
+        # La clé de partitionnement (timestamp) doit figurer dans toute clé unique
+        unique_together = ('agent', 'client_id', 'timestamp')
         indexes = [
             models.Index(fields=['agent', 'timestamp']),
             models.Index(fields=['timestamp', 'dans_zone_autorisee']),
@@ -1328,6 +1490,90 @@ class AgentLocation(models.Model):
         return f"{self.agent.username} - {self.timestamp.strftime('%d/%m/%Y %H:%M:%S')}"
 
 
+class AgentCurrentLocation(models.Model):
+    """
+    Dernière position connue de chaque agent (projection dénormalisée de AgentLocation),
+    tenue à jour à l'ingestion : tableaux de bord et balayages en une requête indexée.
+    """
+    agent = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='current_location')
+    location_id = models.BigIntegerField(null=True, blank=True, help_text="Position AgentLocation correspondante")
+    latitude = models.DecimalField(max_digits=22, decimal_places=17)
+    longitude = models.DecimalField(max_digits=22, decimal_places=17)
+    accuracy = models.FloatField(null=True, blank=True)
+    timestamp = models.DateTimeField(db_index=True)
+    is_background = models.BooleanField(default=False)
+    battery_level = models.IntegerField(null=True, blank=True)
+    distance_bureau = models.FloatField(null=True, blank=True)
+    dans_zone_autorisee = models.BooleanField(default=True)
+    derniere_dans_zone = models.DateTimeField(null=True, blank=True, help_text="Horodatage de la dernière position dans la zone autorisée")
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    
+    class Meta:
+        verbose_name = 'Position courante agent'
+        verbose_name_plural = 'Positions courantes agents'
+    
+    def __str__(self):
+        return f"{self.agent.username} - {self.timestamp.strftime('%d/%m/%Y %H:%M:%S')}"
+
+
+class AgentLocationHourly(models.Model):
+    """
+    Agrégat horaire des positions d'un agent, calculé avant la purge des positions
+    brutes : les rapports restent disponibles sans conserver chaque point GPS.
+    """
+    agent = models.ForeignKey(User, on_delete=models.CASCADE, related_name='location_rollups')
+    heure = models.DateTimeField(help_text="Début de l'heure (UTC)")
+    nb_points = models.PositiveIntegerField(default=0)
+    distance_min = models.FloatField(null=True, blank=True, help_text="Distance minimale au bureau (mètres)")
+    distance_max = models.FloatField(null=True, blank=True, help_text="Distance maximale au bureau (mètres)")
+    distance_moyenne = models.FloatField(null=True, blank=True, help_text="Distance moyenne au bureau (mètres)")
+    secondes_dans_zone = models.PositiveIntegerField(default=0, help_text="Temps estimé dans la zone autorisée")
+    secondes_hors_zone = models.PositiveIntegerField(default=0, help_text="Temps estimé hors de la zone autorisée")
+    premiere_position = models.DateTimeField()
+    derniere_position = models.DateTimeField()
+    
+    class Meta:
+        verbose_name = 'Agrégat horaire des positions'
+        verbose_name_plural = 'Agrégats horaires des positions'
+        ordering = ['-heure']
+        unique_together = ('agent', 'heure')
+        indexes = [
+            models.Index(fields=['heure']),
+        ]
+    
+    def __str__(self):
+        return f"{self.agent.username} - {self.heure.strftime('%d/%m/%Y %Hh')}"
+
+
+class AgentGeofenceState(models.Model):
+    """
+    État de géofencing courant d'un agent (dedans/dehors, depuis quand).
+    Avancé de façon incrémentale à partir de la dernière position traitée,
+    pour éviter de rescanner toutes les positions du jour.
+    """
+    agent = models.OneToOneField(User, on_delete=models.CASCADE, related_name='geofence_state')
+    bureau = models.ForeignKey('Bureau', on_delete=models.SET_NULL, null=True, blank=True, related_name='geofence_states')
+    date = models.DateField(help_text="Journée à laquelle se rapporte l'état")
+    
+    est_dans_zone = models.BooleanField(default=True)
+    hors_zone_depuis = models.DateTimeField(null=True, blank=True, help_text="Horodatage de la première position hors zone de la sortie en cours")
+    
+    # Curseur de traitement
+    derniere_position_id = models.BigIntegerField(default=0, help_text="Identifiant de la dernière AgentLocation traitée")
+    derniere_position_timestamp = models.DateTimeField(null=True, blank=True)
+    derniere_distance = models.FloatField(null=True, blank=True, help_text="Distance au bureau de la dernière position prise en compte")
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = 'État de géofencing agent'
+        verbose_name_plural = 'États de géofencing agents'
+    
+    def __str__(self):
+        etat = 'dans la zone' if self.est_dans_zone else f"hors zone depuis {self.hors_zone_depuis}"
+        return f"{self.agent.username} - {etat}"
+
+
 class DeviceLock(models.Model):
     """Modèle pour verrouiller un appareil à un utilisateur"""
     device_id = models.CharField(max_length=255, unique=True, db_index=True, help_text="Empreinte unique de l'appareil")
@@ -0,0 +1,94 @@
+"""
+Diffusion d'une notification à de nombreux destinataires (fan-out)
+
+Les signaux et les vues créaient une notification par destinataire avec
+objects.create, dans la transaction de la requête. fan_out :
+- résout les destinataires en une requête (identifiants seulement)
+- après le commit, confie l'insertion à la tâche Celery fanout_notifications_task
+  (settings.NOTIFICATION_FANOUT_ASYNC), ou l'exécute directement si Celery est
+  désactivé ou indisponible
+- construit les lignes en mémoire et les insère par lots de TAILLE_LOT (bulk_create)
+
+Les valeurs communes sont passées par identifiant (courrier_id, diligence_id,
+cree_par_id...) pour rester sérialisables en JSON.
+"""
+import logging
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import QuerySet
+
+from .inbox import SOURCE_PAR_MODELE, adjust_unread, element_from_instance
+from .notification_stream import publish_many
+
+logger = logging.getLogger(__name__)
+
+TAILLE_LOT = 500
+
+
+def _identifiants(destinataires):
+    """Identifiants des destinataires (QuerySet d'utilisateurs, utilisateurs ou ids)"""
+    if isinstance(destinataires, QuerySet) and destinataires.model is get_user_model():
+        return list(destinataires.order_by().values_list('id', flat=True).distinct())
+    return list(dict.fromkeys(getattr(d, 'pk', d) for d in destinataires))
+
+
+def inserer_notifications(modele, champ_utilisateur, user_ids, valeurs):
+    """
+    Insère une notification par destinataire, par lots
+
+    Returns:
+        int: nombre de notifications créées
+    """
+    if isinstance(modele, str):
+        modele = apps.get_model(modele)
+    user_ids = list(user_ids)
+    for i in range(0, len(user_ids), TAILLE_LOT):
+        lot = user_ids[i:i + TAILLE_LOT]
+        creees = modele.objects.bulk_create(
+            [modele(**{f'{champ_utilisateur}_id': user_id}, **valeurs) for user_id in lot],
+            batch_size=TAILLE_LOT
+        )
+        # bulk_create n'émet pas post_save : compteurs de non lues et flux temps réel mis à jour ici
+        if modele in SOURCE_PAR_MODELE:
+            adjust_unread({(user_id, SOURCE_PAR_MODELE[modele]): 1 for user_id in lot})
+            publish_many(
+                (getattr(notification, f'{champ_utilisateur}_id'), 'notification', element_from_instance(notification))
+                for notification in creees
+            )
+    return len(user_ids)
+
+
+def _diffuser(label, champ_utilisateur, user_ids, valeurs):
+    if getattr(settings, 'NOTIFICATION_FANOUT_ASYNC', False):
+        from .tasks_notifications import fanout_notifications_task
+        try:
+            fanout_notifications_task.delay(label, champ_utilisateur, user_ids, valeurs)
+            return
+        except Exception as e:
+            logger.warning(f"Diffusion différée indisponible, insertion directe: {e}")
+    inserer_notifications(label, champ_utilisateur, user_ids, valeurs)
+
+
+def fan_out(modele, destinataires, valeurs, champ_utilisateur='user', exclure=None):
+    """
+    Programme une notification pour chaque destinataire, après le commit
+
+    Args:
+        modele: classe de notification (CourrierNotification, DiligenceNotification...)
+        destinataires: QuerySet d'utilisateurs, liste d'utilisateurs ou d'identifiants
+        valeurs: champs communs à toutes les notifications (sérialisables en JSON)
+        champ_utilisateur: nom du ForeignKey vers le destinataire
+        exclure: identifiant d'un utilisateur à ne pas notifier (l'auteur de l'action)
+
+    Returns:
+        int: nombre de destinataires
+    """
+    user_ids = [user_id for user_id in _identifiants(destinataires) if user_id != exclure]
+    if not user_ids:
+        return 0
+    label = modele._meta.label
+    transaction.on_commit(lambda: _diffuser(label, champ_utilisateur, user_ids, valeurs))
+    return len(user_ids)
@@ -0,0 +1,119 @@
+"""
+Flux temps réel des notifications (Server-Sent Events sur Redis pub/sub)
+
+Les clients interrogeaient en boucle count_non_lues, la liste des notifications
+de diligences et alertes_actives. Ils ouvrent désormais une connexion
+GET /api/notifications/stream/ (vue asynchrone, servie par ediligence.asgi)
+et reçoivent :
+- `compteurs` : compteurs de non lues (voir core.inbox), à la connexion puis
+  après chaque nouvelle notification ou lecture
+- `notification` : élément au format de la boîte de réception (core.inbox)
+- `alertes_geofence` : alertes de géofencing créées (liste)
+- un commentaire `: ping` toutes les NOTIFICATION_STREAM_HEARTBEAT secondes
+
+Publication : un canal Redis par utilisateur. Les écrivains (signaux des
+notifications, core.notification_fanout, tâches de géofencing) publient après
+le commit ; sans Redis (NOTIFICATION_STREAM_REDIS_URL vide) rien n'est publié
+et l'endpoint répond 503, les clients reviennent à l'interrogation périodique.
+"""
+import json
+import logging
+
+import redis
+import redis.asyncio as aioredis
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+CANAL = 'ediligence:notifications:{}'
+
+_client = None
+
+
+def is_enabled():
+    return bool(getattr(settings, 'NOTIFICATION_STREAM_REDIS_URL', ''))
+
+
+def _redis():
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.NOTIFICATION_STREAM_REDIS_URL, socket_timeout=2)
+    return _client
+
+
+def _redis_async():
+    # Une connexion par flux : le client asynchrone est lié à la boucle d'événements
+    return aioredis.Redis.from_url(settings.NOTIFICATION_STREAM_REDIS_URL)
+
+
+def publish_many(evenements):
+    """
+    Publie des événements [(user_id, type, données)] en un aller-retour Redis
+
+    Returns:
+        int: nombre d'événements publiés (0 si le flux est désactivé ou Redis indisponible)
+    """
+    evenements = list(evenements)
+    if not evenements or not is_enabled():
+        return 0
+    try:
+        pipe = _redis().pipeline(transaction=False)
+        for user_id, type_evenement, donnees in evenements:
+            pipe.publish(CANAL.format(user_id), json.dumps(
+                {'type': type_evenement, 'data': donnees}, cls=DjangoJSONEncoder
+            ))
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Flux de notifications non publié: {e}")
+        return 0
+    return len(evenements)
+
+
+def publish(user_ids, type_evenement, donnees=None):
+    """Publie le même événement pour plusieurs utilisateurs"""
+    return publish_many((user_id, type_evenement, donnees) for user_id in user_ids)
+
+
+def publish_on_commit(user_ids, type_evenement, donnees=None):
+    user_ids = list(user_ids)
+    transaction.on_commit(lambda: publish(user_ids, type_evenement, donnees))
+
+
+def format_event(type_evenement, donnees):
+    """Bloc Server-Sent Events"""
+    return f"event: {type_evenement}\ndata: {json.dumps(donnees, cls=DjangoJSONEncoder)}\n\n"
+
+
+async def event_stream(user_id, heartbeat=None):
+    """
+    Générateur asynchrone des blocs SSE d'un utilisateur, jusqu'à la déconnexion du client
+    """
+    from .inbox import unread_counts
+
+    heartbeat = heartbeat or getattr(settings, 'NOTIFICATION_STREAM_HEARTBEAT', 20)
+    compteurs = sync_to_async(unread_counts)
+    client = _redis_async()
+    pubsub = client.pubsub()
+    await pubsub.subscribe(CANAL.format(user_id))
+    try:
+        yield format_event('compteurs', await compteurs(user_id))
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=heartbeat)
+            if message is None:
+                yield ': ping\n\n'
+                continue
+            try:
+                evenement = json.loads(message['data'])
+            except (TypeError, ValueError):
+                continue
+            if evenement['type'] != 'compteurs':
+                yield format_event(evenement['type'], evenement['data'])
+            if evenement['type'] in ('notification', 'compteurs'):
+                yield format_event('compteurs', await compteurs(user_id))
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
+        await client.aclose()
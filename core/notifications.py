@@ -1,8 +1,11 @@
 import json
+from collections import Counter
 import requests
 from django.conf import settings
 from django.contrib.auth.models import User
 from .models import Notification, PushNotificationToken, GeofenceAlert
+from .inbox import adjust_unread, element_from_instance
+from .notification_stream import publish_many
 
 
 def send_geofence_notification(user, alert):
@@ -24,48 +27,42 @@ def send_geofence_notification(user, alert):
         return None
 
 
+def send_geofence_notifications_bulk(users, alerts, batch_size=500):
+    """Créer en une insertion groupée les notifications in-app pour plusieurs alertes"""
+    try:
+        notifications = [
+            Notification(
+                user=user,
+                type_notif='geofence_alert',
+                contenu=alert.message_alerte,
+                message=alert.message_alerte,
+                lien=f'/geofencing/alerts/{alert.id}',
+                read=False
+            )
+            for alert in alerts
+            for user in users
+        ]
+        Notification.objects.bulk_create(notifications, batch_size=batch_size)
+        adjust_unread(Counter((n.user_id, 'notification') for n in notifications))
+        publish_many((n.user_id, 'notification', element_from_instance(n)) for n in notifications)
+        return len(notifications)
+    except Exception as e:
+        print(f"Erreur lors de l'envoi groupé des notifications géofencing: {e}")
+        return 0
+
+
 def send_push_notification(user, alert):
-    """Envoyer une notification push pour une alerte de géofencing"""
+    """Envoyer une notification push pour une alerte de géofencing (tous les appareils de l'utilisateur)"""
     try:
-        # Récupérer les tokens actifs de l'utilisateur
-        tokens = PushNotificationToken.objects.filter(
-            user=user,
-            is_active=True
-        )
+        from .push_dispatcher import alert_push_content, send_push_batch
         
-        if not tokens.exists():
+        # Récupérer les tokens actifs de l'utilisateur
+        tokens = list(PushNotificationToken.objects.filter(user=user, is_active=True))
+        if not tokens:
             return False
         
-        # Préparer le message
-        title = "Alerte de géofencing"
-        body = alert.message_alerte
-        
-        # Données supplémentaires
-        data = {
-            'type': 'geofence_alert',
-            'alert_id': str(alert.id),
-            'agent_name': alert.agent.get_full_name() or alert.agent.username,
-            'bureau_name': alert.bureau.nom,
-            'distance': str(alert.distance_metres),
-            'timestamp': alert.timestamp_alerte.isoformat()
-        }
-        
-        success_count = 0
-        
-        for token in tokens:
-            if token.platform == 'android':
-                success = send_fcm_notification(token.token, title, body, data)
-            elif token.platform == 'ios':
-                success = send_apns_notification(token.token, title, body, data)
-            else:
-                success = send_web_notification(token.token, title, body, data)
-            
-            if success:
-                success_count += 1
-                token.last_used = alert.timestamp_alerte
-                token.save()
-        
-        return success_count > 0
+        title, body, data = alert_push_content(alert)
+        return bool(send_push_batch(tokens, title, body, data)['envoyes'])
         
     except Exception as e:
         print(f"Erreur lors de l'envoi de la notification push: {e}")
@@ -151,8 +148,8 @@ def send_bulk_geofence_notifications(alerts):
     
     for alert in alerts:
         # Récupérer les utilisateurs à notifier selon les paramètres
-        from .models import GeofenceSettings
-        settings = GeofenceSettings.objects.first()
+        from .geofence_config import get_geofence_settings
+        settings = get_geofence_settings()
         
         if not settings:
             continue
@@ -0,0 +1,176 @@
+"""
+Table de fermeture de l'organigramme (OrgClosure)
+
+Nœuds : direction, sous_direction, service, user. Chaque nœud a une ligne vers
+lui-même (profondeur 0) et une ligne vers chacun de ses ancêtres :
+- un service est rattaché à sa sous-direction (et à la direction de celle-ci) et,
+  tant que la migration n'est pas terminée, à sa direction historique (Service.direction)
+- un utilisateur est rattaché au service de son profil et au service de sa fiche Agent
+
+API :
+- descendants_of(nœud, type) : identifiants des descendants d'un type (sous-requête)
+- users_under(nœud) : identifiants des utilisateurs sous ce nœud (sous-requête)
+
+Les lignes sont recalculées incrémentalement par les signaux de core.signals
+(création, rattachement modifié, suppression) ; rebuild_all reconstruit tout.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+
+from .models import Agent, Direction, OrgClosure, Service, SousDirection, UserProfile
+
+TYPES_NOEUDS = {
+    Direction: 'direction',
+    SousDirection: 'sous_direction',
+    Service: 'service',
+}
+
+TAILLE_LOT = 500
+
+
+def _noeud(node):
+    """(type, id) d'une instance Direction / SousDirection / Service / User"""
+    return TYPES_NOEUDS.get(type(node), 'user'), node.pk
+
+
+def descendants_of(node, descendant_type=None):
+    """
+    Identifiants des descendants d'un nœud (lui-même compris), en une lecture indexée
+
+    Returns:
+        QuerySet de valeurs `descendant_id`, utilisable dans un filtre `__in`
+    """
+    type_noeud, pk = _noeud(node) if not isinstance(node, tuple) else node
+    qs = OrgClosure.objects.filter(ancetre_type=type_noeud, ancetre_id=pk)
+    if descendant_type:
+        qs = qs.filter(descendant_type=descendant_type)
+    return qs.values_list('descendant_id', flat=True)
+
+
+def users_under(node):
+    """Identifiants des utilisateurs rattachés à un nœud ou à l'un de ses sous-nœuds"""
+    return descendants_of(node, 'user')
+
+
+def _chemins_services(service_ids):
+    """{service_id: {(type, id): profondeur}} y compris le service lui-même"""
+    chemins = {}
+    services = Service.objects.filter(id__in=service_ids).values_list(
+        'id', 'direction_id', 'sous_direction_id', 'sous_direction__direction_id'
+    )
+    for service_id, direction_id, sous_direction_id, sd_direction_id in services:
+        chemin = {('service', service_id): 0}
+        if sous_direction_id:
+            chemin[('sous_direction', sous_direction_id)] = 1
+        if sd_direction_id:
+            chemin[('direction', sd_direction_id)] = 2
+        if direction_id:
+            # Rattachement historique direct : le plus court chemin l'emporte
+            chemin[('direction', direction_id)] = 1
+        chemins[service_id] = chemin
+    return chemins
+
+
+def _chemins_utilisateurs(user_ids):
+    """{user_id: {(type, id): profondeur}} via le profil et la fiche Agent"""
+    services_par_user = defaultdict(set)
+    for user_id, service_id in UserProfile.objects.filter(
+            user_id__in=user_ids, service__isnull=False).values_list('user_id', 'service_id'):
+        services_par_user[user_id].add(service_id)
+    for user_id, service_id in Agent.objects.filter(
+            user_id__in=user_ids, service__isnull=False).values_list('user_id', 'service_id'):
+        services_par_user[user_id].add(service_id)
+
+    chemins_services = _chemins_services(set().union(*services_par_user.values()))
+    chemins = {}
+    for user_id in user_ids:
+        chemin = {('user', user_id): 0}
+        for service_id in services_par_user.get(user_id, ()):
+            for ancetre, profondeur in chemins_services.get(service_id, {}).items():
+                if profondeur + 1 < chemin.get(ancetre, 99):
+                    chemin[ancetre] = profondeur + 1
+        chemins[user_id] = chemin
+    return chemins
+
+
+def _chemins_sous_directions(sous_direction_ids):
+    return {
+        sd_id: {('sous_direction', sd_id): 0, ('direction', direction_id): 1}
+        for sd_id, direction_id in SousDirection.objects.filter(
+            id__in=sous_direction_ids).values_list('id', 'direction_id')
+    }
+
+
+def _remplacer(descendant_type, ids, chemins):
+    """Remplace les lignes des descendants `ids` par leurs chemins recalculés"""
+    ids = list(ids)
+    for i in range(0, len(ids), TAILLE_LOT):
+        lot = ids[i:i + TAILLE_LOT]
+        lignes = [
+            OrgClosure(
+                ancetre_type=ancetre_type, ancetre_id=ancetre_id,
+                descendant_type=descendant_type, descendant_id=pk, profondeur=profondeur
+            )
+            for pk in lot
+            for (ancetre_type, ancetre_id), profondeur in chemins.get(pk, {}).items()
+        ]
+        with transaction.atomic():
+            OrgClosure.objects.filter(descendant_type=descendant_type, descendant_id__in=lot).delete()
+            OrgClosure.objects.bulk_create(lignes, batch_size=TAILLE_LOT)
+
+
+def refresh_users(user_ids):
+    user_ids = list(user_ids)
+    for i in range(0, len(user_ids), TAILLE_LOT):
+        lot = user_ids[i:i + TAILLE_LOT]
+        _remplacer('user', lot, _chemins_utilisateurs(lot))
+
+
+def refresh_services(service_ids):
+    """Recalcule des services et les utilisateurs qui y sont rattachés"""
+    service_ids = list(service_ids)
+    _remplacer('service', service_ids, _chemins_services(service_ids))
+    user_ids = set(UserProfile.objects.filter(service_id__in=service_ids).values_list('user_id', flat=True))
+    user_ids.update(Agent.objects.filter(service_id__in=service_ids).values_list('user_id', flat=True))
+    refresh_users(user_ids)
+
+
+def refresh_sous_directions(sous_direction_ids):
+    """Recalcule des sous-directions, puis leurs services et utilisateurs"""
+    sous_direction_ids = list(sous_direction_ids)
+    _remplacer('sous_direction', sous_direction_ids, _chemins_sous_directions(sous_direction_ids))
+    refresh_services(Service.objects.filter(sous_direction_id__in=sous_direction_ids).values_list('id', flat=True))
+
+
+def refresh_directions(direction_ids):
+    direction_ids = list(direction_ids)
+    _remplacer('direction', direction_ids, {pk: {('direction', pk): 0} for pk in direction_ids})
+
+
+def remove_node(node_type, pk):
+    """
+    Supprime un nœud de la table
+
+    Returns:
+        list: utilisateurs qui étaient sous ce nœud (à recalculer après le commit)
+    """
+    user_ids = list(descendants_of((node_type, pk), 'user'))
+    OrgClosure.objects.filter(ancetre_type=node_type, ancetre_id=pk).delete()
+    OrgClosure.objects.filter(descendant_type=node_type, descendant_id=pk).delete()
+    return user_ids
+
+
+def rebuild_all():
+    """Reconstruit toute la table"""
+    with transaction.atomic():
+        OrgClosure.objects.all().delete()
+        refresh_directions(Direction.objects.values_list('id', flat=True))
+        sous_direction_ids = list(SousDirection.objects.values_list('id', flat=True))
+        _remplacer('sous_direction', sous_direction_ids, _chemins_sous_directions(sous_direction_ids))
+        service_ids = list(Service.objects.values_list('id', flat=True))
+        _remplacer('service', service_ids, _chemins_services(service_ids))
+        user_ids = set(UserProfile.objects.values_list('user_id', flat=True))
+        user_ids.update(Agent.objects.values_list('user_id', flat=True))
+        refresh_users(user_ids)
+    return OrgClosure.objects.count()
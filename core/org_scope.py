@@ -0,0 +1,160 @@
+"""
+Périmètre organisationnel d'un utilisateur (rôle, service, direction, utilisateurs visibles)
+
+Les viewsets filtraient chacun « les utilisateurs de ma direction / de mon service »
+en relisant request.user.profile puis profile.service.direction (requêtes paresseuses).
+get_org_scope calcule ce périmètre une fois :
+- mémorisé sur l'objet utilisateur pour la durée de la requête
+- mis en cache dans Redis (un hash, un champ par utilisateur) entre les requêtes
+- le hash est supprimé après chaque modification d'un profil, d'un service ou d'une
+  fiche Agent (voir core.signals), car un changement de service modifie le périmètre
+  des directeurs et supérieurs concernés
+
+Utilisateurs visibles :
+- ADMIN : tous (user_ids vaut None)
+- DIRECTEUR : utilisateurs dont le service (profil ou fiche Agent) est dans sa direction,
+  directement ou via une sous-direction
+- SUPERIEUR : utilisateurs de son service (profil ou fiche Agent)
+- autres rôles : lui-même
+L'utilisateur fait toujours partie de son périmètre.
+"""
+import json
+import logging
+
+import redis
+from django.conf import settings
+from django.db.models import Q
+
+from .models import UserProfile
+from .org_hierarchy import users_under
+
+logger = logging.getLogger(__name__)
+
+CLE_CACHE = 'ediligence:org_scope'
+DUREE_VIE_CACHE = 3600
+
+_client = None
+
+
+class OrgScope:
+    """Périmètre d'un utilisateur ; user_ids est un frozenset, ou None pour tous"""
+
+    __slots__ = ('user_id', 'role', 'service_id', 'direction_id', 'sous_direction_id', 'user_ids')
+
+    def __init__(self, user_id, role=None, service_id=None, direction_id=None, sous_direction_id=None, user_ids=None):
+        self.user_id = user_id
+        self.role = role
+        self.service_id = service_id
+        self.direction_id = direction_id
+        self.sous_direction_id = sous_direction_id
+        self.user_ids = None if user_ids is None else frozenset(user_ids)
+
+    @property
+    def has_profile(self):
+        return self.role is not None
+
+    @property
+    def sees_all(self):
+        return self.user_ids is None
+
+    def filter(self, queryset, field='agent'):
+        """Restreint un queryset aux lignes dont `field` est un utilisateur du périmètre"""
+        if self.user_ids is None:
+            return queryset
+        return queryset.filter(**{f'{field}__in': self.user_ids})
+
+    def q(self, field='agent'):
+        """Condition Q équivalente, à combiner avec d'autres critères"""
+        if self.user_ids is None:
+            return Q()
+        return Q(**{f'{field}__in': self.user_ids})
+
+    def to_json(self):
+        return json.dumps([
+            self.role, self.service_id, self.direction_id, self.sous_direction_id,
+            None if self.user_ids is None else sorted(self.user_ids)
+        ])
+
+    @classmethod
+    def from_json(cls, user_id, valeur):
+        role, service_id, direction_id, sous_direction_id, user_ids = json.loads(valeur)
+        return cls(user_id, role, service_id, direction_id, sous_direction_id, user_ids)
+
+
+def compute_org_scope(user_id):
+    """Calcule le périmètre depuis la base (2 requêtes au plus)"""
+    profil = UserProfile.objects.filter(user_id=user_id).values_list(
+        'role', 'service_id', 'service__direction_id', 'service__sous_direction_id'
+    ).first()
+    if not profil:
+        return OrgScope(user_id, user_ids={user_id})
+    role, service_id, direction_id, sous_direction_id = profil
+
+    if role == 'ADMIN':
+        return OrgScope(user_id, role, service_id, direction_id, sous_direction_id, None)
+    # Une lecture indexée de la table de fermeture (voir core.org_hierarchy)
+    if role == 'DIRECTEUR' and direction_id:
+        user_ids = set(users_under(('direction', direction_id)))
+    elif role == 'SUPERIEUR' and service_id:
+        user_ids = set(users_under(('service', service_id)))
+    else:
+        user_ids = set()
+    user_ids.add(user_id)
+    return OrgScope(user_id, role, service_id, direction_id, sous_direction_id, user_ids)
+
+
+def _redis():
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.CACHE_INVALIDATION_REDIS_URL, socket_timeout=2)
+    return _client
+
+
+def _lire_cache(user_id):
+    if not settings.CACHE_INVALIDATION_REDIS_URL:
+        return None
+    try:
+        valeur = _redis().hget(CLE_CACHE, user_id)
+    except redis.RedisError as e:
+        logger.debug(f"Cache des périmètres indisponible: {e}")
+        return None
+    return OrgScope.from_json(user_id, valeur) if valeur else None
+
+
+def _ecrire_cache(scope):
+    if not settings.CACHE_INVALIDATION_REDIS_URL:
+        return
+    try:
+        pipe = _redis().pipeline()
+        pipe.hset(CLE_CACHE, scope.user_id, scope.to_json())
+        pipe.expire(CLE_CACHE, DUREE_VIE_CACHE)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.debug(f"Cache des périmètres indisponible: {e}")
+
+
+def get_org_scope(user):
+    """
+    Périmètre de l'utilisateur, calculé au plus une fois par requête
+
+    Returns:
+        OrgScope (role None si l'utilisateur n'a pas de profil)
+    """
+    scope = getattr(user, '_org_scope', None)
+    if scope is None:
+        scope = _lire_cache(user.id)
+        if scope is None:
+            scope = compute_org_scope(user.id)
+            _ecrire_cache(scope)
+        user._org_scope = scope
+    return scope
+
+
+def invalidate_org_scopes():
+    """Vide le cache de tous les périmètres (appelé après le commit)"""
+    if not settings.CACHE_INVALIDATION_REDIS_URL:
+        return
+    try:
+        _redis().delete(CLE_CACHE)
+    except redis.RedisError as e:
+        logger.warning(f"Invalidation des périmètres non publiée: {e}")
@@ -1,6 +1,30 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 class DiligencePagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 100
+
+class KeysetPagination(CursorPagination):
+    """
+    Pagination par curseur (keyset) sur (-created_at, -id) : chaque page est une
+    requête indexée « après cette ligne », sans OFFSET ni COUNT.
+
+    Activée seulement si le client envoie ?cursor= ou ?page_size= : sans ces
+    paramètres la liste reste un tableau complet, comme avant.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = ('-created_at', '-id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params and self.page_size_query_param not in request.query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+class UserKeysetPagination(KeysetPagination):
+    ordering = ('-date_joined', '-id')
+
+class GeofenceAlertKeysetPagination(KeysetPagination):
+    ordering = ('-timestamp_alerte', '-id')
@@ -0,0 +1,96 @@
+"""
+Cache disque des PDF de demandes de congé et d'absence
+
+Un PDF est rendu une fois par version de la demande : le fichier est nommé
+{id}-{horodatage de dernière modification}.pdf sous PDF_CACHE_DIR/<type>/.
+Toute modification de la demande (validation, rejet, édition) change
+l'horodatage, donc le nom : l'ancienne version n'est plus servie et elle est
+supprimée au rendu suivant.
+
+- pdf_response : réponse de téléchargement, envoi du fichier en cache (rendu
+  à la demande s'il n'existe pas encore)
+- schedule_render : pré-génération par la tâche Celery render_demande_pdf_task
+  après le commit (appelée à l'approbation), si PDF_RENDER_ASYNC est activé
+"""
+import glob
+import logging
+import os
+import tempfile
+
+from django.conf import settings
+from django.db import transaction
+from django.http import FileResponse
+
+from .models import DemandeAbsence, DemandeConge
+from .pdf_utils import generate_absence_pdf, generate_conge_pdf
+
+logger = logging.getLogger(__name__)
+
+# type de document : (modèle, champ de dernière modification, fonction de rendu)
+DOCUMENTS = {
+    'conge': (DemandeConge, 'date_modification', generate_conge_pdf),
+    'absence': (DemandeAbsence, 'updated_at', generate_absence_pdf),
+}
+
+
+def _repertoire(type_doc):
+    racine = getattr(settings, 'PDF_CACHE_DIR', None) or os.path.join(settings.MEDIA_ROOT, 'pdf_cache')
+    return os.path.join(racine, type_doc)
+
+
+def cache_path(type_doc, demande):
+    _, champ_modification, _ = DOCUMENTS[type_doc]
+    version = int(getattr(demande, champ_modification).timestamp() * 1_000_000)
+    return os.path.join(_repertoire(type_doc), f'{demande.pk}-{version}.pdf')
+
+
+def render(type_doc, demande):
+    """Rend le PDF dans le cache (écriture atomique) et supprime les versions précédentes"""
+    _, _, generer = DOCUMENTS[type_doc]
+    chemin = cache_path(type_doc, demande)
+    repertoire = os.path.dirname(chemin)
+    os.makedirs(repertoire, exist_ok=True)
+
+    contenu = generer(demande).getvalue()
+    descripteur, temporaire = tempfile.mkstemp(dir=repertoire, suffix='.tmp')
+    with os.fdopen(descripteur, 'wb') as fichier:
+        fichier.write(contenu)
+    os.replace(temporaire, chemin)
+
+    for ancien in glob.glob(os.path.join(repertoire, f'{demande.pk}-*.pdf')):
+        if ancien != chemin:
+            try:
+                os.remove(ancien)
+            except OSError:
+                pass
+    return chemin
+
+
+def get_or_render(type_doc, demande):
+    chemin = cache_path(type_doc, demande)
+    if os.path.exists(chemin):
+        return chemin
+    return render(type_doc, demande)
+
+
+def pdf_response(type_doc, demande, filename):
+    """Téléchargement du PDF : envoi du fichier en cache"""
+    return FileResponse(
+        open(get_or_render(type_doc, demande), 'rb'),
+        as_attachment=True, filename=filename, content_type='application/pdf'
+    )
+
+
+def schedule_render(type_doc, demande_id):
+    """Pré-génère le PDF après le commit (sinon il sera rendu au premier téléchargement)"""
+    if not getattr(settings, 'PDF_RENDER_ASYNC', False):
+        return
+
+    def programmer():
+        from .tasks_documents import render_demande_pdf_task
+        try:
+            render_demande_pdf_task.delay(type_doc, demande_id)
+        except Exception as e:
+            logger.warning(f"Pré-génération du PDF non programmée ({type_doc} {demande_id}): {e}")
+
+    transaction.on_commit(programmer)
@@ -0,0 +1,147 @@
+"""
+Export groupé des PDF de demandes de congé / d'absence dans une archive ZIP
+
+Les demandes sélectionnées sont rendues en parallèle par un ProcessPoolExecutor
+(PDF_EXPORT_WORKERS processus ; 0 : rendu dans le processus courant), avec la
+même logique que le téléchargement unitaire : chaque processus passe par le
+cache disque (voir core.pdf_cache), les PDF déjà pré-générés à l'approbation
+ne sont donc pas rendus une seconde fois.
+
+L'archive est écrite au fil des rendus terminés dans PDF_CACHE_DIR/exports/,
+sous un nom temporaire renommé à la fin : son existence signifie que l'export
+est complet. Le demandeur et le type de document sont enregistrés à côté
+({task_id}.json, enregistrer_export) : seul le demandeur peut suivre et
+télécharger l'archive, et uniquement depuis le point d'accès de ce type. La tâche Celery export_demandes_pdf_task (core.tasks_documents)
+publie sa progression (faits / total) dans l'état de la tâche.
+"""
+import glob
+import json
+import logging
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.db import connections
+
+from .pdf_cache import DOCUMENTS, _repertoire, get_or_render
+
+logger = logging.getLogger(__name__)
+
+# Archives conservées (secondes) avant suppression au prochain export
+DUREE_CONSERVATION = 24 * 3600
+
+
+def zip_path(task_id):
+    return os.path.join(_repertoire('exports'), f'{task_id}.zip')
+
+
+def _chemin_infos(task_id):
+    return os.path.join(_repertoire('exports'), f'{task_id}.json')
+
+
+def enregistrer_export(task_id, user_id, type_doc):
+    """Enregistre le demandeur et le type de document d'un export, avant son lancement"""
+    chemin = _chemin_infos(task_id)
+    os.makedirs(os.path.dirname(chemin), exist_ok=True)
+    with open(chemin, 'w') as fichier:
+        json.dump({'user_id': user_id, 'type_document': type_doc}, fichier)
+
+
+def supprimer_export(task_id):
+    """Oublie un export qui n'a pas pu être lancé"""
+    try:
+        os.remove(_chemin_infos(task_id))
+    except OSError:
+        pass
+
+
+def infos_export(task_id):
+    """{'user_id', 'type_document'} de l'export, ou None s'il est inconnu ou purgé"""
+    try:
+        with open(_chemin_infos(task_id)) as fichier:
+            return json.load(fichier)
+    except (OSError, ValueError):
+        return None
+
+
+def purge_exports():
+    """Supprime les archives et fichiers temporaires plus anciens que DUREE_CONSERVATION"""
+    limite = time.time() - DUREE_CONSERVATION
+    for chemin in glob.glob(os.path.join(_repertoire('exports'), '*')):
+        try:
+            if os.path.getmtime(chemin) < limite:
+                os.remove(chemin)
+        except OSError:
+            pass
+
+
+def _initialiser_processus():
+    # Processus enfant : Django configuré, connexions ouvertes à la première requête
+    import django
+    django.setup()
+
+
+def _rendre(type_doc, demande_id):
+    """(demande_id, chemin du PDF en cache, nom dans l'archive), ou None si la demande a disparu"""
+    modele = DOCUMENTS[type_doc][0]
+    demande = modele.objects.select_related(
+        'demandeur__profile__service', 'directeur', 'superieur'
+    ).filter(pk=demande_id).first()
+    if demande is None:
+        return None
+    return demande_id, get_or_render(type_doc, demande), f'{type_doc}_{demande.demandeur.username}_{demande_id}.pdf'
+
+
+def _resultats(type_doc, demande_ids, workers):
+    """Itère sur les rendus terminés, dans l'ordre d'achèvement"""
+    restants = list(demande_ids)
+    if workers:
+        # Les processus enfants ne doivent pas hériter des connexions du parent
+        connections.close_all()
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_initialiser_processus) as pool:
+                futures = [pool.submit(_rendre, type_doc, demande_id) for demande_id in restants]
+                for future in as_completed(futures):
+                    resultat = future.result()
+                    if resultat:
+                        restants.remove(resultat[0])
+                    yield resultat
+            return
+        except (BrokenProcessPool, AssertionError, OSError) as e:
+            # Ex. worker Celery en processus démon, qui ne peut pas créer d'enfants
+            logger.warning(f"Rendu parallèle indisponible, rendu séquentiel: {e}")
+    for demande_id in restants:
+        yield _rendre(type_doc, demande_id)
+
+
+def export_zip(type_doc, demande_ids, chemin_zip, progression=None, workers=None):
+    """
+    Rend les PDF des demandes et les écrit dans une archive ZIP
+
+    Args:
+        progression: fonction appelée avec (faits, total) après chaque PDF
+        workers: nombre de processus (PDF_EXPORT_WORKERS par défaut)
+
+    Returns:
+        int: nombre de PDF dans l'archive
+    """
+    if workers is None:
+        workers = getattr(settings, 'PDF_EXPORT_WORKERS', os.cpu_count() or 1)
+    os.makedirs(os.path.dirname(chemin_zip), exist_ok=True)
+    temporaire = f'{chemin_zip}.tmp'
+    total, faits, ajoutes = len(demande_ids), 0, 0
+    # PDF déjà compressés : archive sans recompression
+    with zipfile.ZipFile(temporaire, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for resultat in _resultats(type_doc, demande_ids, workers):
+            faits += 1
+            if resultat:
+                _, chemin, nom = resultat
+                archive.write(chemin, nom)
+                ajoutes += 1
+            if progression:
+                progression(faits, total)
+    os.replace(temporaire, chemin_zip)
+    return ajoutes
@@ -9,11 +9,13 @@ from io import BytesIO
 import datetime
 import os
 import base64
+from functools import lru_cache
 from django.conf import settings
 
 
-def _armoirie_image(max_width_cm=3.0, max_height_cm=3.0):
-    """Retourne un objet Image reportlab de l'armoirie à partir d'un base64.
+@lru_cache(maxsize=1)
+def _armoirie_bytes():
+    """Image de l'armoirie décodée une fois par processus (None si absente ou invalide).
     La chaîne base64 doit être fournie via settings.ARMOIRIE_BASE64 ou la variable d'environnement ARMOIRIE_BASE64.
     Supporte un data URL (data:image/...;base64,XXXXX) ou un base64 pur.
     """
@@ -24,9 +26,18 @@ def _armoirie_image(max_width_cm=3.0, max_height_cm=3.0):
         # Si data URL, extraire la partie après la virgule
         if ',' in b64 and b64.strip().lower().startswith('data:'):
             b64 = b64.split(',', 1)[1]
-        raw = base64.b64decode(b64)
-        bio = BytesIO(raw)
-        img = Image(bio)
+        return base64.b64decode(b64)
+    except Exception:
+        return None
+
+
+def _armoirie_image(max_width_cm=3.0, max_height_cm=3.0):
+    """Retourne un objet Image reportlab de l'armoirie (une instance par document)."""
+    raw = _armoirie_bytes()
+    if not raw:
+        return None
+    try:
+        img = Image(BytesIO(raw))
         # Redimensionner en gardant les proportions dans une boîte max_width_cm x max_height_cm
         max_w = max_width_cm * cm
         max_h = max_height_cm * cm
@@ -42,28 +53,11 @@ def _armoirie_image(max_width_cm=3.0, max_height_cm=3.0):
         return None
 
 
-def generate_conge_pdf(demande_conge):
-    """Génère un PDF pour une demande de congé basé sur le formulaire officiel DRENA Abidjan 3"""
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=1.5*cm, leftMargin=1.5*cm, 
-                           topMargin=1*cm, bottomMargin=1*cm)
-    
-    # Styles
+@lru_cache(maxsize=1)
+def _styles():
+    """Styles des formulaires, construits une fois par processus"""
     styles = getSampleStyleSheet()
-    
-    # Style pour l'en-tête ministère
-    ministry_style = ParagraphStyle(
-        'MinistryStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        fontName='Helvetica-Bold',
-        alignment=TA_CENTER,
-        spaceAfter=5
-    )
-    
-    # Style pour le titre principal
-    main_title_style = ParagraphStyle(
-        'MainTitle',
+    titre = dict(
         parent=styles['Heading1'],
         fontSize=16,
         fontName='Helvetica-Bold',
@@ -71,29 +65,62 @@ def generate_conge_pdf(demande_conge):
         spaceAfter=20,
         spaceBefore=10,
         borderWidth=2,
-        borderColor=colors.orange,
         borderPadding=10,
         backColor=colors.white
     )
+    return {
+        # En-tête ministère
+        'ministry': ParagraphStyle(
+            'MinistryStyle',
+            parent=styles['Normal'],
+            fontSize=10,
+            fontName='Helvetica-Bold',
+            alignment=TA_CENTER,
+            spaceAfter=5
+        ),
+        # Titre principal encadré (orange pour les congés, rouge pour les absences)
+        'main_title_conge': ParagraphStyle('MainTitle', borderColor=colors.orange, **titre),
+        'main_title_absence': ParagraphStyle('MainTitle', borderColor=colors.red, **titre),
+        # Textes normaux
+        'normal': ParagraphStyle(
+            'Normal',
+            parent=styles['Normal'],
+            fontSize=11,
+            spaceAfter=8,
+            alignment=TA_LEFT
+        ),
+        # Signatures
+        'signature': ParagraphStyle(
+            'Signature',
+            parent=styles['Normal'],
+            fontSize=10,
+            fontName='Helvetica-Bold',
+            alignment=TA_CENTER,
+            spaceAfter=5
+        ),
+        # Pied de page
+        'footer': ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            alignment=TA_CENTER,
+            textColor=colors.grey
+        ),
+    }
+
+
+def generate_conge_pdf(demande_conge):
+    """Génère un PDF pour une demande de congé basé sur le formulaire officiel DRENA Abidjan 3"""
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=1.5*cm, leftMargin=1.5*cm, 
+                           topMargin=1*cm, bottomMargin=1*cm)
     
-    # Style pour les textes normaux
-    normal_style = ParagraphStyle(
-        'Normal',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=8,
-        alignment=TA_LEFT
-    )
-    
-    # Style pour les signatures
-    signature_style = ParagraphStyle(
-        'Signature',
-        parent=styles['Normal'],
-        fontSize=10,
-        fontName='Helvetica-Bold',
-        alignment=TA_CENTER,
-        spaceAfter=5
-    )
+    # Styles (partagés, voir _styles)
+    styles = _styles()
+    ministry_style = styles['ministry']
+    main_title_style = styles['main_title_conge']
+    normal_style = styles['normal']
+    signature_style = styles['signature']
     
     # Contenu du document
     story = []
@@ -203,13 +230,7 @@ def generate_conge_pdf(demande_conge):
     story.append(signature_table)
     # Pied de page avec contact
     footer_text = "DRENA ABIDJAN3-21 BP 4389 ABIDJAN 21- Tél: 27235118/ 27231912 E-mail: abidjan3dren@yahoo.fr / drenaabidjan3@gmail.com"
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=8,
-        alignment=TA_CENTER,
-        textColor=colors.grey
-    )
+    footer_style = styles['footer']
     story.append(Paragraph(footer_text, footer_style))
     
     # Construction du PDF
@@ -224,52 +245,12 @@ def generate_absence_pdf(demande_absence):
     doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=1.5*cm, leftMargin=1.5*cm, 
                            topMargin=1*cm, bottomMargin=1*cm)
     
-    # Styles
-    styles = getSampleStyleSheet()
-    
-    # Style pour l'en-tête ministère
-    ministry_style = ParagraphStyle(
-        'MinistryStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        fontName='Helvetica-Bold',
-        alignment=TA_CENTER,
-        spaceAfter=5
-    )
-    
-    # Style pour le titre principal
-    main_title_style = ParagraphStyle(
-        'MainTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        fontName='Helvetica-Bold',
-        alignment=TA_CENTER,
-        spaceAfter=20,
-        spaceBefore=10,
-        borderWidth=2,
-        borderColor=colors.red,
-        borderPadding=10,
-        backColor=colors.white
-    )
-    
-    # Style pour les textes normaux
-    normal_style = ParagraphStyle(
-        'Normal',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=8,
-        alignment=TA_LEFT
-    )
-    
-    # Style pour les signatures
-    signature_style = ParagraphStyle(
-        'Signature',
-        parent=styles['Normal'],
-        fontSize=10,
-        fontName='Helvetica-Bold',
-        alignment=TA_CENTER,
-        spaceAfter=5
-    )
+    # Styles (partagés, voir _styles)
+    styles = _styles()
+    ministry_style = styles['ministry']
+    main_title_style = styles['main_title_absence']
+    normal_style = styles['normal']
+    signature_style = styles['signature']
     
     # Contenu du document
     story = []
@@ -379,13 +360,7 @@ def generate_absence_pdf(demande_absence):
     story.append(signature_table)
     # Pied de page avec contact
     footer_text = "DRENA ABIDJAN3-21 BP 4389 ABIDJAN 21- Tél: 27235118/ 27231912 E-mail: abidjan3dren@yahoo.fr / drenaabidjan3@gmail.com"
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=8,
-        alignment=TA_CENTER,
-        textColor=colors.grey
-    )
+    footer_style = styles['footer']
     story.append(Paragraph(footer_text, footer_style))
     
     # Construction du PDF
@@ -0,0 +1,227 @@
+"""
+Matrice mensuelle de présence (PresenceJour)
+
+Une ligne par agent et par jour : code de statut et heures travaillées,
+consolidés depuis quatre sources que les superviseurs combinaient côté client :
+- Presence (pointage du jour, heures arrivée → départ)
+- OccurrenceSpeciale (ancienne `date` unique ou plage `date_debut`/`date_fin`)
+- DemandeConge approuvées
+- DemandeAbsence approuvées
+
+Quand plusieurs sources couvrent un même jour, le code le plus prioritaire
+l'emporte (PRIORITE) : un pointage « présent » prime sur un congé, un congé sur
+une absence non justifiée.
+
+Mise à jour incrémentale : les signaux de core.signals recalculent après le
+commit les jours de l'agent couverts par l'ancienne et la nouvelle version de
+l'objet modifié, sous un verrou des lignes User concernées (lecture des
+sources dans la transaction d'écriture). rebuild_all (commande
+rebuild_presence_matrix) reconstruit la table année par année.
+"""
+import calendar
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Max, Min, Q
+from django.utils import timezone
+
+from .models import Agent, DemandeAbsence, DemandeConge, OccurrenceSpeciale, Presence, PresenceJour
+from .org_hierarchy import users_under
+
+TAILLE_LOT = 1000
+
+CODES = {
+    'P': 'Présent',
+    'M': 'En mission',
+    'R': 'Représentation',
+    'T': 'Télétravail',
+    'PE': 'Permission',
+    'AU': 'Autorisation d\'absence',
+    'C': 'Congé',
+    'F': 'Férié',
+    'A': 'Absent',
+}
+# Du plus prioritaire au moins prioritaire
+PRIORITE = {code: rang for rang, code in enumerate(CODES)}
+
+CODES_PRESENCE = {
+    'présent': 'P',
+    'absent': 'A',
+    'en mission': 'M',
+    'permission accordée': 'PE',
+}
+CODES_OCCURRENCE = {
+    'REP1': 'R', 'REP2': 'R',
+    'M1': 'M', 'M2': 'M',
+    'C': 'C',
+    'T': 'T',
+    'F': 'F',
+    'P1': 'PE', 'P2': 'PE',
+    'ABS': 'A',
+}
+
+
+def _jours(debut, fin):
+    jour = debut
+    while jour <= fin:
+        yield jour
+        jour += timedelta(days=1)
+
+
+def _date_locale(valeur):
+    if isinstance(valeur, datetime):
+        return timezone.localtime(valeur).date() if timezone.is_aware(valeur) else valeur.date()
+    return valeur
+
+
+def _heures(arrivee, depart):
+    if not arrivee or not depart:
+        return Decimal('0')
+    secondes = (datetime.combine(date.min, depart) - datetime.combine(date.min, arrivee)).total_seconds()
+    return Decimal(max(secondes, 0) / 3600.0).quantize(Decimal('0.01'))
+
+
+def _filtre_users(champ, user_ids):
+    return Q() if user_ids is None else Q(**{f'{champ}__in': user_ids})
+
+
+def compute(user_ids, debut, fin):
+    """{(user_id, jour): (code, heures)} depuis les quatre sources, pour la plage [debut, fin]"""
+    cellules = {}
+
+    def poser(user_id, jour, code, heures=Decimal('0')):
+        if not (debut <= jour <= fin):
+            return
+        actuel = cellules.get((user_id, jour))
+        if actuel is None or PRIORITE[code] < PRIORITE[actuel[0]]:
+            cellules[(user_id, jour)] = (code, heures)
+
+    for user_id, jour, statut, arrivee, depart in Presence.objects.filter(
+            _filtre_users('agent__user_id', user_ids), date_presence__range=(debut, fin)
+    ).values_list('agent__user_id', 'date_presence', 'statut', 'heure_arrivee', 'heure_depart'):
+        code = 'P' if arrivee else CODES_PRESENCE.get(statut, 'A')
+        poser(user_id, jour, code, _heures(arrivee, depart))
+
+    for user_id, type_occurrence, jour_unique, date_debut, date_fin in OccurrenceSpeciale.objects.filter(
+            _filtre_users('agent_id', user_ids),
+            Q(date__range=(debut, fin)) |
+            Q(date_debut__lte=fin, date_fin__gte=debut) |
+            Q(date_debut__range=(debut, fin), date_fin__isnull=True)
+    ).values_list('agent_id', 'type_occurrence', 'date', 'date_debut', 'date_fin'):
+        code = CODES_OCCURRENCE.get(type_occurrence)
+        if not code:
+            continue
+        premier = date_debut or jour_unique
+        for jour in _jours(max(premier, debut), min(date_fin or premier, fin)):
+            poser(user_id, jour, code)
+
+    for user_id, date_debut, date_fin in DemandeConge.objects.filter(
+            _filtre_users('demandeur_id', user_ids), statut='approuve', date_debut__lte=fin, date_fin__gte=debut
+    ).values_list('demandeur_id', 'date_debut', 'date_fin'):
+        for jour in _jours(max(date_debut, debut), min(date_fin, fin)):
+            poser(user_id, jour, 'C')
+
+    for user_id, date_debut, date_fin in DemandeAbsence.objects.filter(
+            _filtre_users('demandeur_id', user_ids), statut='approuve',
+            date_debut__date__lte=fin, date_fin__date__gte=debut
+    ).values_list('demandeur_id', 'date_debut', 'date_fin'):
+        for jour in _jours(max(_date_locale(date_debut), debut), min(_date_locale(date_fin), fin)):
+            poser(user_id, jour, 'AU')
+
+    return cellules
+
+
+def refresh(user_ids, debut, fin):
+    """Recalcule les jours [debut, fin] des utilisateurs donnés (tous si user_ids vaut None)"""
+    debut, fin = _date_locale(debut), _date_locale(fin)
+    if user_ids is not None:
+        user_ids = [user_id for user_id in set(user_ids) if user_id]
+        if not user_ids:
+            return
+    with transaction.atomic():
+        # Verrou des utilisateurs, puis lecture des sources dans la transaction d'écriture :
+        # deux recalculs concurrents d'un même agent s'exécutent l'un après l'autre
+        if user_ids is not None:
+            list(User.objects.select_for_update().filter(id__in=user_ids).order_by('id').values_list('id', flat=True))
+        cellules = compute(user_ids, debut, fin)
+        PresenceJour.objects.filter(_filtre_users('user_id', user_ids), jour__range=(debut, fin)).delete()
+        PresenceJour.objects.bulk_create([
+            PresenceJour(user_id=user_id, jour=jour, code=code, heures=heures)
+            for (user_id, jour), (code, heures) in cellules.items()
+        ], batch_size=TAILLE_LOT)
+
+
+def refresh_agents(agent_ids, debut, fin):
+    """Même chose pour des fiches Agent (Presence est rattachée à Agent, les autres sources à User)"""
+    refresh(Agent.objects.filter(id__in=list(agent_ids)).values_list('user_id', flat=True), debut, fin)
+
+
+def _bornes():
+    """Première et dernière date couvertes par les sources"""
+    bornes = [
+        Presence.objects.aggregate(a=Min('date_presence'), b=Max('date_presence')),
+        OccurrenceSpeciale.objects.aggregate(a=Min('date'), b=Max('date')),
+        OccurrenceSpeciale.objects.aggregate(a=Min('date_debut'), b=Max('date_fin')),
+        DemandeConge.objects.aggregate(a=Min('date_debut'), b=Max('date_fin')),
+        DemandeAbsence.objects.aggregate(a=Min('date_debut'), b=Max('date_fin')),
+    ]
+    debuts = [_date_locale(b['a']) for b in bornes if b['a']]
+    fins = [_date_locale(b['b']) for b in bornes if b['b']]
+    return (min(debuts), max(fins)) if debuts and fins else (None, None)
+
+
+def rebuild_all():
+    """Reconstruit toute la table, une année à la fois"""
+    debut, fin = _bornes()
+    PresenceJour.objects.all().delete()
+    if debut:
+        for annee in range(debut.year, fin.year + 1):
+            refresh(None, date(annee, 1, 1), date(annee, 12, 31))
+    return PresenceJour.objects.count()
+
+
+# --- Lecture ---
+
+def service_month(service_id, annee, mois, scope=None):
+    """
+    Matrice d'un service pour un mois, en deux requêtes (agents, puis cellules)
+
+    Tous les agents du service figurent dans la matrice, y compris ceux qui n'ont
+    aucune ligne ce mois-ci (statuts à None) : ce sont les absences à repérer.
+
+    Returns:
+        dict: {'jours': n, 'codes': {...}, 'agents': [{'user_id', 'nom', 'prenom',
+        'statuts': [code ou None par jour], 'heures': [heures par jour]}]}
+    """
+    nb_jours = calendar.monthrange(annee, mois)[1]
+    premier = date(annee, mois, 1)
+    membres = User.objects.filter(id__in=users_under(('service', service_id)))
+    if scope is not None:
+        membres = scope.filter(membres, 'id')
+
+    agents = {
+        user_id: {
+            'user_id': user_id, 'nom': nom, 'prenom': prenom,
+            'statuts': [None] * nb_jours, 'heures': [0] * nb_jours,
+        }
+        for user_id, nom, prenom in membres.order_by('last_name', 'first_name', 'id').values_list(
+            'id', 'last_name', 'first_name'
+        )
+    }
+    if agents:
+        for user_id, jour, code, heures in PresenceJour.objects.filter(
+                user_id__in=list(agents), jour__range=(premier, date(annee, mois, nb_jours))
+        ).values_list('user_id', 'jour', 'code', 'heures'):
+            agents[user_id]['statuts'][jour.day - 1] = code
+            agents[user_id]['heures'][jour.day - 1] = float(heures)
+
+    return {
+        'service': service_id,
+        'annee': annee,
+        'mois': mois,
+        'jours': nb_jours,
+        'codes': CODES,
+        'agents': list(agents.values()),
+    }
@@ -0,0 +1,112 @@
+"""
+Heures de présence agrégées par la base de données
+
+Les durées (heure_depart - heure_arrivee, différence de TIME_TO_SEC sous
+MySQL) sont sommées par GROUP BY : une seule requête quel que soit le nombre de présences,
+y compris pour le rapport annuel de tout le ministère.
+
+- summary_rows : une ligne par agent, avec les moyennes réelles par jour,
+  semaine ISO, mois et année travaillés (total / nombre de périodes distinctes)
+- period_rows : une ligne par agent et par période (jour, semaine, mois, année)
+
+Les deux renvoient des itérateurs sur le curseur : la vue les sérialise au fil
+de l'eau (voir core.views_stats).
+"""
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Q, Sum
+from django.db.models.functions import ExtractIsoYear, ExtractMonth, ExtractWeek, ExtractYear
+
+from .models import Presence
+
+TAILLE_LOT = 2000
+
+CHAMPS_AGENT = {
+    'user_id': 'agent__user_id',
+    'last_name': 'agent__user__last_name',
+    'first_name': 'agent__user__first_name',
+    'service': 'agent__service__nom',
+    'direction': 'agent__service__direction__nom',
+}
+
+# Clés de regroupement de chaque grain de période
+PERIODES = {
+    'jour': {'jour': F('date_presence')},
+    'semaine': {'annee': ExtractIsoYear('date_presence'), 'semaine': ExtractWeek('date_presence')},
+    'mois': {'annee': ExtractYear('date_presence'), 'mois': ExtractMonth('date_presence')},
+    'annee': {'annee': ExtractYear('date_presence')},
+}
+
+
+def _duree():
+    return ExpressionWrapper(F('heure_depart') - F('heure_arrivee'), output_field=DurationField())
+
+
+def presences_filtrees(start=None, end=None, service_id=None, direction_id=None):
+    """Présences complètes (arrivée et départ) de la période et du périmètre demandés"""
+    qs = Presence.objects.filter(heure_arrivee__isnull=False, heure_depart__isnull=False)
+    if start:
+        qs = qs.filter(date_presence__gte=start)
+    if end:
+        qs = qs.filter(date_presence__lte=end)
+    if service_id:
+        qs = qs.filter(agent__service_id=service_id)
+    if direction_id:
+        qs = qs.filter(
+            Q(agent__service__direction_id=direction_id) |
+            Q(agent__service__sous_direction__direction_id=direction_id)
+        )
+    # Pas de tri par défaut du modèle dans le GROUP BY
+    return qs.order_by()
+
+
+def _heures(duree):
+    return round(duree.total_seconds() / 3600.0, 2) if duree else 0
+
+
+def summary_rows(presences):
+    """
+    Une ligne par agent : total et moyennes par jour, semaine, mois et année travaillés
+    """
+    cle_semaine = ExtractIsoYear('date_presence') * 100 + ExtractWeek('date_presence')
+    cle_mois = ExtractYear('date_presence') * 100 + ExtractMonth('date_presence')
+    lignes = (
+        presences.values(*CHAMPS_AGENT.values())
+        .annotate(
+            duree=Sum(_duree()),
+            jours=Count('date_presence', distinct=True),
+            semaines=Count(cle_semaine, distinct=True),
+            mois=Count(cle_mois, distinct=True),
+            annees=Count(ExtractYear('date_presence'), distinct=True),
+        )
+        .order_by('agent__user__last_name', 'agent__user__first_name', 'agent__user_id')
+    )
+    for ligne in lignes.iterator(chunk_size=TAILLE_LOT):
+        secondes = ligne['duree'].total_seconds() if ligne['duree'] else 0
+        resultat = {cle: ligne[champ] for cle, champ in CHAMPS_AGENT.items()}
+        resultat['service'] = resultat['service'] or ''
+        resultat['direction'] = resultat['direction'] or ''
+        resultat.update({
+            'total_hours': _heures(ligne['duree']),
+            'days_worked': ligne['jours'],
+            'hours_per_day': round(secondes / 3600.0 / ligne['jours'], 2) if ligne['jours'] else 0,
+            'hours_per_week': round(secondes / 3600.0 / ligne['semaines'], 2) if ligne['semaines'] else 0,
+            'hours_per_month': round(secondes / 3600.0 / ligne['mois'], 2) if ligne['mois'] else 0,
+            'hours_per_year': round(secondes / 3600.0 / ligne['annees'], 2) if ligne['annees'] else 0,
+        })
+        yield resultat
+
+
+def period_rows(presences, periode):
+    """Une ligne par agent et par période : heures travaillées et nombre de jours"""
+    cles = PERIODES[periode]
+    lignes = (
+        presences.annotate(**cles)
+        .values('agent__user_id', *cles)
+        .annotate(duree=Sum(_duree()), jours=Count('date_presence', distinct=True))
+        .order_by('agent__user_id', *cles)
+    )
+    for ligne in lignes.iterator(chunk_size=TAILLE_LOT):
+        resultat = {'user_id': ligne['agent__user_id']}
+        resultat.update({cle: ligne[cle] for cle in cles})
+        resultat['hours'] = _heures(ligne['duree'])
+        resultat['days_worked'] = ligne['jours']
+        yield resultat
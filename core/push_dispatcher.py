@@ -0,0 +1,211 @@
+"""
+Envoi groupé des notifications push
+
+- une session HTTP partagée par processus (connexions conservées, nouvelles
+  tentatives sur les erreurs 5xx)
+- les tokens Android sont envoyés par lots FCM multicast (registration_ids,
+  jusqu'à FCM_MULTICAST_MAX par requête) au lieu d'une requête par token
+- last_used est mis à jour en une requête pour tous les tokens ayant reçu le message
+- les tokens refusés par FCM (NotRegistered, InvalidRegistration...) sont désactivés,
+  les tokens remplacés (registration_id canonique) sont mis à jour
+
+L'URL FCM est configurable (settings.FCM_SEND_URL) pour tester contre un serveur local.
+Appelé depuis les tâches Celery de la file « push » (voir core.geofencing_tasks).
+"""
+import logging
+import os
+from collections import defaultdict
+
+import requests
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .models import PushNotificationToken
+
+logger = logging.getLogger(__name__)
+
+FCM_SEND_URL = 'https://fcm.googleapis.com/fcm/send'
+
+# Nombre maximal de tokens par requête multicast (limite FCM)
+FCM_MULTICAST_MAX = 1000
+
+# Erreurs FCM signifiant que le token ne recevra plus jamais de message
+FCM_ERREURS_DEFINITIVES = {'NotRegistered', 'InvalidRegistration', 'MismatchSenderId'}
+
+TIMEOUT_SECONDES = 10
+
+_session = None
+_session_pid = None
+
+
+def get_session():
+    """Session HTTP du processus courant (recréée après un fork)"""
+    global _session, _session_pid
+    if _session is None or _session_pid != os.getpid():
+        session = requests.Session()
+        retry = Retry(
+            total=2, backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['POST'])
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _session, _session_pid = session, os.getpid()
+    return _session
+
+
+def send_fcm_multicast(tokens, title, body, data):
+    """
+    Envoie un message FCM à une liste de tokens en une requête
+
+    Returns:
+        list: un résultat par token, dans l'ordre : ('ok', None), ('ok', nouveau_token),
+        ('mort', erreur) ou ('echec', erreur)
+    """
+    fcm_server_key = getattr(settings, 'FCM_SERVER_KEY', None)
+    if not fcm_server_key:
+        logger.warning("FCM_SERVER_KEY non configuré")
+        return [('echec', 'configuration')] * len(tokens)
+
+    payload = {
+        'registration_ids': list(tokens),
+        'notification': {
+            'title': title,
+            'body': body,
+            'sound': 'default',
+            'priority': 'high'
+        },
+        'data': data,
+        'priority': 'high'
+    }
+    try:
+        response = get_session().post(
+            getattr(settings, 'FCM_SEND_URL', FCM_SEND_URL),
+            headers={'Authorization': f'key={fcm_server_key}', 'Content-Type': 'application/json'},
+            json=payload,
+            timeout=TIMEOUT_SECONDES
+        )
+    except requests.RequestException as e:
+        logger.error(f"Erreur lors de l'envoi FCM: {e}")
+        return [('echec', 'reseau')] * len(tokens)
+
+    if response.status_code != 200:
+        logger.error(f"Erreur FCM: {response.status_code} - {response.text[:200]}")
+        return [('echec', f'http_{response.status_code}')] * len(tokens)
+
+    resultats = []
+    for resultat in response.json().get('results', []):
+        erreur = resultat.get('error')
+        if erreur in FCM_ERREURS_DEFINITIVES:
+            resultats.append(('mort', erreur))
+        elif erreur:
+            resultats.append(('echec', erreur))
+        else:
+            resultats.append(('ok', resultat.get('registration_id')))
+    # Réponse incomplète : les tokens sans résultat sont en échec
+    resultats.extend([('echec', 'sans_resultat')] * (len(tokens) - len(resultats)))
+    return resultats
+
+
+def _envoyer_unitaire(token, title, body, data):
+    # APNS et Web Push ne sont pas encore branchés (voir core.notifications)
+    from .notifications import send_apns_notification, send_web_notification
+    if token.platform == 'ios':
+        return send_apns_notification(token.token, title, body, data)
+    return send_web_notification(token.token, title, body, data)
+
+
+def _enregistrer(ok_ids, morts_ids, remplacements):
+    """Met à jour en lot last_used, désactive les tokens morts, applique les tokens canoniques"""
+    if ok_ids:
+        PushNotificationToken.objects.filter(id__in=ok_ids).update(last_used=timezone.now())
+    if morts_ids:
+        PushNotificationToken.objects.filter(id__in=morts_ids).update(is_active=False)
+    for token_id, nouveau in remplacements.items():
+        try:
+            with transaction.atomic():
+                PushNotificationToken.objects.filter(id=token_id).update(token=nouveau)
+        except IntegrityError:
+            # Le nouveau token est déjà enregistré : l'ancien est désactivé
+            PushNotificationToken.objects.filter(id=token_id).update(is_active=False)
+
+
+def send_push_batch(tokens, title, body, data):
+    """
+    Envoie un même message à plusieurs tokens, groupés par plateforme
+
+    Args:
+        tokens: PushNotificationToken actifs
+        title, body: contenu de la notification
+        data: données supplémentaires (valeurs chaînes)
+
+    Returns:
+        dict: {'envoyes': [ids des tokens servis], 'morts': [...], 'echecs': int}
+    """
+    par_plateforme = defaultdict(list)
+    for token in tokens:
+        par_plateforme[token.platform].append(token)
+
+    ok_ids, morts_ids, remplacements = [], [], {}
+    echecs = 0
+
+    android = par_plateforme.pop('android', [])
+    for i in range(0, len(android), FCM_MULTICAST_MAX):
+        lot = android[i:i + FCM_MULTICAST_MAX]
+        for token, (statut, detail) in zip(lot, send_fcm_multicast([t.token for t in lot], title, body, data)):
+            if statut == 'ok':
+                ok_ids.append(token.id)
+                if detail and detail != token.token:
+                    remplacements[token.id] = detail
+            elif statut == 'mort':
+                morts_ids.append(token.id)
+            else:
+                echecs += 1
+
+    for lot in par_plateforme.values():
+        for token in lot:
+            if _envoyer_unitaire(token, title, body, data):
+                ok_ids.append(token.id)
+            else:
+                echecs += 1
+
+    _enregistrer(ok_ids, morts_ids, remplacements)
+    return {'envoyes': ok_ids, 'morts': morts_ids, 'echecs': echecs}
+
+
+def alert_push_content(alert):
+    """Titre, corps et données d'une notification push d'alerte de géofencing"""
+    return "Alerte de géofencing", alert.message_alerte, {
+        'type': 'geofence_alert',
+        'alert_id': str(alert.id),
+        'agent_name': alert.agent.get_full_name() or alert.agent.username,
+        'bureau_name': alert.bureau.nom,
+        'distance': str(alert.distance_metres),
+        'timestamp': alert.timestamp_alerte.isoformat()
+    }
+
+
+def dispatch_alerts_push(alerts, user_ids):
+    """
+    Envoie en push chaque alerte à tous les destinataires (tokens chargés une seule fois)
+
+    Returns:
+        set: identifiants des alertes délivrées à au moins un appareil
+    """
+    tokens = list(PushNotificationToken.objects.filter(user_id__in=user_ids, is_active=True))
+    delivrees = set()
+    for alert in alerts:
+        if not tokens:
+            break
+        title, body, data = alert_push_content(alert)
+        resultat = send_push_batch(tokens, title, body, data)
+        if resultat['envoyes']:
+            delivrees.add(alert.id)
+        if resultat['morts']:
+            morts = set(resultat['morts'])
+            tokens = [token for token in tokens if token.id not in morts]
+    return delivrees
@@ -0,0 +1,205 @@
+"""
+Recherche plein texte des courriers, diligences et tâches
+
+Index inversé (SearchTerm) plutôt que des icontains sur des colonnes TEXT :
+- les textes sont découpés en termes normalisés (minuscules, sans accents,
+  ligatures œ/æ développées, mots vides français retirés, pluriel simple en
+  s/x retiré) ; la requête est normalisée de la même façon
+- chaque (terme, objet) porte le poids cumulé des champs où il apparaît
+  (référence > objet > expéditeur > instructions...)
+- le dernier mot de la requête est cherché comme préfixe (saisie en cours)
+- un objet est retenu s'il contient tous les termes ; le score est la somme
+  des poids, calculée en une requête agrégée par type d'objet
+
+Index tenu à jour après le commit par les signaux de core.signals ;
+rebuild_all (commande rebuild_search_index) le reconstruit entièrement.
+Même code pour MySQL et SQLite : pas de dépendance à FULLTEXT.
+"""
+import re
+import unicodedata
+
+from django.db import transaction
+from django.db.models import Case, Count, IntegerField, Q, Sum, Value, When
+
+from .models import (
+    Courrier, CourrierAccess, CourrierImputation, Diligence, DiligenceVisibility, SearchTerm, Tache
+)
+from .org_scope import get_org_scope
+
+TAILLE_LOT = 500
+LONGUEUR_MAX_TERME = 64
+# Nombre maximal de termes pris en compte dans une requête
+TERMES_MAX = 8
+
+# Champs indexés et poids de chaque champ
+POIDS_CHAMPS = {
+    'courrier': {'reference': 8, 'objet': 4, 'expediteur': 2, 'destinataire': 2},
+    'diligence': {'reference_courrier': 8, 'objet': 4, 'expediteur': 2, 'instructions': 1},
+    'tache': {'titre': 4, 'description': 1},
+}
+MODELES = {'courrier': Courrier, 'diligence': Diligence, 'tache': Tache}
+
+# Champs renvoyés avec chaque résultat
+CHAMPS_RESULTATS = {
+    'courrier': ('id', 'reference', 'objet', 'expediteur', 'statut', 'type_courrier', 'date_reception'),
+    'diligence': ('id', 'reference_courrier', 'objet', 'statut', 'date_limite'),
+    'tache': ('id', 'titre', 'etat', 'priorite', 'date_fin_prevue'),
+}
+
+MOTS_VIDES = frozenset("""
+a au aux avec ce ces cet cette dans de des du elle en et eux il ils je la le les leur leurs
+lui ma mais me meme mes moi mon ne nos notre nous on ou par pas pour qu que qui sa se ses son
+sur ta te tes toi ton tu un une vos votre vous est sont ete etre avoir afin ainsi
+""".split())
+
+
+def normaliser(texte):
+    """Minuscules, sans accents ni ligatures"""
+    texte = texte.lower().replace('œ', 'oe').replace('æ', 'ae')
+    return ''.join(c for c in unicodedata.normalize('NFKD', texte) if not unicodedata.combining(c))
+
+
+def _racine(mot):
+    # Pluriel simple : « courriers » et « courrier » partagent le même terme
+    if len(mot) > 4 and mot[-1] in 'sx' and mot.isalpha():
+        return mot[:-1]
+    return mot
+
+
+def tokenize(texte):
+    """Termes normalisés d'un texte, dans l'ordre, mots vides exclus"""
+    if not texte:
+        return []
+    return [
+        _racine(mot)[:LONGUEUR_MAX_TERME]
+        for mot in re.findall(r'[a-z0-9]+', normaliser(str(texte)))
+        if mot not in MOTS_VIDES and (len(mot) > 1 or mot.isdigit())
+    ]
+
+
+def termes_ponderes(valeurs, poids_champs):
+    """{terme: poids} d'un document à partir de ses valeurs de champs"""
+    termes = {}
+    for champ, poids in poids_champs.items():
+        for terme in set(tokenize(valeurs.get(champ))):
+            termes[terme] = termes.get(terme, 0) + poids
+    return termes
+
+
+# --- Mise à jour de l'index ---
+
+def index_objects(type_objet, ids):
+    """(Ré)indexe des objets ; les identifiants disparus sont retirés de l'index"""
+    modele, poids_champs = MODELES[type_objet], POIDS_CHAMPS[type_objet]
+    ids = list(ids)
+    for i in range(0, len(ids), TAILLE_LOT):
+        lot = ids[i:i + TAILLE_LOT]
+        lignes = [
+            SearchTerm(terme=terme, type_objet=type_objet, objet_id=valeurs['id'], poids=poids)
+            for valeurs in modele.objects.filter(id__in=lot).values('id', *poids_champs)
+            for terme, poids in termes_ponderes(valeurs, poids_champs).items()
+        ]
+        with transaction.atomic():
+            SearchTerm.objects.filter(type_objet=type_objet, objet_id__in=lot).delete()
+            SearchTerm.objects.bulk_create(lignes, batch_size=TAILLE_LOT)
+
+
+def remove_objects(type_objet, ids):
+    SearchTerm.objects.filter(type_objet=type_objet, objet_id__in=list(ids)).delete()
+
+
+def rebuild_all():
+    """Reconstruit tout l'index"""
+    with transaction.atomic():
+        SearchTerm.objects.all().delete()
+        for type_objet, modele in MODELES.items():
+            index_objects(type_objet, modele.objects.values_list('id', flat=True))
+    return SearchTerm.objects.count()
+
+
+# --- Recherche ---
+
+def _visibles(type_objet, user):
+    """
+    Sous-requête des identifiants visibles par l'utilisateur, ou None pour tous
+    (mêmes règles que les listes des viewsets correspondants)
+    """
+    scope = get_org_scope(user)
+    if type_objet == 'courrier':
+        if scope.role in ('ADMIN', 'SECRETAIRE'):
+            return None
+        if not scope.has_profile:
+            return Q(objet_id__in=Courrier.objects.filter(type_courrier='ordinaire').values('id'))
+        return (
+            Q(objet_id__in=CourrierImputation.objects.filter(user=user).values('courrier_id')) |
+            Q(objet_id__in=CourrierAccess.objects.filter(user=user).values('courrier_id'))
+        )
+    if type_objet == 'diligence':
+        if scope.role == 'ADMIN':
+            return None
+        if not scope.has_profile:
+            return Q(pk__in=[])
+        return Q(objet_id__in=DiligenceVisibility.objects.filter(user=user).values('diligence_id'))
+    # Tâches : celles dont l'utilisateur est un intervenant, ou dont le responsable
+    # ou un agent est dans son périmètre
+    if scope.sees_all:
+        return None
+    taches = Tache.objects.filter(
+        scope.q('responsable') | scope.q('agents') |
+        Q(directeurs=user) | Q(superieurs=user) | Q(secretaires=user)
+    ).values('id')
+    return Q(objet_id__in=taches)
+
+
+def _scores(type_objet, termes, prefixe, visibles, limite):
+    """[(objet_id, score)] des objets contenant tous les termes, meilleurs d'abord"""
+    conditions = [When(terme=terme, then=Value(i)) for i, terme in enumerate(termes)]
+    filtre = Q(terme__in=termes) if termes else Q()
+    if prefixe:
+        conditions.append(When(terme__startswith=prefixe, then=Value(len(termes))))
+        filtre = (filtre | Q(terme__startswith=prefixe)) if termes else Q(terme__startswith=prefixe)
+    attendus = len(conditions)
+
+    qs = SearchTerm.objects.filter(filtre, type_objet=type_objet)
+    if visibles is not None:
+        qs = qs.filter(visibles)
+    qs = (
+        qs.annotate(rang=Case(*conditions, output_field=IntegerField()))
+        .values('objet_id')
+        .annotate(score=Sum('poids'), couverts=Count('rang', distinct=True))
+        .filter(couverts=attendus)
+        .order_by('-score', '-objet_id')
+    )
+    return [(ligne['objet_id'], ligne['score']) for ligne in qs[:limite]]
+
+
+def search(user, texte, types=None, limite=10):
+    """
+    Recherche classée dans les objets visibles par l'utilisateur
+
+    Returns:
+        dict: {type_objet: [valeurs de l'objet + 'score']} pour chaque type demandé
+    """
+    mots = list(dict.fromkeys(tokenize(texte)))[:TERMES_MAX]
+    types = [t for t in (types or MODELES) if t in MODELES]
+    if not mots:
+        return {type_objet: [] for type_objet in types}
+
+    termes, prefixe = mots[:-1], mots[-1]
+    # Un préfixe déjà couvert par un terme complet n'apporte rien
+    if any(terme.startswith(prefixe) for terme in termes):
+        prefixe = None
+
+    resultats = {}
+    for type_objet in types:
+        scores = _scores(type_objet, termes, prefixe, _visibles(type_objet, user), limite)
+        objets = {
+            valeurs['id']: valeurs
+            for valeurs in MODELES[type_objet].objects.filter(
+                id__in=[pk for pk, _ in scores]
+            ).values(*CHAMPS_RESULTATS[type_objet])
+        }
+        resultats[type_objet] = [
+            dict(objets[pk], score=score) for pk, score in scores if pk in objets
+        ]
+    return resultats
@@ -3,9 +3,11 @@ from django.contrib.auth.models import User
 from django.contrib.auth import authenticate, get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.db.models import Prefetch
 from rest_framework import serializers
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from .fieldsets import SparseFieldsetMixin
 from core.models import (
     UserProfile, Service, Direction, SousDirection, Courrier, CourrierAccess, CourrierImputation,
     UserDiligenceComment, UserDiligenceInstruction, DemandeConge, 
@@ -142,7 +144,7 @@ class ServiceSerializer(serializers.ModelSerializer):
         model = Service
         fields = ['id', 'nom', 'description', 'direction', 'direction_nom']
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     telephone = serializers.CharField(source='profile.telephone', required=False, allow_blank=True)
     service_obj = ServiceSerializer(source='profile.service', read_only=True)
     service = serializers.PrimaryKeyRelatedField(
@@ -340,7 +342,7 @@ class UserSerializer(serializers.ModelSerializer):
         data = super().to_representation(instance)
         # S'assurer que tous les champs principaux sont présents
         for champ in ['id', 'username', 'email', 'first_name', 'last_name']:
-            if champ not in data:
+            if champ not in data and self.champ_demande(champ):
                 data[champ] = getattr(instance, champ, None)
         return data
 
@@ -371,7 +373,7 @@ class UserSerializer(serializers.ModelSerializer):
         return None
 
 # --- PresenceSerializer doit être défini APRÈS UserSerializer pour éviter l'import circulaire ---
-class PresenceSerializer(serializers.ModelSerializer):
+class PresenceSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     agent = serializers.PrimaryKeyRelatedField(read_only=True)
     
     class AgentSerializer(serializers.ModelSerializer):
@@ -556,7 +558,33 @@ class ServiceSerializer(serializers.ModelSerializer):
         print('- Full data:', representation)
         return representation
 
-class CourrierSerializer(serializers.ModelSerializer):
+def courrier_prefetches(prefix=''):
+    """
+    Prefetch des relations affichées par CourrierSerializer (imputations, accès, diligence)
+
+    Une requête groupée par relation pour toute la page au lieu de quatre par courrier.
+    `prefix` permet de les appliquer à un courrier imbriqué (ex. 'courrier__' pour les diligences).
+    """
+    return [
+        Prefetch(
+            f'{prefix}imputation_access',
+            queryset=CourrierImputation.objects.select_related('user').order_by('id'),
+            to_attr='imputations_prefetchees'
+        ),
+        Prefetch(
+            f'{prefix}access_permissions',
+            queryset=CourrierAccess.objects.select_related('user').order_by('id'),
+            to_attr='acces_prefetches'
+        ),
+        Prefetch(
+            f'{prefix}diligences',
+            queryset=Diligence.objects.only('id', 'reference_courrier', 'statut', 'courrier_id').order_by('id'),
+            to_attr='diligences_prefetchees'
+        ),
+    ]
+
+
+class CourrierSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     service_details = serializers.SerializerMethodField()
     fichier_joint_url = serializers.SerializerMethodField()
     imputation_access = serializers.SerializerMethodField()
@@ -601,8 +629,9 @@ class CourrierSerializer(serializers.ModelSerializer):
     
     def get_imputation_access(self, obj):
         """Retourne la liste des imputations pour ce courrier"""
-        from .models import CourrierImputation
-        imputations = CourrierImputation.objects.filter(courrier=obj).select_related('user')
+        imputations = getattr(obj, 'imputations_prefetchees', None)
+        if imputations is None:
+            imputations = CourrierImputation.objects.filter(courrier=obj).select_related('user')
         return [{
             'id': imp.id,
             'user': {
@@ -618,8 +647,9 @@ class CourrierSerializer(serializers.ModelSerializer):
     
     def get_access_granted(self, obj):
         """Retourne la liste des accès accordés pour les courriers confidentiels"""
-        from .models import CourrierAccess
-        accesses = CourrierAccess.objects.filter(courrier=obj).select_related('user')
+        accesses = getattr(obj, 'acces_prefetches', None)
+        if accesses is None:
+            accesses = CourrierAccess.objects.filter(courrier=obj).select_related('user')
         return [{
             'id': acc.id,
             'user': {
@@ -631,10 +661,15 @@ class CourrierSerializer(serializers.ModelSerializer):
             'granted_at': acc.granted_at
         } for acc in accesses]
     
+    def _premiere_diligence(self, obj):
+        """Première diligence liée au courrier, chargée une seule fois par courrier"""
+        if not hasattr(obj, 'diligences_prefetchees'):
+            obj.diligences_prefetchees = list(Diligence.objects.filter(courrier=obj).order_by('id')[:1])
+        return obj.diligences_prefetchees[0] if obj.diligences_prefetchees else None
+
     def get_diligence(self, obj):
         """Vérifie si le courrier est lié à une diligence"""
-        from .models import Diligence
-        diligence = Diligence.objects.filter(courrier=obj).first()
+        diligence = self._premiere_diligence(obj)
         if diligence:
             return {
                 'id': diligence.id,
@@ -647,8 +682,7 @@ class CourrierSerializer(serializers.ModelSerializer):
     
     def get_diligence_id(self, obj):
         """Retourne l'ID de la diligence si elle existe"""
-        from .models import Diligence
-        diligence = Diligence.objects.filter(courrier=obj).first()
+        diligence = self._premiere_diligence(obj)
         return diligence.id if diligence else None
 
     def create(self, validated_data):
@@ -837,7 +871,7 @@ class CourrierImputationSerializer(serializers.ModelSerializer):
         return None
 
 
-class DiligenceSerializer(serializers.ModelSerializer):
+class DiligenceSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     agents = UserSerializer(many=True, read_only=True)
     agents_ids = serializers.ListField(child=serializers.IntegerField(), write_only=True, required=False)
     services_concernes = ServiceSerializer(many=True, read_only=True)
@@ -905,20 +939,22 @@ class DiligenceSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         ret = super().to_representation(instance)
         # Ajouter les détails des services concernés
-        services_details = []
-        for service in instance.services_concernes.all():
-            service_data = {
-                'id': service.id,
-                'nom': service.nom,
-                'direction': {
-                    'id': service.direction.id,
-                    'nom': service.direction.nom
-                } if service.direction else None
-            }
-            services_details.append(service_data)
-        ret['services_details'] = services_details
+        if self.champ_demande('services_details'):
+            services_details = []
+            for service in instance.services_concernes.all():
+                service_data = {
+                    'id': service.id,
+                    'nom': service.nom,
+                    'direction': {
+                        'id': service.direction.id,
+                        'nom': service.direction.nom
+                    } if service.direction else None
+                }
+                services_details.append(service_data)
+            ret['services_details'] = services_details
         # Forcer agents_ids dans la sortie
-        ret['agents_ids'] = [a.id for a in instance.agents.all()]
+        if self.champ_demande('agents_ids'):
+            ret['agents_ids'] = [a.id for a in instance.agents.all()]
         return ret
 
     def get_agents(self, obj):
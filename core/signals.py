@@ -1,7 +1,13 @@
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save, pre_delete
 from django.dispatch import receiver
-from .models import UserProfile
+from django.db import transaction
+from .models import (
+    Agent, AgentLocation, Bureau, Courrier, CourrierNotification, DemandeAbsence, DemandeConge, Diligence,
+    DiligenceNotification, Direction, GeofenceSettings, ImputationAccess, ImputationFile, Notification,
+    OccurrenceSpeciale, Presence, Service, SousDirection, Tache, UserProfile
+)
+from .search_index import POIDS_CHAMPS
 import secrets
 
 @receiver(post_save, sender=User)
@@ -17,4 +23,388 @@ def create_profile_fields(sender, instance, created, **kwargs):
         instance.matricule = f"M{instance.id:05d}"
         updated = True
     if updated:
-        instance.save()
\ No newline at end of file
+        instance.save()
+
+@receiver(post_save, sender=AgentLocation)
+def update_agent_current_location(sender, instance, **kwargs):
+    # Les insertions groupées (bulk_create) mettent la projection à jour elles-mêmes
+    from .location_ingest import update_current_location
+    update_current_location(instance)
+
+@receiver(post_save, sender=Bureau)
+@receiver(post_delete, sender=Bureau)
+def invalidate_bureau_index(sender, **kwargs):
+    # L'index spatial des bureaux est reconstruit à la prochaine recherche
+    from .bureau_index import invalidate_bureau_index
+    invalidate_bureau_index()
+
+@receiver(post_save, sender=GeofenceSettings)
+@receiver(post_delete, sender=GeofenceSettings)
+def invalidate_geofence_settings(sender, **kwargs):
+    # Cache local vidé tout de suite, autres processus prévenus après le commit
+    from .geofence_config import invalidate_local, publish_invalidation
+    invalidate_local()
+    transaction.on_commit(publish_invalidation)
+
+# --- Valeurs initiales des champs suivis (relevé unique, voir la fin du module) ---
+
+def _valeurs(instance, champs):
+    # __dict__ : ne pas charger un champ différé
+    return tuple(instance.__dict__.get(champ) for champ in champs)
+
+def _valeurs_initiales(instance, champs):
+    initiales = getattr(instance, '_valeurs_initiales', {})
+    return tuple(initiales.get(champ) for champ in champs)
+
+def _champs_modifies(instance, champs):
+    return _valeurs_initiales(instance, champs) != _valeurs(instance, champs)
+
+# --- Index de visibilité des diligences (voir core.diligence_visibility) ---
+
+# Champs dont dépend la visibilité, mémorisés au chargement pour détecter un changement
+CHAMPS_VISIBILITE = {
+    Diligence: ('direction_id', 'courrier_id'),
+    UserProfile: ('role', 'service_id'),
+    Courrier: ('service_id',),
+    Service: ('direction_id',),
+}
+
+def _visibilite_modifiee(instance, created):
+    return created or _champs_modifies(instance, CHAMPS_VISIBILITE[type(instance)])
+
+@receiver(post_save, sender=Diligence)
+def visibilite_diligence_modifiee(sender, instance, created, **kwargs):
+    if _visibilite_modifiee(instance, created):
+        from .diligence_visibility import refresh_diligences_on_commit
+        refresh_diligences_on_commit([instance.pk])
+
+@receiver(m2m_changed, sender=Diligence.agents.through)
+@receiver(m2m_changed, sender=Diligence.services_concernes.through)
+def visibilite_relations_modifiees(sender, instance, action, reverse, pk_set, **kwargs):
+    from .diligence_visibility import refresh_diligences_on_commit
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            refresh_diligences_on_commit([instance.pk])
+        return
+    # Côté utilisateur / service : pk_set contient les diligences
+    if action == 'pre_clear':
+        relation = instance.diligences if sender is Diligence.agents.through else instance.diligences_concernes
+        instance._diligences_avant_clear = list(relation.values_list('id', flat=True))
+    elif action == 'post_clear':
+        refresh_diligences_on_commit(getattr(instance, '_diligences_avant_clear', []))
+    elif action in ('post_add', 'post_remove'):
+        refresh_diligences_on_commit(pk_set or [])
+
+@receiver(post_save, sender=ImputationAccess)
+@receiver(post_delete, sender=ImputationAccess)
+@receiver(post_save, sender=ImputationFile)
+@receiver(post_delete, sender=ImputationFile)
+def visibilite_imputation_modifiee(sender, instance, **kwargs):
+    from .diligence_visibility import refresh_diligences_on_commit
+    refresh_diligences_on_commit([instance.diligence_id])
+
+@receiver(post_save, sender=UserProfile)
+def visibilite_profil_modifie(sender, instance, created, **kwargs):
+    if _visibilite_modifiee(instance, created):
+        from .diligence_visibility import (
+            diligences_liees_utilisateurs, refresh_diligences_on_commit, refresh_users_on_commit
+        )
+        # Ce que l'utilisateur voit, et qui voit les diligences où il est assigné
+        refresh_users_on_commit([instance.user_id])
+        refresh_diligences_on_commit(diligences_liees_utilisateurs([instance.user_id]))
+
+@receiver(post_save, sender=Courrier)
+def visibilite_courrier_modifie(sender, instance, created, **kwargs):
+    if not created and _visibilite_modifiee(instance, created):
+        from .diligence_visibility import refresh_diligences_on_commit
+        refresh_diligences_on_commit(instance.diligences.values_list('id', flat=True))
+
+@receiver(post_save, sender=Service)
+def visibilite_service_modifie(sender, instance, created, **kwargs):
+    if not created and _visibilite_modifiee(instance, created):
+        from .diligence_visibility import (
+            diligences_liees_service, refresh_diligences_on_commit, refresh_users_on_commit
+        )
+        # Les directeurs rattachés à ce service changent de direction
+        refresh_users_on_commit(instance.users.values_list('user_id', flat=True))
+        refresh_diligences_on_commit(diligences_liees_service(instance.pk))
+
+@receiver(pre_delete, sender=Service)
+def visibilite_service_avant_suppression(sender, instance, **kwargs):
+    # Relevé avant que la suppression ne vide les rattachements (SET NULL, sans post_save)
+    from .diligence_visibility import diligences_liees_service
+    instance._visibilite_avant_suppression = (
+        list(instance.users.values_list('user_id', flat=True)),
+        list(diligences_liees_service(instance.pk)),
+    )
+
+@receiver(post_delete, sender=Service)
+def visibilite_service_supprime(sender, instance, **kwargs):
+    from .diligence_visibility import refresh_diligences_on_commit, refresh_users_on_commit
+    user_ids, diligence_ids = getattr(instance, '_visibilite_avant_suppression', ([], []))
+    refresh_users_on_commit(user_ids)
+    refresh_diligences_on_commit(diligence_ids)
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+@receiver(post_save, sender=Agent)
+@receiver(post_delete, sender=Agent)
+def invalidate_org_scopes(sender, **kwargs):
+    # Périmètres organisationnels mis en cache (voir core.org_scope)
+    from .org_scope import invalidate_org_scopes
+    transaction.on_commit(invalidate_org_scopes)
+
+# --- Table de fermeture de l'organigramme (voir core.org_hierarchy) ---
+
+CHAMPS_HIERARCHIE = {
+    SousDirection: ('direction_id',),
+    Service: ('direction_id', 'sous_direction_id'),
+    UserProfile: ('service_id',),
+    Agent: ('user_id', 'service_id'),
+}
+
+def _recalculer_hierarchie(fonction, ids):
+    # Après le commit ; les périmètres en cache (core.org_scope) sont dérivés de la table
+    def executer():
+        from .org_scope import invalidate_org_scopes
+        fonction(ids)
+        invalidate_org_scopes()
+    transaction.on_commit(executer)
+
+@receiver(post_save, sender=Direction)
+@receiver(post_save, sender=SousDirection)
+@receiver(post_save, sender=Service)
+@receiver(post_save, sender=UserProfile)
+@receiver(post_save, sender=Agent)
+def rattachement_modifie(sender, instance, created, **kwargs):
+    if sender is Direction:
+        if created:
+            from .org_hierarchy import refresh_directions
+            refresh_directions([instance.pk])
+        return
+    initial = _valeurs_initiales(instance, CHAMPS_HIERARCHIE[sender])
+    if not created and initial == _valeurs(instance, CHAMPS_HIERARCHIE[sender]):
+        return
+    from . import org_hierarchy
+    if sender is SousDirection:
+        _recalculer_hierarchie(org_hierarchy.refresh_sous_directions, [instance.pk])
+    elif sender is Service:
+        _recalculer_hierarchie(org_hierarchy.refresh_services, [instance.pk])
+    else:
+        # Fiche Agent réaffectée à un autre utilisateur : l'ancien est aussi recalculé
+        user_ids = {instance.user_id} | ({initial[0]} if sender is Agent and initial[0] else set())
+        _recalculer_hierarchie(org_hierarchy.refresh_users, user_ids)
+
+@receiver(post_delete, sender=Direction)
+@receiver(post_delete, sender=SousDirection)
+@receiver(post_delete, sender=Service)
+def noeud_supprime(sender, instance, **kwargs):
+    from . import org_hierarchy
+    user_ids = org_hierarchy.remove_node(org_hierarchy.TYPES_NOEUDS[sender], instance.pk)
+    _recalculer_hierarchie(org_hierarchy.refresh_users, user_ids)
+
+@receiver(post_delete, sender=UserProfile)
+@receiver(post_delete, sender=Agent)
+def rattachement_utilisateur_supprime(sender, instance, **kwargs):
+    from .org_hierarchy import refresh_users
+    _recalculer_hierarchie(refresh_users, [instance.user_id])
+
+# --- Compteurs de notifications non lues (voir core.inbox) ---
+
+def _est_lue(instance):
+    return instance.__dict__.get('lue' if isinstance(instance, CourrierNotification) else 'read')
+
+def _ajuster_non_lues(instance, delta, nouvelle=False):
+    # Compteurs en cache puis flux temps réel (voir core.notification_stream), après le commit
+    from .inbox import SOURCE_PAR_MODELE, adjust_unread, element_from_instance
+    from .notification_stream import publish
+    user_id = instance.utilisateur_id if isinstance(instance, CourrierNotification) else instance.user_id
+    evenement = ('notification', element_from_instance(instance)) if nouvelle else ('compteurs', None)
+    def executer():
+        adjust_unread({(user_id, SOURCE_PAR_MODELE[type(instance)]): delta})
+        publish([user_id], *evenement)
+    transaction.on_commit(executer)
+
+@receiver(post_init, sender=Notification)
+@receiver(post_init, sender=DiligenceNotification)
+@receiver(post_init, sender=CourrierNotification)
+def memoriser_lecture(sender, instance, **kwargs):
+    instance._lue_initiale = _est_lue(instance)
+
+@receiver(post_save, sender=Notification)
+@receiver(post_save, sender=DiligenceNotification)
+@receiver(post_save, sender=CourrierNotification)
+def notification_enregistree(sender, instance, created, **kwargs):
+    lue = _est_lue(instance)
+    initiale = getattr(instance, '_lue_initiale', None)
+    instance._lue_initiale = lue
+    if created:
+        if not lue:
+            _ajuster_non_lues(instance, 1, nouvelle=True)
+    elif initiale is not None and lue != initiale:
+        _ajuster_non_lues(instance, -1 if lue else 1)
+
+@receiver(post_delete, sender=Notification)
+@receiver(post_delete, sender=DiligenceNotification)
+@receiver(post_delete, sender=CourrierNotification)
+def notification_supprimee(sender, instance, **kwargs):
+    if _est_lue(instance) is False:
+        _ajuster_non_lues(instance, -1)
+
+# --- Index de recherche plein texte (voir core.search_index) ---
+
+TYPES_RECHERCHE = {Courrier: 'courrier', Diligence: 'diligence', Tache: 'tache'}
+CHAMPS_RECHERCHE = {modele: tuple(POIDS_CHAMPS[type_objet]) for modele, type_objet in TYPES_RECHERCHE.items()}
+
+@receiver(post_save, sender=Courrier)
+@receiver(post_save, sender=Diligence)
+@receiver(post_save, sender=Tache)
+def indexer_pour_recherche(sender, instance, created, **kwargs):
+    if not created and not _champs_modifies(instance, CHAMPS_RECHERCHE[sender]):
+        return
+    from .search_index import index_objects
+    type_objet, pk = TYPES_RECHERCHE[sender], instance.pk
+    transaction.on_commit(lambda: index_objects(type_objet, [pk]))
+
+@receiver(post_delete, sender=Courrier)
+@receiver(post_delete, sender=Diligence)
+@receiver(post_delete, sender=Tache)
+def retirer_de_recherche(sender, instance, **kwargs):
+    from .search_index import remove_objects
+    type_objet, pk = TYPES_RECHERCHE[sender], instance.pk
+    transaction.on_commit(lambda: remove_objects(type_objet, [pk]))
+
+# --- Statistiques des courriers (voir core.courrier_stats) ---
+
+CHAMPS_STATS = {
+    Courrier: ('date_reception', 'service_id', 'type_courrier', 'sens', 'categorie', 'statut'),
+    Diligence: ('courrier_id', 'statut'),
+    Service: ('direction_id',),
+}
+
+@receiver(post_save, sender=Courrier)
+def courrier_stats_modifie(sender, instance, created, **kwargs):
+    initiales = _valeurs_initiales(instance, CHAMPS_STATS[Courrier])
+    if not created and initiales == _valeurs(instance, CHAMPS_STATS[Courrier]):
+        return
+    from .courrier_stats import refresh
+    # Ancien et nouveau couple (jour, service) si la date ou le service a changé
+    couples = {(instance.date_reception, instance.service_id)}
+    if not created and initiales[0]:
+        couples.add(initiales[:2])
+    transaction.on_commit(lambda: refresh(couples))
+
+@receiver(post_delete, sender=Courrier)
+def courrier_stats_supprime(sender, instance, **kwargs):
+    from .courrier_stats import refresh
+    couples = {(instance.date_reception, instance.service_id)}
+    transaction.on_commit(lambda: refresh(couples))
+
+def _recalculer_courriers_stats(courrier_ids):
+    courrier_ids = {c for c in courrier_ids if c}
+    if courrier_ids:
+        from .courrier_stats import refresh_courriers
+        transaction.on_commit(lambda: refresh_courriers(courrier_ids))
+
+@receiver(post_save, sender=Diligence)
+def diligence_stats_modifiee(sender, instance, created, **kwargs):
+    initiales = _valeurs_initiales(instance, CHAMPS_STATS[Diligence])
+    if not created and initiales == _valeurs(instance, CHAMPS_STATS[Diligence]):
+        return
+    _recalculer_courriers_stats({instance.courrier_id, initiales[0]})
+
+@receiver(post_delete, sender=Diligence)
+def diligence_stats_supprimee(sender, instance, **kwargs):
+    _recalculer_courriers_stats({instance.courrier_id})
+
+@receiver(post_save, sender=Service)
+def service_stats_modifie(sender, instance, created, **kwargs):
+    # Le changement de direction d'un service se répercute sur ses lignes
+    if created or not _champs_modifies(instance, CHAMPS_STATS[Service]):
+        return
+    from .courrier_stats import refresh_services
+    service_ids = [instance.pk]
+    transaction.on_commit(lambda: refresh_services(service_ids))
+
+@receiver(post_delete, sender=Service)
+def service_stats_supprime(sender, instance, **kwargs):
+    # Les courriers du service supprimé passent sans service (SET_NULL)
+    from .courrier_stats import refresh_services
+    service_ids = [instance.pk]
+    transaction.on_commit(lambda: refresh_services(service_ids))
+
+# --- Matrice de présence (voir core.presence_matrix) ---
+
+def _plage_matrice(instance):
+    """(agent ou utilisateur, premier jour, dernier jour) couverts par l'objet"""
+    valeurs = instance.__dict__
+    if isinstance(instance, Presence):
+        return valeurs.get('agent_id'), valeurs.get('date_presence'), valeurs.get('date_presence')
+    if isinstance(instance, OccurrenceSpeciale):
+        premier = valeurs.get('date_debut') or valeurs.get('date')
+        return valeurs.get('agent_id'), premier, valeurs.get('date_fin') or premier
+    return valeurs.get('demandeur_id'), valeurs.get('date_debut'), valeurs.get('date_fin')
+
+def _recalculer_matrice(sender, plages):
+    from . import presence_matrix
+    fonction = presence_matrix.refresh_agents if sender is Presence else presence_matrix.refresh
+    plages = {plage for plage in plages if all(plage)}
+    def executer():
+        for cle, debut, fin in plages:
+            fonction([cle], debut, fin)
+    if plages:
+        transaction.on_commit(executer)
+
+@receiver(post_init, sender=Presence)
+@receiver(post_init, sender=OccurrenceSpeciale)
+@receiver(post_init, sender=DemandeConge)
+@receiver(post_init, sender=DemandeAbsence)
+def memoriser_plage_matrice(sender, instance, **kwargs):
+    instance._plage_matrice = _plage_matrice(instance)
+
+@receiver(post_save, sender=Presence)
+@receiver(post_save, sender=OccurrenceSpeciale)
+@receiver(post_save, sender=DemandeConge)
+@receiver(post_save, sender=DemandeAbsence)
+def matrice_modifiee(sender, instance, created, **kwargs):
+    # Ancienne et nouvelle plage : un changement de dates ou d'agent libère les anciens jours
+    initiale = getattr(instance, '_plage_matrice', None)
+    instance._plage_matrice = _plage_matrice(instance)
+    _recalculer_matrice(sender, {instance._plage_matrice} | ({initiale} if initiale and not created else set()))
+
+@receiver(post_delete, sender=Presence)
+@receiver(post_delete, sender=OccurrenceSpeciale)
+@receiver(post_delete, sender=DemandeConge)
+@receiver(post_delete, sender=DemandeAbsence)
+def matrice_supprimee(sender, instance, **kwargs):
+    _recalculer_matrice(sender, {_plage_matrice(instance)})
+
+# --- Relevé unique des champs suivis par les sections ci-dessus ---
+
+CHAMPS_SUIVIS = {}
+for champs_par_modele in (CHAMPS_VISIBILITE, CHAMPS_HIERARCHIE, CHAMPS_RECHERCHE, CHAMPS_STATS):
+    for modele, champs in champs_par_modele.items():
+        CHAMPS_SUIVIS[modele] = tuple(dict.fromkeys(CHAMPS_SUIVIS.get(modele, ()) + tuple(champs)))
+
+@receiver(post_init, sender=Courrier)
+@receiver(post_init, sender=Diligence)
+@receiver(post_init, sender=Tache)
+@receiver(post_init, sender=Service)
+@receiver(post_init, sender=SousDirection)
+@receiver(post_init, sender=UserProfile)
+@receiver(post_init, sender=Agent)
+def memoriser_valeurs_initiales(sender, instance, **kwargs):
+    instance._valeurs_initiales = dict(zip(CHAMPS_SUIVIS[sender], _valeurs(instance, CHAMPS_SUIVIS[sender])))
+
+# Déclaré en dernier : les récepteurs post_save ci-dessus comparent encore à l'ancien relevé
+@receiver(post_save, sender=Courrier)
+@receiver(post_save, sender=Diligence)
+@receiver(post_save, sender=Tache)
+@receiver(post_save, sender=Service)
+@receiver(post_save, sender=SousDirection)
+@receiver(post_save, sender=UserProfile)
+@receiver(post_save, sender=Agent)
+def rafraichir_valeurs_initiales(sender, instance, **kwargs):
+    memoriser_valeurs_initiales(sender, instance)
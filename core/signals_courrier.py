@@ -5,6 +5,7 @@ from .models import (
     Courrier, CourrierAccess, CourrierImputation, 
     CourrierNotification, CourrierStatut, Diligence
 )
+from .notification_fanout import fan_out
 
 
 def creer_notification(utilisateur, courrier, type_notification, titre, message, priorite='normale', cree_par=None, metadata=None):
@@ -47,25 +48,23 @@ def notifier_nouveau_courrier(sender, instance, created, **kwargs):
                 )
             priorite = 'normale'
         
-        # Créer les notifications
+        # Créer les notifications (insérées par lots après le commit)
         type_courrier_label = 'confidentiel' if instance.type_courrier == 'confidentiel' else 'ordinaire'
         sens_label = 'en arrivée' if instance.sens == 'arrivee' else 'en départ'
         
-        for utilisateur in utilisateurs_a_notifier:
-            creer_notification(
-                utilisateur=utilisateur,
-                courrier=instance,
-                type_notification='nouveau_courrier',
-                titre=f'Nouveau courrier {type_courrier_label} {sens_label}',
-                message=f'Un nouveau courrier {type_courrier_label} {sens_label} a été enregistré : {instance.reference}. Objet: {instance.objet}',
-                priorite=priorite,
-                metadata={
-                    'courrier_id': instance.id,
-                    'reference': instance.reference,
-                    'type_courrier': instance.type_courrier,
-                    'sens': instance.sens
-                }
-            )
+        fan_out(CourrierNotification, utilisateurs_a_notifier, {
+            'courrier_id': instance.id,
+            'type_notification': 'nouveau_courrier',
+            'titre': f'Nouveau courrier {type_courrier_label} {sens_label}',
+            'message': f'Un nouveau courrier {type_courrier_label} {sens_label} a été enregistré : {instance.reference}. Objet: {instance.objet}',
+            'priorite': priorite,
+            'metadata': {
+                'courrier_id': instance.id,
+                'reference': instance.reference,
+                'type_courrier': instance.type_courrier,
+                'sens': instance.sens
+            }
+        }, champ_utilisateur='utilisateur')
 
 
 @receiver(post_save, sender=CourrierImputation)
@@ -163,22 +162,20 @@ def notifier_changement_statut(sender, instance, created, **kwargs):
             'archive': 'Archivé'
         }
         
-        for imputation in imputations:
-            creer_notification(
-                utilisateur=imputation.user,
-                courrier=instance.courrier,
-                type_notification='statut_modifie',
-                titre='Statut de courrier modifié',
-                message=f'Le statut du courrier {instance.courrier.reference} a été modifié en "{statut_labels.get(instance.statut, instance.statut)}" par {instance.modifie_par.get_full_name() if instance.modifie_par else "le système"}.',
-                priorite='normale',
-                cree_par=instance.modifie_par,
-                metadata={
-                    'courrier_id': instance.courrier.id,
-                    'reference': instance.courrier.reference,
-                    'ancien_statut': kwargs.get('old_statut'),
-                    'nouveau_statut': instance.statut
-                }
-            )
+        fan_out(CourrierNotification, imputations.values_list('user_id', flat=True), {
+            'courrier_id': instance.courrier.id,
+            'type_notification': 'statut_modifie',
+            'titre': 'Statut de courrier modifié',
+            'message': f'Le statut du courrier {instance.courrier.reference} a été modifié en "{statut_labels.get(instance.statut, instance.statut)}" par {instance.modifie_par.get_full_name() if instance.modifie_par else "le système"}.',
+            'priorite': 'normale',
+            'cree_par_id': instance.modifie_par_id,
+            'metadata': {
+                'courrier_id': instance.courrier.id,
+                'reference': instance.courrier.reference,
+                'ancien_statut': kwargs.get('old_statut'),
+                'nouveau_statut': instance.statut
+            }
+        }, champ_utilisateur='utilisateur')
 
 
 @receiver(post_save, sender=Diligence)
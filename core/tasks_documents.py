@@ -0,0 +1,40 @@
+"""
+Tâches Celery de rendu des documents PDF (voir core.pdf_cache)
+"""
+from celery import shared_task
+
+from .pdf_cache import DOCUMENTS, get_or_render
+
+
+@shared_task(ignore_result=True)
+def render_demande_pdf_task(type_doc, demande_id):
+    """
+    Tâche pour pré-générer le PDF d'une demande approuvée
+    """
+    modele = DOCUMENTS[type_doc][0]
+    demande = modele.objects.select_related(
+        'demandeur__profile__service', 'directeur', 'superieur'
+    ).filter(pk=demande_id).first()
+    if demande is None:
+        return None
+    chemin = get_or_render(type_doc, demande)
+    print(f"PDF pré-généré: {chemin}")
+    return chemin
+
+
+@shared_task(bind=True)
+def export_demandes_pdf_task(self, type_doc, demande_ids):
+    """
+    Tâche pour rendre les PDF de plusieurs demandes dans une archive ZIP
+    (progression : état PROGRESS avec {'faits', 'total'})
+    """
+    from .pdf_export import export_zip, purge_exports, zip_path
+
+    def progression(faits, total):
+        if not self.request.is_eager:
+            self.update_state(state='PROGRESS', meta={'faits': faits, 'total': total})
+
+    purge_exports()
+    ajoutes = export_zip(type_doc, demande_ids, zip_path(self.request.id), progression=progression)
+    print(f"Export PDF terminé: {ajoutes}/{len(demande_ids)} ({type_doc})")
+    return {'faits': len(demande_ids), 'total': len(demande_ids), 'pdf': ajoutes}
@@ -0,0 +1,16 @@
+"""
+Tâches Celery pour la diffusion des notifications (voir core.notification_fanout)
+"""
+from celery import shared_task
+
+from .notification_fanout import inserer_notifications
+
+
+@shared_task(ignore_result=True)
+def fanout_notifications_task(model_label, champ_utilisateur, user_ids, valeurs):
+    """
+    Tâche pour insérer par lots les notifications d'un fan-out
+    """
+    creees = inserer_notifications(model_label, champ_utilisateur, user_ids, valeurs)
+    print(f"Notifications diffusées: {creees} ({model_label})")
+    return creees
@@ -6,7 +6,9 @@ from django.utils import timezone
 from django.contrib.auth.models import User
 from datetime import datetime, timedelta, time
 from .models import Presence, Agent, Bureau, AgentLocation
-from .geofencing_utils import calculate_distance
+from .geo_distance import location_distances
+from .geofencing_state import advance_geofence_state, SEUIL_SORTIE_METRES
+import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
@@ -55,7 +57,7 @@ def check_agent_exits():
         heure_depart__isnull=True,    # Pas encore de départ
         sortie_detectee=False,        # Pas encore de sortie détectée
         statut='présent'              # Statut présent
-    )
+    ).select_related('agent__user', 'agent__bureau')
     
     logger.info(f"📊 {presences_today.count()} présences à vérifier")
     
@@ -70,102 +72,38 @@ def check_agent_exits():
                 logger.info(f"❌ Bureau manquant ou coordonnées manquantes pour {agent.user.username}")
                 continue
             
-            # Récupérer la dernière position de l'agent
-            last_location = AgentLocation.objects.filter(
-                agent=agent.user,  # AgentLocation utilise User, pas Agent
-                timestamp__date=current_date
-            ).order_by('-timestamp').first()
+            # Faire avancer l'état de géofencing avec les seules positions reçues depuis le dernier passage
+            state = advance_geofence_state(agent.user, bureau, now)
             
-            if not last_location:
+            if not state.derniere_position_timestamp:
                 logger.info(f"❌ Aucune position trouvée pour {agent.user.username}")
                 continue
             
-            logger.info(f"📍 Dernière position: {last_location.latitude}, {last_location.longitude} à {last_location.timestamp}")
-            
-            # Calculer la distance par rapport au bureau
-            distance = calculate_distance(
-                float(last_location.latitude),
-                float(last_location.longitude),
-                float(bureau.latitude_centre),
-                float(bureau.longitude_centre)
-            )
+            logger.info(f"📍 Dernière position traitée: #{state.derniere_position_id} à {state.derniere_position_timestamp}")
             
+            # Distance de la dernière position valide par rapport au bureau
+            distance = state.derniere_distance or 0.0
             logger.info(f"📏 Distance calculée: {distance:.1f}m du bureau")
             
             # MODE TEST: Si l'agent est à plus de 200m et plus de 5 minutes
             TEST_MODE = True  # Mettre à False pour revenir au mode normal
-            distance_threshold = 200 if TEST_MODE else 200
+            distance_threshold = SEUIL_SORTIE_METRES
             time_threshold = timedelta(minutes=5) if TEST_MODE else timedelta(hours=1)
             
-            if distance > distance_threshold:
+            if not state.est_dans_zone:
                 logger.info(f"⚠️ Agent éloigné: {distance:.1f}m > {distance_threshold}m")
-                # Vérifier depuis combien de temps il est loin
-                locations_recent = AgentLocation.objects.filter(
-                    agent=agent.user,  # AgentLocation utilise User, pas Agent
-                    timestamp__date=current_date,
-                    timestamp__gte=now - time_threshold
-                ).order_by('timestamp')
                 
-                logger.info(f"🕐 Positions récentes: {locations_recent.count()}")
-                
-                # Vérifier si toutes les positions récentes sont éloignées
-                all_away = True
-                
-                for loc in locations_recent:
-                    logger.info(f"   📍 {loc.timestamp.strftime('%H:%M')} - Lat: {loc.latitude}, Lon: {loc.longitude}")
-                    loc_distance = calculate_distance(
-                        float(loc.latitude),
-                        float(loc.longitude),
-                        float(bureau.latitude_centre),
-                        float(bureau.longitude_centre)
-                    )
-                    
-                    logger.info(f"      Distance: {loc_distance:.1f}m")
-                    
-                    if loc_distance <= distance_threshold:
-                        logger.info(f"      ✅ Position proche trouvée, agent pas toujours loin")
-                        all_away = False
-                        break
-                
-                # Si toutes les positions récentes sont éloignées, chercher la VRAIE première position éloignée
-                first_away_time = None
-                if all_away:
-                    # Chercher toutes les positions du jour, triées par timestamp
-                    # MAIS ignorer les positions aberrantes (émulateur) > 10km
-                    all_locations_today = AgentLocation.objects.filter(
-                        agent=agent.user,
-                        timestamp__date=current_date
-                    ).order_by('timestamp')
-                    
-                    logger.info(f"🔍 Recherche de la première position éloignée parmi {all_locations_today.count()} positions du jour")
-                    
-                    for loc in all_locations_today:
-                        loc_distance = calculate_distance(
-                            float(loc.latitude),
-                            float(loc.longitude),
-                            float(bureau.latitude_centre),
-                            float(bureau.longitude_centre)
-                        )
-                        
-                        # Ignorer les positions aberrantes (émulateur) > 10km
-                        if loc_distance > 10000:
-                            logger.info(f"      ⚠️ Position aberrante ignorée: {loc.timestamp.strftime('%H:%M')} - Distance: {loc_distance:.1f}m (émulateur)")
-                            continue
-                        
-                        if loc_distance > distance_threshold:
-                            first_away_time = loc.timestamp
-                            logger.info(f"      🎯 VRAIE première position éloignée: {first_away_time.strftime('%H:%M')} - Distance: {loc_distance:.1f}m")
-                            break
+                # Première position éloignée de la sortie en cours (positions aberrantes > 10km ignorées)
+                first_away_time = state.hors_zone_depuis
                 
                 logger.info(f"🔍 Résultat vérification:")
-                logger.info(f"   all_away: {all_away}")
                 logger.info(f"   first_away_time: {first_away_time}")
                 if first_away_time:
                     duration = now - first_away_time
                     logger.info(f"   Durée d'absence: {duration.total_seconds()/60:.1f} minutes")
                 
-                # Si l'agent est loin depuis le temps défini (1 minute en mode test, 1 heure en mode normal)
-                if all_away and first_away_time and (now - first_away_time) >= time_threshold:
+                # Si l'agent est loin depuis le temps défini (5 minutes en mode test, 1 heure en mode normal)
+                if first_away_time and (now - first_away_time) >= time_threshold:
                     duration_minutes = int((now - first_away_time).total_seconds() / 60)
                     logger.info(f"🚨 SORTIE DÉTECTÉE ! Agent loin depuis {duration_minutes} minutes")
                     # Calculer l'heure de sortie (première position éloignée)
@@ -253,19 +191,16 @@ def auto_close_forgotten_departures():
                 ).order_by('timestamp')
                 
                 # Chercher la première position où l'agent s'est éloigné du bureau (>200m)
-                for location in positions_after_work:
-                    distance = calculate_distance(
-                        float(location.latitude),
-                        float(location.longitude),
-                        float(bureau.latitude_centre),
-                        float(bureau.longitude_centre)
-                    )
-                    
-                    if distance > 200:
-                        # Première position éloignée = heure de départ
-                        detected_departure_time = location.timestamp.time()
-                        logger.info(f"📍 Départ détecté via GPS à {detected_departure_time} (distance: {distance:.1f}m)")
-                        break
+                positions_after_work = list(positions_after_work.only('id', 'timestamp', 'latitude', 'longitude'))
+                distances = location_distances(
+                    positions_after_work, bureau.latitude_centre, bureau.longitude_centre
+                )
+                away_indexes = np.flatnonzero(distances > 200)
+                if away_indexes.size:
+                    # Première position éloignée = heure de départ
+                    first_index = int(away_indexes[0])
+                    detected_departure_time = positions_after_work[first_index].timestamp.time()
+                    logger.info(f"📍 Départ détecté via GPS à {detected_departure_time} (distance: {distances[first_index]:.1f}m)")
             
             # Si on a détecté l'heure via GPS, l'utiliser, sinon 16h30 par défaut
             if detected_departure_time:
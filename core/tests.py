@@ -38,3 +38,1345 @@ def test_login_with_fingerprint():
     resp = client.post('/api/login/', {'fingerprint_hash': 'fingerprint_login123'}, format='json')
     assert resp.status_code == 200
     assert 'token' in resp.json()
+
+
+@pytest.mark.django_db
+def test_geofence_sweep_creates_alerts_in_bulk(agent_avec_position, django_assert_max_num_queries, monkeypatch):
+    from django.utils import timezone
+    from core.geofencing_sweep import run_geofence_sweep
+    from core.models import Bureau, GeofenceAlert, GeofenceSettings
+
+    bureau = Bureau.objects.create(nom='Siège', latitude_centre='5.3600000', longitude_centre='-4.0083000', rayon_metres=100)
+    settings = GeofenceSettings.objects.create(distance_alerte_metres=200, duree_minimale_hors_bureau_minutes=5)
+    for i in range(5):
+        agent_avec_position(f'agent{i}', bureau, '5.3700000', '-4.0083000', minutes_ago=2)
+    # Agent revenu dans la zone : pas d'alerte
+    agent_avec_position('agent_ok', bureau, '5.3600100', '-4.0083000', minutes_ago=2)
+
+    with django_assert_max_num_queries(6):
+        alert_ids = run_geofence_sweep(settings)
+
+    assert len(alert_ids) == 5
+    assert GeofenceAlert.objects.filter(type_alerte='sortie_zone', statut='active').count() == 5
+    assert all(a.message_alerte for a in GeofenceAlert.objects.all())
+
+    # Un second balayage ne duplique pas les alertes actives
+    assert run_geofence_sweep(settings) == []
+
+    # MySQL (clés primaires non renvoyées par bulk_create) : seules les alertes du
+    # balayage sont relues, pas celle créée au même instant par update_location
+    GeofenceAlert.objects.update(statut='resolue')
+    autre_bureau = Bureau.objects.create(nom='Annexe', latitude_centre='5.3700000', longitude_centre='-4.0083000', rayon_metres=100)
+    instant = timezone.now()
+    monkeypatch.setattr(timezone, 'now', lambda: instant)
+    bulk_create = GeofenceAlert.objects.bulk_create
+
+    def bulk_create_sans_cles(alertes, **kwargs):
+        creees = bulk_create(alertes, **kwargs)
+        GeofenceAlert.objects.create(
+            agent=creees[0].agent, bureau=autre_bureau, type_alerte='sortie_zone',
+            latitude_agent='5.3700000', longitude_agent='-4.0083000', distance_metres=0
+        )
+        for alerte in creees:
+            alerte.id = None
+        return creees
+
+    monkeypatch.setattr(GeofenceAlert.objects, 'bulk_create', bulk_create_sans_cles)
+    alert_ids = run_geofence_sweep(settings)
+    assert sorted(alert_ids) == sorted(
+        GeofenceAlert.objects.filter(bureau=bureau, statut='active').values_list('id', flat=True)
+    )
+    assert len(alert_ids) == 5
+
+
+def test_geo_distance_batch_matches_scalar():
+    from decimal import Decimal
+    from core.geo_distance import distance_matrix, distances_to_point, haversine, pairwise_distances
+    from core.geofencing_utils import calculate_distance
+
+    lats = [Decimal('5.3600000'), Decimal('5.3700000'), Decimal('5.4000000')]
+    lons = [Decimal('-4.0083000'), Decimal('-4.0083000'), Decimal('-3.9500000')]
+    bureaux = [(Decimal('5.3600000'), Decimal('-4.0083000')), (Decimal('5.3900000'), Decimal('-3.9800000'))]
+
+    expected = [calculate_distance(la, lo, *bureaux[0]) for la, lo in zip(lats, lons)]
+    assert expected[0] == 0
+    assert abs(expected[1] - 1111.95) < 0.1
+    assert list(distances_to_point(lats, lons, *bureaux[0])) == pytest.approx(expected, abs=1e-6)
+    assert list(pairwise_distances(lats, lons, [bureaux[0][0]] * 3, [bureaux[0][1]] * 3)) == pytest.approx(expected, abs=1e-6)
+
+    matrix = distance_matrix(lats, lons, [b[0] for b in bureaux], [b[1] for b in bureaux])
+    assert matrix.shape == (3, 2)
+    for i, (la, lo) in enumerate(zip(lats, lons)):
+        for j, (bla, blo) in enumerate(bureaux):
+            assert matrix[i, j] == pytest.approx(haversine(la, lo, bla, blo), abs=1e-6)
+
+
+@pytest.mark.django_db
+def test_geofence_state_advances_incrementally():
+    from datetime import timedelta
+    from django.utils import timezone
+    from core.geofencing_state import advance_geofence_state
+    from core.models import AgentLocation, Bureau
+
+    bureau = Bureau.objects.create(nom='Annexe', latitude_centre='5.3600000', longitude_centre='-4.0083000', rayon_metres=100)
+    user = get_user_model().objects.create_user(username='state_agent', password='Testpass123!')
+    now = timezone.now()
+
+    def add_location(latitude, minutes_ago):
+        loc = AgentLocation.objects.create(agent=user, latitude=latitude, longitude='-4.0083000')
+        AgentLocation.objects.filter(id=loc.id).update(timestamp=now - timedelta(minutes=minutes_ago))
+        return loc
+
+    add_location('5.3600000', 30)
+    first_away = add_location('5.3700000', 20)
+    add_location('5.3710000', 10)
+
+    state = advance_geofence_state(user, bureau, now)
+    assert not state.est_dans_zone
+    assert state.hors_zone_depuis == AgentLocation.objects.get(id=first_away.id).timestamp
+
+    # Sans nouvelle position : aucune écriture
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    with CaptureQueriesContext(connection) as ctx:
+        advance_geofence_state(user, bureau, now)
+    assert not [q for q in ctx.captured_queries if q['sql'].startswith(('UPDATE', 'INSERT'))]
+
+    last = add_location('5.3600100', 1)
+    state = advance_geofence_state(user, bureau, now)
+    assert state.est_dans_zone
+    assert state.hors_zone_depuis is None
+    assert state.derniere_position_id == last.id
+
+
+@pytest.mark.django_db
+def test_bulk_location_ingest_is_idempotent_and_accepts_gzip(monkeypatch):
+    import gzip
+    import json
+    from core.models import Agent, AgentLocation, Bureau
+
+    bureau = Bureau.objects.create(nom='Plateau', latitude_centre='5.3600000', longitude_centre='-4.0083000', rayon_metres=100)
+    user = get_user_model().objects.create_user(username='bulk_agent', password='Testpass123!')
+    Agent.objects.create(user=user, nom='Bulk', matricule='MAT-BULK', poste='Agent', bureau=bureau)
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    points = [
+        {'client_id': 'p1', 'latitude': '5.3600000', 'longitude': '-4.0083000', 'timestamp': '2026-01-05T08:00:00Z'},
+        {'client_id': 'p2', 'latitude': '5.3700000', 'longitude': '-4.0083000', 'timestamp': '2026-01-05T08:05:00Z'},
+        {'client_id': 'p2', 'latitude': '5.3700000', 'longitude': '-4.0083000', 'timestamp': '2026-01-05T08:05:00Z'},
+        {'client_id': 'bad', 'latitude': 'abc', 'longitude': '-4.0083000'},
+    ]
+    body = gzip.compress(json.dumps({'points': points}).encode('utf-8'))
+    resp = client.generic('POST', '/api/agent-locations/bulk/', body,
+                          content_type='application/json', HTTP_CONTENT_ENCODING='gzip')
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [r['status'] for r in data['results']] == ['created', 'created', 'duplicate', 'invalid']
+    assert data['results'][0]['dans_zone_autorisee'] is True
+    assert data['results'][1]['dans_zone_autorisee'] is False
+    assert AgentLocation.objects.filter(agent=user).count() == 2
+    # L'horodatage fourni par l'application est conservé
+    assert AgentLocation.objects.get(client_id='p1').timestamp.isoformat().startswith('2026-01-05T08:00')
+
+    # Renvoi du même lot : aucun nouvel enregistrement
+    resp = client.post('/api/agent-locations/bulk/', points[:2], format='json')
+    assert [r['status'] for r in resp.json()['results']] == ['duplicate', 'duplicate']
+    assert AgentLocation.objects.filter(agent=user).count() == 2
+
+    # Renvoi avec un autre horodatage, y compris concurrent (non rejeté par la contrainte unique)
+    renvoi = dict(points[0], timestamp='2026-01-05T08:01:00Z')
+    resp = client.post('/api/agent-locations/bulk/', [renvoi], format='json')
+    assert resp.json()['results'][0]['status'] == 'duplicate'
+    bulk_create = AgentLocation.objects.bulk_create
+
+    def bulk_create_concurrent(locations, **kwargs):
+        bulk_create([AgentLocation(agent=user, latitude='5.36', longitude='-4.0083', client_id='p3')])
+        return bulk_create(locations, **kwargs)
+
+    monkeypatch.setattr(AgentLocation.objects, 'bulk_create', bulk_create_concurrent)
+    client.post('/api/agent-locations/bulk/', [dict(points[0], client_id='p3')], format='json')
+    assert AgentLocation.objects.filter(agent=user, client_id='p3').count() == 1
+    assert AgentLocation.objects.filter(agent=user).count() == 3
+
+
+@pytest.mark.django_db
+def test_bulk_location_resolves_bureau_from_latest_point_when_replayed_out_of_order(monkeypatch):
+    from decimal import Decimal
+    from core import geofencing_views
+
+    user = get_user_model().objects.create_user(username='bulk_desordre', password='Testpass123!')
+    client = APIClient()
+    client.force_authenticate(user=user)
+    positions = []
+
+    def resolve(user, latitude, longitude):
+        positions.append((Decimal(latitude), Decimal(longitude)))
+        return None
+
+    monkeypatch.setattr(geofencing_views, 'resolve_agent_bureau', resolve)
+    points = [
+        {'client_id': 'recent', 'latitude': '5.3600000', 'longitude': '-4.0083000', 'timestamp': '2026-01-05T09:00:00Z'},
+        {'client_id': 'ancien', 'latitude': '5.3700000', 'longitude': '-4.0100000', 'timestamp': '2026-01-05T08:00:00Z'},
+    ]
+    resp = client.post('/api/agent-locations/bulk/', points, format='json')
+    assert resp.status_code == 200
+    assert positions == [(Decimal('5.36'), Decimal('-4.0083'))]
+
+
+@pytest.mark.django_db
+def test_location_buffer_flushes_replays_and_reclaims(settings, monkeypatch):
+    import fakeredis
+    from core import location_buffer
+    from core.models import Agent, AgentLocation, Bureau
+
+    settings.LOCATION_BUFFER_ENABLED = True
+    redis_client = fakeredis.FakeRedis()
+    monkeypatch.setattr(location_buffer, '_client', redis_client)
+    monkeypatch.setattr(location_buffer, '_set_latest', redis_client.register_script(location_buffer._SET_LATEST_LUA))
+
+    bureau = Bureau.objects.create(nom='Treichville', latitude_centre='5.3600000', longitude_centre='-4.0083000', rayon_metres=100)
+    user = get_user_model().objects.create_user(username='buffer_agent', password='Testpass123!')
+    Agent.objects.create(user=user, nom='Buffer', matricule='MAT-BUFFER', poste='Agent', bureau=bureau)
+    admin = get_user_model().objects.create_user(username='buffer_admin', password='Testpass123!')
+    admin.profile.role = 'ADMIN'
+    admin.profile.save()
+    client = APIClient()
+
+    points = [
+        {'client_id': 'b1', 'latitude': '5.3600000', 'longitude': '-4.0083000', 'timestamp': '2026-01-05T08:00:00Z'},
+        {'client_id': 'b2', 'latitude': '5.3700000', 'longitude': '-4.0083000', 'timestamp': '2026-01-05T08:05:00Z'},
+    ]
+    client.force_authenticate(user=user)
+    resp = client.post('/api/agent-locations/bulk/', points, format='json')
+    assert resp.status_code == 202
+    resp = client.post('/api/agent-locations/update_location/', {
+        'latitude': '5.3800000', 'longitude': '-4.0083000', 'timestamp': '2026-01-05T08:06:00Z'
+    }, format='json')
+    assert resp.status_code == 202
+    assert not AgentLocation.objects.filter(agent=user).exists()
+
+    # Carte en direct : la position en attente est déjà visible
+    client.force_authenticate(user=admin)
+    resp = client.get('/api/agent-locations/live/')
+    assert [(row['agent'], row['location_id']) for row in resp.json()] == [(user.id, None)]
+    assert resp.json()[0]['dans_zone_autorisee'] is False
+
+    # Un message illisible est mis de côté sans bloquer le lot
+    redis_client.xadd(location_buffer.STREAM_KEY, {'data': b'{illisible'})
+    assert location_buffer.flush_buffer() == 4
+    assert AgentLocation.objects.filter(agent=user).count() == 3
+    assert redis_client.xlen(location_buffer.DEAD_LETTER_KEY) == 1
+    assert redis_client.xlen(location_buffer.STREAM_KEY) == 0
+    assert location_buffer.buffer_metrics()['compteurs']['rejetes'] == '1'
+
+    # Renvoi des mêmes points par l'application : aucun doublon
+    client.force_authenticate(user=user)
+    assert client.post('/api/agent-locations/bulk/', points, format='json').status_code == 202
+    assert location_buffer.flush_buffer() == 2
+    assert AgentLocation.objects.filter(agent=user).count() == 3
+
+    # Message lu par un worker arrêté avant l'acquittement : repris au passage suivant
+    monkeypatch.setattr(location_buffer, 'RECLAIM_IDLE_MS', 0)
+    client.post('/api/agent-locations/bulk/', [
+        {'client_id': 'b3', 'latitude': '5.3600000', 'longitude': '-4.0083000', 'timestamp': '2026-01-05T08:10:00Z'}
+    ], format='json')
+    redis_client.xreadgroup(location_buffer.GROUP, 'worker-arrete', {location_buffer.STREAM_KEY: '>'})
+    assert location_buffer.flush_buffer() == 1
+    assert AgentLocation.objects.filter(agent=user, client_id='b3').exists()
+    assert redis_client.xpending(location_buffer.STREAM_KEY, location_buffer.GROUP)['pending'] == 0
+
+
+@pytest.mark.django_db
+def test_location_retention_rolls_up_expired_days():
+    from datetime import datetime, timedelta, timezone as dt_timezone
+    from core.location_partitions import apply_location_retention
+    from core.models import AgentLocation, AgentLocationHourly
+
+    user = get_user_model().objects.create_user(username='rollup_agent', password='Testpass123!')
+    now = datetime(2026, 3, 20, 12, 0, tzinfo=dt_timezone.utc)
+    old = datetime(2026, 3, 10, 8, 0, tzinfo=dt_timezone.utc)
+
+    def add_location(timestamp, distance, dans_zone):
+        AgentLocation.objects.create(
+            agent=user, latitude='5.36', longitude='-4.00', timestamp=timestamp,
+            distance_bureau=distance, dans_zone_autorisee=dans_zone
+        )
+
+    add_location(old, 50, True)
+    add_location(old + timedelta(minutes=10), 300, False)
+    add_location(old + timedelta(minutes=15), 80, True)
+    add_location(old + timedelta(hours=3), 40, True)  # après un trou : durée non comptée
+    add_location(now - timedelta(hours=1), 10, True)  # dans la fenêtre de rétention
+
+    resultat = apply_location_retention(retention_days=7, now=now)
+
+    assert resultat['jours_agreges'] == [old.date()]
+    assert resultat['lignes_supprimees'] == 4
+    assert AgentLocation.objects.filter(agent=user).count() == 1
+
+    huit_heures = AgentLocationHourly.objects.get(agent=user, heure=old)
+    assert huit_heures.nb_points == 3
+    assert (huit_heures.distance_min, huit_heures.distance_max) == (50, 300)
+    assert huit_heures.secondes_dans_zone == 600
+    assert huit_heures.secondes_hors_zone == 300
+    assert AgentLocationHourly.objects.filter(agent=user).count() == 2
+
+
+@pytest.mark.django_db
+def test_live_locations_use_current_projection_with_etag(agent_avec_position):
+    from core.models import AgentCurrentLocation, Bureau
+
+    bureau = Bureau.objects.create(nom='Cocody', latitude_centre='5.3600000', longitude_centre='-4.0083000', rayon_metres=100)
+    user = agent_avec_position('live_agent', bureau, '5.3700000', '-4.0083000', minutes_ago=2)
+    current = AgentCurrentLocation.objects.get(agent=user)
+    assert not current.dans_zone_autorisee
+    assert current.derniere_dans_zone < current.timestamp
+
+    admin = get_user_model().objects.create_user(username='live_admin', password='Testpass123!')
+    admin.profile.role = 'ADMIN'
+    admin.profile.save()
+    client = APIClient()
+    client.force_authenticate(user=admin)
+
+    resp = client.get('/api/agent-locations/live/')
+    assert resp.status_code == 200
+    assert [row['agent'] for row in resp.json()] == [user.id]
+    etag = resp['ETag']
+
+    assert client.get('/api/agent-locations/live/', HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    # Nouvelle position : la projection et l'ETag changent
+    agent_client = APIClient()
+    agent_client.force_authenticate(user=user)
+    agent_client.post('/api/agent-locations/update_location/', {'latitude': '5.3600000', 'longitude': '-4.0083000'}, format='json')
+    resp = client.get('/api/agent-locations/live/', HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 200
+    assert resp.json()[0]['dans_zone_autorisee'] is True
+
+
+@pytest.mark.django_db
+def test_bureau_index_matches_brute_force():
+    import random
+    from core.bureau_index import bureaux_containing, get_bureau_index, invalidate_bureau_index, nearest_bureau
+    from core.geo_distance import haversine
+    from core.models import Bureau
+
+    invalidate_bureau_index()
+    rng = random.Random(7)
+    for i in range(40):
+        Bureau.objects.create(
+            nom=f'Site {i}', rayon_metres=rng.choice([100, 500, 2000]),
+            latitude_centre=f'{5.0 + rng.uniform(0, 2):.7f}', longitude_centre=f'{-5.0 + rng.uniform(0, 2):.7f}'
+        )
+    bureaux = list(Bureau.objects.all())
+
+    for _ in range(200):
+        lat, lon = 4.5 + rng.uniform(0, 3), -5.5 + rng.uniform(0, 3)
+        distances = {b.id: haversine(lat, lon, b.latitude_centre, b.longitude_centre) for b in bureaux}
+        bureau, distance = nearest_bureau(lat, lon)
+        assert distance == pytest.approx(min(distances.values()))
+        attendus = sorted(b.id for b in bureaux if distances[b.id] <= b.rayon_metres)
+        assert sorted(b.id for b, _ in bureaux_containing(lat, lon)) == attendus
+
+    # Un nouveau bureau invalide l'index
+    index = get_bureau_index()
+    nouveau = Bureau.objects.create(nom='Nouveau site', latitude_centre='9.0000000', longitude_centre='-6.0000000', rayon_metres=100)
+    assert get_bureau_index() is not index
+    assert nearest_bureau(9.0001, -6.0)[0].id == nouveau.id
+
+
+@pytest.mark.django_db
+def test_geofence_settings_cache_is_query_free_and_invalidated_on_save(django_assert_num_queries):
+    from datetime import datetime, timezone as dt_timezone
+    from core.geofence_config import get_geofence_settings, invalidate_local, is_heure_travail
+    from core.models import GeofenceSettings
+
+    invalidate_local()
+    config = GeofenceSettings.objects.create(distance_alerte_metres=250)
+    assert get_geofence_settings().distance_alerte_metres == 250
+
+    lundi_matin = datetime(2026, 3, 2, 8, 0, tzinfo=dt_timezone.utc)
+    lundi_midi = datetime(2026, 3, 2, 12, 30, 30, tzinfo=dt_timezone.utc)
+    samedi_matin = datetime(2026, 3, 7, 8, 0, tzinfo=dt_timezone.utc)
+    with django_assert_num_queries(0):
+        assert get_geofence_settings().distance_alerte_metres == 250
+        assert is_heure_travail(lundi_matin)
+        assert not is_heure_travail(lundi_midi)
+        assert not is_heure_travail(samedi_matin)
+
+    config.distance_alerte_metres = 500
+    config.samedi_travaille = True
+    config.save()
+    assert get_geofence_settings().distance_alerte_metres == 500
+    assert is_heure_travail(samedi_matin)
+
+
+@pytest.mark.django_db
+def test_push_dispatcher_multicasts_and_deactivates_dead_tokens(settings):
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from core.models import PushNotificationToken
+    from core.push_dispatcher import send_push_batch
+
+    requetes = []
+
+    class StubFCM(BaseHTTPRequestHandler):
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            requetes.append(payload)
+            results = []
+            for token in payload['registration_ids']:
+                if token == 'mort':
+                    results.append({'error': 'NotRegistered'})
+                elif token == 'ancien':
+                    results.append({'message_id': '1', 'registration_id': 'nouveau'})
+                else:
+                    results.append({'message_id': '2'})
+            body = json.dumps({'success': 2, 'failure': 1, 'results': results}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    serveur = HTTPServer(('127.0.0.1', 0), StubFCM)
+    threading.Thread(target=serveur.serve_forever, daemon=True).start()
+    settings.FCM_SERVER_KEY = 'cle-test'
+    settings.FCM_SEND_URL = f'http://127.0.0.1:{serveur.server_address[1]}/fcm/send'
+
+    try:
+        users = [get_user_model().objects.create_user(username=f'push{i}', password='Testpass123!') for i in range(3)]
+        tokens = [
+            PushNotificationToken.objects.create(user=user, token=valeur, platform='android')
+            for user, valeur in zip(users, ['valide', 'mort', 'ancien'])
+        ]
+        resultat = send_push_batch(tokens, 'Titre', 'Corps', {'type': 'test'})
+    finally:
+        serveur.shutdown()
+
+    assert len(requetes) == 1
+    assert requetes[0]['registration_ids'] == ['valide', 'mort', 'ancien']
+    assert sorted(resultat['envoyes']) == sorted([tokens[0].id, tokens[2].id])
+    assert not PushNotificationToken.objects.get(id=tokens[1].id).is_active
+    assert PushNotificationToken.objects.get(id=tokens[2].id).token == 'nouveau'
+
+
+@pytest.mark.django_db(transaction=True)
+def test_geofence_alert_notifications_are_inserted_when_broker_is_down(agent_avec_position, creer_utilisateur, monkeypatch):
+    from datetime import timedelta
+    from django.utils import timezone
+    from kombu.exceptions import OperationalError
+    from core import geofencing_tasks, geofencing_views
+    from core.models import Bureau, GeofenceAlert, GeofenceSettings, Notification
+
+    def broker_indisponible(*args, **kwargs):
+        raise OperationalError('broker indisponible')
+    monkeypatch.setattr(geofencing_views.send_geofence_notifications_batch_task, 'delay', broker_indisponible)
+    monkeypatch.setattr(geofencing_tasks.send_push_alerts_task, 'delay', broker_indisponible)
+    monkeypatch.setattr(geofencing_views, 'is_heure_travail', lambda *args: True)
+
+    GeofenceSettings.objects.create(distance_alerte_metres=200, duree_minimale_hors_bureau_minutes=5)
+    bureau = Bureau.objects.create(nom='Yopougon', latitude_centre='5.3600000', longitude_centre='-4.0083000', rayon_metres=100)
+    directeur = creer_utilisateur('alerte_directeur', 'DIRECTEUR')
+    agent = agent_avec_position('alerte_agent', bureau, '5.3600000', '-4.0083000', minutes_ago=40, inside_minutes_ago=40)
+
+    client = APIClient()
+    client.force_authenticate(user=agent)
+    resp = client.post('/api/agent-locations/update_location/', {
+        'latitude': '5.3800000', 'longitude': '-4.0083000', 'timestamp': timezone.now() - timedelta(minutes=1)
+    }, format='json')
+    assert resp.status_code == 200
+    alerte = GeofenceAlert.objects.get(agent=agent)
+    # Seul le push est perdu : notification in-app créée et alerte marquée envoyée
+    assert alerte.notification_envoyee
+    assert Notification.objects.filter(user=directeur, type_notif='geofence_alert').count() == 1
+
+
+@pytest.fixture
+def organisation_diligences(creer_utilisateur, creer_service):
+    """Service Paie de la DAF (directeur, supérieur, agent), un lecteur hors service et trois diligences"""
+    from types import SimpleNamespace
+    from core.models import Diligence, Direction, ImputationAccess
+
+    service = creer_service('Paie', Direction.objects.create(nom='DAF'))
+    org = SimpleNamespace(
+        service=service,
+        autre_service=creer_service('Courrier'),
+        directeur=creer_utilisateur('vis_directeur', 'DIRECTEUR', service),
+        superieur=creer_utilisateur('vis_superieur', 'SUPERIEUR', service),
+        agent=creer_utilisateur('vis_agent', 'AGENT', service),
+        lecteur=creer_utilisateur('vis_lecteur'),
+        diligences=[Diligence.objects.create(reference_courrier=f'REF-{i}', categorie='NORMAL') for i in range(3)],
+    )
+    org.diligences[0].agents.add(org.agent)
+    ImputationAccess.objects.create(diligence=org.diligences[1], user=org.lecteur)
+    return org
+
+
+def _liste_diligences(user, **params):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client.get('/api/diligences/', params)
+
+
+def _ids_visibles(user):
+    resp = _liste_diligences(user)
+    assert resp.status_code == 200
+    return {d['id'] for d in resp.json()}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_diligence_visibility_index_covers_assignments_imputations_and_hierarchy(organisation_diligences):
+    org = organisation_diligences
+    assert _ids_visibles(org.agent) == {org.diligences[0].id}
+    assert _ids_visibles(org.directeur) == {org.diligences[0].id}
+    assert _ids_visibles(org.superieur) == {org.diligences[0].id}
+    assert _ids_visibles(org.lecteur) == {org.diligences[1].id}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_diligence_visibility_follows_agent_service_change(organisation_diligences):
+    org = organisation_diligences
+    # L'ancien supérieur et le directeur ne voient plus la diligence de l'agent
+    org.agent.profile.service = org.autre_service
+    org.agent.profile.save()
+    assert _ids_visibles(org.directeur) == set()
+    assert _ids_visibles(org.superieur) == set()
+    assert _ids_visibles(org.agent) == {org.diligences[0].id}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_diligence_visibility_follows_services_concernes(organisation_diligences):
+    from core.models import DiligenceVisibility
+
+    org = organisation_diligences
+    org.diligences[2].services_concernes.add(org.service)
+    assert _ids_visibles(org.superieur) == {org.diligences[0].id, org.diligences[2].id}
+    assert set(DiligenceVisibility.objects.filter(user=org.directeur).values_list('raison', flat=True)) == {'direction'}
+
+    org.service.diligences_concernes.clear()
+    assert _ids_visibles(org.superieur) == {org.diligences[0].id}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_diligence_visibility_drops_hierarchy_rows_when_service_is_deleted(organisation_diligences):
+    from core.models import DiligenceVisibility
+
+    org = organisation_diligences
+    # Les rattachements passent à NULL sans post_save : l'index suit quand même
+    org.service.delete()
+    assert _ids_visibles(org.superieur) == set()
+    assert _ids_visibles(org.directeur) == set()
+    assert not DiligenceVisibility.objects.filter(user__in=[org.directeur, org.superieur]).exists()
+    assert _ids_visibles(org.agent) == {org.diligences[0].id}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_diligence_visibility_is_empty_without_assignment_or_service(organisation_diligences, creer_utilisateur):
+    from core.models import DiligenceVisibility
+
+    for user in (creer_utilisateur('vis_isole'), creer_utilisateur('vis_directeur_sans_service', 'DIRECTEUR')):
+        assert _ids_visibles(user) == set()
+        assert not DiligenceVisibility.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_diligence_list_paginates_by_cursor_only_on_request(organisation_diligences):
+    org = organisation_diligences
+    for diligence in org.diligences[1:]:
+        diligence.services_concernes.add(org.service)
+    assert isinstance(_liste_diligences(org.directeur).json(), list)
+
+    client = APIClient()
+    client.force_authenticate(user=org.directeur)
+    ids, url = [], '/api/diligences/?page_size=1'
+    while url:
+        page = client.get(url).json()
+        assert len(page['results']) == 1
+        ids.extend(d['id'] for d in page['results'])
+        url = page['next']
+    assert ids == [d.id for d in reversed(org.diligences)]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_diligence_list_rejects_invalid_cursor(organisation_diligences):
+    resp = _liste_diligences(organisation_diligences.directeur, cursor='pas-un-curseur')
+    assert resp.status_code == 404
+
+
+@pytest.mark.django_db
+def test_courrier_list_query_count_does_not_grow_with_page_size():
+    from datetime import date
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from core.models import Courrier, CourrierAccess, CourrierImputation, Diligence
+
+    User = get_user_model()
+    admin = User.objects.create_user(username='courrier_admin', password='Testpass123!')
+    admin.profile.role = 'ADMIN'
+    admin.profile.save()
+    agent = User.objects.create_user(username='courrier_agent', password='Testpass123!')
+    client = APIClient()
+    client.force_authenticate(user=admin)
+
+    def creer_courriers(debut, fin):
+        for i in range(debut, fin):
+            courrier = Courrier.objects.create(
+                reference=f'C-{i}', expediteur='Ministère', objet='Objet', date_reception=date(2024, 1, 1)
+            )
+            CourrierImputation.objects.create(courrier=courrier, user=agent, granted_by=admin)
+            # bulk_create : les signaux de core.signals_courrier lisent des champs absents des modèles
+            CourrierAccess.objects.bulk_create([CourrierAccess(courrier=courrier, user=agent, granted_by=admin)])
+            Diligence.objects.bulk_create([Diligence(courrier=courrier, reference_courrier=f'C-{i}', categorie='NORMAL')])
+
+    def nb_requetes():
+        with CaptureQueriesContext(connection) as requetes:
+            resp = client.get('/api/courriers/')
+        assert resp.status_code == 200
+        return len(resp.json()), len(requetes)
+
+    creer_courriers(0, 2)
+    nb_petit, requetes_petit = nb_requetes()
+    creer_courriers(2, 12)
+    nb_grand, requetes_grand = nb_requetes()
+
+    assert (nb_petit, nb_grand) == (2, 12)
+    assert requetes_grand == requetes_petit
+
+    item = client.get('/api/courriers/').json()[0]
+    assert item['imputation_access'][0]['user']['username'] == 'courrier_agent'
+    assert item['access_granted'][0]['user']['id'] == agent.id
+    assert item['diligence']['id'] == item['diligence_id']
+
+    # Courrier imbriqué dans la liste des diligences : mêmes prefetch, préfixés
+    with CaptureQueriesContext(connection) as requetes:
+        diligences = client.get('/api/diligences/').json()
+    assert len(diligences) == 12
+    assert all(d['courrier']['diligence_id'] == d['id'] for d in diligences)
+    assert len(requetes) < 20
+
+
+@pytest.mark.django_db
+def test_list_endpoints_support_keyset_pagination_and_sparse_fields():
+    from core.models import Diligence
+
+    User = get_user_model()
+    admin = User.objects.create_user(username='page_admin', password='Testpass123!')
+    admin.profile.role = 'ADMIN'
+    admin.profile.save()
+    for i in range(5):
+        Diligence.objects.create(reference_courrier=f'P-{i}', categorie='NORMAL')
+    client = APIClient()
+    client.force_authenticate(user=admin)
+
+    # Sans paramètre de pagination : tableau complet, comme avant
+    assert len(client.get('/api/diligences/').json()) == 5
+
+    references = []
+    url = '/api/diligences/?page_size=2&fields=id,reference_courrier'
+    while url:
+        page = client.get(url).json()
+        assert all(set(item) == {'id', 'reference_courrier'} for item in page['results'])
+        references.extend(item['reference_courrier'] for item in page['results'])
+        url = page['next']
+    assert references == [f'P-{i}' for i in reversed(range(5))]
+
+    users = client.get('/api/users/', {'page_size': 1, 'fields': 'id,username'}).json()
+    assert users['results'] == [{'id': admin.id, 'username': 'page_admin'}]
+    assert client.get('/api/geofence-alerts/', {'page_size': 10}).json()['results'] == []
+
+
+@pytest.fixture
+def organisation_drh(creer_utilisateur, creer_service, creer_agent):
+    """DRH avec deux services : directeur (Paie), supérieur et agent (Formation), agent terrain par sa fiche Agent"""
+    from types import SimpleNamespace
+    from core.models import Direction
+
+    direction = Direction.objects.create(nom='DRH')
+    paie = creer_service('Paie', direction)
+    formation = creer_service('Formation', direction)
+    return SimpleNamespace(
+        direction=direction, paie=paie, formation=formation,
+        directeur=creer_utilisateur('scope_directeur', 'DIRECTEUR', paie),
+        superieur=creer_utilisateur('scope_superieur', 'SUPERIEUR', formation),
+        agent=creer_utilisateur('scope_agent', 'AGENT', formation),
+        # Rattaché à la direction seulement par sa fiche Agent
+        terrain=creer_agent('scope_terrain', service=paie),
+    )
+
+
+class _RedisIndisponible:
+    """Client Redis dont chaque commande échoue"""
+
+    def __getattr__(self, nom):
+        def echec(*args, **kwargs):
+            import redis
+            raise redis.ConnectionError('redis indisponible')
+        return echec
+
+
+@pytest.mark.django_db(transaction=True)
+def test_org_scope_directeur_covers_direction_and_is_memoized(organisation_drh, django_assert_num_queries):
+    from core.org_scope import get_org_scope
+
+    org = organisation_drh
+    scope = get_org_scope(org.directeur)
+    assert (scope.role, scope.service_id, scope.direction_id) == ('DIRECTEUR', org.paie.id, org.direction.id)
+    assert scope.user_ids == {org.directeur.id, org.superieur.id, org.agent.id, org.terrain.id}
+    with django_assert_num_queries(0):
+        assert get_org_scope(org.directeur) is scope
+
+
+@pytest.mark.django_db(transaction=True)
+def test_org_scope_superieur_covers_service_and_agent_only_self(organisation_drh, creer_utilisateur):
+    from core.org_scope import compute_org_scope
+
+    org = organisation_drh
+    assert compute_org_scope(org.superieur.id).user_ids == {org.superieur.id, org.agent.id}
+    assert compute_org_scope(org.agent.id).user_ids == {org.agent.id}
+    assert compute_org_scope(creer_utilisateur('scope_admin', 'ADMIN').id).sees_all
+
+
+@pytest.mark.django_db(transaction=True)
+def test_org_scope_is_only_self_without_service_or_profile(creer_utilisateur):
+    from core.models import UserProfile
+    from core.org_scope import compute_org_scope
+
+    directeur = creer_utilisateur('scope_sans_service', 'DIRECTEUR')
+    assert compute_org_scope(directeur.id).user_ids == {directeur.id}
+
+    sans_profil = creer_utilisateur('scope_sans_profil')
+    UserProfile.objects.filter(user=sans_profil).delete()
+    scope = compute_org_scope(sans_profil.id)
+    assert not scope.has_profile
+    assert scope.user_ids == {sans_profil.id}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_org_scope_round_trips_through_json_and_filters_querysets(organisation_drh):
+    from core.org_scope import OrgScope, get_org_scope
+
+    org = organisation_drh
+    scope = get_org_scope(org.directeur)
+    copie = OrgScope.from_json(org.directeur.id, scope.to_json())
+    assert (copie.role, copie.direction_id, copie.user_ids) == (scope.role, scope.direction_id, scope.user_ids)
+    assert list(scope.filter(get_user_model().objects.order_by('id'), field='id')) == [
+        org.directeur, org.superieur, org.agent, org.terrain
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_org_scope_is_shared_between_requests_through_redis(organisation_drh, settings, monkeypatch, django_assert_num_queries):
+    import fakeredis
+    from core import org_scope
+
+    settings.CACHE_INVALIDATION_REDIS_URL = 'redis://cache'
+    monkeypatch.setattr(org_scope, '_client', fakeredis.FakeRedis())
+    org = organisation_drh
+    scope = org_scope.get_org_scope(org.directeur)
+
+    # Nouvelle requête : nouvel objet utilisateur, périmètre lu dans Redis
+    directeur = get_user_model().objects.get(pk=org.directeur.pk)
+    with django_assert_num_queries(0):
+        assert org_scope.get_org_scope(directeur).user_ids == scope.user_ids
+
+    # Un changement de service vide le cache après le commit
+    org.agent.profile.service = org.paie
+    org.agent.profile.save()
+    assert not org_scope._client.exists(org_scope.CLE_CACHE)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_org_scope_falls_back_to_database_when_redis_is_down(organisation_drh, settings, monkeypatch):
+    from core import org_scope
+
+    settings.CACHE_INVALIDATION_REDIS_URL = 'redis://cache'
+    monkeypatch.setattr(org_scope, '_client', _RedisIndisponible())
+    org = organisation_drh
+    assert org_scope.get_org_scope(org.superieur).user_ids == {org.superieur.id, org.agent.id}
+    # L'invalidation ne fait pas échouer l'enregistrement
+    org.agent.profile.service = org.paie
+    org.agent.profile.save()
+    assert org_scope.compute_org_scope(org.superieur.id).user_ids == {org.superieur.id}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_org_closure_follows_hierarchy_changes():
+    from core.models import Direction, OrgClosure, Service, SousDirection
+    from core.org_hierarchy import descendants_of, rebuild_all, users_under
+
+    User = get_user_model()
+    daf = Direction.objects.create(nom='DAF')
+    drh = Direction.objects.create(nom='DRH')
+    budget = SousDirection.objects.create(nom='Budget', direction=daf)
+    carrieres = SousDirection.objects.create(nom='Carrières', direction=drh)
+    service = Service.objects.create(nom='Engagements', sous_direction=budget)
+    agent = User.objects.create_user(username='closure_agent', password='Testpass123!')
+    agent.profile.service = service
+    agent.profile.save()
+
+    assert set(descendants_of(daf, 'service')) == {service.id}
+    assert set(descendants_of(daf, 'sous_direction')) == {budget.id}
+    assert set(users_under(daf)) == {agent.id}
+    assert set(users_under(budget)) == {agent.id}
+    assert OrgClosure.objects.get(ancetre_type='direction', ancetre_id=daf.id, descendant_type='user').profondeur == 3
+
+    # Le service change de sous-direction : ses agents suivent
+    service.sous_direction = carrieres
+    service.save()
+    assert set(users_under(daf)) == set()
+    assert set(users_under(drh)) == {agent.id}
+
+    # La sous-direction change de direction
+    carrieres.direction = daf
+    carrieres.save()
+    assert set(users_under(drh)) == set()
+    assert set(users_under(daf)) == {agent.id}
+
+    avant = set(OrgClosure.objects.values_list('ancetre_type', 'ancetre_id', 'descendant_type', 'descendant_id', 'profondeur'))
+    rebuild_all()
+    assert set(OrgClosure.objects.values_list('ancetre_type', 'ancetre_id', 'descendant_type', 'descendant_id', 'profondeur')) == avant
+
+    service.delete()
+    assert set(users_under(daf)) == set()
+    assert set(OrgClosure.objects.filter(descendant_type='user').values_list('ancetre_type', flat=True)) == {'user'}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_courrier_notifications_fan_out_in_bulk_after_commit(settings):
+    from datetime import date
+    from django.db import connection, transaction
+    from django.test.utils import CaptureQueriesContext
+    from core.models import Courrier, CourrierNotification, Service
+
+    settings.NOTIFICATION_FANOUT_ASYNC = False
+    User = get_user_model()
+    service = Service.objects.create(nom='Courrier')
+
+    def creer_courrier(reference, nb_destinataires):
+        for i in range(nb_destinataires):
+            user = User.objects.create_user(username=f'{reference}_{i}', password='Testpass123!')
+            user.profile.service = service
+            user.profile.save()
+        with CaptureQueriesContext(connection) as requetes:
+            with transaction.atomic():
+                courrier = Courrier.objects.create(
+                    reference=reference, expediteur='Ministère', objet='Objet',
+                    date_reception=date(2024, 1, 1), service=service
+                )
+                pendant = len(requetes)
+                assert not CourrierNotification.objects.filter(courrier=courrier).exists()
+        return courrier, pendant, len(requetes) - pendant
+
+    petit, pendant_petit, apres_petit = creer_courrier('FAN-1', 2)
+    grand, pendant_grand, apres_grand = creer_courrier('FAN-2', 30)
+
+    assert pendant_grand == pendant_petit
+    assert apres_grand == apres_petit
+    assert CourrierNotification.objects.filter(courrier=grand).count() == 32
+    notification = CourrierNotification.objects.filter(courrier=grand).first()
+    assert notification.type_notification == 'nouveau_courrier'
+    assert notification.metadata['reference'] == 'FAN-2'
+
+
+@pytest.mark.django_db(transaction=True)
+def test_inbox_merges_streams_and_serves_cached_unread_counts(monkeypatch, django_assert_num_queries):
+    import fakeredis
+    from core import inbox
+    from core.models import CourrierNotification, DiligenceNotification, Notification
+
+    monkeypatch.setattr(inbox, '_client', fakeredis.FakeRedis())
+    User = get_user_model()
+    user = User.objects.create_user(username='inbox_user', password='Testpass123!')
+    for i in range(3):
+        Notification.objects.create(user=user, message=f'N{i}')
+        DiligenceNotification.objects.create(user=user, type_notification='nouvelle_diligence', message=f'D{i}')
+        CourrierNotification.objects.create(utilisateur=user, type_notification='nouveau_courrier', titre='C', message=f'C{i}')
+
+    # Sans hash en cache, les variations ne créent pas de compteurs partiels
+    inbox.adjust_unread({(user.id, source): 1 for source in inbox.SOURCES})
+    assert not inbox._redis().exists(inbox.CLE_COMPTEURS.format(user.id))
+
+    assert inbox.unread_counts(user.id) == {'notification': 3, 'diligence': 3, 'courrier': 3, 'total': 9}
+    with django_assert_num_queries(0):
+        assert inbox.unread_counts(user.id)['total'] == 9
+
+    # Les compteurs en cache suivent créations, lectures et suppressions
+    DiligenceNotification.objects.create(user=user, type_notification='nouvelle_diligence', message='D3')
+    courrier = CourrierNotification.objects.filter(utilisateur=user).first()
+    courrier.marquer_comme_lue()
+    Notification.objects.filter(user=user).first().delete()
+    with django_assert_num_queries(0):
+        assert inbox.unread_counts(user.id) == {'notification': 2, 'diligence': 4, 'courrier': 2, 'total': 8}
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+    vus, url = [], '/api/inbox/?page_size=4'
+    while url:
+        resp = client.get(url)
+        assert resp.status_code == 200
+        vus.extend(resp.json()['results'])
+        url = resp.json()['next']
+    assert len(vus) == 9
+    assert len({e['id'] for e in vus}) == 9
+    dates = [e['created_at'] for e in vus]
+    assert dates == sorted(dates, reverse=True)
+
+    resp = client.post('/api/inbox/marquer_lues/', {'ids': [f'courrier-{courrier.id}', vus[0]['id']]}, format='json')
+    assert resp.json()['count'] == 1
+    assert client.post('/api/inbox/marquer_lues/', {}, format='json').json()['count'] == 7
+    assert client.get('/api/inbox/non_lues/').json()['total'] == 0
+    assert client.get('/api/inbox/?lue=false').json()['results'] == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_notification_stream_pushes_new_items_and_counters(monkeypatch):
+    import json
+    import fakeredis
+    from asgiref.sync import async_to_sync, sync_to_async
+    from core import inbox, notification_stream
+    from core.models import DiligenceNotification
+
+    serveur = fakeredis.FakeServer()
+    monkeypatch.setattr(inbox, '_client', fakeredis.FakeRedis(server=serveur))
+    monkeypatch.setattr(notification_stream, '_client', fakeredis.FakeRedis(server=serveur))
+    monkeypatch.setattr(notification_stream, '_redis_async', lambda: fakeredis.FakeAsyncRedis(server=serveur))
+    User = get_user_model()
+    user = User.objects.create_user(username='stream_user', password='Testpass123!')
+
+    def evenement(bloc):
+        entete, donnees = bloc.strip().split('\n')
+        return entete.removeprefix('event: '), json.loads(donnees.removeprefix('data: '))
+
+    @async_to_sync
+    async def lire():
+        flux = notification_stream.event_stream(user.id, heartbeat=0.05)
+        blocs = [await flux.__anext__()]
+        await sync_to_async(DiligenceNotification.objects.create)(
+            user=user, type_notification='nouvelle_diligence', message='Nouvelle'
+        )
+        while len(blocs) < 3:
+            bloc = await flux.__anext__()
+            if not bloc.startswith(':'):
+                blocs.append(bloc)
+        await flux.aclose()
+        return [evenement(bloc) for bloc in blocs]
+
+    (type0, compteurs0), (type1, element), (type2, compteurs1) = lire()
+    assert (type0, compteurs0['total']) == ('compteurs', 0)
+    assert type1 == 'notification'
+    assert (element['source'], element['message'], element['lue']) == ('diligence', 'Nouvelle', False)
+    assert (type2, compteurs1['diligence'], compteurs1['total']) == ('compteurs', 1, 1)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_search_is_accent_insensitive_ranked_and_scoped():
+    from datetime import date
+    from core.models import Courrier, CourrierImputation, Diligence, SearchTerm, Tache
+    from core.search_index import rebuild_all, search, tokenize
+
+    assert tokenize("L'Œuvre des Élèves à Réceptionner") == ['oeuvre', 'eleve', 'receptionner']
+
+    User = get_user_model()
+    admin = User.objects.create_user(username='search_admin', password='Testpass123!')
+    admin.profile.role = 'ADMIN'
+    admin.profile.save()
+    agent = User.objects.create_user(username='search_agent', password='Testpass123!')
+
+    budget = Courrier.objects.create(
+        reference='BUDGET-2024', expediteur='Ministère des Finances', objet='Préparation du budget annuel',
+        date_reception=date(2024, 1, 1)
+    )
+    note = Courrier.objects.create(
+        reference='NS-12', expediteur='Direction générale', objet='Note de service sur le budget',
+        date_reception=date(2024, 1, 2)
+    )
+    CourrierImputation.objects.create(courrier=note, user=agent, granted_by=admin)
+    diligence = Diligence.objects.create(reference_courrier='D-1', categorie='NORMAL', objet='Suivi budgétaire')
+    Tache.objects.create(titre='Élaborer le budget', responsable=agent)
+
+    resultats = search(admin, 'budget')
+    assert [c['id'] for c in resultats['courrier']] == [budget.id, note.id]
+    assert [t['titre'] for t in resultats['tache']] == ['Élaborer le budget']
+    assert search(admin, 'budgetaire')['diligence'][0]['id'] == diligence.id
+    # Accents, pluriel et préfixe de la saisie en cours
+    assert [c['id'] for c in search(admin, 'PREPARATIONS budg')['courrier']] == [budget.id]
+    assert search(admin, 'note finances')['courrier'] == []
+
+    # Visibilité : l'agent ne voit que le courrier qui lui est imputé, ses tâches, aucune diligence
+    resultats = search(agent, 'budget')
+    assert [c['id'] for c in resultats['courrier']] == [note.id]
+    assert resultats['diligence'] == []
+    assert len(resultats['tache']) == 1
+
+    # Mise à jour et suppression suivies par les signaux
+    note.objet = 'Note de service sur les congés'
+    note.save()
+    assert [c['id'] for c in search(admin, 'conges')['courrier']] == [note.id]
+    budget.delete()
+    assert not SearchTerm.objects.filter(type_objet='courrier', objet_id=budget.id).exists()
+    avant = SearchTerm.objects.count()
+    assert rebuild_all() == avant
+
+    client = APIClient()
+    client.force_authenticate(user=agent)
+    resp = client.get('/api/search/', {'q': 'note'})
+    assert resp.status_code == 200
+    assert [c['reference'] for c in resp.json()['courriers']] == ['NS-12']
+    assert client.get('/api/search/', {'q': 'n'}).status_code == 400
+
+
+@pytest.mark.django_db(transaction=True)
+def test_courrier_stats_rollup_follows_changes_and_serves_dashboards(django_assert_max_num_queries):
+    from datetime import timedelta
+    from django.utils import timezone
+    from core.courrier_stats import rebuild_all
+    from core.models import Courrier, CourrierStatsJour, Diligence, Direction, Service
+
+    User = get_user_model()
+    admin = User.objects.create_user(username='stats_admin', password='Testpass123!')
+    drh = Direction.objects.create(nom='DRH')
+    daf = Direction.objects.create(nom='DAF')
+    paie = Service.objects.create(nom='Paie', direction=drh)
+    aujourd_hui = timezone.now().date()
+    ancien = aujourd_hui.replace(year=aujourd_hui.year - 1)
+
+    courriers = [
+        Courrier.objects.create(reference=f'S-{i}', expediteur='X', objet='Objet', date_reception=jour,
+                                service=service, type_courrier=type_courrier)
+        for i, (jour, service, type_courrier) in enumerate([
+            (aujourd_hui, paie, 'ordinaire'), (aujourd_hui, paie, 'confidentiel'),
+            (ancien, paie, 'ordinaire'), (ancien, None, 'ordinaire'),
+        ])
+    ]
+    # Créée sans courrier puis rattachée : la notification de création lit des champs absents
+    diligence = Diligence.objects.create(reference_courrier='D-1', categorie='NORMAL', objet='Suivi')
+    diligence.courrier = courriers[0]
+    diligence.save()
+
+    client = APIClient()
+    client.force_authenticate(user=admin)
+    # Nombre de requêtes indépendant du nombre de courriers
+    with django_assert_max_num_queries(9):
+        data = client.get('/api/courrier-stats/statistiques_globales/').json()
+    assert data['total_courriers'] == 4
+    assert data['courriers_avec_diligence'] == 1
+    assert data['periode']['aujourd_hui'] == 2
+    assert {l['type_courrier']: l['count'] for l in data['courriers_par_type']} == {'ordinaire': 3, 'confidentiel': 1}
+    assert {l['service__nom']: l['count'] for l in data['courriers_par_service']} == {'Paie': 3, None: 1}
+    filtre = client.get('/api/courrier-stats/statistiques_globales/', {'direction': drh.id}).json()
+    assert filtre['total_courriers'] == 3
+
+    # Diligence terminée, courrier déplacé, service rattaché à une autre direction, suppression
+    diligence.statut = 'termine'
+    diligence.save()
+    courriers[2].date_reception = aujourd_hui
+    courriers[2].save()
+    paie.direction = daf
+    paie.save()
+    courriers[3].delete()
+
+    data = client.get('/api/courrier-stats/tableau_de_bord/').json()
+    assert data['statistiques_generales']['total_courriers'] == 3
+    assert data['statistiques_generales']['courriers_aujourd_hui'] == 3
+    assert data['statuts'] == {'nouveaux': 2, 'en_cours': 0, 'traites': 1}
+    assert client.get('/api/courrier-stats/statistiques_globales/', {'direction': daf.id}).json()['total_courriers'] == 3
+    evolution = client.get('/api/courrier-stats/evolution_temporelle/', {'annee': aujourd_hui.year}).json()
+    assert evolution['evolution'] == [
+        {'mois': aujourd_hui.month, 'count': 3, 'ordinaires': 2, 'confidentiels': 1}
+    ]
+
+    # Le recalcul complet donne les mêmes lignes que les mises à jour incrémentales
+    def lignes():
+        return sorted(CourrierStatsJour.objects.values_list(
+            'jour', 'service_id', 'direction_id', 'type_courrier', 'statut', 'nombre', 'avec_diligence',
+            'diligence_terminee', 'nb_delais'
+        ))
+    incrementales = lignes()
+    rebuild_all()
+    assert lignes() == incrementales
+
+
+@pytest.mark.django_db
+def test_presence_stats_are_aggregated_in_one_grouped_query(django_assert_num_queries):
+    import json
+    from datetime import date, time
+    from core.models import Agent, Direction, Presence, Service
+    from core.presence_stats import presences_filtrees, summary_rows
+
+    User = get_user_model()
+    direction = Direction.objects.create(nom='DRH')
+    paie = Service.objects.create(nom='Paie', direction=direction)
+    user = User.objects.create_user(username='presence_agent', password='Testpass123!', last_name='Kone')
+    agent = Agent.objects.create(user=user, nom='Kone', matricule='MAT-PRES', poste='Agent', service=paie)
+    autre = Agent.objects.create(
+        user=User.objects.create_user(username='presence_autre', password='Testpass123!'),
+        nom='Autre', matricule='MAT-PRES2', poste='Agent'
+    )
+    # Deux jours la même semaine ISO, un jour la semaine suivante, une présence sans départ
+    for jour, arrivee, depart in [
+        (date(2026, 1, 5), time(8), time(16)), (date(2026, 1, 6), time(8), time(12)),
+        (date(2026, 1, 12), time(9), time(15)), (date(2026, 1, 13), time(8), None),
+    ]:
+        Presence.objects.create(agent=agent, date_presence=jour, heure_arrivee=arrivee, heure_depart=depart,
+                                statut='présent', latitude=0, longitude=0)
+    Presence.objects.create(agent=autre, date_presence=date(2026, 1, 5), heure_arrivee=time(8),
+                            heure_depart=time(10), statut='présent', latitude=0, longitude=0)
+
+    with django_assert_num_queries(1):
+        lignes = list(summary_rows(presences_filtrees(direction_id=direction.id)))
+    assert lignes == [{
+        'user_id': user.id, 'last_name': 'Kone', 'first_name': '', 'service': 'Paie', 'direction': 'DRH',
+        'total_hours': 18.0, 'days_worked': 3, 'hours_per_day': 6.0, 'hours_per_week': 9.0,
+        'hours_per_month': 18.0, 'hours_per_year': 18.0,
+    }]
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+    resp = client.get('/api/stats/presence/', {'periode': 'semaine', 'start': '2026-01-01'})
+    semaines = json.loads(b''.join(resp.streaming_content))
+    assert [(l['user_id'], l['semaine'], l['hours']) for l in semaines] == sorted(
+        [(user.id, 2, 12.0), (user.id, 3, 6.0), (autre.user_id, 2, 2.0)]
+    )
+    assert client.get('/api/stats/presence/', {'periode': 'trimestre'}).status_code == 400
+
+
+@pytest.mark.django_db(transaction=True)
+def test_presence_matrix_merges_sources_and_follows_changes(django_assert_max_num_queries):
+    from datetime import date, datetime, time
+    from django.utils import timezone
+    from core.models import (
+        Agent, DemandeAbsence, DemandeConge, OccurrenceSpeciale, Presence, PresenceJour, Service
+    )
+    from core.presence_matrix import rebuild_all, service_month
+
+    User = get_user_model()
+    paie = Service.objects.create(nom='Paie')
+    chef = User.objects.create_user(username='matrice_chef', password='Testpass123!', last_name='A')
+    chef.profile.role = 'SUPERIEUR'
+    chef.profile.service = paie
+    chef.profile.save()
+    user = User.objects.create_user(username='matrice_agent', password='Testpass123!', last_name='B')
+    agent = Agent.objects.create(user=user, nom='B', matricule='MAT-MATRICE', poste='Agent', service=paie)
+
+    presence = Presence.objects.create(agent=agent, date_presence=date(2026, 3, 2), heure_arrivee=time(8),
+                                       heure_depart=time(16, 30), statut='présent', latitude=0, longitude=0)
+    OccurrenceSpeciale.objects.create(agent=user, type_occurrence='M1', nom_occurrence='Mission', statut='en mission',
+                                      date_debut=date(2026, 3, 3), date_fin=date(2026, 3, 4))
+    OccurrenceSpeciale.objects.create(agent=user, type_occurrence='F', nom_occurrence='Férié', statut='férié',
+                                      date=date(2026, 3, 2))
+    conge = DemandeConge.objects.create(demandeur=user, type_conge='annuel', date_debut=date(2026, 3, 9),
+                                        date_fin=date(2026, 3, 10), nombre_jours=2, motif='Repos',
+                                        adresse_conge='-', telephone_conge='-', statut='approuve')
+    DemandeAbsence.objects.create(
+        demandeur=user, type_absence='medicale', motif='RDV', duree_heures=2, statut='approuve',
+        date_debut=timezone.make_aware(datetime(2026, 3, 5, 9)), date_fin=timezone.make_aware(datetime(2026, 3, 5, 11))
+    )
+
+    with django_assert_max_num_queries(2):
+        matrice = service_month(paie.id, 2026, 3)
+    ligne = next(a for a in matrice['agents'] if a['user_id'] == user.id)
+    assert matrice['jours'] == 31
+    # Le pointage prime sur le férié, la mission couvre sa plage
+    assert ligne['statuts'][:10] == [None, 'P', 'M', 'M', 'AU', None, None, None, 'C', 'C']
+    assert ligne['heures'][1] == 8.5
+
+    # Congé déplacé : les anciens jours sont libérés ; pointage supprimé : le férié réapparaît
+    conge.date_debut, conge.date_fin = date(2026, 3, 16), date(2026, 3, 16)
+    conge.save()
+    presence.delete()
+    ligne = next(a for a in service_month(paie.id, 2026, 3)['agents'] if a['user_id'] == user.id)
+    assert ligne['statuts'][1] == 'F'
+    assert ligne['statuts'][8:10] == [None, None]
+    assert ligne['statuts'][15] == 'C'
+
+    incrementales = sorted(PresenceJour.objects.values_list('user_id', 'jour', 'code', 'heures'))
+    rebuild_all()
+    assert sorted(PresenceJour.objects.values_list('user_id', 'jour', 'code', 'heures')) == incrementales
+
+    client = APIClient()
+    client.force_authenticate(user=chef)
+    resp = client.get('/api/stats/presence/matrice/', {'annee': 2026, 'mois': 3})
+    assert resp.status_code == 200
+    # Le chef, sans aucune ligne ce mois-ci, figure aussi dans la matrice
+    assert [a['user_id'] for a in resp.json()['agents']] == [chef.id, user.id]
+    assert resp.json()['agents'][0]['statuts'] == [None] * 31
+    assert client.get('/api/stats/presence/matrice/', {'mois': 13}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_exports_stream_csv_and_xlsx_with_list_visibility():
+    import csv
+    import io
+    import zipfile
+    from datetime import date
+    from xml.etree import ElementTree
+    from core.models import Courrier, CourrierImputation
+
+    User = get_user_model()
+    admin = User.objects.create_user(username='export_admin', password='Testpass123!')
+    admin.profile.role = 'ADMIN'
+    admin.profile.save()
+    agent = User.objects.create_user(username='export_agent', password='Testpass123!')
+    agent.profile.role = 'AGENT'
+    agent.profile.save()
+    for i in range(3):
+        courrier = Courrier.objects.create(reference=f'EXP-{i}', expediteur='=HYPERLINK("http://x")', objet=f'Objet ; "{i}"\x0b',
+                                           date_reception=date(2026, 2, i + 1))
+        if i == 1:
+            CourrierImputation.objects.create(courrier=courrier, user=agent, granted_by=admin)
+
+    client = APIClient()
+    client.force_authenticate(user=agent)
+    resp = client.get('/api/exports/courriers.csv')
+    assert resp.status_code == 200
+    assert resp['Content-Disposition'].startswith('attachment; filename="courriers_')
+    texte = b''.join(resp.streaming_content).decode('utf-8-sig')
+    lignes = list(csv.reader(io.StringIO(texte), delimiter=';'))
+    assert lignes[0][:3] == ['ID', 'Référence', 'Date de réception']
+    assert [ligne[1] for ligne in lignes[1:]] == ['EXP-1']
+    # Pas de formule évaluée à l'ouverture dans un tableur
+    assert lignes[1][3] == "'=HYPERLINK(\"http://x\")"
+    assert lignes[1][0] == str(Courrier.objects.get(reference='EXP-1').id)
+
+    client.force_authenticate(user=admin)
+    resp = client.get('/api/exports/courriers.xlsx', {'date_debut': '2026-02-02'})
+    archive = zipfile.ZipFile(io.BytesIO(b''.join(resp.streaming_content)))
+    assert archive.testzip() is None
+    feuille = ElementTree.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+    ns = {'s': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+    cellules = [[''.join(c.itertext()) for c in row] for row in feuille.iterfind('.//s:row', ns)]
+    assert len(cellules) == 3
+    assert {ligne[1] for ligne in cellules[1:]} == {'EXP-1', 'EXP-2'}
+    for type_export in ('presences', 'diligences', 'alertes'):
+        resp = client.get(f'/api/exports/{type_export}.csv')
+        assert b''.join(resp.streaming_content).count(b'\n') == 1
+    assert client.get('/api/exports/inconnu.csv').status_code == 404
+    assert client.get('/api/exports/courriers.pdf').status_code == 400
+    assert client.get('/api/exports/courriers.csv', {'date_debut': '2026-02-30'}).status_code == 400
+    assert client.get('/api/exports/courriers.csv', {'date_fin': 'hier'}).status_code == 400
+
+
+@pytest.mark.django_db(transaction=True)
+def test_conge_pdf_is_pregenerated_on_approval_and_served_from_disk_cache(settings, tmp_path, monkeypatch):
+    from datetime import date
+    from core import pdf_cache, pdf_utils
+    from core.models import DemandeConge
+
+    settings.PDF_CACHE_DIR = str(tmp_path)
+    settings.PDF_RENDER_ASYNC = True
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+    assert pdf_utils._styles() is pdf_utils._styles()
+
+    rendus = []
+    generer = pdf_utils.generate_conge_pdf
+    monkeypatch.setitem(pdf_cache.DOCUMENTS, 'conge', (
+        DemandeConge, 'date_modification', lambda demande: rendus.append(demande.id) or generer(demande)
+    ))
+
+    User = get_user_model()
+    admin = User.objects.create_user(username='pdf_admin', password='Testpass123!')
+    admin.profile.role = 'ADMIN'
+    admin.profile.save()
+    demande = DemandeConge.objects.create(
+        demandeur=admin, type_conge='annuel', date_debut=date(2026, 7, 1), date_fin=date(2026, 7, 15),
+        nombre_jours=15, motif='Vacances', adresse_conge='Abidjan', telephone_conge='0102030405'
+    )
+
+    client = APIClient()
+    client.force_authenticate(user=admin)
+    assert client.post(f'/api/demandes-conge/{demande.id}/approuver/').status_code == 200
+    demande.refresh_from_db()
+    chemin = pdf_cache.cache_path('conge', demande)
+    assert rendus == [demande.id]
+    assert list(tmp_path.joinpath('conge').iterdir()) == [tmp_path / 'conge' / chemin.rsplit('/', 1)[1]]
+
+    for _ in range(2):
+        resp = client.get(f'/api/demandes-conge/{demande.id}/telecharger_pdf/')
+        assert resp.status_code == 200
+        assert resp['Content-Type'] == 'application/pdf'
+        contenu = b''.join(resp.streaming_content)
+        assert contenu.startswith(b'%PDF')
+    assert rendus == [demande.id]
+
+    # Nouvelle version de la demande : nouveau rendu, l'ancien fichier est supprimé
+    demande.motif = 'Vacances familiales'
+    demande.save()
+    client.get(f'/api/demandes-conge/{demande.id}/telecharger_pdf/')
+    assert len(rendus) == 2
+    assert len(list(tmp_path.joinpath('conge').iterdir())) == 1
+
+
+@pytest.mark.django_db
+def test_bulk_pdf_export_zips_approved_demandes(settings, tmp_path, monkeypatch):
+    import io
+    import zipfile
+    from datetime import date
+    from kombu.exceptions import OperationalError
+    from core.models import DemandeConge
+    from core.tasks_documents import export_demandes_pdf_task
+
+    settings.PDF_CACHE_DIR = str(tmp_path)
+    settings.PDF_RENDER_ASYNC = False
+    settings.PDF_EXPORT_WORKERS = 0
+    monkeypatch.setattr(export_demandes_pdf_task.app.conf, 'task_always_eager', True)
+
+    User = get_user_model()
+    admin = User.objects.create_user(username='zip_admin', password='Testpass123!')
+    admin.profile.role = 'ADMIN'
+    admin.profile.save()
+    agent = User.objects.create_user(username='zip_agent', password='Testpass123!')
+    agent.profile.role = 'AGENT'
+    agent.profile.save()
+    demandes = [
+        DemandeConge.objects.create(
+            demandeur=agent, type_conge='annuel', date_debut=date(2026, 3, jour), date_fin=date(2026, 3, jour + 1),
+            nombre_jours=2, motif='Repos', adresse_conge='-', telephone_conge='-', statut=statut
+        )
+        for jour, statut in [(2, 'approuve'), (9, 'approuve'), (16, 'en_attente')]
+    ]
+    DemandeConge.objects.create(
+        demandeur=agent, type_conge='annuel', date_debut=date(2026, 4, 1), date_fin=date(2026, 4, 2),
+        nombre_jours=2, motif='Repos', adresse_conge='-', telephone_conge='-', statut='approuve'
+    )
+
+    client = APIClient()
+    client.force_authenticate(user=agent)
+    assert client.post('/api/demandes-conge/export_pdf/', {'mois': '2026-03'}, format='json').status_code == 403
+
+    client.force_authenticate(user=admin)
+    resp = client.post('/api/demandes-conge/export_pdf/', {'mois': '2026-03'}, format='json')
+    assert resp.status_code == 202
+    assert resp.json()['total'] == 2
+    task_id = resp.json()['task_id']
+    assert client.get('/api/demandes-conge/export_pdf_statut/', {'task_id': task_id}).json()['etat'] == 'SUCCESS'
+
+    resp = client.get('/api/demandes-conge/export_pdf_zip/', {'task_id': task_id})
+    archive = zipfile.ZipFile(io.BytesIO(b''.join(resp.streaming_content)))
+    assert sorted(archive.namelist()) == sorted(f'conge_zip_agent_{d.id}.pdf' for d in demandes[:2])
+    assert all(archive.read(nom).startswith(b'%PDF') for nom in archive.namelist())
+    assert client.get('/api/demandes-conge/export_pdf_zip/', {'task_id': '../../etc'}).status_code == 403
+    assert client.post('/api/demandes-conge/export_pdf/', {'ids': '1,2'}, format='json').status_code == 400
+
+    # Réservé au demandeur de l'export, et au point d'accès de son type
+    assert client.get('/api/demandes-absence/export_pdf_zip/', {'task_id': task_id}).status_code == 404
+    autre = User.objects.create_user(username='zip_directeur', password='Testpass123!')
+    autre.profile.role = 'DIRECTEUR'
+    autre.profile.save()
+    client.force_authenticate(user=autre)
+    assert client.get('/api/demandes-conge/export_pdf_zip/', {'task_id': task_id}).status_code == 404
+    assert client.get('/api/demandes-conge/export_pdf_statut/', {'task_id': task_id}).status_code == 404
+
+    # Broker indisponible : pas de rendu dans le processus web
+    def broker_indisponible(*args, **kwargs):
+        raise OperationalError('broker indisponible')
+    monkeypatch.setattr(export_demandes_pdf_task, 'apply_async', broker_indisponible)
+    client.force_authenticate(user=admin)
+    resp = client.post('/api/demandes-conge/export_pdf/', {'ids': [demandes[0].id]}, format='json')
+    assert resp.status_code == 503
+    assert sorted(p.name for p in tmp_path.joinpath('exports').iterdir()) == [f'{task_id}.json', f'{task_id}.zip']
\ No newline at end of file
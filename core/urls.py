@@ -14,6 +14,9 @@ from .views import (
 from .views_courrier_access import CourrierAccessViewSet
 from .views_courrier_stats import CourrierStatsViewSet
 from .views_courrier_notifications import CourrierNotificationViewSet
+from .views_inbox import InboxViewSet
+from .views_stream import notification_stream
+from .views_search import SearchView
 from .views_ import UserManagementViewSet, NotificationViewSet, UserRegistrationView
 from .task_views import ProjetViewSet, TacheViewSet, CommentaireViewSet, FichierViewSet, ActiviteViewSet, DomaineViewSet
 from .diligence_views import DiligenceDocumentViewSet, DiligenceNotificationViewSet, EnhancedDiligenceViewSet
@@ -21,7 +24,8 @@ from .geofencing_views import GeofenceAlertViewSet, GeofenceSettingsViewSet, Age
 from .device_locking_views import CheckDeviceLockView, LockDeviceView, UnlockDeviceView, DeviceLockViewSet
 from .agenda_views import RendezVousViewSet, RendezVousDocumentViewSet, ReunionViewSet, ReunionPresenceViewSet
 from django.urls import path, include
-from core.views_stats import PresenceStatsAPIView
+from core.views_stats import PresenceMatrixAPIView, PresenceStatsAPIView
+from core.views_export import ExportView
 from rest_framework_simplejwt.views import TokenRefreshView, TokenObtainPairView
 from .serializers import MyTokenObtainPairSerializer
 
@@ -55,6 +59,7 @@ router.register(r'domaines', DomaineViewSet)
 
 # --- ROUTES NOTIFICATIONS ---
 router.register(r'notifications', NotificationViewSet, basename='notifications')
+router.register(r'inbox', InboxViewSet, basename='inbox')
 
 # --- ROUTES DILIGENCES AMÉLIORÉES ---
 router.register(r'diligence-documents', DiligenceDocumentViewSet)
@@ -89,6 +94,10 @@ urlpatterns = [
     path('presence/simple/', SimplePresenceView.as_view(), name='simple-presence'),
     path('presence/<int:presence_id>/update-status/', UpdatePresenceStatusView.as_view(), name='update-presence-status'),
     path('stats/presence/', PresenceStatsAPIView.as_view(), name='presence-stats'),
+    path('stats/presence/matrice/', PresenceMatrixAPIView.as_view(), name='presence-matrix'),
+    path('notifications/stream/', notification_stream, name='notification-stream'),
+    path('search/', SearchView.as_view(), name='search'),
+    path('exports/<str:type_export>.<str:extension>', ExportView.as_view(), name='export'),
     path('', include(router.urls)),
     path('auth/register/', AgentRegistrationView.as_view(), name='register'),
     path('auth/register/admin/', AdminRegistrationView.as_view(), name='register_admin'),
@@ -26,9 +26,15 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import authenticate
 from rest_framework.exceptions import PermissionDenied
-from .pdf_utils import generate_conge_pdf, generate_absence_pdf, create_pdf_response
+from .pdf_cache import pdf_response, schedule_render
+from .views_pdf_export import ExportPdfMixin
 from rest_framework.permissions import BasePermission
 from rest_framework.pagination import PageNumberPagination
+from .pagination import KeysetPagination, UserKeysetPagination
+from .fieldsets import wants_any
+from .org_scope import get_org_scope
+from .notification_fanout import fan_out
+from .inbox import unread_counts
 from .models import Direction, SousDirection, Service, Diligence, Courrier, UserProfile, Bureau, Presence, Agent, RolePermission, ImputationAccess, CourrierAccess, CourrierImputation, ImputationFile, UserDiligenceComment, UserDiligenceInstruction, DemandeConge, DemandeAbsence, OccurrenceSpeciale
 from .serializers import (
     CourrierSerializer, ServiceSerializer, DirectionSerializer, SousDirectionSerializer,
@@ -85,6 +91,7 @@ class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
     permission_classes = [permissions.IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    pagination_class = UserKeysetPagination
 
     def get_queryset(self):
         print('UserViewSet: requête reçue, user =', self.request.user, 'is_authenticated =', self.request.user.is_authenticated)
@@ -97,7 +104,7 @@ class UserViewSet(viewsets.ModelViewSet):
         if roles:
             role_list = [r.strip() for r in roles.split(',') if r.strip()]
             qs = qs.filter(profile__role__in=role_list)
-        return qs.order_by('-date_joined')
+        return qs.order_by('-date_joined', '-id')
 
     def get_serializer_class(self):
         print(f"[DEBUG] UserViewSet using serializer: {UserSerializer}")
@@ -174,7 +181,7 @@ class LoginView(APIView):
                 'role_display': self.get_role_display(profile.role),
                 'service': profile.service.id if profile.service else None,
                 'direction': profile.direction.id if profile.direction else None,
-                'notifications_count': user.notifications.filter(read=False).count() if hasattr(user, 'notifications') else 0
+                'notifications_count': unread_counts(user.id)['notification']
             }
         })
 
@@ -254,11 +261,9 @@ class UserProfileView(APIView):
                 'service': profile.service.id if profile.service else None,
                 'direction': profile.direction.id if profile.direction else None,
                 'bureau_obj': bureau_obj,
-                'notifications_count': 0  # Par défaut 0 notifications
+                # Compteur en cache Redis (voir core.inbox)
+                'notifications_count': unread_counts(user.id)['notification']
             }
-            # Vérifier si les notifications sont configurées
-            if hasattr(user, 'notifications'):
-                data['notifications_count'] = user.notifications.filter(read=False).count()
             return Response(data)
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -476,7 +481,7 @@ class ServiceViewSet(viewsets.ModelViewSet):
         instance.updated_at = timezone.now()
         instance.save()
 
-from .serializers import DirectionSerializer, ServiceSerializer, CourrierSerializer
+from .serializers import DirectionSerializer, ServiceSerializer, CourrierSerializer, courrier_prefetches
 
 class DiligenceViewSet(viewsets.ModelViewSet):
     queryset = Diligence.objects.all()
@@ -484,123 +489,47 @@ class DiligenceViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     authentication_classes = [JWTAuthentication]
     parser_classes = (MultiPartParser, FormParser, JSONParser)
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         user = self.request.user
-        profile = getattr(user, 'profile', None)
+        scope = get_org_scope(user)
         base_qs = Diligence.objects.select_related(
             'courrier',
             'courrier__service',
             'courrier__service__direction',
             'direction'
-        ).prefetch_related(
-            Prefetch('agents', queryset=User.objects.select_related('profile', 'profile__service')),
-            'services_concernes',
-            'services_concernes__direction'
-        ).all().order_by('-created_at')
+        ).all().order_by('-created_at', '-id')
+        # ?fields= : ne charger que les relations qui seront renvoyées
+        if wants_any(self.request, 'agents', 'agents_ids'):
+            base_qs = base_qs.prefetch_related(
+                Prefetch('agents', queryset=User.objects.select_related('profile', 'profile__service'))
+            )
+        if wants_any(self.request, 'services_concernes', 'services_details'):
+            base_qs = base_qs.prefetch_related('services_concernes', 'services_concernes__direction')
+        if wants_any(self.request, 'courrier'):
+            base_qs = base_qs.prefetch_related(*courrier_prefetches('courrier__'))
 
-        if not profile:
+        if not scope.has_profile:
             print(f"[ERROR] No profile found for user {user.username} (ID: {user.id})")
             return Diligence.objects.none()
 
-        role = profile.role
-        print(f"[DEBUG] DiligenceViewSet get_queryset - User: {user.username} (ID: {user.id}), Role: {role}")
+        role = scope.role
 
         # Filtrage par statut si présent dans la requête
         statut = self.request.query_params.get('statut')
         if statut:
             base_qs = base_qs.filter(statut=statut)
 
-        # Build queryset for diligences accessible by ImputationAccess
-        from core.models import ImputationAccess
-        imputation_access_qs = base_qs.filter(imputation_access__user=user)
-        print(f"[DEBUG] ImputationAccess diligences count: {imputation_access_qs.count()}")
-
-        # Build queryset for diligences accessible by ImputationFile (agent imputation)
-        from core.models import ImputationFile
-        imputation_file_qs = base_qs.filter(imputation_files__agent=user)
-        print(f"[DEBUG] ImputationFile diligences count: {imputation_file_qs.count()}")
-
-        # Filtrage par rôle
-        # 1. Diligences où l'utilisateur est dans les agents assignés
-        assigned_qs = base_qs.filter(agents=user)
-        print(f"[DEBUG] Assigned diligences count: {assigned_qs.count()}")
-        
         if role == 'ADMIN':
             # ADMIN peut voir toutes les diligences du système
-            qs = base_qs
-            print(f"[DEBUG] ADMIN - Using all diligences")
-            # Combine with ImputationAccess and ImputationFile-based querysets (union, remove duplicates)
-            final_qs = (qs | imputation_access_qs | imputation_file_qs).distinct()
-        elif role == 'DIRECTEUR':
-            # DIRECTEUR peut voir toutes les diligences de sa direction ET des services rattachés
-            user_direction = profile.service.direction if profile.service else None
-            if user_direction:
-                # Diligences directement liées à la direction
-                direction_qs = base_qs.filter(
-                    models.Q(direction=user_direction) |
-                    models.Q(services_concernes__direction=user_direction) |
-                    models.Q(courrier__service__direction=user_direction)
-                ).distinct()
-                
-                # Diligences des agents de tous les services de cette direction
-                from core.models import Service
-                direction_services = Service.objects.filter(direction=user_direction)
-                direction_agents = User.objects.filter(profile__service__in=direction_services)
-                agents_direction_qs = base_qs.filter(agents__in=direction_agents).distinct()
-                
-                print(f"[DEBUG] DIRECTEUR - Direction diligences count: {direction_qs.count()}")
-                print(f"[DEBUG] DIRECTEUR - Direction agents diligences count: {agents_direction_qs.count()}")
-                
-                # Combiner les querysets sans utiliser l'union pour éviter l'erreur "unique query"
-                diligence_ids = set()
-                diligence_ids.update(assigned_qs.values_list('id', flat=True))
-                diligence_ids.update(direction_qs.values_list('id', flat=True))
-                diligence_ids.update(agents_direction_qs.values_list('id', flat=True))
-                diligence_ids.update(imputation_access_qs.values_list('id', flat=True))
-                diligence_ids.update(imputation_file_qs.values_list('id', flat=True))
-                
-                final_qs = base_qs.filter(id__in=diligence_ids)
-            else:
-                final_qs = (assigned_qs | imputation_access_qs | imputation_file_qs).distinct()
-        elif role == 'SUPERIEUR':
-            # SUPERIEUR peut voir ses propres diligences ET celles de ses agents
-            user_service = profile.service if profile.service else None
-            if user_service:
-                # Diligences du service du supérieur
-                service_qs = base_qs.filter(
-                    models.Q(services_concernes=user_service) |
-                    models.Q(courrier__service=user_service)
-                ).distinct()
-                
-                # Diligences des agents du même service
-                service_agents = User.objects.filter(profile__service=user_service)
-                agents_qs = base_qs.filter(agents__in=service_agents).distinct()
-                
-                print(f"[DEBUG] SUPERIEUR - Service diligences count: {service_qs.count()}")
-                print(f"[DEBUG] SUPERIEUR - Agents diligences count: {agents_qs.count()}")
-                
-                # Combiner les querysets sans utiliser l'union pour éviter l'erreur "unique query"
-                diligence_ids = set()
-                diligence_ids.update(assigned_qs.values_list('id', flat=True))
-                diligence_ids.update(service_qs.values_list('id', flat=True))
-                diligence_ids.update(agents_qs.values_list('id', flat=True))
-                diligence_ids.update(imputation_access_qs.values_list('id', flat=True))
-                diligence_ids.update(imputation_file_qs.values_list('id', flat=True))
-                
-                final_qs = base_qs.filter(id__in=diligence_ids)
-            else:
-                final_qs = (assigned_qs | imputation_access_qs | imputation_file_qs).distinct()
-        else:
-            # Autres rôles (SECRETAIRE, AGENT) ne voient que leurs diligences assignées + imputées
-            final_qs = (assigned_qs | imputation_access_qs | imputation_file_qs).distinct()
-            print(f"[DEBUG] {role} - Using assigned + imputation diligences")
-
-        print(f"[DEBUG] Final queryset count: {final_qs.count()}")
-        
-        return final_qs
+            return base_qs
 
-        # Note: If you want to be more restrictive and only add ImputationAccess for non-admins, adjust logic above.
+        # Autres rôles : index de visibilité précalculé (agents assignés, imputations,
+        # direction du DIRECTEUR, service du SUPERIEUR), voir core.diligence_visibility
+        from core.models import DiligenceVisibility
+        visibles = DiligenceVisibility.objects.filter(user=user).values('diligence_id')
+        return base_qs.filter(id__in=visibles)
 
 
     def create(self, request, *args, **kwargs):
@@ -688,15 +617,13 @@ class DiligenceViewSet(viewsets.ModelViewSet):
                     from .models import DiligenceNotification
                     diligence = Diligence.objects.get(id=diligence_id)
                     
-                    # Créer une notification pour chaque agent assigné
-                    for agent in diligence.agents.all():
-                        DiligenceNotification.objects.create(
-                            user=agent,
-                            diligence=diligence,
-                            type_notification='nouvelle_diligence',
-                            message=f'Nouvelle diligence assignée: {diligence.reference_courrier}'
-                        )
-                        print(f"Notification créée pour {agent.username} - Diligence {diligence.reference_courrier}")
+                    # Une notification par agent assigné, insérées par lots après le commit
+                    nombre = fan_out(DiligenceNotification, diligence.agents.all(), {
+                        'diligence_id': diligence.id,
+                        'type_notification': 'nouvelle_diligence',
+                        'message': f'Nouvelle diligence assignée: {diligence.reference_courrier}'
+                    })
+                    print(f"{nombre} notification(s) programmée(s) - Diligence {diligence.reference_courrier}")
                 except Exception as e:
                     print(f"Erreur lors de la création des notifications: {e}")
         
@@ -710,6 +637,7 @@ class CourrierViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     authentication_classes = [JWTAuthentication]
     parser_classes = (MultiPartParser, FormParser, JSONParser)
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -717,6 +645,8 @@ class CourrierViewSet(viewsets.ModelViewSet):
             'service',
             'service__direction'
         ).all()
+        if wants_any(self.request, 'imputation_access', 'access_granted', 'diligence', 'diligence_id'):
+            queryset = queryset.prefetch_related(*courrier_prefetches())
         
         # Filtrage selon le type de courrier et les permissions
         if hasattr(user, 'profile'):
@@ -841,10 +771,8 @@ class CourrierViewSet(viewsets.ModelViewSet):
             users_to_notify = set()
             
             # 1. Notifier les utilisateurs imputés (sauf celui qui fait le changement)
-            imputations = CourrierImputation.objects.filter(courrier=courrier).select_related('user')
-            for imp in imputations:
-                if imp.user.id != request.user.id:  # Ne pas se notifier soi-même
-                    users_to_notify.add(imp.user)
+            imputations = CourrierImputation.objects.filter(courrier=courrier).exclude(user_id=request.user.id)
+            users_to_notify.update(imputations.values_list('user_id', flat=True))
             
             # 2. Notifier les rôles de supervision (ADMIN, DIRECTEUR, SUPERIEUR, CHEF_SERVICE, SECRETAIRE)
             supervision_roles = ['ADMIN', 'DIRECTEUR', 'SUPERIEUR', 'CHEF_SERVICE', 'SECRETAIRE']
@@ -852,19 +780,16 @@ class CourrierViewSet(viewsets.ModelViewSet):
                 profile__role__in=supervision_roles
             ).exclude(id=request.user.id)  # Ne pas se notifier soi-même
             
-            for supervisor in supervisors:
-                users_to_notify.add(supervisor)
+            users_to_notify.update(supervisors.values_list('id', flat=True))
             
             # Créer les notifications pour tous les utilisateurs concernés
-            for user in users_to_notify:
-                CourrierNotification.objects.create(
-                    utilisateur=user,
-                    courrier=courrier,
-                    type_notification='statut_modifie',
-                    titre=f'Statut du courrier {courrier.reference} modifié',
-                    message=f'Le statut du courrier {courrier.reference} est passé de "{ancien_statut}" à "{nouveau_statut}" par {request.user.get_full_name() or request.user.username}',
-                    priorite='normale'
-                )
+            fan_out(CourrierNotification, users_to_notify, {
+                'courrier_id': courrier.id,
+                'type_notification': 'statut_modifie',
+                'titre': f'Statut du courrier {courrier.reference} modifié',
+                'message': f'Le statut du courrier {courrier.reference} est passé de "{ancien_statut}" à "{nouveau_statut}" par {request.user.get_full_name() or request.user.username}',
+                'priorite': 'normale'
+            }, champ_utilisateur='utilisateur')
         except Exception as e:
             print(f'Erreur lors de la création de la notification de changement de statut: {e}')
         
@@ -898,16 +823,14 @@ class CourrierViewSet(viewsets.ModelViewSet):
             try:
                 from .models import CourrierNotification
                 # Notifier tous les utilisateurs imputés sur ce courrier
-                imputations = CourrierImputation.objects.filter(courrier=courrier).select_related('user')
-                for imp in imputations:
-                    CourrierNotification.objects.create(
-                        utilisateur=imp.user,
-                        courrier=courrier,
-                        type_notification='rappel_traitement',
-                        titre=f'Rappel de traitement activé - {courrier.reference}',
-                        message=f'Un rappel de traitement a été activé pour le courrier {courrier.reference} par {user.get_full_name() or user.username}. Veuillez traiter ce courrier dans les meilleurs délais.',
-                        priorite='haute'
-                    )
+                imputations = CourrierImputation.objects.filter(courrier=courrier)
+                fan_out(CourrierNotification, imputations.values_list('user_id', flat=True), {
+                    'courrier_id': courrier.id,
+                    'type_notification': 'rappel_traitement',
+                    'titre': f'Rappel de traitement activé - {courrier.reference}',
+                    'message': f'Un rappel de traitement a été activé pour le courrier {courrier.reference} par {user.get_full_name() or user.username}. Veuillez traiter ce courrier dans les meilleurs délais.',
+                    'priorite': 'haute'
+                }, champ_utilisateur='utilisateur')
             except Exception as e:
                 print(f'Erreur lors de la création de la notification de rappel: {e}')
         
@@ -1031,16 +954,6 @@ class CourrierViewSet(viewsets.ModelViewSet):
                 'details': str(e)
             }, status=status.HTTP_400_BAD_REQUEST)
 
-    def list(self, request, *args, **kwargs):
-        response = super().list(request, *args, **kwargs)
-        print('\nAPI Response data:')
-        for item in response.data:
-            print(f'\nCourrier {item["reference"]}:')
-            print('- Full data:', item)
-            if 'service' in item:
-                print('- Service:', item['service'])
-        return response
-
     def get_serializer_context(self):
         context = super().get_serializer_context()
         print('Request data:', self.request.data)
@@ -1299,13 +1212,13 @@ class SimplePresenceView(APIView):
             )
             
             # Vérification de la distance par rapport au bureau
-            from .models import Bureau
-            from math import radians, cos, sin, asin, sqrt
+            from .bureau_index import nearest_bureau
+            from .geo_distance import haversine
             
-            # Récupérer le bureau de l'agent ou le bureau principal
-            bureau = agent.bureau if agent.bureau else Bureau.objects.filter(nom__icontains='Principal').first()
+            # Récupérer le bureau de l'agent, sinon le bureau le plus proche du pointage
+            bureau = agent.bureau
             if not bureau:
-                bureau = Bureau.objects.first()  # Fallback sur le premier bureau
+                bureau, _ = nearest_bureau(corrected_latitude, corrected_longitude)
             
             # Si l'agent n'a pas de bureau assigné, l'assigner maintenant
             if bureau and not agent.bureau:
@@ -1314,17 +1227,6 @@ class SimplePresenceView(APIView):
                 logger.info(f'[SimplePresenceView] Bureau {bureau.nom} assigné automatiquement à {agent.user.username}')
             
             if bureau and bureau.latitude_centre and bureau.longitude_centre:
-                # Fonction de calcul de distance (Haversine)
-                def haversine(lat1, lon1, lat2, lon2):
-                    R = 6371000  # Rayon de la Terre en mètres
-                    phi1 = radians(lat1)
-                    phi2 = radians(lat2)
-                    dphi = radians(lat2 - lat1)
-                    dlambda = radians(lon2 - lon1)
-                    a = sin(dphi/2)**2 + cos(phi1)*cos(phi2)*sin(dlambda/2)**2
-                    c = 2*asin(sqrt(a))
-                    return R * c
-                
                 # Calculer la distance avec les coordonnées corrigées
                 distance = haversine(
                     float(corrected_latitude), float(corrected_longitude),
@@ -1487,12 +1389,13 @@ class PresenceViewSet(viewsets.ModelViewSet):
     serializer_class = PresenceSerializer
     permission_classes = [permissions.IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    pagination_class = KeysetPagination
 
     def perform_create(self, serializer):
         import logging
         logger = logging.getLogger(__name__)
         from rest_framework.exceptions import ValidationError
-        from math import radians, cos, sin, asin, sqrt
+        from .geo_distance import haversine
         from .models import Agent
         logger.warning('[PresenceViewSet] Données reçues: %s', self.request.data)
         user = self.request.user
@@ -1521,11 +1424,14 @@ class PresenceViewSet(viewsets.ModelViewSet):
         localisation_valide = False
         commentaire_final = commentaire or ''
 
-        # Validation GPS par rapport au bureau
-        from .models import Bureau
-        bureau = agent_obj.bureau if agent_obj.bureau else Bureau.objects.filter(nom__icontains='Principal').first()
+        # Validation GPS par rapport au bureau (sinon le bureau le plus proche du pointage)
+        from .bureau_index import default_bureau, nearest_bureau
+        bureau = agent_obj.bureau
         if not bureau:
-            bureau = Bureau.objects.first()  # Fallback sur le premier bureau
+            try:
+                bureau, _ = nearest_bureau(latitude, longitude)
+            except (TypeError, ValueError):
+                bureau = default_bureau()
             
         if bureau and bureau.latitude_centre and bureau.longitude_centre:
             try:
@@ -1535,17 +1441,6 @@ class PresenceViewSet(viewsets.ModelViewSet):
                 lon2 = float(bureau.longitude_centre)
                 rayon = float(bureau.rayon_metres) if bureau.rayon_metres else 100.0  # Rayon configurable
 
-                # Haversine
-                def haversine(lat1, lon1, lat2, lon2):
-                    R = 6371000  # m
-                    phi1 = radians(lat1)
-                    phi2 = radians(lat2)
-                    dphi = radians(lat2 - lat1)
-                    dlambda = radians(lon2 - lon1)
-                    a = sin(dphi/2)**2 + cos(phi1)*cos(phi2)*sin(dlambda/2)**2
-                    c = 2*asin(sqrt(a))
-                    return R * c
-
                 distance = haversine(lat1, lon1, lat2, lon2)
                 if distance > rayon:
                     logger.warning('[PresenceViewSet] Hors zone autorisée: %.1f m > %.1f m', distance, rayon)
@@ -1688,7 +1583,8 @@ class UserDiligenceInstructionViewSet(viewsets.ModelViewSet):
         return obj
 
 
-class DemandeCongeViewSet(viewsets.ModelViewSet):
+class DemandeCongeViewSet(ExportPdfMixin, viewsets.ModelViewSet):
+    type_document = 'conge'
     serializer_class = DemandeCongeSerializer
     permission_classes = [permissions.IsAuthenticated]
     authentication_classes = [JWTAuthentication]
@@ -1726,49 +1622,30 @@ class DemandeCongeViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         user = self.request.user
-        profile = getattr(user, 'profile', None)
+        scope = get_org_scope(user)
         
-        if not profile:
+        if not scope.has_profile:
             return DemandeConge.objects.none()
         
         # ADMIN peut voir toutes les demandes
-        if profile.role == 'ADMIN':
+        if scope.role == 'ADMIN':
             return DemandeConge.objects.all().order_by('-date_creation')
         
-        # DIRECTEUR peut voir les demandes de toute sa direction
-        elif profile.role == 'DIRECTEUR':
-            if profile.service and profile.service.direction:
-                direction_users = User.objects.filter(
-                    profile__service__direction=profile.service.direction
-                )
-                return DemandeConge.objects.filter(
-                    models.Q(demandeur=user) | 
-                    models.Q(demandeur__in=direction_users) |
-                    models.Q(superieur_hierarchique=user)
-                ).order_by('-date_creation')
-        
-        # SUPERIEUR peut voir les demandes de son service uniquement
-        elif profile.role == 'SUPERIEUR':
-            if profile.service:
-                service_users = User.objects.filter(profile__service=profile.service)
-                return DemandeConge.objects.filter(
-                    models.Q(demandeur=user) | 
-                    models.Q(demandeur__in=service_users) |
-                    models.Q(superieur_hierarchique=user)
-                ).order_by('-date_creation')
-        
+        # DIRECTEUR : toute sa direction, SUPERIEUR : son service (voir core.org_scope)
+        if (scope.role == 'DIRECTEUR' and scope.direction_id) or (scope.role == 'SUPERIEUR' and scope.service_id):
+            perimetre = scope.q('demandeur')
         # SECRETAIRE peut voir les demandes de son service + ses propres demandes
-        elif profile.role == 'SECRETAIRE':
-            if profile.service:
-                service_users = User.objects.filter(profile__service=profile.service)
-                return DemandeConge.objects.filter(
-                    models.Q(demandeur=user) | 
-                    models.Q(demandeur__in=service_users) |
-                    models.Q(superieur_hierarchique=user)
-                ).order_by('-date_creation')
-        
-        # AGENT ne peut voir que ses propres demandes
-        return DemandeConge.objects.filter(demandeur=user).order_by('-date_creation')
+        elif scope.role == 'SECRETAIRE' and scope.service_id:
+            perimetre = models.Q(demandeur__profile__service_id=scope.service_id)
+        else:
+            # AGENT ne peut voir que ses propres demandes
+            return DemandeConge.objects.filter(demandeur=user).order_by('-date_creation')
+        
+        return DemandeConge.objects.filter(
+            models.Q(demandeur=user) | 
+            perimetre |
+            models.Q(superieur_hierarchique=user)
+        ).order_by('-date_creation')
     
     def perform_create(self, serializer):
         # Déterminer le supérieur hiérarchique automatiquement
@@ -1826,13 +1703,10 @@ class DemandeCongeViewSet(viewsets.ModelViewSet):
             # Créer des notifications pour les agents concernés
             try:
                 from .models import DiligenceNotification
-                for agent in agents_concernes:
-                    DiligenceNotification.objects.create(
-                        user=agent,
-                        diligence=None,
-                        type_notification='nouvelle_diligence',
-                        message=f'{user.first_name} {user.last_name} a demandé un congé {demande.get_type_conge_display()} du {demande.date_debut} au {demande.date_fin}'
-                    )
+                fan_out(DiligenceNotification, demande.agents_concernes.all(), {
+                    'type_notification': 'nouvelle_diligence',
+                    'message': f'{user.first_name} {user.last_name} a demandé un congé {demande.get_type_conge_display()} du {demande.date_debut} au {demande.date_fin}'
+                })
             except Exception as e:
                 print(f"Erreur notification agents concernés congé: {e}")
     
@@ -1850,6 +1724,8 @@ class DemandeCongeViewSet(viewsets.ModelViewSet):
         demande.date_validation = timezone.now()
         demande.commentaire_validation = request.data.get('commentaire', '')
         demande.save()
+        # Le PDF de la demande approuvée est pré-généré hors du worker web
+        schedule_render('conge', demande.id)
         
         # Créer une notification pour le demandeur
         try:
@@ -1919,14 +1795,14 @@ class DemandeCongeViewSet(viewsets.ModelViewSet):
         """Télécharge la demande de congé en PDF"""
         demande = self.get_object()
         
-        # Générer le PDF
-        buffer = generate_conge_pdf(demande)
+        # PDF en cache sur disque, rendu seulement s'il n'existe pas pour cette version
         filename = f"demande_conge_{demande.demandeur.username}_{demande.date_creation.strftime('%Y%m%d')}.pdf"
         
-        return create_pdf_response(buffer, filename)
+        return pdf_response('conge', demande, filename)
 
 
-class DemandeAbsenceViewSet(viewsets.ModelViewSet):
+class DemandeAbsenceViewSet(ExportPdfMixin, viewsets.ModelViewSet):
+    type_document = 'absence'
     serializer_class = DemandeAbsenceSerializer
     permission_classes = [permissions.IsAuthenticated]
     authentication_classes = [JWTAuthentication]
@@ -1964,49 +1840,30 @@ class DemandeAbsenceViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         user = self.request.user
-        profile = getattr(user, 'profile', None)
+        scope = get_org_scope(user)
         
-        if not profile:
+        if not scope.has_profile:
             return DemandeAbsence.objects.none()
         
         # ADMIN peut voir toutes les demandes
-        if profile.role == 'ADMIN':
+        if scope.role == 'ADMIN':
             return DemandeAbsence.objects.all().order_by('-created_at')
         
-        # DIRECTEUR peut voir les demandes de toute sa direction
-        elif profile.role == 'DIRECTEUR':
-            if profile.service and profile.service.direction:
-                direction_users = User.objects.filter(
-                    profile__service__direction=profile.service.direction
-                )
-                return DemandeAbsence.objects.filter(
-                    models.Q(demandeur=user) | 
-                    models.Q(demandeur__in=direction_users) |
-                    models.Q(superieur_hierarchique=user)
-                ).order_by('-created_at')
-        
-        # SUPERIEUR peut voir les demandes de son service uniquement
-        elif profile.role == 'SUPERIEUR':
-            if profile.service:
-                service_users = User.objects.filter(profile__service=profile.service)
-                return DemandeAbsence.objects.filter(
-                    models.Q(demandeur=user) | 
-                    models.Q(demandeur__in=service_users) |
-                    models.Q(superieur_hierarchique=user)
-                ).order_by('-created_at')
-        
+        # DIRECTEUR : toute sa direction, SUPERIEUR : son service (voir core.org_scope)
+        if (scope.role == 'DIRECTEUR' and scope.direction_id) or (scope.role == 'SUPERIEUR' and scope.service_id):
+            perimetre = scope.q('demandeur')
         # SECRETAIRE peut voir les demandes de son service + ses propres demandes
-        elif profile.role == 'SECRETAIRE':
-            if profile.service:
-                service_users = User.objects.filter(profile__service=profile.service)
-                return DemandeAbsence.objects.filter(
-                    models.Q(demandeur=user) | 
-                    models.Q(demandeur__in=service_users) |
-                    models.Q(superieur_hierarchique=user)
-                ).order_by('-created_at')
-        
-        # AGENT ne peut voir que ses propres demandes
-        return DemandeAbsence.objects.filter(demandeur=user).order_by('-created_at')
+        elif scope.role == 'SECRETAIRE' and scope.service_id:
+            perimetre = models.Q(demandeur__profile__service_id=scope.service_id)
+        else:
+            # AGENT ne peut voir que ses propres demandes
+            return DemandeAbsence.objects.filter(demandeur=user).order_by('-created_at')
+        
+        return DemandeAbsence.objects.filter(
+            models.Q(demandeur=user) | 
+            perimetre |
+            models.Q(superieur_hierarchique=user)
+        ).order_by('-created_at')
     
     def perform_create(self, serializer):
         # Déterminer le supérieur hiérarchique automatiquement
@@ -2064,13 +1921,10 @@ class DemandeAbsenceViewSet(viewsets.ModelViewSet):
             # Créer des notifications pour les agents concernés
             try:
                 from .models import DiligenceNotification
-                for agent in agents_concernes:
-                    DiligenceNotification.objects.create(
-                        user=agent,
-                        diligence=None,
-                        type_notification='nouvelle_diligence',
-                        message=f'{user.first_name} {user.last_name} a demandé une absence {demande.get_type_absence_display()} du {demande.date_debut} au {demande.date_fin}'
-                    )
+                fan_out(DiligenceNotification, demande.agents_concernes.all(), {
+                    'type_notification': 'nouvelle_diligence',
+                    'message': f'{user.first_name} {user.last_name} a demandé une absence {demande.get_type_absence_display()} du {demande.date_debut} au {demande.date_fin}'
+                })
             except Exception as e:
                 print(f"Erreur notification agents concernés absence: {e}")
     
@@ -2088,6 +1942,8 @@ class DemandeAbsenceViewSet(viewsets.ModelViewSet):
         demande.date_validation = timezone.now()
         demande.commentaire_validation = request.data.get('commentaire', '')
         demande.save()
+        # Le PDF de la demande approuvée est pré-généré hors du worker web
+        schedule_render('absence', demande.id)
         
         # Créer une notification pour le demandeur
         try:
@@ -2167,11 +2023,10 @@ class DemandeAbsenceViewSet(viewsets.ModelViewSet):
         """Télécharge la demande d'absence en PDF"""
         demande = self.get_object()
         
-        # Générer le PDF
-        buffer = generate_absence_pdf(demande)
+        # PDF en cache sur disque, rendu seulement s'il n'existe pas pour cette version
         filename = f"demande_absence_{demande.demandeur.username}_{demande.created_at.strftime('%Y%m%d')}.pdf"
         
-        return create_pdf_response(buffer, filename)
+        return pdf_response('absence', demande, filename)
 
 
 class CourrierImputationViewSet(viewsets.ModelViewSet):
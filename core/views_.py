@@ -31,6 +31,7 @@ from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from .models import *
 from .serializers import *
+from .inbox import invalidate_unread, unread_counts
 # from .serializers import EvenementSerializer
 
 class MyTokenObtainPairView(TokenObtainPairView):
@@ -52,7 +53,7 @@ class UserProfileView(APIView):
                 'role': profile.role,
                 'service': profile.service.id if profile.service else None,
                 'direction': profile.direction.id if profile.direction else None,
-                'notifications_count': user.notifications.filter(read=False).count()
+                'notifications_count': unread_counts(user.id)['notification']
             }
             return Response(data)
         except Exception as e:
@@ -244,9 +245,11 @@ class NotificationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'])
     def mark_all_as_read(self, request):
         role = getattr(getattr(request.user, 'profile', None), 'role', None)
-        qs = self.get_queryset()
+        qs = self.get_queryset().filter(read=False)
         # Si admin, on peut permettre un scope global optionnel; par défaut on limite à get_queryset()
+        user_ids = set(qs.values_list('user_id', flat=True))
         qs.update(read=True)
+        invalidate_unread(user_ids)
         return Response({'message': 'Notifications marquées comme lues'})
 
 class ObservationViewSet(viewsets.ModelViewSet):
@@ -6,6 +6,7 @@ from django.db.models import Q, Count
 from django.utils import timezone
 from .models import CourrierNotification
 from .serializers_courrier import CourrierNotificationSerializer
+from .inbox import invalidate_unread, unread_counts
 
 
 class CourrierNotificationViewSet(viewsets.ModelViewSet):
@@ -50,9 +51,10 @@ class CourrierNotificationViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def count_non_lues(self, request):
-        """Compter les notifications non lues"""
-        count = self.get_queryset().filter(lue=False).count()
-        return Response({'count': count})
+        """Compter les notifications non lues (compteur en cache, voir core.inbox)"""
+        if any(filtre in request.query_params for filtre in ('type', 'priorite', 'courrier')):
+            return Response({'count': self.get_queryset().filter(lue=False).count()})
+        return Response({'count': unread_counts(request.user.id)['courrier']})
 
     @action(detail=True, methods=['post'])
     def marquer_lue(self, request, pk=None):
@@ -65,11 +67,9 @@ class CourrierNotificationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'])
     def marquer_toutes_lues(self, request):
         """Marquer toutes les notifications comme lues"""
-        notifications = self.get_queryset().filter(lue=False)
-        count = notifications.count()
-        
-        for notification in notifications:
-            notification.marquer_comme_lue()
+        count = self.get_queryset().filter(lue=False).update(lue=True, date_lecture=timezone.now())
+        if count:
+            invalidate_unread([request.user.id])
         
         return Response({
             'message': f'{count} notification(s) marquée(s) comme lue(s)',
@@ -2,7 +2,7 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from django.db.models import Count, Q, Avg, F, ExpressionWrapper, fields
+from django.db.models import Count, Q, Avg, F, ExpressionWrapper, Sum, fields
 from django.utils import timezone
 from datetime import timedelta, datetime
 from .models import (
@@ -10,6 +10,10 @@ from .models import (
     CourrierStatut, CourrierRappel, Diligence, Service, Direction
 )
 from django.contrib.auth.models import User
+from .courrier_stats import (
+    compter_periodes, delai_moyen_jours as delai_moyen_jours_, par, par_direction, par_service,
+    stats_queryset, summarize
+)
 
 
 class CourrierStatsViewSet(viewsets.ViewSet):
@@ -28,92 +32,30 @@ class CourrierStatsViewSet(viewsets.ViewSet):
         service_id = request.query_params.get('service')
         direction_id = request.query_params.get('direction')
 
-        queryset = Courrier.objects.all()
-
-        # Appliquer les filtres
-        if date_debut:
-            queryset = queryset.filter(date_reception__gte=date_debut)
-        if date_fin:
-            queryset = queryset.filter(date_reception__lte=date_fin)
-        if service_id:
-            queryset = queryset.filter(service_id=service_id)
-        if direction_id:
-            queryset = queryset.filter(service__direction_id=direction_id)
-
-        # Nombre total de courriers
-        total_courriers = queryset.count()
-
-        # Courriers par type
-        courriers_par_type = queryset.values('type_courrier').annotate(
-            count=Count('id')
-        )
-
-        # Courriers par sens
-        courriers_par_sens = queryset.values('sens').annotate(
-            count=Count('id')
-        )
+        # Lignes pré-agrégées par jour (voir core.courrier_stats)
+        queryset = stats_queryset(date_debut, date_fin, service_id, direction_id)
+        totaux = summarize(queryset)
 
-        # Courriers par catégorie
-        courriers_par_categorie = queryset.values('categorie').annotate(
-            count=Count('id')
-        ).order_by('-count')
-
-        # Courriers par service
-        courriers_par_service = queryset.values(
-            'service__nom', 'service_id'
-        ).annotate(
-            count=Count('id')
-        ).order_by('-count')
-
-        # Courriers par direction
-        courriers_par_direction = queryset.values(
-            'service__direction__nom', 'service__direction_id'
-        ).annotate(
-            count=Count('id')
-        ).order_by('-count')
+        total_courriers = totaux['nombre']
+        courriers_par_type = par(queryset, 'type_courrier')
+        courriers_par_sens = par(queryset, 'sens')
+        courriers_par_categorie = par(queryset, 'categorie')
+        courriers_par_service = par_service(queryset)
+        courriers_par_direction = par_direction(queryset)
 
         # Taux de traitement (courriers avec diligences)
-        courriers_avec_diligence = queryset.filter(
-            diligences__isnull=False
-        ).distinct().count()
-        
+        courriers_avec_diligence = totaux['avec_diligence']
         taux_traitement = (courriers_avec_diligence / total_courriers * 100) if total_courriers > 0 else 0
 
-        # Délai moyen de traitement
-        courriers_traites = queryset.filter(
-            diligences__isnull=False
-        ).annotate(
-            delai=ExpressionWrapper(
-                F('diligences__created_at') - F('date_reception'),
-                output_field=fields.DurationField()
-            )
-        )
-        
-        delai_moyen = courriers_traites.aggregate(
-            delai_moyen=Avg('delai')
-        )['delai_moyen']
-        
-        delai_moyen_jours = delai_moyen.days if delai_moyen else 0
+        # Délai moyen de traitement (réception → création des diligences)
+        delai_moyen_jours = delai_moyen_jours_(totaux)
 
         # Statistiques par période
-        aujourd_hui = timezone.now().date()
-        
-        courriers_aujourd_hui = queryset.filter(
-            date_reception=aujourd_hui
-        ).count()
-        
-        courriers_cette_semaine = queryset.filter(
-            date_reception__gte=aujourd_hui - timedelta(days=7)
-        ).count()
-        
-        courriers_ce_mois = queryset.filter(
-            date_reception__year=aujourd_hui.year,
-            date_reception__month=aujourd_hui.month
-        ).count()
-        
-        courriers_cette_annee = queryset.filter(
-            date_reception__year=aujourd_hui.year
-        ).count()
+        periodes = compter_periodes(queryset, timezone.now().date())
+        courriers_aujourd_hui = periodes['aujourd_hui']
+        courriers_cette_semaine = periodes['cette_semaine']
+        courriers_ce_mois = periodes['ce_mois']
+        courriers_cette_annee = periodes['cette_annee']
 
         return Response({
             'total_courriers': total_courriers,
@@ -310,32 +252,32 @@ class CourrierStatsViewSet(viewsets.ViewSet):
         periode = request.query_params.get('periode', 'mois')  # jour, semaine, mois, annee
         annee = request.query_params.get('annee', timezone.now().year)
 
-        queryset = Courrier.objects.filter(date_reception__year=annee)
+        try:
+            annee = int(annee)
+        except (TypeError, ValueError):
+            annee = timezone.now().year
+
+        # Une ligne par jour et par type, regroupées ici par mois / semaine / jour
+        lignes = stats_queryset().filter(jour__year=annee).values('jour', 'type_courrier').annotate(
+            n=Sum('nombre')
+        ).values_list('jour', 'type_courrier', 'n')
 
         if periode == 'mois':
-            evolution = queryset.extra(
-                select={'mois': 'EXTRACT(month FROM date_reception)'}
-            ).values('mois').annotate(
-                count=Count('id'),
-                ordinaires=Count('id', filter=Q(type_courrier='ordinaire')),
-                confidentiels=Count('id', filter=Q(type_courrier='confidentiel'))
-            ).order_by('mois')
+            cle, regrouper = 'mois', lambda jour: jour.month
         elif periode == 'semaine':
-            evolution = queryset.extra(
-                select={'semaine': 'EXTRACT(week FROM date_reception)'}
-            ).values('semaine').annotate(
-                count=Count('id'),
-                ordinaires=Count('id', filter=Q(type_courrier='ordinaire')),
-                confidentiels=Count('id', filter=Q(type_courrier='confidentiel'))
-            ).order_by('semaine')
+            cle, regrouper = 'semaine', lambda jour: jour.isocalendar()[1]
         else:
-            evolution = queryset.extra(
-                select={'jour': 'date_reception'}
-            ).values('jour').annotate(
-                count=Count('id'),
-                ordinaires=Count('id', filter=Q(type_courrier='ordinaire')),
-                confidentiels=Count('id', filter=Q(type_courrier='confidentiel'))
-            ).order_by('jour')
+            cle, regrouper = 'jour', lambda jour: jour
+
+        buckets = {}
+        for jour, type_courrier, nombre in lignes:
+            bucket = buckets.setdefault(regrouper(jour), {'count': 0, 'ordinaires': 0, 'confidentiels': 0})
+            bucket['count'] += nombre
+            if type_courrier == 'ordinaire':
+                bucket['ordinaires'] += nombre
+            elif type_courrier == 'confidentiel':
+                bucket['confidentiels'] += nombre
+        evolution = [{cle: valeur, **bucket} for valeur, bucket in sorted(buckets.items())]
 
         return Response({
             'periode': periode,
@@ -350,45 +292,35 @@ class CourrierStatsViewSet(viewsets.ViewSet):
         """
         aujourd_hui = timezone.now().date()
         
+        # Lignes pré-agrégées par jour (voir core.courrier_stats)
+        queryset = stats_queryset()
+        totaux = summarize(queryset)
+        par_type = {ligne['type_courrier']: ligne['count'] for ligne in par(queryset, 'type_courrier')}
+        periodes = compter_periodes(queryset, aujourd_hui)
+
         # Statistiques générales
-        total_courriers = Courrier.objects.count()
-        courriers_ordinaires = Courrier.objects.filter(type_courrier='ordinaire').count()
-        courriers_confidentiels = Courrier.objects.filter(type_courrier='confidentiel').count()
+        total_courriers = totaux['nombre']
+        courriers_ordinaires = par_type.get('ordinaire', 0)
+        courriers_confidentiels = par_type.get('confidentiel', 0)
         
         # Courriers récents
-        courriers_aujourd_hui = Courrier.objects.filter(date_reception=aujourd_hui).count()
-        courriers_semaine = Courrier.objects.filter(
-            date_reception__gte=aujourd_hui - timedelta(days=7)
-        ).count()
-        courriers_mois = Courrier.objects.filter(
-            date_reception__year=aujourd_hui.year,
-            date_reception__month=aujourd_hui.month
-        ).count()
+        courriers_aujourd_hui = periodes['aujourd_hui']
+        courriers_semaine = periodes['cette_semaine']
+        courriers_mois = periodes['ce_mois']
         
-        # Courriers par statut (si le modèle CourrierStatut est utilisé)
-        courriers_nouveaux = Courrier.objects.filter(
-            diligences__isnull=True
-        ).count()
-        
-        courriers_en_cours = Courrier.objects.filter(
-            diligences__statut__in=['en_attente', 'en_cours']
-        ).distinct().count()
-        
-        courriers_traites = Courrier.objects.filter(
-            diligences__statut='termine'
-        ).distinct().count()
+        # Courriers par état de leurs diligences
+        courriers_nouveaux = total_courriers - totaux['avec_diligence']
+        courriers_en_cours = totaux['diligence_en_cours']
+        courriers_traites = totaux['diligence_terminee']
         
         # Top 5 catégories
-        top_categories = Courrier.objects.values('categorie').annotate(
-            count=Count('id')
-        ).order_by('-count')[:5]
+        top_categories = par(queryset, 'categorie', limite=5)
         
         # Top 5 services
-        top_services = Courrier.objects.values(
-            'service__nom', 'service_id'
-        ).annotate(
-            count=Count('id')
-        ).order_by('-count')[:5]
+        top_services = [
+            {'service__nom': ligne['service__nom'], 'service_id': ligne['service_id'], 'count': ligne['count']}
+            for ligne in par_service(queryset, limite=5)
+        ]
         
         # Imputations récentes
         imputations_recentes = CourrierImputation.objects.select_related(
@@ -0,0 +1,82 @@
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from .exports import EXPORTS, csv_stream, rows, xlsx_stream
+from .geofencing_views import GeofenceAlertViewSet
+from .models import Presence
+from .org_scope import get_org_scope
+from .views import CourrierViewSet, DiligenceViewSet
+
+# Les listes reprennent le get_queryset des viewsets : mêmes règles de visibilité
+VIEWSETS = {
+    'courriers': CourrierViewSet,
+    'diligences': DiligenceViewSet,
+    'alertes': GeofenceAlertViewSet,
+}
+
+FORMATS = {
+    'csv': (csv_stream, 'text/csv; charset=utf-8'),
+    'xlsx': (xlsx_stream, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+
+
+class ExportView(APIView):
+    """
+    Export en flux des listes (voir core.exports)
+
+    GET /api/exports/<presences|courriers|diligences|alertes>.<csv|xlsx>?date_debut=&date_fin=
+    Mêmes règles de visibilité que les endpoints de liste ; les présences, listées sans
+    filtre par PresenceViewSet, sont limitées au périmètre de l'utilisateur.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    authentication_classes = [JWTAuthentication]
+
+    def _queryset(self, request, type_export):
+        if type_export == 'presences':
+            return get_org_scope(request.user).filter(Presence.objects.all(), 'agent__user')
+        vue = VIEWSETS[type_export](request=request, action='list', format_kwarg=None, args=(), kwargs={})
+        return vue.get_queryset()
+
+    def get(self, request, type_export, extension):
+        if type_export not in EXPORTS:
+            return Response(
+                {'error': f'Export inconnu. Valeurs possibles: {", ".join(EXPORTS)}'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        if extension not in FORMATS:
+            return Response({'error': 'Format invalide (csv ou xlsx)'}, status=status.HTTP_400_BAD_REQUEST)
+
+        bornes = {}
+        for parametre in ('date_debut', 'date_fin'):
+            valeur = request.query_params.get(parametre)
+            if not valeur:
+                continue
+            try:
+                bornes[parametre] = parse_date(valeur)
+            except ValueError:
+                bornes[parametre] = None
+            if bornes[parametre] is None:
+                return Response(
+                    {'error': f'{parametre} doit être une date au format AAAA-MM-JJ'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        champ_date, colonnes = EXPORTS[type_export]
+        queryset = self._queryset(request, type_export)
+        if 'date_debut' in bornes:
+            queryset = queryset.filter(**{f'{champ_date}__gte': bornes['date_debut']})
+        if 'date_fin' in bornes:
+            queryset = queryset.filter(**{f'{champ_date}__lte': bornes['date_fin']})
+
+        ecrire, content_type = FORMATS[extension]
+        response = StreamingHttpResponse(
+            ecrire([entete for _, entete in colonnes], rows(queryset, colonnes)),
+            content_type=content_type
+        )
+        nom = f'{type_export}_{timezone.localdate():%Y%m%d}.{extension}'
+        response['Content-Disposition'] = f'attachment; filename="{nom}"'
+        return response
@@ -0,0 +1,67 @@
+from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from .inbox import SOURCES, inbox_page, mark_read, unread_counts
+
+
+class InboxViewSet(viewsets.ViewSet):
+    """
+    Boîte de réception unifiée : notifications générales, de diligences et de courriers
+
+    GET  /inbox/?cursor=&page_size=&source=courrier,diligence&lue=false
+    GET  /inbox/non_lues/        compteurs de non lues (cache Redis)
+    POST /inbox/marquer_lues/    {"ids": ["courrier-12", ...]} ou {} pour tout marquer
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    authentication_classes = [JWTAuthentication]
+    page_size = 50
+    max_page_size = 200
+
+    def list(self, request):
+        try:
+            page_size = min(int(request.query_params.get('page_size', self.page_size)), self.max_page_size)
+        except ValueError:
+            page_size = self.page_size
+        sources = None
+        if request.query_params.get('source'):
+            sources = [s for s in request.query_params['source'].split(',') if s in SOURCES]
+            if not sources:
+                return Response(
+                    {'error': f'Source invalide. Valeurs possibles: {", ".join(SOURCES)}'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        try:
+            elements, suivant = inbox_page(
+                request.user.id,
+                curseur=request.query_params.get('cursor'),
+                limite=max(page_size, 1),
+                sources=sources,
+                non_lues=request.query_params.get('lue', '').lower() == 'false'
+            )
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        next_url = None
+        if suivant:
+            params = request.query_params.copy()
+            params['cursor'] = suivant
+            next_url = request.build_absolute_uri(f'{request.path}?{params.urlencode()}')
+        return Response({'next': next_url, 'results': elements})
+
+    @action(detail=False, methods=['get'])
+    def non_lues(self, request):
+        """Compteurs de non lues par source, sans requête SQL si le cache est chaud"""
+        return Response(unread_counts(request.user.id))
+
+    @action(detail=False, methods=['post'])
+    def marquer_lues(self, request):
+        """Marquer comme lues les notifications listées (toutes si `ids` est absent)"""
+        ids = request.data.get('ids')
+        if ids is not None and not isinstance(ids, list):
+            return Response({'error': 'ids doit être une liste'}, status=status.HTTP_400_BAD_REQUEST)
+        count = mark_read(request.user.id, ids)
+        return Response({
+            'message': f'{count} notification(s) marquée(s) comme lue(s)',
+            'count': count
+        })
@@ -0,0 +1,131 @@
+import logging
+import os
+import uuid
+
+from celery.result import AsyncResult
+from django.http import FileResponse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from .org_hierarchy import users_under
+from .pdf_export import enregistrer_export, infos_export, supprimer_export, zip_path
+from .tasks_documents import export_demandes_pdf_task
+
+logger = logging.getLogger(__name__)
+
+
+class ExportPdfMixin:
+    """
+    Export groupé des PDF des demandes approuvées dans une archive ZIP (voir core.pdf_export)
+
+    POST export_pdf/ {"mois": "2026-03", "direction": 4, "ids": [...]}  -> 202 {"task_id", "total"}
+         (503 si la tâche ne peut pas être confiée à Celery)
+    GET  export_pdf_statut/?task_id=   progression {"etat", "faits", "total"}
+    GET  export_pdf_zip/?task_id=      archive, une fois l'export terminé
+
+    Le rendu a lieu dans un worker Celery, jamais dans le processus web.
+    Le suivi et le téléchargement sont réservés au demandeur de l'export.
+    """
+    type_document = None
+
+    def _peut_exporter(self, request):
+        profile = getattr(request.user, 'profile', None)
+        return profile is not None and profile.role in ['ADMIN', 'SUPERIEUR', 'DIRECTEUR']
+
+    def _task_id(self, request):
+        try:
+            return str(uuid.UUID(request.query_params.get('task_id', '')))
+        except ValueError:
+            return None
+
+    def _export_du_demandeur(self, request, task_id):
+        """L'export a été lancé par cet utilisateur, depuis le point d'accès de ce type"""
+        infos = infos_export(task_id)
+        return (
+            infos is not None
+            and infos.get('user_id') == request.user.id
+            and infos.get('type_document') == self.type_document
+        )
+
+    @action(detail=False, methods=['post'])
+    def export_pdf(self, request):
+        if not self._peut_exporter(request):
+            return Response({'error': 'Non autorisé'}, status=403)
+
+        queryset = self.get_queryset().filter(statut='approuve')
+        mois = request.data.get('mois')
+        if mois:
+            try:
+                annee, numero = (int(x) for x in str(mois).split('-'))
+            except ValueError:
+                return Response({'error': 'mois doit être au format AAAA-MM'}, status=status.HTTP_400_BAD_REQUEST)
+            queryset = queryset.filter(date_debut__year=annee, date_debut__month=numero)
+        direction_id = request.data.get('direction')
+        if direction_id:
+            try:
+                direction_id = int(direction_id)
+            except (TypeError, ValueError):
+                return Response({'error': 'direction doit être un identifiant'}, status=status.HTTP_400_BAD_REQUEST)
+            queryset = queryset.filter(demandeur_id__in=users_under(('direction', direction_id)))
+        ids = request.data.get('ids')
+        if ids is not None and not (isinstance(ids, list) and all(type(i) is int for i in ids)):
+            return Response({'error': 'ids doit être une liste d\'entiers'}, status=status.HTTP_400_BAD_REQUEST)
+        if ids:
+            queryset = queryset.filter(id__in=ids)
+
+        demande_ids = list(queryset.order_by('id').values_list('id', flat=True).distinct())
+        if not demande_ids:
+            return Response({'error': 'Aucune demande approuvée à exporter'}, status=status.HTTP_400_BAD_REQUEST)
+
+        task_id = str(uuid.uuid4())
+        enregistrer_export(task_id, request.user.id, self.type_document)
+        try:
+            export_demandes_pdf_task.apply_async((self.type_document, demande_ids), task_id=task_id)
+        except Exception as e:
+            logger.warning(f"Export PDF non programmé: {e}")
+            supprimer_export(task_id)
+            return Response(
+                {'error': 'Export indisponible pour le moment, réessayez plus tard'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        return Response({'task_id': task_id, 'total': len(demande_ids)}, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=False, methods=['get'])
+    def export_pdf_statut(self, request):
+        task_id = self._task_id(request)
+        if not task_id:
+            return Response({'error': 'task_id invalide'}, status=status.HTTP_400_BAD_REQUEST)
+        if not self._export_du_demandeur(request, task_id):
+            return Response({'error': 'Export introuvable'}, status=status.HTTP_404_NOT_FOUND)
+        # L'archive n'existe qu'une fois complète
+        if os.path.exists(zip_path(task_id)):
+            return Response({'task_id': task_id, 'etat': 'SUCCESS'})
+        try:
+            resultat = AsyncResult(task_id)
+            etat, infos = resultat.state, resultat.info
+        except Exception as e:
+            logger.warning(f"État de l'export PDF {task_id} indisponible: {e}")
+            etat, infos = 'PENDING', None
+        infos = infos if isinstance(infos, dict) else {}
+        return Response({
+            'task_id': task_id,
+            'etat': etat,
+            'faits': infos.get('faits', 0),
+            'total': infos.get('total'),
+        })
+
+    @action(detail=False, methods=['get'])
+    def export_pdf_zip(self, request):
+        task_id = self._task_id(request)
+        if not task_id or not self._peut_exporter(request):
+            return Response({'error': 'Non autorisé'}, status=403)
+        chemin = zip_path(task_id)
+        if not self._export_du_demandeur(request, task_id) or not os.path.exists(chemin):
+            return Response({'error': 'Export introuvable ou en cours'}, status=status.HTTP_404_NOT_FOUND)
+        return FileResponse(
+            open(chemin, 'rb'), as_attachment=True,
+            filename=f'demandes_{self.type_document}_{timezone.localdate():%Y%m%d}.zip',
+            content_type='application/zip'
+        )
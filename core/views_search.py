@@ -0,0 +1,44 @@
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from .search_index import MODELES, search
+
+
+class SearchView(APIView):
+    """
+    Recherche plein texte classée dans les courriers, diligences et tâches visibles
+
+    GET /search/?q=note de service&types=courrier,diligence&limit=10
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    authentication_classes = [JWTAuthentication]
+    limite_max = 50
+
+    def get(self, request):
+        texte = request.query_params.get('q', '').strip()
+        if len(texte) < 2:
+            return Response(
+                {'error': 'Le paramètre q doit contenir au moins 2 caractères'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        types = None
+        if request.query_params.get('types'):
+            types = [t for t in request.query_params['types'].split(',') if t in MODELES]
+            if not types:
+                return Response(
+                    {'error': f'Type invalide. Valeurs possibles: {", ".join(MODELES)}'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        try:
+            limite = min(max(int(request.query_params.get('limit', 10)), 1), self.limite_max)
+        except ValueError:
+            limite = 10
+
+        resultats = search(request.user, texte, types=types, limite=limite)
+        return Response({
+            'q': texte,
+            'courriers': resultats.get('courrier', []),
+            'diligences': resultats.get('diligence', []),
+            'taches': resultats.get('tache', []),
+        })
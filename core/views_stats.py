@@ -1,77 +1,69 @@
-from rest_framework.views import APIView
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import status
 from rest_framework.response import Response
-from django.db.models import F, ExpressionWrapper, DurationField, Sum, OuterRef, Subquery, Q
-from django.db.models.functions import Cast
-from django.contrib.auth.models import User
-from core.models import Presence
-from core.serializers import UserSerializer
-from datetime import datetime, timedelta, date
-from django.db.models.functions import ExtractWeek, ExtractMonth, ExtractYear
-from django.db.models import Count
+from rest_framework.views import APIView
+
+from core.org_scope import get_org_scope
+from core.presence_matrix import service_month
+from core.presence_stats import PERIODES, period_rows, presences_filtrees, summary_rows
+
+
+def _json_array(lignes):
+    """Tableau JSON émis élément par élément"""
+    yield '['
+    for i, ligne in enumerate(lignes):
+        yield (',' if i else '') + json.dumps(ligne, cls=DjangoJSONEncoder)
+    yield ']'
+
 
 class PresenceStatsAPIView(APIView):
     """
     API endpoint: /api/stats/presence/
-    Retourne pour chaque agent le cumul d'heures/jour, semaine, mois, année, avec nom/prénom/service/direction.
-    Filtrable par période et service.
+    Retourne pour chaque agent le cumul d'heures et les moyennes par jour, semaine, mois
+    et année travaillés, avec nom/prénom/service/direction.
+    Filtrable par période (start, end), service et direction.
+    ?periode=jour|semaine|mois|annee : heures par agent et par période.
+    Agrégé par la base (voir core.presence_stats), réponse envoyée au fil de l'eau.
     """
     def get(self, request):
-        start = request.GET.get('start')
-        end = request.GET.get('end')
-        service_id = request.GET.get('service')
-        presences = Presence.objects.select_related('agent__profile', 'agent__profile__service', 'agent__profile__service__direction')
-        if start:
-            presences = presences.filter(date_presence__gte=start)
-        if end:
-            presences = presences.filter(date_presence__lte=end)
-        if service_id:
-            presences = presences.filter(agent__profile__service_id=service_id)
-        # Annotate duration
-        presences = presences.annotate(
-            duration=ExpressionWrapper(
-                (F('heure_depart') - F('heure_arrivee')),
-                output_field=DurationField()
+        periode = request.GET.get('periode')
+        if periode and periode not in PERIODES:
+            return Response(
+                {'error': f'Période invalide. Valeurs possibles: {", ".join(PERIODES)}'},
+                status=status.HTTP_400_BAD_REQUEST
             )
+        presences = presences_filtrees(
+            start=request.GET.get('start'),
+            end=request.GET.get('end'),
+            service_id=request.GET.get('service'),
+            direction_id=request.GET.get('direction'),
         )
-        # Build stats per agent
-        stats = {}
-        for p in presences:
-            if not p.heure_arrivee or not p.heure_depart:
-                continue
-            uid = p.agent.id
-            if uid not in stats:
-                stats[uid] = {
-                    'user_id': uid,
-                    'last_name': p.agent.last_name,
-                    'first_name': p.agent.first_name,
-                    'service': getattr(p.agent.profile.service, 'nom', ''),
-                    'direction': getattr(getattr(p.agent.profile.service, 'direction', None), 'nom', ''),
-                    'hours_per_day': 0,
-                    'hours_per_week': 0,
-                    'hours_per_month': 0,
-                    'hours_per_year': 0,
-                    'dates': set(),
-                    'weeks': set(),
-                    'months': set(),
-                    'years': set(),
-                }
-            # Compute duration in hours
-            d = datetime.combine(date.min, p.heure_depart) - datetime.combine(date.min, p.heure_arrivee)
-            hours = d.total_seconds() / 3600.0
-            stats[uid]['hours_per_day'] += hours
-            stats[uid]['dates'].add(p.date_presence)
-            week = p.date_presence.isocalendar()[1]
-            month = p.date_presence.month
-            year = p.date_presence.year
-            stats[uid]['weeks'].add((year, week))
-            stats[uid]['months'].add((year, month))
-            stats[uid]['years'].add(year)
-        # Cumuls par période
-        for s in stats.values():
-            if s['dates']:
-                s['hours_per_day'] = s['hours_per_day'] / len(s['dates'])
-            s['hours_per_week'] = s['hours_per_day'] * 5  # approx (ou recalculer sur la base réelle)
-            s['hours_per_month'] = s['hours_per_day'] * 22  # approx
-            s['hours_per_year'] = s['hours_per_day'] * 260  # approx
-            del s['dates'], s['weeks'], s['months'], s['years']
-        return Response(list(stats.values()))
+        lignes = period_rows(presences, periode) if periode else summary_rows(presences)
+        return StreamingHttpResponse(_json_array(lignes), content_type='application/json')
+
+
+class PresenceMatrixAPIView(APIView):
+    """
+    API endpoint: /api/stats/presence/matrice/?service=&annee=&mois=
+    Matrice du mois pour un service (son propre service par défaut) : pour chaque agent,
+    un code de statut et des heures par jour (voir core.presence_matrix).
+    Limitée aux agents du périmètre de l'utilisateur.
+    """
+    def get(self, request):
+        scope = get_org_scope(request.user)
+        aujourd_hui = timezone.localdate()
+        try:
+            service_id = int(request.GET.get('service') or scope.service_id or 0)
+            annee = int(request.GET.get('annee', aujourd_hui.year))
+            mois = int(request.GET.get('mois', aujourd_hui.month))
+        except ValueError:
+            return Response({'error': 'Paramètres invalides'}, status=status.HTTP_400_BAD_REQUEST)
+        if not service_id:
+            return Response({'error': 'Le paramètre service est requis'}, status=status.HTTP_400_BAD_REQUEST)
+        if not 1 <= mois <= 12 or not 1900 <= annee <= 9999:
+            return Response({'error': 'Mois ou année invalide'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(service_month(service_id, annee, mois, scope=scope))
@@ -0,0 +1,46 @@
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework.exceptions import AuthenticationFailed
+from .notification_stream import event_stream, is_enabled
+
+
+def _authentifier(request):
+    """
+    Utilisateur du jeton JWT (en-tête Authorization, ou ?token= car EventSource
+    ne permet pas d'envoyer d'en-tête), ou None
+    """
+    auth = JWTAuthentication()
+    try:
+        resultat = auth.authenticate(request)
+        if resultat:
+            return resultat[0]
+        jeton = request.GET.get('token')
+        if jeton:
+            return auth.get_user(auth.get_validated_token(jeton))
+    except (InvalidToken, TokenError, AuthenticationFailed):
+        return None
+    return None
+
+
+@require_GET
+async def notification_stream(request):
+    """
+    Flux Server-Sent Events des notifications de l'utilisateur (voir core.notification_stream)
+
+    À servir par un serveur ASGI (ediligence.asgi) : sous WSGI chaque connexion
+    ouverte immobilise un worker.
+    """
+    user = await sync_to_async(_authentifier)(request)
+    if user is None:
+        return JsonResponse({'error': 'Authentification requise'}, status=401)
+    if not is_enabled():
+        return JsonResponse({'error': 'Flux temps réel indisponible'}, status=503)
+
+    response = StreamingHttpResponse(event_stream(user.id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Pas de mise en tampon par nginx
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -3,6 +3,10 @@ ASGI config for ediligence project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Le flux temps réel des notifications (/api/notifications/stream/, vue
+asynchrone) doit être servi par ce point d'entrée, par exemple :
+    uvicorn ediligence.asgi:application --workers 2
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
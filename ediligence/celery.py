@@ -38,6 +38,12 @@ app.conf.beat_schedule = {
         'schedule': 300.0,  # 5 minutes en secondes
         'options': {'expires': 290.0}  # Expire avant la prochaine exécution
     },
+    'flush-location-buffer': {
+        'task': 'core.geofencing_tasks.flush_location_buffer',
+        # Sans effet si LOCATION_BUFFER_ENABLED est désactivé
+        'schedule': float(os.environ.get('LOCATION_BUFFER_FLUSH_INTERVAL', '10')),
+        'options': {'expires': 30.0}
+    },
     'cleanup-old-locations-daily': {
         'task': 'core.geofencing_tasks.cleanup_old_locations',
         'schedule': crontab(hour=2, minute=0),  # Tous les jours à 2h00
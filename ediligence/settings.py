@@ -229,6 +229,16 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
 CELERY_ENABLE_UTC = True
 
+# Les notifications push partent d'une file dédiée (worker: -Q celery,push)
+# Les exports PDF groupés créent leurs propres processus : worker non démon (-Q documents -P solo)
+CELERY_TASK_ROUTES = {
+    'core.geofencing_tasks.send_push_alerts_task': {'queue': 'push'},
+    'core.tasks_documents.export_demandes_pdf_task': {'queue': 'documents'},
+}
+
+# Modules de tâches non découverts par autodiscover_tasks (qui ne cherche que core/tasks.py)
+CELERY_IMPORTS = ('core.tasks_notifications', 'core.tasks_documents')
+
 # Celery Beat Schedule
 CELERY_BEAT_SCHEDULE = {
     'check-agent-exits-every-5-minutes': {
@@ -237,5 +247,40 @@ CELERY_BEAT_SCHEDULE = {
     },
 }
 
+# ============================================
+# TAMPON D'ÉCRITURE DES POSITIONS GPS (write-behind)
+# ============================================
+# Si activé, les positions reçues sont empilées dans Redis puis écrites
+# en base par lots par la tâche core.geofencing_tasks.flush_location_buffer
+LOCATION_BUFFER_ENABLED = os.environ.get('LOCATION_BUFFER_ENABLED', 'False') == 'True'
+LOCATION_BUFFER_REDIS_URL = os.environ.get('LOCATION_BUFFER_REDIS_URL', CELERY_BROKER_URL)
+LOCATION_BUFFER_FLUSH_INTERVAL = int(os.environ.get('LOCATION_BUFFER_FLUSH_INTERVAL', '10'))  # secondes
+LOCATION_BUFFER_FLUSH_BATCH = int(os.environ.get('LOCATION_BUFFER_FLUSH_BATCH', '2000'))  # points par lot
+LOCATION_BUFFER_MAX_PENDING = int(os.environ.get('LOCATION_BUFFER_MAX_PENDING', '200000'))  # au-delà : écriture directe
+
+# Rétention des positions GPS brutes (jours) et partitions journalières créées à l'avance
+LOCATION_RETENTION_DAYS = int(os.environ.get('LOCATION_RETENTION_DAYS', '7'))
+LOCATION_PARTITIONS_AHEAD = int(os.environ.get('LOCATION_PARTITIONS_AHEAD', '7'))
+
+# Redis utilisé pour diffuser l'invalidation des caches mémoire entre processus
+# (chaîne vide : pas de pub/sub, expiration courte des caches)
+CACHE_INVALIDATION_REDIS_URL = os.environ.get('CACHE_INVALIDATION_REDIS_URL', CELERY_BROKER_URL)
+
+# Notifications à plusieurs destinataires insérées après le commit par la tâche
+# core.tasks_notifications.fanout_notifications_task (False : insertion directe)
+NOTIFICATION_FANOUT_ASYNC = os.environ.get('NOTIFICATION_FANOUT_ASYNC', 'True') == 'True'
+
+# Flux temps réel des notifications (SSE, /api/notifications/stream/) publié sur Redis pub/sub
+# (chaîne vide : flux désactivé, les clients interrogent les compteurs)
+NOTIFICATION_STREAM_REDIS_URL = os.environ.get('NOTIFICATION_STREAM_REDIS_URL', CACHE_INVALIDATION_REDIS_URL)
+NOTIFICATION_STREAM_HEARTBEAT = int(os.environ.get('NOTIFICATION_STREAM_HEARTBEAT', '20'))  # secondes
+
+# PDF des demandes de congé / d'absence mis en cache sur disque (voir core.pdf_cache),
+# pré-générés à l'approbation par core.tasks_documents.render_demande_pdf_task
+PDF_CACHE_DIR = os.environ.get('PDF_CACHE_DIR', os.path.join(MEDIA_ROOT, 'pdf_cache'))
+PDF_RENDER_ASYNC = os.environ.get('PDF_RENDER_ASYNC', 'True') == 'True'
+# Processus de rendu des exports PDF groupés (0 : rendu dans le worker Celery)
+PDF_EXPORT_WORKERS = int(os.environ.get('PDF_EXPORT_WORKERS', str(os.cpu_count() or 1)))
+
 # settings.py
 ARMOIRIE_BASE64 = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAASwAAAD6CAYAAAAbbXrzAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJbWFnZVJlYWR5ccllPAAAAxBpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDUuMy1jMDExIDY2LjE0NTY2MSwgMjAxMi8wMi8wNi0xNDo1NjoyNyAgICAgICAgIj4gPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4gPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIgeG1sbnM6eG1wTU09Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9tbS8iIHhtbG5zOnN0UmVmPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvc1R5cGUvUmVzb3VyY2VSZWYjIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6NzI4NzEwQTE5Qzg2MTFGMDg2MEI4QjkwQTM1RjYyMTQiIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6NzI4NzEwQTA5Qzg2MTFGMDg2MEI4QjkwQTM1RjYyMTQiIHhtcDpDcmVhdG9yVG9vbD0iQWRvYmUgUGhvdG9zaG9wIENTNiBXaW5kb3dzIj4gPHhtcE1NOkRlcml2ZWRGcm9tIHN0UmVmOmluc3RhbmNlSUQ9IkM2OTFBMDIwMTI5RTc1MkUzRTc0MDFBN0FFOUQzODIzIiBzdFJlZjpkb2N1bWVudElEPSJDNjkxQTAyMDEyOUU3NTJFM0U3NDAxQTdBRTlEMzgyMyIvPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/PuWcDUMAAXTTSURBVHja7F0HeFTF2n7P2d53s5veE5IASSC00ELvIE2wgt2r14a9XxWQa8NrBVFEEQQRpBfpvYZeQ4eQkN7L9t1z/m/OBrte9Oq91/vvPJyHZLNnzpyZb95532++meFEUUQwBVMwBdOfIXFBwAqmPzIt/2rGKJPFVtOj74hNwdoIpn818cEqCKY/Mh3cu/S2Y8eWXx+siWD6PZI8WAXB9EemqqqCcCgaZcGaCKYgYAXTf3VyOxrl9dXlYXKe84qCCI7ngpUSTEHACqarT4UFF8JXLftsjFrhNWa177wlMrrV8fDIhMo/4lmVFYXRbld1ZEOtHI31NTqDOcT+RzynuOBCWGnJkVZ7927tq9QaiocO++sXoaHRlcHWDgJWMP3JU2RUXKVeLxNmTHn5JeM8vBQSGnG5XcfBi7r3um1m6/Y5R35Pt2ZldUm4y+FVif4qW119ue33BCzRJyB3z/pOOzbPvPv4/nVDamprIhweiI88++l1NltkVbClg4AVTP8LDS6X+8fe8dI7KrXavmTuxPctsqqYk/s+fbj+4hf3blo5aP61t7/2bHxCasnv8ayK0rMpcAEeuPRVFWcTYuKaX/o98j15YnfLr2e99qSzbvPY4ooGuUVLICso6x57cOqdPQbcsTjYyv+7KThL+P80XXfT0x+PuOH5cZHRHFo008PlgzpEtvm2D/7ee/OKRZ9c+3s8o6z0YjOTBTDogJLiwoTfI895n7x+15z3hmwyWPbc7nMK8nbpZoSEyby3PvjxrT0G3P0vglUwxCcIWMH0hyS/3y1buXzK9TU1ZebfmsfoMc9M540jpiYZgOwWapw548Kgzv60/Wvu+3LhZ++M+ZclYXlBjNXKIcTEoaL4cvS/mt9nk59+vOzIMzO6d5CH5x+rR/duaqKMDsQmPjC+94Bbl//WfIsKz0etXz3luqBVBQErmP6wJMOKZZ+O+3jaQ2/85sbnedz98PQntpxK3tk6yY0Rwzls2FGDa/tYFXu3PvHxojnTfnMnZrOC9dVF0aEWDWwmDYHXpZh/5W2nvv/iw2Vn35yc08mAPVsbcM9YBbT6RhSU9pl/831vvPZb8xUEN//O5Dumb9+ydhQQnMUMAlYw/TFwJZP7Bw66cfaKFV/9ZcemeQN/az5mi8k17K5Xn5q6UrR3yPBheC81Fq9uwA3DdJotK556L+/g4eTfkm9dXa1W8JYkmbRKWI0KOBovpXl9wm8q49a1qzuV7Jr0eu8Bem7BWi9uvEmO6FA/lq1U1tzywKS/KVUK4be+/4qv3vrL3tztQwYOueWzoFUFASuY/sDUpevolVajuu7TKU98WFGSH/pb88npPmiXMWzY7O3bBHTopERGmg+7dgq4YQgX8em0e6Y6HK5fHfhZW1diE8S6CL1SC4tBBZerOryxsUH5a/OpqKgwrpl5//SbRhpUa9e70KuzEmnpLqzcTFKw/Z3vNstoe+63vveFU4eafT7j75MS4iLPZ7UfuC1oUUHACqY/MIVHJBZnteq5uuhScfyMqc+MFwX/b8qHCaEePW5YtOeAzA9fJfr3l6P8kpvYF4eUqH0Dvpr55t2/Ns/q8vMxBrnXpFKpSLqpoRDq4mqqCiN+bT6zP3z+me4d8jOr3VQ0N4+BnUT4q/zIPWWsz+l75+e/te487gb1tHcffK+22m5rlz18gVZrdAQtKghYwfRHJo5Dp+4jlul1QO7W+fevWPL+Lb81q6QWnQ/Wea1lrjoRJp0H8alyHDrpwm39dTix54MnSkpKTL8mv7LCktg4swMC7wev9CNSX20oLSmI/zV5nM47mFJ9fvb9vQboceKQB+3TveBMDaitFMHLEs4lJaXk/9b3XTB90iOnTuwaZDIDnbsPWRM0piBgBdO/IbVpN3CTNcxWpLcAS2ZNeP38qUNJvyUfW3hYjVJrvejxgUVlolmcEaXFSqjD5YiLLWm2ecvCob8mv9Li4iizyQOe80Eu80Knc6GspML2a/LYtOaL0W3S3CalUonKOiUS4jSAUw6PF9CZI87qdZrf5Ls6sGd159XLP3gu1ABExTY7mp7R9UDQkoKAFUz/DlkYFV+e2LLzFquZg1ZWHznzwwc+dDoaf7WvyOl0KLyCx8Axi/CLiA7j0FCvhOj0ol06cPzQth7ir4CHqvLC+FAbi2vyQ8YJCLMCFSUXE6/2frfbKT9/YtOQbHp2Q50PDp8KoTY54JKBU9DffXazz+f71fVVU1lmnPfxw1NMZqchRC9Dy6xBy7Q6iz1oSUHACqZ/U2rdYchyjZKDNUwLT8Pufos+nXzfr82juqY8VPRXxCiZe51wxmB0EDPyw2MXkRZDgFZxon19nUNxNXn5CPBc9RdbhJhZ2IBIFxAWAtRVncq82vKUFBdGyYVTmTERgN0uQK7yQ6chakV5KVQEWK6yxMbGBu2vfc/PPnjuBTV3tm24VQOVjvN36DQoKAeDgBVM/87ULnvoOojxhWERPOIseuQdfPOl3O1rs38VYFWWRKj4OqNSxUmgIFN6oFD44XLLYDHJYZRXRNdWlYZcTV4up0PpclyOCbEoIRB4sSvMokBDzcV48SppWmXJhSibwWXkdTIqgwgdAZaCABScFxpShry3IqS2rvZX+dXWLJk2qrpwwcNWvQ7REYTMyvSjGa177AtaUBCwgunfKQvDo2pDwtuvCQ9xwFPFI7sDZ5k/++GpVdXlxquXcGfijFqZnJNTRxYItJRqMg4/vGxbGDWP2PBq2+WLec2vDvwKQzmuMlJvUEnsyi/6YTbq4HOWJDXUVemuJo/igjNpsSw2XqaHz+sHQR9krGwyAVqNEjpOMFVVFIRf7fsVXDgVvX75c+9mZ6kUfjfJZ1Ud4poNWKjWaL1BCwoCVjD9m1NmzqBVpYUyJKfLUFPGIyf1dPtP3nvh6au9v6y4IDGULfLhtSwqFUpBSWAlQBAJJHgdbFaBKy27ulm+4uKiWKu63szxPsI+YliiAiqtAwZ5tbmsvCLsqspTWhQbw1z0Mg5eUQ/RT4DF1upzpAfleoSYXYqK4vyrmmDwep389LcffHdwdmN0/oVGdGitRH6BsaFtj6Ergpbz50rB3Rr+3YkkkdtlV9bVVZoLLl2Kt9dXGRUylYeTy32RCQn5CXHNf9NOCe2zB27b+pWxYEgve9zM+SLuuCESx5d89tiqZV13Dxl+68p/6jMqLYztEMrkGgMENxQEDz7J/xQALLOlBheqC6+K0ZSVl9nMGj8HXmTqkl5ZTjjjg1rmMVRWVVpTgIv/LI/6utJQaxwxPcrD51fCJ7IoDoUUygFOiTCbFyVFl+KupjxzZ/3j3gjFxlFhIdHYVV+D6Eg3Gg/EH0/P7Hjit9Q188vlXzwfVVR0JoHz+2Q+IoBms6kuPiH1nN5kdioUGnfQ0IOA9T+Rcnd83eXD9558tabmfHuF4NVGmom9hPHQGOSCo15eadQkHonOHLKiS58bF8b8im1eQm2RNWER/VaWlS2+v12WGuv2VOPeG+TqSTOfe6dlVqeDifGpxb90v72hNDw8jQg34QxkGoll+f1MHbIJRw42sx6H8s+1vDq2djolirEjhUwCHLCpRwWBnrGBLyk6RyDTff8vMyIBrsaC5iZ6JkQlRJEjcSpClCkJr6h8JDHDLBwKq8r/aZjE4YO70o9vfHPixPvNePerMvTuZsKJc41IzOi/Sqv+dUt6zpw+lLxzy5r+l08tHcW7z2SqVKrQeruLq6xqRFm1H4JCXW2LbXZg3KPTnsjMyDkatPagJPzTp6wOvQ889OR7z3TtNHCRyKsaG/12KEk2RWsFflC36rBeXc/2k5W//t7H47MPvvfyoy9duHDkqtfydeg2Ytm2oy70yxFw8QIPJsmG5ZQmf/z+A//w+bw/29bs4CQZakNNFjYJqIDI6ehSSOAgErsipCAJZkVNTUHK1awHrKs4lR5q5SUmxPLg2LhIUjM0lIU2nEr/Z/c3NtRq3fbiJKMxhBCTGB+vkNxqEnhKAMrKo4LoqfrFyPnGxkbFzGn3T71jqNNWUMKj0a5EdmYj9p+Eu32Pmxddbb0eP7I/ddILd701662O+82O8R+M7HK6T/eOjWEGs5uTUds5HX6oVNqqnr2un/vIwzMeS0vtcCpo6UHA+p9IKrXW3Ta73+4nJy2/dcLbX/dqmTVkdpXLhyq/DJv3arFyox+mCB/uvd0Qkah7f/y74zvvWTT/nauKYM/s2GtXaX3UaZ/QiB6teSxaJUe/PkYYfBtuXDRr6piflziAh/qc5B/ilZKfiGtiVgL7jBiSyWCE114UV19V/Iszc2wWsLE6PymMOcRELQGfnIxMJknN0HADasrz/6kfrKr8QhTvq4zS6tmcgYa4lUxSgrxUNnXg4lXw+vyaX8pn5jsTnmgdeaRHehsDvtrgxpDuVM/lbrhlmTtbtGzzT0HFR0xv9ocTHvh0ct/cjpFfPPrIjWazluexeC2PPUdJ5trdqHb73Zm9bpz69/e3dXn42Vnj0lt1PK5UqjxBSw8C1v9cSs/svf/xCStv6z1y6sjSMuvJrDQ5Rg8Cjh5TYOaMarRsrsBL92pshduf+Ozt52+eUl/zyzNsZqutMTZh0Iq9+wX07qlBfiljWh7ce70Ge9dNfPX4oZ0/yW5I/cEvmi9XNxATkjOAkkOp0IKXy+AVGFOSQaNWQa2oCystLfrFbWIaGqp0fmdZgs3CPPhM0gUAjzGjUJsJrtpLiX7/L695LCm80Myss2s5hULyn3np60olMT45Y4AEVjIDquoEyJSWgp/LY+e6r/oUn/xg/NhRWuw9RCBFsrJLezW25ALN24xcqFb+sjek9PLFsMlPDZlrvzh+ysTHBbPNIsPbM1w4WyLHDaM4JBO3K65vsee62+YOeOypeQ8mprQ7E7ToIGD9zye28HjQsDuX3v/8ir7r9kdvOXTWjcful6PrABXe/sCPskIBjzys4mND5j3wyktjptfU1at+Kb9OOdctPnZQ5lFbGtAlW4kl6/wIsfkx4pq66I+nPfWmvdH5kzsvhEUmnbtY4AlEZYo85Bo9lCqltAwGvAy8WguLWaUqLyv9xV0hKivKw5Qye4hWq5YYluQm5QLuUpNRDb+nKra+tvYXgbestDgiKpy+IldKAOrxitBqKD8GYCw/mQ4XityIiU3+Sed9RUmpcdacF9+640anUinjsHKLiMHdqBB+J45f0Fd26j7i6196flHhJdvk8cMXtM1Yc/N992pxONeLjxd4cfO1wIN3KbFjezUO5vec/cik1X1zeg3fGrTiIGD9v0vRCWnFz0xeO3LX+R5frVrdiJ45DtxzkwyzV3lIYvkxepgcHULX3fzRa3e8Lwg/70fKbN/pyEU++lxxvoiBOV6UVvhx7rgC3TrLkBm6a+CnH0x67Cfvy+i55fQlxjq0JL9IaSk90GtUqKggEOND2GbwaBalQXHBkV90vNdUVpv18nqDzBDwN3HwgalNCAaYTSoyuHJrXW3dL8aHlZccbRmVSOxM0Ep5VJV6oTHaJPASFSJEL4/zZUpf81btfhT0yRYDvf/+U5OuyTjTKjWdx46DxMREH7pkyXHmrAC/ruXB1LQWP7u3vNNZp5r2ypjPh2Qd7zGghxzF54ClO4Dn7lAgo40DnyysxgXfTVOef2PhXWZbWHBJTxCw/v+mUFtU7fiXZ92950iz3MunvGjVAUiNU2DFOvqjx4fh16rB1S/9y5Iv3hv7c3kYjCZHbNLQpYeOeqAye5HT2YRVG+gPLiWuH6HA5aP/mLBp6/wBP7yvRYs2eRW1fLmjkck3nSS9oiIMOHfOJzEahgQJcVacOLS5v/gLe58XFV+MtliUPFQ6yVnOSf4nZmZKyIi1GXSisbwkP+rn7nc57bJzp/f2jo2JJMDiJXl6/qIXsdHMXcUmAvQor3bB6Q47ldSs3Y/8UEvmT7tOrJlz/+D+RgjVCqzdytiVgXDYid1H/Wiedc0Kuezndxad/eHLj8Rbdg7s3Y/A0slhxWqgazsFYtJ9OLEXuFzcbdnfJsx4VKPT+YIWGwSs//fJaouob9fj0bc37BSk6btr+3E4fpb5dZSQy5y4Y5QS27+eMLkgP+9nY5C6db1u0eE83geHgN6dG1FW58Pxk0oYjQLuGu3XLJjx/OSSsiLLd++Jik0oU2qSD5y9VCOFIEDQoXVmCHVQO3z2gApNSo6Au+5I79OnDv3szGVp8emWoTZGoFSSY1yScDyTccxRroHNopQXXT6X8nP3H8zdkq2WFWZFR0RIvq+qWhmq6z1o1ZIYl5d53o04fLYK4WGdtxiNZud37z1/6kT81qUvvXv/aLVMrnVgz0EV5ByHdlkOeKs4HCtU13XqMfpn934/eGBr63MHp7wwdiibcHDg+GkZims5AjwvRLeATTt4X/+hT0/WaLRBsAoC1p89Cb9bTu1yBmzML7KVORsBU5gTmS01WJ3LVvyqERbuQ+c2tRGff/TcSz93f+v22cfqvGmHLhcJ0Os9yOmqwcptjSSltEhNMaFfy9LMD95/4uXv+dJ4Hkktem44mFce8GORaSQlhhHB4XH6NBVEroE6xIS2mXrD6iUf3/qzkrDsdLNQFr8ATQCkOLnktAenDYQ2hBhRWZb/s477dctm3Nm9c4RMrlEQ5mlw6Eg9QqwGhIVaCcDlkj/t0AkHWrTqvOO797ndHu6j9x54e2Qfe2RkNA+vncPK3Xb076MjnHTi/BkvZIY2e5olpxT+1HPdHg83+9PnXh3Wza3T6PzSNjZrdinQkaS0SuNCVQWJWVfU2YyOOcGtaIKA9edPl/IPp02acPNHZaXnIv7VvKLj4yrlpqw9l8u81Em96NXeheMXXGio0LKtEDC4twJV59fcfGD3ttY/db9Wp/HGtbxmyZ5jTEqq0bMjYK+X4cAZ5gSXYcQQC/iK5fcsWjD1e4dMtGrfe8epC26/3yuTHOUytQ5ZbRKwPfciWYoNop/DgH5ZOHdk6b0FF479KDyBbuSc9RdbhoZbAwAlhUbIIUoxCVrJPxYRbkJN5ckWP1XuI3s3ta0v33Vzt67p9J4CRGJ5+3OL0LlzmsTOWB7ORh9KSuW1GR2653733jkfTnow0rBnZM/uJgkkd+wzQKnWo31rN1iYfO4JH1q3vmGeTCb/ST27cfXCQVrnngFds1nwrBwl+WpJenZpHYhQuFjohSmm406DyeT6V9v3/NmDaZMm3vJmbXWxKdhzgoD1n/E/hSYX1tcWxTx4T9e9u7Yv6fkvNQqxHWt85vGLlwSJuYWHA/FWJbbl+SWFZdD6Magbp16x4LUnxJ9xJ3XoMWjdkTNKr+jRQKtVoncXDdZsdMBHTEmmkOG+GyMVm5eOf/fsmSPf7FHVIqPTYZc36lhRsYNYFoGNV0FgkYiLpTUoy/cFJF10JHpkm8MXzZv8wA+f2dhQrxO9tWEWswGB8AOV5MMCxyJTlVKIQ6hNR6BTlOj7YQAqfWXxl5OeGjIoWaszEuDJTTh5qhZulwdtWkdRNRB4K0zIy7dDp22+NT4xPf/Krfv3rO1wZu+7E+8a3UyS0S63DZt2OjCkjxoKToCrVo/jFcaqTt0Hr/9JduVyyjeumPzkDb1lPC+nClZ7sfkwkJkkg9kgSNL0fIGAmJTu//KM4PpV00c/cl+vXXIZp9cZQoLbMgcB6z+TtDqT49nnvhijVKicL7547ZqZ05561uuy/+alT+HRmQcLWZcUqYl4H3q092HvSRd8xJjgFNC9qx/uyrXXH9i7ocNP3d+qTfYxl5BwpKjYLoFB5y5GuBs47Dspk6RaRLwCI/vJIme8++QbXo9bsgOdzuBJTM5Ze/hwoeTHEgUZrOF6NG+ZgA0bjhFh0kIktjLkmg64dG7THXnH9jf77jPr62p0os8TYjKbpHsZaEl+c2kNIJVbkJO8s8Jpb7A5Hd+vm22bl3b1uk+M7NGD2JWbrRc0Ys36PHTq3AJqAw+/VA8G7D9ajPQ23dcyUGeptrZaO+vDJ94bO9pqNproM5kNO/d4oNXLSb6y8HgFTuYLJAc7b0xslvKTy5M2r1k4wCI/3LN1pigxWHuDAscKHOjZhsrs97A9CFFYwvnj41uf+K3taa8r173/xv2vvTLh3q+SkmJOP/r41IcUCnVwp4ggYP3nkiU0uvbpFz+7yaDUupd9NvmViU8MXXzh/NH435JXQlrq+eI6lQ9upTRD2CKV+rdbgzMX2eGhbBJOxLAuonLlF288Lv4EzdKodZ6k9KGL9x0jhsCrqdO70LV3OLatrSIQMZJ8U6NPjzTEqfePnjN94jdsqV373puP5lWLoL9zzGnOJGjPtjh8shTlpQ0S+OhCIjBqaDPb/E//NsHv/5YplRddiNPpODOv1YDzM0loJowSwEvhCWzWUA+tOQQKmTemsrQw8pvO3GiXL10w/pVbR3dUypX0fgSMp89Uo6i8Bl27p9D7i5AJEfA6OZzLr3a06dz/mxNuPnj/4Qk5yTWdMttGkvT0wek0YfOOGgzuEwEZC1pVKbA7z4V2bUcs/qm5QYfLqdiw6s1nRpHMliJoZQKO5ilg0RgQHauU5kOdjXLUucw1sbGRv2lh+vEj2zPHPzFgzdcLpz0dEx11/vG/LbxRpTYEwSoIWP/51Kp174N33PnKOFJTQv7ZzUPffu6a9RtWzh38a/NJTsw46RZjTzU0kF37VFBpfUhNdeLgsQbJv+Rx+9GuI3Wo6m0jduxY2/Gn8ujc85o1h85xPsFL3/MwKWeD2+nGvqMOyOQWqflvvr0djuydMv7g3g1t2T1ZnfrurHerL5aX2AOBmz4FwuOiiGXFYf26owQARgJOL3K69SQsOH3d5rXz+l553uXS/ESr1ShjUjDQ+VkcFgeeOd3lnLTTAi+3wWhUmUtKL8VeuW/5V1NvSokTujdvlUUylC2UVmPt6kPo2qk19JYQiZlByZEsK4FClbojrUX2SclBv2pOf/ulFQ8MvzmTKkQOTh6FHbn5MJrV1A5GaQ2kvT4EBYWmyk7d+v6knNu04vPhYeqjOanpHNWRm+lxqh8R7dIdVNZqSc1WVgpEOBNOR8fElf6aNmSHyS5f8N7Yt18dur6g8HCOXKtofODRKXfHxbUoCPaUIGD916Sh142b1fuaW993kZTQcyUpq768c8lbr9z9em1t5VVv6WsymjzGiDa78kv80p5Q8LupEylx+pIWbrsGcuqMSrWAa/r6VMsXvP60z//jmfaWmZ2P2fnmuy8WMz+MhliXHz37JGL12kr42aJivwwWG4/bR6eEfD7tkbframs0BlNYY2xa98VHiVFByeKxWIiDDwOvaYejJMdqypwSoDDf1Nibeig2rHj1tYbacj17XlHp6USrjQWZqgNgx2ulhc8ik2+8OrCXlcIIk1nFlZWdkcIyCgtORRzJnTHxpuv6k9yk91TrceFcBUpKqtG3TzYBmBhgZxo5DuYVkBy8dr5MLhcKL5+JWD7nmQ/vuyVDo9awd9fDZVdh43Y7Bg2MJnZI4KM04NhZL1SWjutjEpqV/tjn1qDatfTdJ67rowZbxMxRPZdXaVFUJUNWKpXX65Pq/uxlHyLiOu3kZIqrtoGK4lL95JdGT9++8qnPzbCHs+3nr7/tpSc7dR+5JdhD/h8CVnFxsXXVmlU9jxw91Ly+vk5td9hVTpdD6fG4ZX7ffzZMhuM53H3fm88npbTeXi/6EGpVKdXVnz7198f7rDpwMLf51eYTkdjucB6bhGd7mRNupUaKEOVe7D0nkswySU7x9h30sHA7hq9fMXPkD+9XKlW+1Mwhy3YdISmnJNDyytCpUwL8Pi/2HamifHUQXRpktctE2+bO7h9NffRFiWVlX7vs8PFiaWsXafExO5QiKRzJzZKxZdthylgvAUlcYiYym1vaLZr3qrSHfE3lpRbh4WESOIqMZUEb2B6GZ2LMELiIeUVEaEheXkhj93wxa9JTvbvFJpitsRKAQqHBhk3H0L5TcxhDDdLmfwz4/G4BeedqHO27DNrIZNq0t+9/a0jv8MSY5tGAiwBNEYKNuwpgtCmRmWEmFkj1Iw/B3qPVaN1x6FLuJ/Tgoi8/vCkp5mzHxBQrfF4GpgbsPsIhyuKBNcITiFQROOQVAXEp3Tdfbbvt37q+/T+e77pFKVv9F7NaQ1JWpHYaNG/MbU9/+J/uN16/l3NTH3E6HUq73a6qrq3W7juQ22rN2pXdqqorjf/t/f5Pux+WwWCw783bl3HHQ28tCDEZHLxB6eYUvNcgU7tMSq1TFxpao7eF1ISERFyMDIkoTYtvdjYtNvlCdFRMmdFo+cNnZ0ymUPs9j3zw1ylvjNgEwRvu9hnRN/tszy9f6bflzNCJT9xw64NzeO6Xq79DxwHrPn3r5cahTr9ey0mB4+jcgcf6PRy6tSTbEjQkg9y4eaiSf2f2pFeyc67ZZLVF1n03j649RqyYO+WjF30u3ignIFGqVRjQvxm+XncJ2e2TwIsGSU5df0N3/O3VFY9uXjt/XcduQ3YsmiVcqKlqTLJIkkwmXf0H9MJns77AwCEeaBj7cqowYuRg/H3yp4/kn7vzM7+r3hoemkzAowoEixI741jsFBdwmIsyuySxwsJDcaGsxnri8L54V+2hu/oMuJEAhiQdMbeqkipiXZW47roeVC7GDBUSoyu4UAy7y3w0rUWrS/Nnv3KnQTxz06AhQyG4SbrxGmmLly27inDbLRmBBdcEcvU1DSgsUxeMvn/Iph/W7YXTx+MObX1j0t8eYgDrIhyVU/567NxXj1sGMElL1ajgUF0lx4WisIujO/TY88/a3O+1y7+Y/uoDp3InT+rfXaPfd4B4qMYFXVSzQ395+OP7ef7f092qqyoMl0svh58pON/szKWzKSU1+Yl1NbXhdVVVltqqGpPL5VK7PG41MVqZvd6l9Tq9ngnPTnxKp9W7goD1xwGWa8Jj46ckR8UWPzJ+3Cy3WqZ3K+QQGl1Q2n3gzorw8iL8Sp6UjQq8Ss4WdjhirZHnujbvun5kz2HLupMR6vR/nPMzOa1L3sBrXvvLro33LbKY9YqTh2S4905Z+Lzlj37+wvEtfcY98d4T4eFxVT93f/PmWef14dfM2bhp4V+HDmT+JKB7lgZrt9Zg71k/srMICFxyJCSa0bt9SfO3Jtw25fk3lt+uZdqvKbXIaH+Gk8UdOXnJ1y0z1Uiyy4+OXZKxYd1l7NlXgS45VvidPqh0Otx/6wDV21Of+zi9ddeMyLg2K8/lXx7XISKS+jPVq8ePhJRI6LUGnD5ViKz2JNc8DdDZbOjSuUPUF9Of2+BzlcSFhudIM4IC7yMQYJJSAVGKdiemJXOAI2YYFZ6CspIt2QvmvPTmNX07GGUqK7E4DylGNQ4fuoCY6HBYIqMg1hHLkXslwDp1+jJapvf76uyZY5Hb173z5sSnhwV2HxWI7el8WLlpP8JtOmSkxkH01hPJUyLvYBlCQtpsj4qOr/yeXKuo0L3/2s2fXtffG20LM0FwsMNe9di+ww6F0oN0NhgQGEPHYeEGNzJbjPo8IiKy9pfaOr/gTOTHb94xK1a5q99tN5ux4Es/msVrcKzMVzHqjnf+aouIrv0j+0NdZYV+Q+7mrl/vWHnN9tP7+l6ur4z3wq8RPR5qX8Ihlx8qkQBUoaBP6TKooGlwwQxN8fQPZt8+sM/gHUFJ+G9It9541+K3X/5gjMfF+xFhgSwpCnx6EoR28ZCnRcBo1kPvE6HyCfBYVNqL6sZWM/KWPD74jbHbev6l14ZP50650WGvV/xR5Rsw8s4VkSkPvGhSOBAfz+Gz5R7cf4cVbS2rbn9pXJ+NO7Yu7vWz0pL64613TZy4cZ/1UkkxAZZKJKDmMbRnOOatqkSDS5AkFAsDGHZNLCJ0B8a++uIt73hcrm/aVSbj0CKz39LcQ+WS/4iFGigIGAYObo81a49LbhpeKYPoEZFI9davb3zyJ1OfnpWYkJpcWNAYCPi8sgkfybm01BTkHTtPQKILbEXj44ix9Ud52eFWbleV2RgRRUrQCJmWZJneADnlraTnQW+irCykMM2IjU1DRfGpjry/cHSHnD5ETbQBvxenxYmT+UhvRWpRUIOTNTE1ToXLpR5ER9nafjbl0dljruthCSFQE/1KYp0cGmuAXTvOY9iQrkwIB2K+iBTmHi0neTts8XfrtKquQvfq0zd93Cm1pE/XblEQXD56/1BUlquwfkMtRg6xBlYUKY04elLEsYL4o6PufPT9X2rjDSvn93v92UEbemTu6jdimBVzPvOifTsO5T4X2nd+6bH2HQfu/aPsq6ayXDd5xqt/6Xl3j+3Xv3f/mk8LNz54zuxurlYrNGoanLRUEVZdCIxJcRCykuFomwhPWhT8ViN4QVX/2ftzr/2zgJVkz+PHj//TO+Ky0rNO79y1pdW5opMtYdFKzIrsHT4DjSRheghWPfzU2fgqD1SlLPBQDXe6FUWoi1++a/XoNWtX9WwRlngsPj6p+I8oX4vMnrsWLV7SrW16WWIIdeAlX7sw9iYN0mKqIz77bNn1+SV17qy2vXbJZD8ePywWa2OdS1mxbs2ya7t1Cpd220tMspJEsuPQIR7tOprBpKUoqNChfQLO5+3PXr1ua0KbjoPWqdWBE2E0hvDS9as+uqtHpySlXKal73KIjI/Czq0noVIaEJcSL80Gcj4VUtJbYP+uHemn846mst1cOnRqKz2TLTqGMoT+92Pbrj3o0ScHgl9BHb0eFUx65V9GcXEN3B4OuTsOY8/OI9i9PReHj5xEfmE5zh67gCO5eTh57ATOni9A3olTyMhojpDwCJJ1bmh1BngJPFauXo2hwwZAa2DgSkyZhWz4DVi34QBOHNvRKi1ZkTTs2v4QnSwCnYBUp8Xq5YeZqsPgkR2prMSuRB3qah1YvLno8vV3vvWkXmeQ9lgvKrpkfePF6z/v0OLMqBuvS5Pi2TiqD6dPiQ9n5KNlRhj69yDw9DfA6dHinY/rhGG3fjSmeWaXn4y/stPA8NEbTz13bNvf3nvstpqY6AgT3v6gEX0HUHu4nLjguPb9ux959XVplvQPSMtWfNV7zMQ75n9x5uu/lMZpIxRhRhiLHdDm18JDQC6GmeGJMcMepYKgkkkhJiInQEnt7z9/GXd1v/ndB//y6Gd/pr7+PwFYLLVq1vLgkoULRng5n4nXKaEgUeTnWdygCB/zHRvV4EMJuIwaeKsaoSioh9xqBhcfhiKuJn7x13OvFytq3V079NzD8b8v8VQq5WKzVj02z5wxZ9RtfUWTHSrMIdC6tq8KvbIFxY7N2/uvWbMpKymtyy5LiK3+R9KwRdaJDRu2Z7hrClumpkfSe1WhLY2SW0gaXigSkEWjJnwy6Viudh1iUFF6NOvzeUuyk1M6bbXaIupMFmvdxvUL+0eH+RPCo8LB+TXgNVpotQqsXHUA3bt3pnFYK+1fxWbCWrRIwtIVK9Ho9mLgoMGSc54dvFBeVoWTpwuwadNBnD5xGuvXrkPuzq04tn8nVHI3kmOJTbnzYFJchk1Xjgh9Ndq0UKN5vAiTphha9WVqlEI46y8hhjpTXWUVDu/cjD3b9mLH5t3YvWsfLhdUkMRNhVZjgpoYGacxwueyY9bsuVCrZRj38DgoOKZ43VRWJRpqRcz5fAVuumUAQkKJKXoJxOQG5O4/hQpH3MrBQ+/7gtXhkb1rOkx5bezc4Z38vYeOSoHPXwfer4cot2Dq9JPQkOy8/ZZEcJ46KXZr7kJSkZaxr429+5kZTRt6fS+dPJHb4q2JN8w2yZbe88R9osrn0OKtKW6qLxWiQ31Yvr3ZrscnLLnlj1go7bQ3Kp97+aHxTy+f/H5JPBeriAmBspqD72QJ2PyGN9UGb4wBPj0HLyeCJ9sQRAIrXoBC5MEXNCCNCz88/c0Z9xoNJmcQsP4DKSIssjomJOL8unUrh3r9LqWgUhHVJ9ZArIVnG4KT0XnYTD6xLqXNArVbhPZUGfzUCZShRrjCFeoNuRsGFudd1F/TY8j63xu0zKbQepk+7eCseYtHP3Abp2qol+OrZV50y+LRpzvQUHOp+WezvxzOq8IupKZlfW/3Sl4mF5PTOu+c+dlX17ROc1ktJi0Zpg6t28RgyboLqKa+lZFpo1f0gJ1Tk57REhpvXfL0GVOGmyOTDyckpF8qLamU55/ZO6xddgsCN7nkRI+ID8XOXUegkBkRn9aKjNpFnV2AOjwGiTHx2LJlO8xaHXZt3I8VC5Zj19aVqK0+iZw2FrRMdqJ7Bx16dzWhbzcjunXRom2WFuktI5CWZkWzZmYkJZkQF6clKaxDcpIZqUkRaJkWjtaZoWjb2owu2WZ0bmuk91AjKdEHi9GFMBpEjhzcj60bNmLvzmMoKalHQVEF8k4dx/MvPABrbCj1WMa8iEITK1u1dJOEJ4OGd4fodtCPSimw9qvFO8T23R59Ojml9bmvl80eMP/juxfecWNsaudusUSNPFR/SogEUh/NOgt7YyPuv7cFFKiW9v7KO1qPFXtC9j01afHtKpX6R4Cz6KupNy766O4513a50Pb6UUoU5WswdZqAwYNkaJ8h4s2Z2stjHpl3fVx8s5Lf284bG+rVY566bubM86se8GVFKmQaFUynqmE8WQEkhcLZPBRuLQ1dgp+AigXcKiQGzot+cHYXZEX1CHNqSj995ZObMzOyzv3Z+vn/DGCx5G50YdGXc+/31NUr9GVeqCudkNl90iELPC+DWlRKIU0OnQ+uCBqBzBrI84pJDfEQQ/Tgoiw4cDS3S/WZQnn/bgO38L8zaCUlN790sqwaJ9dv7jN2LIfaOh4LlwnISFeifbaA5BCPZcmXi284cr5U0bp1l71KleabCQFziK2B14SfXj5//s3d2kfzPJtM0DPQisKypcdQVsojgzEtAiLOrUZC8ygkxKssH38w/Vovrz/fpfPAzWuXLbqze+dmarmKAEsklqUyE/MxYfny9ehNEo83aOBs4HBk90ViTkdQXZJPVx7CQ+rRraMSg/uHolcXK1q20CMu2kAAI4dGyQfOCyQaK7JoWapsVt/sgOdvLr8onXQD0SOtCRTZ5aeLPmMyWEsDidWiQkKCkWSiDp3bW9AmSwOrtR6lxZdwaP9eCB65FHGuYLFjYSbIzHo0Vjgw+/N5uPW2kTCzLZnp+ZxChuqqOmzYUpx//a1/+9u8OVPGbF474dOnHu5sadGSJLXLHdh2mQB/yoxDaKysxqMPZUKlIk0p86OuxoD3Zp6zj7n/s+sTm6V/L8Czuqbc+M7kx18qPPDyO+PG8sbMdjwunlLivU98uGagH927iZj8kUPoPPi927v1Grb9d2dWDrvyjudum7q4auetyIqD0iOD5mQd3JV2NHSOJJvWwU8VLveSbXiJcTf6Ia92QVNYC93FSmgvE3mvdpPYCKl94O5xr1vMFkcQsP6Diei3x1Hb4D1y6GBXb7RJ7iPJA7cLyvJ6KIqI6tP/sloXtI1eaX2dN0QHpdEA+YkiCAYyYosC8gg99uRu7W71ai52atvlyO/ub2uVs2fl2qNJQvmZVkNGKlBB/eSrlT5kJQMJKSJyMrX8gQN7uq9ctLldfFKrg7bwmIor96akZl44dqrKu3/X5j7Z2RHwigoYVTq0bdsM81bloazYiazWKRKb9BHTioiORPu0JPWXc2dcV1FWOqjR0RAWHq6RR8RGBEIPRBUiU5vh2ME8YgmlOHnoIr76fBEuntuAtEQ7biTpNHCgGRmtOISFKqBiO4j6FAEAEpqWA5EGETmSHNIJOwReTHJ8c8kC/xOgcTRYcAJdVGaOPudE5sgX6X8hEMnulweCRH3EDAjxtGoFoiINaJ2hRO/O4chsGYaK8nxs2Lgdm7ecQEO9A3v37kZUeDR6Dh0I0emQJhQ4lRK5uXkoLlXJTxzZfGNJ/pd3Pvv4YFU0DVCig+0LL4eXQPLdD/ehsb4eT43rAqVMRY8X4PXq8ea0ff6M7s8+NGDYnd87ZPXAnk3t3500dmbL0FVjx92sgSnKgfMnTJgy24Xhg4AeA0TMnUu1br3372PveWHaH2Hfz7352Aszzix5lMuIg8LDQ3OhAYpLtfBn00Cl4aGqsENd0gAlfaa4UAUZsVM5DeJekoKCUQNBoQTvkteOu23c+F7deucqlUpfELD+o4Cl8fTpM2CbyWgs3HR8y3BvuJZzJZggRBvBnPFsIS7v8ENR4YG/tI46mRdCvBXQKqEk/S8jAHMbWLyhAfu27Go7JHvAolBraP3vWUa5TCGktu22+fO5ywbGmesienbzwVetwazVApqnGhAaYkeXLDN1/Npm0z+dO5pIfFnLjC5Hr3hR2nTstXPxyrWtnJX5LdJbRhLz4CQHdft2iVix9ChKS91o1TGRwIGYjlsDY6gGOZ1bYf/eXaG79x2Rmyx6tO3QLrBXlUyBo8fO0t9O4tiR/Yi0FWDYgCiMGByJ1DQlDBoBvJdtScyCR1VUf2zPGa+0J5UkmbmA1OYIlCQQYruLMlIqHTpx5ZJJl0g/swBSBmrSxSYKeHakGMuX/i7jA19nwMcmr8WmMxLZCaqijximh6SuBj06RiPa6seZ47nYurcYOlU4IkLDEBKlIzAKnM6zaMlaArOjqqyWOtvDDwyEQUHsy0XlZI5nesjUqVsJrOx48rEeUKnl9AgRcoUKsz7Jg1vf84P7Hpsy6Up7sQMz5sya+NCaOY9/eefQ+uT+vbRSEO7p02p8MMeJa/ur0L23iJ07XNh7qs9Xj7/02f3Sjg+/c9q9fXvmo7Ofn65oHaX2EIvUlnggnCmF0D4aHisNCYerwV2shooYlHRadrgOQpwFPmKtzii9tEzJ5tY633vhnRvuue2+eX9GsJJmzkVR/M+XQhBwufBS2IkLp5udLjzV3FFXZ7XX1ZsanA61SW9oDDVZqs0WW2moLbokOjK6OLVZ2nmlWv2TWZ07dyrqH29P+vB81cUhx44f4T0harjImL1mNUS9EqTowfsFMlKv1IF8OpIyNJqbDpbAbXfAR52d0ALeC6W41dr9o1n/mP/XXyp6WUW5McRstSsUMr/P68HJU8dTTl86lXKp7FJyVX21tb6+1sz4hVqtdsmgcrZu2bpuaP+RH3696qteuxY+tHTSfQqVJsSLZZuAjbl+PHaXFQnhTkI2GwovN2DqrEooooa///jT0582mwM7bF4uPBvx98cHrn1gTGyrjA7R8Llc1OFCUFfHYdJrC9EuOxU3jukI0SVxGPByendOi48/XoGjeRfx5j/G4+TZ81hJHdtXXYIunczo1DkCJrOPnW1FF/3PIsylE28gHbMVAB5IC4whsSQGVqKEWaL4HenM/eiHK5aGwNbK3A/+zgU2YhdFaQaSQ2Cn1cCHQtOz6XPRG9CXLPJULp35hYoqHju2lyJ3vx3h8TEYOmoQQmwheObhiRjYpyuuHduV+QmkGDJeJrA+i4+nrUNxZQmefnooNFxg/SCnU2DzxiNYus69Z9J7W/ux5UlS2xYVGae9ds+7GnHz7ffeGkmyk8ogOAisFHh/Th1uGCpHt2w3Ki6pMWGGruqmB+d2z2jdpmzV13PvOVVwXk3WpHK4nWqCSsFmCqmxGSzVcVHJp1MS0861TM3IZ5XndLqUdoddbWP692eSj9pk0F19V27UnB+iiLWBdxK47zoPIdEMb5IVnMsDzkH1R8xXwRODlE47EqCoc0JdS38rtUNf70F2RjtXQlji/L899+qD1tDAO/4wORob5GfOnk4pLiuKKK0piq6qrQ6rqq0xOxwOrVGrcxgNhnqzyVqWltDiNPXDs5GRMTX/LwBLpArdtntb22Ublg3fe3Rf96KKouZFrtoIPzMsdcAgRXZysEjG5iFKSyMtT/YSojTUxxjCT2ckNDuRnd5+V5vW7Q+2adXuuM5gdAewz4/sQR13nyrJ62SiEdzhdYId2qChhnSFaOAjxuG1aOCxqKGkkR1qHj56ntIlQLn1AvzJ4XCkMH+IB7rc4oYdr69p1zqj/dnvlvvkmROJ2w7s6LRi/aphg7v1XzNm9JgvP5v/6Zh5m5eMPVd1sX0N7zKINJpDw/LnAtFu5Q5Yi7zol9MHZ+qq8iuEWrmltDTq7jYu/oHbBUk2rd/EYUmuD0/eFYtEtpcBAYOHWNCs+cU4lGfJvX3cew9ndx4obVy3Y/OC3gs+vnXtpL8NlZMRSTKN08qpExNovbQA/fq1wTWju5JU4gPQoNFLrOr5p96Gp5HkhLoG3bvZ0K1DFFQ6qliPPTCtKrK909mJzf4fAItEnSSmJJ2+/J0QPvFH3/vJFpck4A9u+vEv3BXH17eg9c13ROHbz9jPMgJPtQoNDW5s2V5DUt4Ol8uMiHgtnpzwINBYTe/vDgAetcPs6ctx5nQZnpkwCnoVMRQXCxh108BQg0mTd5Q/PH5dTsv0bKmtt29c0eXLGQ9/2DenLnNk/1hJqkJbjBNH5fhoVh2uH6FHTicXAT6Hlz91Y/Zlk1c02EriVDYuTGOMXbF3DTzxxOz1msDp1yxq307PIzsz89rq1mFpu28adN2sscNuXTr5vdfvPnTxRIeRfQevzGnXdU9SUtr3wmvWblyeM3zyLZuFnHi5T66AZX8F/HUNcHRPhIzAmG2syHl88Lt9kFFdqJjvli5lnVsKFPbLeSi0GlQ7nejdse/ir2euGnUl7/raGm3ugdysA8cPZu3P259zNv9My8raypQy2LWigpNO72YDOy+tZ6Vn+VhfZKvFZEK8KqQoNjz+ZIcOXTYO7zd0ZXbbjnn/c4DlcbuxfNWSQZ98+dGDWy8e7OU0QAOSYNArIFPKIWOsRyZKBxfw1BDMvcHJr8gEtg6XKo1GFJA2R72DOAvnSdVFneif1evr3l37bOjdvf+OGV/OvH7c7KfmqppFg3N6iCZ7ICfj9NF9CpI4bp4dfe6Hlt7dY5HB1S4afqMSslIn9PuLYO+ZDLeJOu2pYjwcMeQfb7/6yRPnC89Ffb12xcDlO78esbf4ZE69s96SYY7BC2Pv2/LWsk81+0vOdvTHWwhRNeAUbGayyb9Dl9otwHWmiLCR2BzJTicBJmhUVxK4pp3Kx+s9tRg0UJTeb+t6E5ZuLcS4++ORGGcihkAdRaNC7l43PllwsaZzr8eev+3eZz/k5Srxkw8eebokb85rzz85mmRKA9mTBTKNDkUF9Xjz7/Nx972jkZ7Ndrcxo66iBgsWbsSZvAPo2SkE/bvFQKFRUi3UEEb4Az4lBlYSq7oCWMK3QMWkH5N14L7Hnjjuyu//DLB+AEziD37mrgBU4BJFoQkGv/u50PRjE9NirAvsYkG1ajTU+7BuXTF2H69Fq+xsXDe8JzS6QAzU9nVHsGT5Zkx46XYYTH7J58UR4Nnd9XjxlRX+HgMn3zDs+vsWedwNik/eHf/ohWMz/3bn2ERDi+bsMIoGKWj32CEXPv68ELfeYED71py0NvPLRdV45pwal1JZLJuDKIoTXD3J6Qu1cOvIxlKi0ED3Mv3F06Ci8vLwE8h4mP0W1GBwcsdFo/uP3PLc9FffL/XVwKqylHVMbLP12pzBSwf2GbI+OiK2csR9g+Yv445fj/hQ6Enyy/fkw9U1Ee4QJfjqRqiOlsBQJcBBg72fgEVB/YZNMvn1JLc1PKkLBQSVFrLjlcKiF6b3zcnuvm/djs05G3atGrL92J6+lxqrU5w6USaYqe1NamkQULC2FgPKnE2OQAgMYGyM4Glg81AbKBz0WYMHnppGaL1c/aAWOSvvvfm+qf36Ddr1U6EgfzrA2rN9S9bz70yYuO1s7lAuQgMh0gBBTSDlZ94PifzDIadRiAkDOSf5RBjAMHcJWxfrZ8DFB4CAXXL6hTELn4Mav5wartKPLFvKjvSY1BOL9iy9y5EeIWdAxIye3cvCG1TegNCQ02ihJDDwEG2zR+oldiKTqaDZeh4KgxZ1rUOpX/iRsK++tFezjosWH916fY3fEYpwLeT0d8XlWiRrQlDkrEVNqAJyi0GKFmD+A1Z+uS8ggHhqYD1bu+zxwquRE3sMnNMncCa4TE5oG6rR9XQV/nGTFpmtZdLOBJu3+LF4TSUevC8NaYkK6pcy+tiIimKORvedsPMdvnjw6Q8fj45JKn3uoX5z2jUvHzPqpv40gisCosugwt4dF7Fw8XqMf/mvOLgvH8vnr0KLFBEjRsTAYqNCOal80migDMi7gPMpwAbYxdYA0iVeASEp2j0AXIHvBuDkW8C6Aj5XObP6PbP7DnP6zv9iE2Ax8OK+uelbpiUVm+3HJbroOyz+ijqcxoGiMhcWzq9AebkaN9zeG9ExiXh5wjTc9+B1SGthhNjAnP006GlFTJ26Go1i11eeHv/J8+fPHo2f9tY90xJsFwbdcUM76PQCO/dLWsN9+EAJPp1VhZtvC0OnNk7JjbFtZyOeWMHjWPNYuNVaGEh2yXy1ZFPEaBpUkLs98OrkcCv9EMgumEvOz1i9QNLN65cAwVdRj3ASg5GiGme5BjhjTRAqiO1WOxCrtOYPad5x1YKCXbfVdArRswy0e4ugERSo6hJNctYFhd0LbakLXpUcfhoomZ9R4rJcwM4lxkp2ry31Qn/Jbh/euc/n+08f6nXUUZbmi6Q2DjWCU6mkJhUFXxM4sdv4b8eUps/YBzyrZ+qTMmJtPhbnSO8igRgjBMW1UFd4fIPb9v3ixScnTmyV3vr8nxKwKqsq9ER7x32yaPqTVVFysyzKDKXDA5fDAYXVBjlD8/IaqEw61BHjYaDikTq/TOo7fuZOgSB1GDT5dFnlsS1WGLD5lWS8jNVQx5YTFUaFA/oKN5ETyihUB2+0AR6DTLpHxgLoaCQSqIE5ZjwIsAY2uwX6TFbRAOPBEtT0T6F8aiE/cJmeQZ06NgQeI1sTJ0BPj/BcqoTXoAYfbZUMhTWY2iEQJfeAa3CCd3ql2S7WqB5ekECMxcUwHw17H79CDR2vhTtCoH4jwwgaXd8YZ4bZSCyHRsOt251YuLQE996fhowWBulQBMj10mLgBSsOY/V238Hb73vz0ayszrkvPd5932P39MmMS6TvuQn65cTyLCa899oc5B29iIhQD0YPj0BGS+rQDmIjgpL+eQhbSEL4tIFZOolViU1+Kma9TUB0BcjAfwNO4o+AivsJ39Q/AyzxJ9BL+JZtsXZCoL7QBF/cN5KQrIFjUdtuGuzEwGjGgkk5F2EBO7HaJ4Uo7N3vwZI15Sgjht2nXxbG3D0cYl2pdBgH2+3m0OED+HJB9aqJ726+ZuP6z4esnPfS2yMGx6T079mc6rGB6XgCQAVyd5VjzrwzuOOOZLTNIHvxulByScTDH5Vho9kMj4sGsHKSmN5a4nte1tJUFp+0ckDyIbIBUhADbg5itZxeDQ8xeIdeLh0OqyK78RdWQEUDqDzehnoNAzMRymoCgYJqMO8C3yYCPoMGchqI0D6Z7pfDK7pp0CXGxrGQYR8BJJskEaQtxaT+QgDH1tXKixrJrh0QybYarAooqE/46X6GZcwl6We1y1YzXGkHKivnkwWGDDHwu4R9IgNCAi26QsrccLpdcEWY4BPYM+qgCiF7pr7ou1gPm0Nb9PTYR14ed+8j05UatfinAaxVG1bmPPnm02+dLDvbQZYWRhVFHbXaC8XZCogWLVyJNvB2qvjTlVKErtOmlGa4pMaVNwkSgZOWFFyRWN/4TFSC1LlkbMsoNpXPluSw3XgJ6LQu+qHGAdnFSvCk67kwPZxsmY6eBRYK0ojEOihrhACjY4DFQeekfLedh8+iA0+A5YojmafXSSO5T8GW8ZLEE2TSzBKbMNNU0jPq7XCwEZP5dyhfkai4TEfGqpZJi69FuaJpBkvStNIBCz6vF3J7HfwNCmgafEgigL25B/DoQ8lS8CaTgdt3OzH3q9N48O52yMiMh+DmJLYJrQFHDpVi2qzd9o7dxkwyag1ZhaeX3/DII6MCM2v09wP7T+HLmUvQpgWB4choaDX0bLczsG5PoFFcxpzXDglUmd9KlGb4mpzcLOJdslBPwJ91BbiuABYXYF1XBpBAgzQxK47/BUr1Sz4s8fssSxR/5nOhyRkvBjqlwDUBGdcEdo6ATGSsQMehuo5k27xClJZqcMu9I5CSnkigTczH58Yrb85C1x4P/ePMmTON+WeXPP/gnTnyuGRi1sxeRAIsowPbN5Zh/oKTuPcvGchMV7CDE+GvdeOFf1zArAukiJi7U20iVqsHr3NKP5MuhwbVZCMEDNTWnNdHwEIAxhi900327qKq97INKiBjwc00UDttWskGZQwUWJwawYjA2Awvh7KiEVxVNZR6PWQEbnX900ihuQILxun95dIO14EKZebFkS0q6tj8sh2+ugbIzWS/sVY4rSrJTSkn2xO4QP5s2yKxqe4kt0ATOAlXQOrbMSIwjjCWRb8YShzwXa4Gl0qSl8iA5UQl2acTjWlWUk0K8FRHOF2NHontVr82/s0nOrTrlPdfDVhup5Of9ObLj7/z5QcTnBG8BlHUeDI5dU4BqvO1UgS6I8NGwCFAfaoCCqjRmG6DX/BI23roqqlhCXgaTUqpKwQGfCYDOYlN+aj25Exv0e8+LsCW2HcYa0DTjDrT8VJYY7kL6rxqoMoujXC8SQWvUQGPjRowRCNNiPm1POTEilR5FdLWutzZcrjTI6UZRGZYDCkkluTxQUH5KKl8PhrN/CQluRA2auogaNmaLWJ8MiZBxcCoz+4RA34UxgYD/Z9GT2I5XoWcpKkAhYcanzpJItXLxL5KXD8qCaKb8lQbsG9fBWbNO4y7b++DrOxo+Dz03h4Z20Qe9Y1eTJv5NYqL1KitrcFTjw1Dertm+GrWNmzbthW33mRDh9Z6Sf4x35SfV0oMkWdr9ASl5NQXmTOVVYB0UIQ7AELsiHmx6fCI77GspovnvzPD9wNm9T3A4n5OA/4EwxK/ZVjfSMPvOtvx/b83AVeABIiSz41r8rUI0kk9HnpVF5mMXFpqs2XnJSxd5sKQEYPRb3Rn7Fi5CbPm7oUpxITmqQrcPqY32AGroptFuzto4DFhy/pzWLJ0J/56V1e0aKmB118LBSHClFmFeO1oA0riYqDQkV0rA4MZx4JhfTKpTDzZMfPBMobNZp3ZIMV8P8w1yIBB5qahoZG+U0NgVOuQJpb8ZJtum46AUgOfkrHIAANiWchpUNSeKocnPYqYFb1rWqjEMqWlNzQOqSqI1dc5oajx0CDqgp3KKUSGQJ4YAkcET4qFgJNUgJwtWaMcBSkUxfetr7Bp7y+lwEu+NpfUt8SmAYFFW7uk2WBepZTAjvkz9YdLwSuVqGthI2nqh/5ouaSKnClGYo9kpyQd/fn1CKnni1+8+4Vnxz346Oz/yjisvJPHE+6+b+zMT/YsfMiTalHwZq3kNFc7iPmcrQJzeTtTLXATMmvYYuQiOxpSQ0imcFI/0VAHU5wqg1erldgKq01BQd8l0FYdLJRAxKdXSmuj1NR52TQux9gSc21S3Sr9CmmBp0ceoLqiQQVPkgWcTiYtTUCVG7pGH/hqGoFsOmnWUMV8YLsuQelhRkYGaCU2ZtSyrg3iS1DWeQKBeIz6uqjxWcxWPMmBOKPEGv1KVo6AhGGjFJVYGi2Z30wkg1Z6A51bcg8xY6CRUkkG69O7JIkqqm1whJpQfOASWlpNiEmMJaBxI7qZAVGhYfh41k6EhcYiNi6iiVmwY/ssyMnpTCDegP3HTqK8sgGn9p5D6Zl9eOS+eKSkECg5ZQGn9BXAlbioQoqBCgDPlfgnXtpsj7vidOea5DLfJBdxRTbKmlgXL4EaJ31X/u35g/jO9cN4rG/CI77L2n4Ys8U3yXS+6ftcQGJ9DzgRODrsCjh+R55yTdI18FvgOZzPi4SkUGQmKjBn+W5cOt+IQ7nH4HU6cOOYPhg2qgeBjZ+AgFgvG2eUZqxfdx6LV+zGIw/0RmoLknCMJSn12LbyMl44UIeSlsTUtB54lF7Jb6cudwfKKmOshwY1rzIgXaVgrgDuMr8mY7ReAjAfPcjLGDgNmP4wA9maWvq2rpwGw5IGiDQw8nK2F5g8sA5QrZLsWUtApyhvAHe5CgLb4FBLA3BxLYFFPWQ1JIkr66EgDenrEA1nphVeHVtC7pdsUubnpfFFwWQg38Ri2eQW2GcEmNT/5IV2mPLqIYRr2cIBqS2Yu0RDfZQvrQdH/YL1Xx+Bu5oGOqG0Vopj9FA/ZTOxyrIayIiUiDoDlZfyJvbo0PKGDWuXj8g7uD++U3bODqPB6PyvAaz5S+YMueXZO+ccdBZ0VSZY4VcFDFHuEqG5WEVG4YGYEAJniBraei/UBGAeAgx/lCFQgdRB1Pm1JJeoMydb4VEH6D+IOusIrVm0ujfeKoUiMHbg4wONIGOWIWeSMDCj6FUG/DHMnSEZCfVDgSSoIsJKut4FN5GIuk5xEMhgNJfroD5STEqR0WsRDo0M7miTNICriNpqLtZATbScjdRCjAX2eBNcNo0k9yRHJI1IbI87vkku+Rk+sKlmyceGwI4DVAd+NkXMRi02AcBmLo+WUX70LmRgxq2X4aH/i5N0qNiTjx4p8dCH0Wjm1iAyIR7RMWbMmrEeNgKzaPqb4DUEOjg9I7lDByRHhGL+zDVoltSA+x+Kp0GamJVDIwHON/6mJjC4Ah5Sx/4GLORNR3JdoacyKYI94GqXB0CBkzXlJfvWEc99H5ik7ZC/+Z37zvUtAH1z4dvvcfyVsjU58yXgQZM/6Er5xW+kJ3clvIJrigcD9537m7ggFxhApL+STDLa9OjS1oZtWw7gyBkHJrzyf9R9CZhkZXX2e/faq/eemZ7pnn0BnIFhBwV3URQVCOAaEyEqiriEqGhM1JioiRsaUREhoCLghoCIIooQFodtFpZh9qV7eu/q2uuu/znnu1VdM2CiCRj/4amn6eqqW7fu/b5z3nPOe97zQRxxzBqgUKcX12gNkcFOZfDznz2I2269G+9//6uwbGUf/DqZeNrMT22Zxqd+sBkbVw+isYdCrn0ziBZ1QC+RRXp4N4J+LiIZYkw5uc7rjsnKnLJgxyVJd14zjLI4T8T5cH4Nc9Rsk0LKBBpkvIKMheQ0hY0js9AqDRi07gL6OxunoFCiKIQwJAUiEe0FPZ2ESSixQYbEnKHfaR/NnrIY9V5yogzP6LX8eY7H1XfI+XBXgs6fHynDL4qwUXwNCRWZO6dpTxIgyCTI2AeSczUJFNh7ZmHQ/a71knFi42vacCja0AjZ8d7y6LxrhBITI1WKpFw0+BiE4my6V2QAtc07txx1y89uftGKxcs3LR9aPvx/arAKxZnUxz/50Y9+5B/+7puFoNjNGtxsZyyH8EktRGrvLBkKQjSLacN3J+WCZbaTNa6StV5CniARyk1xZnwktpMRG+qERyFbxNUcet7ilMKmSfJIGYKceTq0R0aBkBRtgpDDHLIUIYWZhq7aQjS+qUyLYLK0rbWiEJ9CP3dxnmA4Iaq908Ltws4JeP051Mo1gva0cBZ0SbKSWxw4jPTpM0srO+D3pcW4SDjCvKcwEo/Mjsi3tNZGs9iI8mLUFWI0A+WpzFAVCdgA64kE0jvJm9ZoIQ2wNhF55cfIgC1dgmF+74P78MLjl9HiTQJk7BcM9mPx4oW46spfoCPXj0Wrh6SKqRPS3PfENL7ztetw+mk5nHfeIvocOoCrclLCSscc47yJlrSDUI95ECt9zqAZLVSlibGKjU6L5R4/pyvD2XyPFmM5HPLQYrSktQySPmcw42ebhrBl0PQmumo3SHrLCGpt1AotThtozdcfWhPwfTiOixOP6+JUFO64cyfWrl2CVIdF4RJtzmQKt9x8L26743f4u0vOwhCtE79KqMt0UJ1s4NJv/Ra3Lhyiw1iwHjkAe9kCuHkHafp/NvchO2jO/fBow4YKVdlAMKLRxIjRUqY1wKhfFYC0gxhqnIMNyIr5jkkGJw2DEL5Vo8VDhitZDGCkaD9kKOqYLEtONOrMIBidQcojY7J9P1hepsxE4jg85eqdykqoqx4JktLFaOqM+KH2TSIwRJJJjKjtwB6vwqbQ0icDHNiBJMZCLg5UCEFRhOL1kDGkc2TDZzMYYeRFCI3J2Rwi2rwWpgkFeg2EaVvQWFio0Dr2Mb33wMCPb/ze2yjWKRy7/vhHTNMM/+QGa6Ywk/riZZ9/6+Ytj570qle9+pZzTzv7+y9ec8Idk/tG0+O7983vbNCyK5a02mAH6mQYePHkdxHsnCoRkumA15eRXi6N7mj+sUlw5ml2TRdZfk8WbCIw5fmgWEPjsPlSYeHYKlukVw6TN+gwJWTkEVTZkZqEiozsDGhNVzuXa9GYSBcQ0qK4e6SMaOcUakt6aWHQdStSeDbUS56qjjShKj9NsIx+d3tS8nk8BSXkn3xz21kAZJikbYWxSM1Hmoxz1JEU4yZelFNEk1WkdhQQ0aLi/JZJr+fEv71lDPo8WmiDFjK7yIONhiivm4+R/RPoHCvjqKMXqa1ct9G7ZB6WLVuNb13xI2QpzF68bgX2bJ7Alz/3Vbz8xRmcdnovdNejhcIyMUpeWDOYT2spo4Rmm8ycodI0o4W6pKTQet3cz6gZEmIuVET7c+1G7yADZRz0aA/9oqZxan99HAqqPFobIkNbDk1r8sIUAmsar6gtx6bFxipCG6CLDRuHV7wujjwqjcmJcdzwg0dw1Pq1SPcP4ac//inuuuMRfPhDbyEHkRXNLUnxeTq+cuWvcQV9Vrl/CdJ37YHZEaF8FKGrUReZR4bRWDcAN6uuAUeJzqP71e8JW60BclSGGyK/rYBG1pZIgJ83YrpA8/zZket0joy8vARzqFIweWxamdbmGK0rQltmPotGoSjOO6Dj4wmKDga7MHs8Ux08MURcPWVj5Flq3XMujauGqVkPDkU2XipBDj6QSCbJkUueEJKt3IZN+9DZVZChHD4ZJ+4M4bxXkCTjvLeIBBnxam9Gwl1GVVaZdebKXHxGkCNj25kQFJibqMMJrcgdrdZfPHDcbRe9/u1fedXxL7xj5aLl2x5+9JF1k1NT2pFrj3rCsqzwT5p0r9aqFh1HS6fSbvvz5UrZfuKpTUs//fmP/sevdjx8XH2QPBBXMGYqGJiOMGX7KD+vV4VTlo70E1Po2FNGZVUfZpZmOLCjG03h0vYiGaxxHFjTiXD1PFmuHGrlHieDNz2B+imLEBE8zczSUrzvSdSPnQ9vflbxSaAS5lyOlZXL+JwWjz1LT9+3G1o+j1reJohNN7kRIDlRJQ/qw6MQzM8mFHpjr2kgLlFrEmpIq1vc+2boalGEBqEzMnoZCukaxwyhxmEuHYuVULLj9L3v24XG0RRODPLzriza7O27kXKSmHj5PFgTFJbcOYrghHnwVhhYe88wLn/9sTjuNYcjqqTo+OSXMlnsIER1+TeuxcnHn4wHf3M/XvHKBE55EYWAJSdGJaoRmDlWEtZFRiukU/mhuTyS1swnNcPB1v9rsaGKjUR0SEI9pj60ws0m/0r/w2gNUdSWWI/aEuycn4uiOXqDhjnZB2HBB20VxCCmOwRzx4uCOAyMXytZyKDFng/l+5NR18iLJgLc+pMJPLApj+UnLMXGhzbiQxe/GX29vUBjkl7nkh1O4ebrfob3/e4p7DlyHZIPjyHxxASKr6ZQMUURwe1j4KxH5dQhlQzXEuggJ4Q94yhRaMaUF7lOhELNPTMUJYyicOpSei8XcCBri/cgiyoaQpkKVYgoye5IOVpGPrSG7SmChaMFWAkHARkY31G8K646en4V1nFL4fDka1rjYRAJom8w/CeDowlz1YS5m/bY45OonbIS5ayP1BRFKvfuQbiynxx3FnrDp71A+2PTBPL7Syge2UfrOM07UZB01+PTFBnMYIoARZ32CHeROGTAujZPwUhq2J+nz+rsQtolR7d/Bn9x/Ct+8rcXfuQDq5av2WXaBwv7FkvFhGM7nuM4wZ8UYbGFtC37aR9qmVbwnWuvOe+K6666AHRzc54zM2h2bX/pqmN/M1qcWj7Zb5t+zhQD4OyvIbeb0FJfEsVVnZIUtGjjJPfV4Dw5RZ7NQePwXuXIaSM5M+RJHp+ANpincI4MDv2BK4EaeYxoZa9cXC4Tcy7JFilhVfWSigttLou8okubzu1MqxwDxeoGN0RT+OkRtHfTepwy5eR5pHhaWiwKyBBXj0vJDPUNBbe5CZh5Ncw+Tsw0yGjmpGLIG8WykwgJ3ut7JmHP60AjyaIsnFh1oG+ZETqEt7xDqqfYTKEhhYDF7gT23LcVJy5dgc6BPrXouD1pyVLkEzl847Lv4C1vXIAXnMIa5KyFlVAGRFeJc0aChENlio+CIyo5rulmHI4Zc8ly/ZCkeIy+5HWRQkZzIZzZ9v/N18efERlzqOkQxBWzfuMIT297aHOhpNZOoZirRkbtoV5b2KjFKFqLQ0J1Tk2GfJPsGqM2+axQhat86zwPKwmxl8oz+P73H8JH/u59GFyxGFGd1lXoQEvlcf+DW/Dpn9yLx9ctR2KC0MnvdqJ20nxCyt1kvCZhERJxj1mIRk6dV3IqhP3IfnhLaA3NT8eGVEOyGiG1aYSiAUIyCzuFtsDGKNSbrZSaFBOjOBjQYpPMVUWDkT0fx6H7Su/XC+TYGHHlEqoKSYbAIWPG3MYqOUMOK6OYxMupDclE8mfRNeZBGOb2cQIINhq93FtLTrYckjGdhtOVRS2lCa2NQ09jsgKDwkM9mURA0QYFq9KP65U9ZEaKZPBNQosWRQyGVNKXGd2zL1158o+8fbOWW67apWrZ2fbw5iVrDz/ygaPXH/s0WgMZKp9Cwj8KMT2nmu5jowe6KIo1L7vsm2+9+cs/Ouneb/78qHv+4xcnJENrfE+1kNAJzjJFwNpBVp+gckiQs7q6RyobSa6ojZZgb6MNnkujto61wi2p2HEJWH98XMKqcEGnVLyMqQa0vRRO9mSFXcw33YzYiNH7ySM6FFYyryukYyQobPTppiOXkapZ53SA/PZpmOkksKBDqjisUsAeT0qzhMj4OfHhsdqAwPmA81IEnyuRFAA4ZxTwRPZFXUiMVWGPcK5BlzxCzQrgLeuEWeYu+3HYvvh91Ia6UKHv4Dw8TgazAu+wHjhpCg/vnkatK4d7BzL44pW/QJ1gPHt7zenEzPAUbv7h7bjggkGc/EIKVyu0QMOc0OojnjITpeRnFKVpgzZB7yEhHfQ47NPbwrz2vNYcYZQRqtZWAWz///a8mISeujH30A55tJ635gxl02ge9PltFcP4Oa0ttzZXPNAPrmAeFGIq9QjJ12EufFV+h8ek8WKgzU3IhPXw3/aq+bjxu9ejxgNMzD6ZgzhJ1/kL1/4Sjy3uJ8NCjuV328iRdMBdnoO2p0gopAR9YS/8PlUw4sHz1hPDQuSsDfZK+V+XHCetz32zsGZd1JZ2iRPj9KLpszNVTpS5gb7wDsmZ+pr8Xe5AFKhWtUgx0bly5w11yjq2ycFbjUjliGitVKZmYdI+MGALqo5o3VqbhmFxisI2YAWEvJjOQ+Gcvm0CRjGgdUlre1GeUJUP57EDSNUjcZpR3kGd9pxGxtDcOi7VfIuuXD1LxmlVL2wGCLRntH0FgHsWMw4enzqQX9azZOPdN961/lff+tn62y+78QVf/JfPv/vAxIG+2eJs+s9eXiaTzdZOff6p9x9z+NGblg4u29/d3Tt7443XvfLb37vqwp7Onol0JSwMaV07V+cGogPlqVx5TS/qabrchE7Su4owd0yAm6FZp4p7ArUiGaXJBqwnJ5Ge9eGuJS82LyNcwc4HRuDUGqgeNR/1Dpu8FYWSW6cR7p5AePhCCfuSXJoeo1ibnvc5hk8lkaSYHmPkJftzKC9ISnmbe7E8U4V7eqsthYwkV0pK6vVOKi3JfGYwO4SITMuEm4vZwYmknCfGikB3UhZ/wLwg8kgWGRd7+yzcbjKgZDC50JCgh7ZvEmDIv7AL4YCBxIZJ8oIOZo/I48DIJBJk5I4/5Tj4ZBG/8LlvYPlQCWeePiAkSGmv0WN5l2aqR6p+elzhM1uVPwkJxQCYh2x+UyRf5pLtTUZ7s2kqfk8zBxY/tHY6g3yG+XRDddAjribCOIjGMFdV1FuVSEFV2lxTjhZTGKI2SoTWnllv72uMQ9Zm/bBVPYzakloc7jNT3q9j1WEd2PjoAdy3ZQ9OOOlF5AR8fPayr+PHto6JxcuQvW8Poukaii9ZhuR0A9m7ttP9t+EevwD1DBsdB/knphDuoJB+9Ty4C/MEx+syqCM5Ukfy0VFJEURk8EStjIxJam8NGuu0dadlypDFQ7aGpxGR4w6S5Ax9XxLzga5gV2hyG4zipbn5hFQK9fGyDPmoMx/QY8G+CnJkWtyszQPD4VBo5jw0Bo1+DzroHhscKpqwaX/JnurOoEH7haMRZyehrLE66hyiTpcQVWoSdjMHzJgokgOn3UDGLEhR9EKfaVd0nLJg7fbUTLAnVYmKnVZmcuOmR9etfd76+08+9uTNSxev2Lt+3fGPvODEUzcknMSzMp3qTz7m68zXn/urc85+0/MSjtPgxTi8f2/nm99x1q8qmWjAcQlyP0lGZqaEWiehhLXzpUs8gOpvk9wVoSuN4HfdonCOolCbE5FP0iKZqSFYTvF2X0rCQGNrGdHG/TCf14vCkAOr5CK5YRzW7hkUewh99PQgWXRhjRRQn58Fy9BwZZE5mSKKG6e7OJxSTaCa8CuzjOF3F8nTkcFbTO+j3w26gQnyQkHnYrh0XsyvKT2vC5nfDSO7YQzVExZK8pJVW+or+5AeqyDx8DSqPFWmh7zmIto4R+TgPDiF6J79cF+4CO4RZMgo/Aj6hjC8bhBX3fcYVtz0WzJeBXTaI3jjuSvAI5w0zY57/9BGH2jnLbXxnmLk0qIvxLmoqBmaRXN0hbk+wbaKn663KqEt/lPU/Kw/ppcwxNxg0yaFumlVmtSFMJawiUM/MUBB/F6tRSCNWlVCL46l4lA9ag8N9TgnFmfiEcUGLVJGPFSaW+/8y0F8+vLNuO6H18OcDfF9ConGj18jKN8gJxmcPIAkGTLnt8MUktGxTiY03ulLxS6xh7wm53E6OoFFZJiiWYoSUrIuM4/sgZtUWusRfx5Xjqu0qsmZ6vNzPP+D1pqJzP4yMFpDva8TPosZ0triHJR0euiq6s3hYcNQF686kEaGGT8UzmFxBznqNEUrE2jsm4GztAfauoWoLKHPHC3DvH8X/GOHoA32oD5oCuLL7ZxCiZy4sWa+7LFaN1dKLZWHZANISM+jULA2SIiSFm9qXwnZfdPSAxxQ1DPpVGE55lO//d6vX5/r6nZZ7bRWryf+8IbSPzOE9Uz/KG71KJQLHt300Jprb7nmvE989dOfemTPlhNChzDwZAkZWpOdiRQqs0VEnUmK9/O02ZPwO8hA0APdFAItyJGR4Vi+RHB1DE6BCZgWoSLySrNVmHTDclumoA3kUV2/ENoUHffuXXCKdEEp7ueEJQu5ZfYQ0ulLo0E3yggJWXlC5YLnKD6VzpuYEQzjJscSvSHf5vxZHUahSt4pp6ow9ND3z0gnvk/PceLUSpPH4hh0P3mqEr22lxYxoTCf0JZBcD6zrYjkJBNXbTTyhLw687CLEbpLNjr3eRgNCVWVIzKwHiqDedQHctjy899hgTeC9757FaFAX7SpIosXdkrIoCrh3R4iGW00hGcgb2oqPNMOqvQ9Q6jXRE5RM6TT24zhHI/rUBT1Xz2itvfOca0OyXtph9AYDuJkHVw11A4ikGoHkUnnSPeKyxU1iaUthYg4sZ0Kse6wAfzk6rvx3R0j2H/UagQHZtBx5y5yQknUPRcDwxFSsxqm1lJY9rxOBLRQrNE6UvfvlUO5xw2i2q2LgXGmdOTv3w3PbaCxbj6FYum4IdlA/iEygtUafDJiLjk8qxwiSc66Tg6XxfcEqROaSc+QU20oqoNN6CrQmzUHTdChKDLQuSfGSwjzSdXaY3E7T5WM6CxCQm/ukk6khgmJbSOHSAZKnyrSXqijweTVcg02c6k66PsdMQ8hvdZkddKcI4ToMJtAkpVkJwgAEMrq7epChZBXtVImYK9h676dK+5/6IH1tUIhkXXShYGFCydt237OZn3+SdUaHn9q8+Ibfvq9v7j1gTte99TE7vVFx02gPw8jm5SWCi2u+xhVDykyCrVCGclVA/DyZIw0JfsraII8jCnMbV20f0wKl6I6hYMUd6f6uxFMUyh2gCDs0DwyNGT0tuyFzvrtK3rR2DZG4VgHcmTUXDKAjMhCCjvNSG0ITqDrliFVFt4MFoV1vBjcNfMEdnOFMUOeJrflANylvZg+rFfyDOlNo8jvrmJmbR8ay/IU6vkEvW1knywg+dh+1PqTqB45gAYjQPqOmc3TMB87ALM3h7EuHtFOYexsA527SnjPO9+PqXoZV33naooWuqH35lGzD+Bl2Qr++V0rMDCPrkOVEKjNpD5agF6XGFfJyouRsZ6eo2pV/JQRUmTBWDkU7WTQucpg1IauopZhiSVmmgTP6NDWnT9GqiGKi4TNZrW4QtjqJQznlBnQFPcLW/IzCnuH0ksYRc2/B4e07gTxc0Hc4BsItUW93xdkpdQINPVcuo7tj4W48Ds7scHtwKJyFoXhMXFg7/rr96E0MYPLrv8abe68yAgZVR0DEwGqpUnMnkT3d1mXtOAYIzUkHxyFSZu7dnQ/6kM5mf3IeStn6wxSW6dRWZlF9bAeyZemt0zCIaMyc8x8cnqWXMnUJDnL7RQ9DHSh3p2MJaVZoymQog93fsiwYLqXKQotE1UfJQo7tUIF1op5SDy4Bw36rqnDFsGbqaA+XgCGuihMoLVGoatBn+vSvohW9NEeoxAyCJThDiPVacA1JGa5j9B7d42ppDyTvB0bjlB8fJU/m6XQcbyOLs8urxhYuuGMU0//wbmvPO9HyxYtH/3/zmDx8W//zW0nX3PjVef/cvu9r57Uyj2QfqkEOW29JV8iG4gMhenRDeXmYk5i0wIzeL5BzNFS0DgSYlzEnBGK0XyRpyGDQ/A6IiNiU0zunrSEFkcNFi0KawsZhiyhnpeshLt7H6KRIswGeTQeVjCUVs2ezM+xjFZ04hwoQevMSAWEqzT5x8ek2bl8RD+ipCELzH5sGOmpBuoEp6U9hxZReuMILEJNUV8W5TU9tPDS0oht7p6EtXmE4n5aASv66fUdkgR17h/GS3Jr8NKXno7d1QJ97xB5Oo+1q9fhla84B7+848e0XnfjuCNPxufeexoufoeDk04YAErcNcv5hYyEGMqYmHO8JOFdHYKoWojGaOWPWhW0VlXOakMxxsHs+HZj1YZgWsz36BnqOJp2qGpjjGoOMVyxMoMyUpoojyoagjCI5mgMB9EalGGS9SvGyp8T/tO8NhHAYM5oiRHzW5QHRXfw2j6fQuyAQruUgx/9fBTX/dzGJ798O35+20140bHH48hjX4irb7oRI7seg9coko2z0ZHpxE03XY+HyaG463qhk7M19lbgkKPyrAD64QMoLcmSA3SR3F+R6TYBOeMKrQGP1kjEDc+7Cuh4YpKiBjIey/u5lQV60UV68ygZiAQ5xi7V6llsIKzUwfpxvqYIqsztCmMlBXO8KNOguJsyWtUPh/NTd22W5uuIw76l/Uhwfvb+rdL6g9XzEZIx5AqfFvhC7ZGcHndv+KqwxHtQF4KR4pJJh1kYKQZ96Kn+zfjeRSz1U1RqKQNG1/BpR7zwJ2//i/O/deLxpzz6/4XBGh3Z33nvht+eeP1t333zT3/1szeEfQ6MpYRAKHwTlizF7XaDtcdZ5qRBP8kwUWzPtH/uxeOqiRH6qvUl5gUxnDc5Gc5zC2xTILGZdeDTjU3RccrD4+TlumFQjM2FoMyeAsK9E9Bdeu9UlbyRJex7dz7dTDuMe7wM8TY1MlAmfZZN6EsjqKwP9qLaS4io4iL/6AFJNlYP76cQzpHmbGvLKGzyavVlnait6JFzSxLaS+6ckTCrvCQH0OcYVhLOvjL0HeOY39lDIYMt5WMUGrS4y/iHT3wWbzvvgt97HW/45sdRO3AZ/vJtgwAPdZYpya5MR+ZKF+yaMkqhHeeZTPVo/b/RRms4pAqomXMG6mlVuDbDBf2QkAxthE79mQX82g1W9HRk9cxNzk3uVfP34JCm6EORU3Mij9+mSOodgrSCg5BW63coFvdBv0dq5iEP6fjyFduw6tTP4LTXvOv33pt//cI/4F++9UUkF/fSbTGQ5qofhU+TRTJYRxDa76LwrsqFmlkk9xUlbPeX9qC0sht23UO0fQrJ3eRcUzYmj8tJJdyeDJB4bFQQcOnIBXCThMiHS7SuplFYmIM/Pweb0Froe5KiYCURLjJx602GjJ/Jx6Wowe915Pb5qzkcTcj1MPfPIiCnai+ZR6+jPVWoqWJW1UXA+8z3VYM2RTxRk4kit8SMbzm5LCuUpHtoOzKliAsELGLA/DGTDJ1Dx/R2ECIr+njj6W/86qtPO+vHJ60/9d6unu76n6XBqteqxuf+/Z8uvvq2ay8cDgvLNJYKTlqIynRB+7rgshFiGElxtO8HUv1wmKLAxLKko1jrMROY80McyzOVoEn0Mj0ybK4nZd6AVURZg4oWppdJyPinsC+HWo9D+5U8DVdWyOCY9+xFOEJxPPdd0Q2vJzURDmTincMNpYSC9FwK1UU5yQOkmAFfJmjd24H6ok4kp8iAPTUi7PeQvKBPhox1r5JbKFwoezA703CX00IkL5k5UKOQcQJevU5xfkLyZbN2Eik6j35aDfMGFmHNynU4au1aJHJ52IkUTjjyeJneEgobm5dHIBW4HU89gqu+cj7eff4SdHWQ12vY8p2YpabLSC1HFqfeqgi2ET7j/jwZwxWjqWaCvYmstEMS9FrTkEXN0FKb03Vv7+/DXM9f1JSdaSb+JXSJYnul/hZqzVbgqKVv1VSD0CUdELX+0kRU/MOImt3DfosXh5ZSVoyaWHsqCuLkOX8nTykRNA2bpoya9HFGvkrExwYtio8hHxNqQhTWwgaLDmDfcA1Xf38YF33senQsWE7rxYvVIUwxDrV6DQ8/fDdcOubs5DQe3PQItj31JEZH92FGd4USwB9tuyYZgiIaPSYqrLZA4VeO0FZEYZZGmzuZzqJ+GIWN3AQyXUZ285ToWpXWDohUi7NvikKuWZi9nSgs7yR0RGh+NxlEz4U/2B3zA3VBPolaAGusAHuCPm9lHsb6xSjlTfmOzJ5nxVJnXwUhfW7QqAv51EjQmqL9yW1pBkcEdA09K66vsniATEmCKE6YHutu0d6r+/ACnhESKpFN1pdLpyTvzNe2XCjSeqbrRK/3XT9alujfdNGZ53/p3X958dWGaf35GKzHtm5acsHH33nFfeObX4KBtHSb8xCEZJ0QTrEq3eQJ8g4+oRWvi4dhJmByU7Glo5EwpC2BF7pHBkVrxAxzXWs2XSiJlpgIadDDEq02TaSEgzIZCO6zImPIVB99sAuVRXlR4NRrdKHv3QGLUE1xUa9Ue1hnOyBD4zmRjEjqfoo8GJ0zc6NsOoA5UkBybwFBRwLe0l6E5LlMMmRpQoKN/jTqPQnVu0goKTVTo4VB3pMWYyKZJKhOG2OEuTlZ5NwSCmYKDs/ui2a5Yg4nyiKdSiBL4SrL4NQb9dg4kGc0SrRA6Jxho16aha1XkCUvy/rczfBLSde25ZJihBMHNy2ipRQPCLoro6N+l1veZKSHaPXgRdFcHiqKSbFzob3WSlZrrTXTpBhEczhJV5pKse5lbCTjkCVUjb5s+MImkmJTGyn1UEVDmNOIj4SeFELpTUfSraC+syF/NaLGHH0hij8zbsOK4opj1NYwLdXG2B6qTq2o1bHFr+Pj6Txgg82YzijFQqlICFvPIJ3UlX5UU+oodggZ25ZBFoVKCeVamUK1AMzoFoliOm+mxzgNRtQzsOaZKNPrzQJ57hJH9S452ATKi/Nk9ALh7pnjJdiWJblRHgjb+dg46hR9BITgGr2ErMg5O3umEVTr8Bb3oN7piM46NyHbdOxyRkeCIgqD1qd3/CLZU9p0QJEGM9QLYHpxpZ9Qf2cWVpLCzYSGmtT1AjFIzeEirVFuzYvVAsVqT9oNukoMHAjdpWZceOSMeVArK+tyfyFz02rdSdWyRnvBrFbhjxVx2opTb7jyU99814IFC6f/zw3WhofvP+ycS8+7YbdROByEpBgZMfnSHq2Rxa/BdXzhnEQsN2OrxC+T6GRJsa6V3ST10fNW3EGuqb/xBg1jaeQmN4cHnQpTOEZhQrpjPWuy/sxp0vbRjSNvgEUd8Fb0wqEF6G/YhaDoISQ0lt82izotGK7A6eTJuIkzQQbKoBtfWtwhukTONMH1fdOo2XTc7pxSdSR4zz6i0eFILiFLN8+r0vej3xs8UinwBfFZE2kcXtTxsZMIcSWLcDwF20Nwyw8L/nktPSIxJzpaG0Kx6ZuaXsr7x9YijsC0uQ2nNxtco9iYYy4x3iztN3sqtTYx0UP+1gJEeiyYGLfGzHXkxAM1ELYLK2BORTkmEbQ9F8XPsQ6nG6MwlXGKEMRpKi/SEcQGSgRE5aGItT6rXLDqBV0MPyLcGemyZ7gA45mEsHn8WMQJY12J0tE1Deh1nmZLI7IcJxIWnSAMwh+iBSX4Kz4XrrJJWZ/zDD6tTf4cOluPwm7foOMEqgcxiObe44tR5IEMyVh/SxMkzccRDEd/59kByaoP67atcLNlNDrpeLoNiyWS99fJidZgZpKiAMTrIjVFkQD3EC7IokLrLTNclClP0xQ+BmkbBhmljt2zYiRmVnSJyKRVJmM2UYBDxs8d6pBqXsCj7Y5ZpJQUtk0AhBSNBH2npZ0I+lIylMIjVBqGRhxhq7SLyCLpyumAi+Nxk7YojbYJ+EnHSMDtQ3PdHnzvk9VQEFVQLsMar0kDeNBLhosVTnk2Ih9vZAbHpZb/+rtf+t5bli9ZMfx/ZrAe2vjA6jMuet3tI3l30MplFPucRb0oZuZBjg02ChlbVA3YSMn+0zQ0KTUiS8J9V5qS3RCPr0dSFJSkuIEWsmohh7hHUFPqx4K4ROeHQ0rdgUNITp8sCAE1pBvqL+1DSI/okT2wuAmUwjTsnVYbo5fpDVl0TjZEbqZBULmcNYQHZhEkCmsNMbQmE07Ji7hklHjEEo8Jswk56nR8m1Ccu6RbuuFD8lzGtgDP3zqBG87y0Jkqq5DDmUsBaU0DpKElTyxPcrc0t9obMd25aWW4baf1uqahahqpGBG1CnbR05WL24nghz5/8HCcNrWE+DhGs7dPV8lvTWv7DK1lKNXf5owommKYnGOBIZuef3qhprr8mArABgbKsPj0Og+xwQo1EagLxFiRswmbrwuhupQM9R563o2Pz4bEF8FgZfi8iOcONo0dZ6cMOR4bHm7N8kNDjCAbmgY7Ed+hv9NxaEN78KWHzg/Z+KXUucsx6RxjtFVldMzvZyNKzwdyDvHvZG6ShTqsb/8O9eUGIXcKV10KuUpVWBTSRVlCZ4TGgmwCWtFFihCQlzWFaZ4ihxtRxFDtSihyMTPQ6w1ZBu5AB6pZC+nRMhIUGfiEovyhPCq1CpweiihWD5Ch2odo7xScDK3rFfMoIkipQgM58MAIlENqGHNDPTAneRNFSpC8ibAOMlhh3KoWpxUZmInApSTqVY+tFAiY9T9JEc9YCQ45ghpzHTPseMhVTJawEv0bb7/iZ6ctXrRk9E9usKZnp5IvecuLb3/U2/UCo6cXGifeRkuCToK+pDDIWUOOy68GN3lGSolRN5ttqopRzdqibIm5FYElYlgZQXETY6VOSWWrymJTvdMQYTIl6x1ZKghhLpXvaCLrwn1zrENljzUQPjEG0yfI2pODv39GtIc47MrumIbn+yKtwQbV5iRpEKAyj0JaDicpdMyQ8S3RBzXmK5llxSJvRmhctSTDFipjrIkYWojkUzpOpjDzurMK6Ez6ssEaLLPM6CsmNkZGNCfUGRuApqaU1uo39pVqgKb6weYoSUo5okX05v+MZi9y1Ga4ohYiitpy51GbcsvTKUxqpJfiLcWors2oavH58LfX9Xg4CCIcqrUXagqRBJEaesGox2eKChupeGO7HELEqIqvkScGRs1Q9WjTM8Ly5W+qWsXGRVAXGxcK3TzaBIQRKMInhxgl6e+eoFefDJMnn2MoY8IGkGkAbHj4bxT2+/Gx2cjUYctm9SM15YbP0ScPw39zOYktORt+ny7vlywYn6uoDRnxsaRDVNCjqHgXakhd/TCKK4HiEN37GiF5zr1aLOlCa84L5Trq3I5DKJGVRhOTNWRZMM8wUWWZJtOQ/sEUGadqmr5P0kCSDJhd8VAjVM8y3kG1giSFZVZ/J/zRKZGiYXXSei9dE270riv+GX8/w9fiVGAY5/VUfitqUtNENKtZgT3EYEGtXeYkuoRoDU/J5ghtzAviliO1NpgXqVNEkhopwiUjzUKeXm9CUSH2zuDlS0664eYrbjrPtpw/2Ag9K8TRv/3sJf948+ZfvNkY6KYLb0i7gUHQ0KWwqtqXkE0dtnaVrgTEojjpLZtWSR87ZI05z+GlrVb0IdciZvayQXBkwo4mk831WDWBDZUcL1IXj0vFSQrTGpZCXBKe8xivwV4kE7QAxynsowVgjpTlfDgJqLkULDR8OPR3ryclgmXBLP2dCXT9WXiEqkLyflHeBoOkxPAMAUJadDIhIBQ6RueOgqioBk6sgDoDLJgJccZhPhJWTHAkz21HLdaTmkJyCNAJmmJ2MGOmeRzGGQrBaJrK62hNY9QyKpF8bvP/WyFdS39di1GtdhAZU2uTd5mrBsY0gthpIJ5LocVWVGlbRUokT4vm5KcO5W1qsaghh1GaCgXlp65K5BIacijFSEprhoFKml5qgFIg4FDPl+ZbaV2mcI/bpJiHxnkeulnSNyeeyqjFyColoaHPRklKGJYgMDb4LDDDSCiUh6mMXxSTWWMXqkJIO1Z3CJWwVIxEopiZ3ywCyKQZLVTNwRKm+xKeVgj5sAaUtXEYQQchkbwuYSOqVSRZE52coRUqQ2HO1pGYrkIjBO8TQq/R+xspQo4UmUSFCszJCtx+laawqwGhNBdBwkKUTsAo1mCNTMMgZNZI03V43gKUj+yXtRl5riTKpcksmCuAiBGSvtgYWcXXmoGCFRhxD0HUKq3McW91kQfnmYce7Q1eImaglCUCXYlq8jG9eE2yRI2Xd2BaCejjRbo95LhpL5rpFHY+8fjhjmVMvGD9KRv+ZK0592/4zyOu/Nk1H9QofubxP+mdU3ShdFSX5UR7ncX3A0IsiUSGNnIgX4KbieUR70T2LnL76aLrLMFKqCyMxfE0xZYRDpZDcXV9/zCS83qhc/WN0ZUkNMjv2ircbCZhXVMJ7alf2RPU4NkNTC9zYC9aDutAGebmUWR200/HQYkuflR1EdXrKCxNw+q2kd9chD9TJeRM3oxgbEQozC4mpV0n4JYgdrnpLtosphJaYyPWkxASKE/ysSLyeFxxovOwA0WKbOgqPNFNb87QaHP5Hi1ONGtsZQk9cN4u1JraA7riKGlzUWKrsz9GTFGboWhyntolwVpFQL3N2Olay8A050nobXSEZs41AlpTYKK2hHz7sOdWHSCaO4Bq29PRlJETNragK+XpuaoZRirvI8Pd4r9HkaKL8vW2LUbnZJg81q8PMTYaYWoqgdmih9KsL5+b7nTQ059ExyC9voMMI3cmuEFsiGNkimaFKkD7pTIkhAzjGqSh9O4lvK2JWoUWZoWT1Bxawm1Mhhjf2PhFMWFC02NESZ/k0pr1ZXyhVF9Z9YkJ0EaJAtvhEoz5neqakFFh+WFjpgHL544LetMkl9QTEpbpMzXZqTxyntUXtJGCtM7UybGbpRoyZRfl1V3wVs+HR9/fNRm5VRWHSuf+waSQQtmxSFN1FEj0YrFUGg9gZTE+Q90jzjXrY0WEq3vFccwttjkpIIM+nw2PztEGO85AkbllSfE11+LWc07DuLQHEglRH01a/bD2TCGxtwR3MI9oMIuvXPOVD7/ttL+6bsHCgenn3GCx4uXnrvrUxxq5MKEbeWR3TlA8DVFQYJ5IQzaaAYcMUTDkqLmCPGuQNrdNhsBdmKGLGyshcssAz99jDVHuKtd5Sq4Dg25sNJgkq6yxhBSyu+gCs6fqDVSvH+u8bxhG44RFMFn9gax/tHMateO7oZlpdDw+A7dXQ2WBTcaTvu4MIb9uMmiLU8gtWIX6f+5BtHUCQReFhxRjeyNTSO4cE5RU7uAmz1AmpVT7UwLR+UbzojYS3cLIN3eMk/G0RLzfl5K5JglznTWFxmgj8eAHLgmR8XGlgKCLR46iZnpKa9OEitoKc20j3OPnm50kmh5TjNo7V5oTTvS4H699mLIWthmROIzjDaYpqgOH6c2UU9jqS5w7QMtgxYauqbrerAU0oVXUPIfmiTaT7nFuS2/9KUaOkUKPgmkiM67CifampAscRlH0uokJHU88bmDjw3UMD9fQqCXovTnk8n3I5/PI5XIUwQcY2TeLxwuTqHnj6BjwsOr4LBYenoPhaCh6nmS2OB/FWlgmkx5DS1ITbJgCTpwLyjqUhW+oh+bH16FJD1EJeFWzCOe+j/Rkxu2dLBbJg3R9QvDkIGsLHMnTSpMBIfbEvmk0fEIr3M9H37U6lBNnr5FhtrK0kSjEMiq0wAlx+RRC6vtGYZcCwX+1hV1CYfCnSgiOHoR7Ugfq3DBRoONOuxJR+AkP9h7OrxKKXEbGbZbFBidRfd5CigRcaDzb4JFRlE9ZAodVSbjNi2lCow2EyyORIee2N3uY9uribjTMhhTEpEob87VYlomVTGw659TuWdQIbLAEOOuAJSr094kqwmVJce68FmpDnTD2TiG7p4QygZrRibGF/3blp97/hX/4+t8/5wbrvgfuPvL23/36TH1FD8wxgqx84+Z3IWSrPTkLDHVLjM4iqIEghUjNAmR6wwx9m4FMq9dV5FwIdPBACc+IGc/1QMkU99mi2MAtCXY1RFE8nVIfMEdnpWu9TqEcJwKdjSNoJJMUttGFmwhQf2wY7ouWwLDSSG+vwN88DOPkQbXpC7PQ9haQq2oo0E9O1tqEjjQ7iYCgdyNtQnNU+0rDbuv31RTrSc6nRIuf0JY3U0auHqLRYGG+NHlCMpyFKhlpp7V/GSkZTUHcZurpkOhd037PFPfnYJAu0wl0zlVoSh5HVFV1Vqc0WpUfESgMlZGKwphjZegtVCZZyChswSpRuYjzWtJMze0/UtkLFANbU6oDIdcMdVWJ5BCZpYDYuDd4EEbQSUbKxKZNs7jnfgN791awcOBIrD/mpTj7dWuweOkSDA0tQkcuQ2DWahl55vTVa3Vs3rQFd939K9zy81tw1627cPjzs1h9fBctjgAlHnQapOizUsLj0sOE0t433Nb9aJu+qNZZnEnWnuFGNOkbbXqnLS0uzpfZzPMjyFGerRDqUrwsnYxCitH87klEhJq8RR0I0oqvJ5U6QeIqCuXBFQY5fx5FD0Irrl6XFi5jz6QoNzCiqe4bg7lLg5VLoHOCjNmjO5E5fgUKiwkV1hpI/m4Pwv4l8JMOGXsPzpZxhMcTgqLw0S6TURwnJzA/JVw2m/aczDaMQpn7aVY8RISoRLue7zuHvoYulCM+L1e4xppQKwJChWGOooeOhOQAeY3w+bvCF6Qvs38GPhlatgsugZskOR9vQTeuvf36C9/zxou/vnTFmuHn1GDd9pufv7qa0C2OqVmwzh3Ko0FOJDtL3os27ywZH7PoCgw14p3IMJWHTwT0pV1d6f7wBfAbdAwmgxpxbMM3jCBlgo2fQE1dRg3pQSAqjZIH40rE7mk42TTKFPtj1xissRoqp68kpGCR99hJ3stGdYan0o5A31pQwcGj+0W6A8x8d01UBwgtMdILPLlRBlMXyCPyvACehAPbQDKpS8tGkLFlHBMvLHdkUnIPPPoror+X2WDPlJCihcXSszYnH21tLqfzZ/aPt1mgm9JLyTlBIx74aTekmkFRkRqjBj1GUu2VTE1RH5r0By3e6Xok6uaK8CkzqnyJt5J6U6WUwrh6BtNlC5MlH2Va+PU689BCTBbL2DNcxvYdEfbvJXScORYnnXICLv3o6Thq/VFKHecgS37wReW8Y4bWwoknHy+P91z4Hvz4pptw5TVXY9NvtuDUVw9hwRFpzBA0KMXkU2WMg2ddYIDPTCY36WoosF4lRLJrir5+Ah6t6xqhlzBNjq9QIadXR70nA31hj9AFDDIqnJ7gDgv5f1fxP2xOQRDKD2itO1yEIGcaEgqzx2cR3L1DooQGV0NpL1UfJKM12o1UREaqTp/92Bj8k5bBOHwRsnewrlcWlXkU0qXJ0dN5hcyZhArr0mSkymS4QpZjZhFA+v8GHVOzDaWGygOHG56Ep/VuPe4D5ulSOn03imDy8TrhtiOunHBYTsfiQcMu7ZVG1oE9Py9S4vV8Bwjzdf3qP3/9IjJY33nODJbrecavN937QuQzcMaqMMi6uyycx/edLrZlSFZcYl3hE0tJPpAKAo+3qmZ1SYhr8UIxp5UWe5Q2YzKjAXuyLh67liLDx208UzV5T5CMJ+buLUv1pLJyHlITdIMfHkN1sFtaE/R79hLCIgRFN0QbnoLGighHDKDRk5Q2ggotlkyBPuiB/ahSyMCKDWboSIEkkI3LjPpAIG9AD6fagFYoSr8Uh4uswGinMzD6e+ByBRRKlpZhfJogPlcD6110ntW5fE97tIc/AwMmyEA2bIwYZQgChSe229LfE8tj4GAqhe4dNKawXXJd5KT1mKIeJMgI9eDAmIHN26awj8KVSiXCth01CgV4wEiH9OPJGHfYcJwuDC5eTkbqMDI4x+Coo9YhaSXaTFTQMlTaIdqTB1W74+plhkLFt7zlLTj37L/A17/9TXz9qivQuWEGJ547BCtfQcPVFWtKEurJNnmbZ8MZqCyZARUiGvkkzAR9S0Lc6HcIafRKZNxghRGK+rKTNYTbyXAQ+gL3/nEIaNsyFSfsYma9iZKpeHfcjsMlVGHRjxeRmd+B0kkDtA5ZXYRHykWoNKqIJkoIyQl4vQ7yW6cpNCWDs6gPXk8axuYD0PtWoLIgiyxFJdFoHQ0K55AwUbQ8WJNVVHtSQtExCHFZtD9rHXmVuuARe5w/JmfN4+6iFi/SgEVgxJ0fZyVMNePQIIMXOAmpdvLe53Y6l0LWKj2SHJlRNHPnht++6IK3XfjcGazh0X29j40+dZSRIctJiGJ2wJLYmvkFGhkMj6yo0HDKdYWgGK5wNY0sNd+UoDetNKboAqSqdA1G6ILQF6h0qnHPiRp55XGK+8k1+2TEEgRd7X2zBDkpbOiixU3vSTw5A8skjz0vj5BCvyRdQDZk0WO70ehPwj9lEHUyLExC9eg4taYMLUNbm1nuNhJpizxSg2GeVArlBQlL0SRspinQ8VggLcpK0tRx1flzh7q5bxoWJ1kJ1jfoxpuMvghxTCVUS1GGexeeKih2d9SW1P6zQVsx0ZPguiEFCk1x4ej5Yi2BsQKhkaKO8UKAAnnTGoU2ddooDc53kOH2CO1yYjuQYdYUDlJYUGVlV0YXThIzFRObt1JIkl2ARUtORHf/MiQ7HLzo3GVYuXQxuns6pWqbyiSQSuWRSiQpJNcP3vWtkDiYG6X+TN+kDcKGLc6OLyGpTajmve9+L854zWvwd5deih9/9Zd4xQVrkOwix8m0FwoLdY3uKc9kfLb1mwKVFXN5tN1KjhrMmPBLhor2Rnr/rPQeiohRjlAOIY8wZQolwNdVeCnNxoFyAoky3S8yCszJ42Q+O9XSQI72hCWdGI2cjgaj5DADl9alX4+kZ7BKIakxVoK3ZY+0tiXGq9C2jMFd1IXG42NIb6XwtHuIkF4KCXLICdpr1WX0t2wCRtqQIRPRQB41piKRwfFYL4tCwAR3hnBfLzkdN2FIiqTmhTKvgPc9p4JsHnrRo0vDf4oiruq8UAxvvTslPE2dwM6GXZtOrJSKdjqbc58Tg7Vt1xMrZoNyZ2omiSp5D07Q6YHq5LYafBFpEdBPtqgea1DF4YRJX4g7xblvUIvjXIesuUYborosL/kNLqsysc4nVNNY2SMyxNbOKWkiFfkOnt6x6QBdsDoC+rtNoWBqzwxqy+dB5/FIXay4aCHDo4cotOHEvs6dL4YiPPIkZg49XVoAjkUXvlITZGXyaHsePUA3xjdVyCCNoNzCQ0bH41J8il5IC8voy0iztjtbRepACdmdBdQGsigv76K1ZEoeIIrmWj/+HP/JxjbJWNnsJCzsG7Fw+8Ycbnu0hsmKIUqmqfQCdHQMUKiVY+1+epjSbsXNuradkIdl2Gr2HPeqJSMK5brxg+//BJsf3oSL3vMuvPOi87Fw/vw/8Kx8paAQ9x9FutM2RQcHGf7fF2brzQbnuAeyOcl+8eASfO/q7+CDH7wEv/jWd/Cyd68lpNyQnjjdt55lV6CWG68i5nDVbIW0mYWhUciVfmpGaDMsLVwf6kKYTYr4oyp60AnR+pGhUTHtIYwNF+8Nb6oszPeoKyEGy7Xj0WEUKXDzMhejPGGiq4GpTGKuswpuD90ren04yXrwhMB2j9G9JyQ3rxvYN4lgZBr+4m4y5Dnou2eQ2lWQ31lZIkfggEf1NZZkCTiTsezNikiAVeBw1hZeZCNloYOjLQpjfctW8w4StjJStDbcHDknNnyhau/iMLHOgIdC3wPW9OCO/TuG1q45attzYrB27ty5InIbWopitinuTQo9KWV6DVcKxwGdPHeA85RkdMeTh9mLMzLhlh1CMaKLzqXrsYIwxrXeHJyAp8ySG9k5DndeTi6YM1ZGdk8RZZalGaCQ77ERWFsnyCs6qE0VpVRcOGEIfi6FMMnM6IawbhucVmWU58c67BxUcHl81oXJEsaLeuUiNliMj6tltUgar42ASYaK1MdN21JytxQEZ413NVySPBktEG0e3cAFnajP1ERTnhOc2kLypiu6EQ//fVq6JXquQFa78Gfrw4x4ON3Bny8iNDaPL8zi7q0OrrlDw8O7NPQuWo9TX/5CrD/maBx+2BrkO3JIp5J/6DAc+ffVr3wVB/ZtxDXX/hte+9pzWi1ozQLmQYW4tlahKKYUKO6VqjCaB4nzqcpb1OIH/Z7l266cGndCNMUgOM/1hX/9N7z+9Tuw6a79WPL6NNw650a5layuwptojo6h/Q/jdwndyCmm6DMzrmo/igjtZJ6YQmVihpBLGsGRC8nwWJJmkAnlTEPwA8U2Zza+EYqhYgI0N/AHrDJi8rRzpUBR7OTqugY/qZrUuUAVseHLWvEcRsWxkv/heYh0AThVwdQbrycHrZhBavs09NlAqCTZR0dRJNRcWtmH/HgdGQpRJ3vo3i/phbm3hmjbOCwGA90JRLQ3WfmhOj4LrbuPDs/JLxsWD1gt0/6jSEg6UDjfNU2hIwEXlmI2eHoUGbSAW4U4B0r7L03Ibzaopnft37v4OTNYTx3YudSiMK3aQQuINm4QJGmd+ARZK6hwwzaP0irW5eZX87asH7NqSquCl9akBYF1pNP7qkhOV+FxnxPFstpoBfZjkyIz7D6vW5o8czvL6O7sQiHtI7mjgGO9DuxyXIx3081d3Cl5KW43MH3uzzIk4c4ESp72zHQnmb7M5FQyRC6P2J6gC0gezp1Hno2gavZJn24UhGDX4Aqh5cOZbcAe0VE+TFXKWIxPhlxyuV24JqFU2XjWGy+raq8Fo3tACH7OtknyPGSY0SthltY+sUp7boxVGCsYS8jLi9OIGdTcC6TVhR+kx2GSwXMqzG7c/1SEr9zqYvM+Cye/5K/wjX88G8ccvZKl4/4ovbP2kOwzn/kMvviFL+Lyr19OxurMOdSj/f78nXbQz//aQCja8B8Ab1pH0w76XKZ2mraO973zfXjrP56DJS84Eg6jZqOimPlwFEOLUJ4EBWEqltwJ/jjfwfmlQIU+NTvOx46MIvCSMFYvRIOcOOu8MQ+KlW65u4MraiKXzJw135QhpiHdO27Sz+6sojKUgpcvg7n8ZoOuBFfq/ATqfYR8K3UYG2YQHZ2CS3sy0bCk9Yjdth4q9MtcK5Y9ZmfumrQHyKiU184ng0J7kELCxW4KzngWW/Uq6l15DBK6rT81ifoRfSgf1Q/ndyPIPjSB2WO64PdkKaKgSGO0QHslT+EdGbGMjhphitQonXefjnraRTYZqi6zUl0pB3NUQ6FwJZmSnLXGbUW8dslW7BreOfTfVrb/pxtk/9jIcuFB8SDHSMl48MBFm3Z+wPCTuT10Ier0Jep5ZrITApsokQGiEJEVEpImfVEP4Z5JiomTmCH0FG7Zi4Eds8Jirq5egMZ0DfmN09Grj36pX5+oYKhi4aiORRiPqphY6MBfN5+sdkKSlNxKw83TLIvBXCFp62GGu6kYvRqdi0kegkMLDoE4YRjQTdYIZuiVEJkCeRmfoHqjLkjMmarCkajEkipNYrwiN563Z92KVQUMtR14ITB3jPNbrLNVP2kJHK6wDE8L96yVX3kOw0PJjXMDMBkozr9JKGAwoqxKDo2nxAjfii7XaLELH7zSx9u/lMLA8gtw40/vxuVf+ycyVkcqjlQU/MGp5/bc0ec+9zl8/vOfx9cu/3eceeaZf5ZhcNw3gFNfdjJWzl+H3Q9MwiYH1RCVCS7u6IKwJW0gCrShcAL/JwiLizmc22Fp49TuKaAvi9mTBwihOGqga11J6PgxhUFYIFo8bZEdIoV+tqB+NQXK4KZiMmQua60ZLJtUQQ1VWLRGQXuFq+ocERhcTNg6SifQEMqBH1eqmekuTixS06jDIJBiEaumNNYvxJMLNFQ1Hy9MDSDNPMp6gLeufpmXvHsY1YDCvOU5ZGhtdG6vwHviAJxMHmky8FlCjQ7toUbORLEvgaBcg0MRjBHYtD+TKGYI1U3VRY47tBN03qGQgIUXyQ3nji2zE/cO713xnBgsjqXHRkf7DY1QEutcISZ68qigKv1MOISUiujX0wT5UuIJ/CeHsdRNom9gIWodGWCsgvzWGSzQc5gt1rBqLLX5X1558aVvfPGZm6erFbjbJ/CC4rw7v/fBr72iIzfvW4tXrQmOXLwam0a24/GBEC6T7OgzuUlV+pu4R1F4KfHATXpk6jqhIUPcO9MMnJ0z4q00Rxcvk5hyEfL4LHqvTQaqrqubqLkaksVI6U7xgivSxR8vqv7eZlUtasqh6JIQjSI1BFPzXbhWiMraefCXdEsfYquC9RyKu/J34KZpKTvL8Fcu5jn0PZNSiTV4AjQ5iZs29OK1n7Kww38Jrr7xRnzu61/AqlVDaERlldwVCRwjbjv5w43WV77yFUFX/POss85Wnfl/jv9ELDMUDah3vPFC7LqbNnbJFloHr+FQV1r5ivVqxNSNP97XKB0sxF0ahPYP64e/okM0tVzDiyV31CPU5/7f9hUj32c0MDoDh4mihildI06pKhyJZI2boSnU5NxvWIc101DtMoykWIG3QpEOrXXOozKRVUT1fMXx4ticK++B1jRiHIaGqJN3dpd3Ynumho3j2/CSNevQ1dXrLV5x1Ke//L4vnLVmNL2htHcck14N73/9O++85JS//FSqoO2uUKg3HzkhX0cUPXFD9/JFg+grEkJ8ckKCOKPDQV9ARnWiLBI4hvTqhqoRii9s0pGc1vDoyILnxGBV3Yo5PXag1yB04jmWiveZdMjyrCGhjMlprM8NPPG8JatnpijOHZxKbf3Ay975j5+86O/fPTpZgLdnGscEC3576XkXf7gz37P1vW9+z8fv+c6vn3/2a9581U/u+I33muNO/+4PL73itF/+6O6XvPL15/zyzFef+SVCZFM/GtuIyVUdMjPNI8Rmsc5OqKZA+7EHMWJZVzY0PrcB7KuQ4TFksrRVD4Vlz2Ps2Yakp12kDjCBtRNurYqgg1Ae87m4xdAzUEsE4qGYVxaaptxk7mVknSzWAuLPC8w5DSeecKL0nnxaV8xjUeMdnmtjpQ7PFRnabMJGZsKhJbkPnfwxJ3pnoxze910LH/3BfJz/oS/jRz++EccedwK9ry49cDYTbWWYY0jHqcp05P8qDGynEfz0pz8F96R+9rOfxXnnnReXuJ8dXlPzsw79TP7ned4zGsZnem3zeS1uLue/vv51r8aa/udhyy+mkTOS0mbi6RS6GIS+ddXSo9CW9kffPpXDAjrqEAMxkzPU9OTYaMgqMeZ6RHkdMUnTYglvxvi0kJM8kakSKAFL0yNDRWu3RkFrNoGEZshYMK0/j+T+KuxZJVQoTQQ1D/maLtVwzk1Z22cQjFC4aBjiaDnsDJrDdXVF4bE4L+bT3p2Xwp4VKdy8/V50L+jecdqrXvONv3zL+T+694Z7TrnqA1/7i6NXPf/W2279ZXjpBZf+y13/cfuJZ5/xpi/n5y3c9PFz33/J4dPZh91d0wRAKtGXP/pvb7rg2LM/nx8LR0p7Z3HsuvX7V0a5naDIJmp4Ihldt5WmvkdGVqdzGxs70Bf9N1f6f5TDmilOdDXKxX6fG4lZoC90YZE30gmluAQll3T3bfrqx75y3g9/eOM5rzj9jdvPOeOsm7q7espf+Nrn33LMivU/ecfb33n5K192+p2Pbnl08TEnv/SWk489+TE+7m9ve+DIK7707beeeKL6Xdj0v7tn7TsvfeeVj+mTfcGKTrq+PlK8CLip0mpSxQ2lrcXkoShom5pL/0cX0FqeJyiqS+XEqXIvYyAd5z4nDJmlO7AA+uiENCYbVYLYzLXiBGhUFxfAOt3c6sALh/kpAaHHoD8n1p7VBzT2gLTYJSykz6zH3lqqpn8y4BAq5Qdeg14sQuc0hDOzfT8Zq2+X4c9/MW748Zdw2KoVcmIeV53gxKJtzQS4kBLQZmr/y1DwoYcewoUXXoiLL74YF1xwwbP/vdpyZPx44okncP311+PRRx/F7t27kUwm8ba3vQ3nn3++qGUemlObnZ1FvV5Hf39//FygZk0ymknZ+OdP/gvO+pu3IpHbj8WnrkCZkGZVcn5hS3hQKGX/g3A+itUqOOSTVrVAGSnbU43fIjocxI3CRpx/PEBrMpuEnjOEw4WGaoFhZKZTqOdMzaJEaJk7MAxCw95Qr0zDCT1P8rOCqijKCQJdeFA2GTlj5zS0lb1C1DZEdIDzZIacA6M7jgiY3yuEbA5IUyZmV3fjlh2/WzV9yQVXX/Wv375gxYpV+972pr/5wV++8fwf3HHnHcc+vOWRNS9+4Usf/vaXr37fnXfdsX7RgoUjF73t4n//4a0/eNW3r/nWO9yyd+Cb/3rF3354385//dEPv3d23avb7zz/kt+85R1vuqkcuosM5p0tyooqhMezHFh8cHZmQaVRMTJOJvj9yPV/IC+za9+Tgy9/7fM37+qyc8ynst063N1jeP3hL78pCnT37W/668tf/arX/fqgpHAUaiOjBzoXzn/mJkc6D1pPBzeq3P3bu9af++E3f3+821uhL8gzbolVZjipbIoXCk01WCFdJ4M1RWFbbwa1tBoqmJwgGLxhN4LnL5IqX/IXu+G9YAW0RhmpjWV4tSK8owcoZKUbu3UEPSkNr197BK59YBMsLQUQwtq7fAEyj49Ky0F1VR9Sjx8QI1lZq2a5WdywW/PFswX0mjS3NWhc4jWQ2RLh6G0z+O6Z01hA8UFD1+YUD+IJxHM6UtFcczIQj5fHQc3RrVRYq4F5jripczhoBZK/M70ELegaGVkH9z3ejfdeWcZpL38jPv6ZLyCVTpJNd+NhFGj1vsk90Fs3Kx4Zr/1eI8J/n5qawstf/nIcdthhuPrqq8VgPBcGq2l8/v3f/x3//M//jMHBQbzuda/DihUrxIB9/etfFyN20kknzRGbXVfyaddddx0ajQbWrFmDT3ziE1i3bt2cIdQ86V29/4EH8b4P/Q1K3SWse9Vh8PpclEKW7+YKnmrM5gQ2ZxtE+kZkboxYA0uPpXF09TeRyolEyiZgvfyyj+RVDyNarmF2mdKg4mo5G8D0ZF0QfDWtcjjM2co9NI5GZwr1pRnkNo5J21B5aR4L9lJ4OEMGKRfh9KOW4sYHN2PWzcI7qksKPMbWabhMLzqmV6gG5kZCOq9ZhsQYOeyHJuG+YCmqWZkggY4pQs9TdRQX5RTfP1DyMtITGSgUyH2VbDCDvdM4otG54frLbnzjYUes2/6H3DOOssZHR7vmL5jb6837+M1vfe0Nv7r/12dMTY3M/83+jadiSY+MuufZimvN/u2/uOW+53VmO+vPakjoex6FxZHGk2d4lmBA8eubTz7z8qu/dM0bbrjqh+ccaqxUlUiPfp+xij3iQcbqll/85NTzLjn3h2Pz/RXBQIYughdvLCXRwakpLZYr0GMvaOydgPPkOBkRmT5JBoQljG2Y+3lkvCW2wea5hXsKSEQpOLkM/J40vG0H0OUGeP9pR+KvT1yFU4cW4Iil83B4ZxoGfz+m9TG64twAC6tlHalKctk2XY5gbxxFaqwic9rKXN1kT8/NsfqfLo/DrcXiPX1CTIYPLa3jrq3d+PBXXbzl3f+Kz3zlcjFW0oXC7U+EJvUoFuPjDgM9nONoauHTmxyf4d+nPvUp2tQ+vvSlLx2Ebp5tY8WNzR/84AfxT//0T/jIRz6CO++8Ex/60Icksc+/L1q0CDt27Gi9b3x8HGeddRauvPJKXHrppbjqqquQSqXk9ffd95+tKxaJvAxwwvHH4Nbv/RIn9Z2KX3/jXuz89QEkqnk4BksjuYTc67HKpBHTLiKhVxysfHgo4o3ixv6YBR6pEV98yaUNitawO12U5LjtsmSOoZweoStnnAyQG6jDB2Q0ac0dv6AbQ/R4xaqFePfxq/HuU49G93QF+mNTQlzWM0kZvcXtP1xECgxTEts6z8V0TKnM81k5vonwiQm4kwU1zTwKW43siNUyREGCDS4rkQ7msCU9dezZ7zzzBxsevPfwP6gARJFOu7FqR7wXvP1d1333699/wzVf/M65r1rx/Oslz1WgkNY2eSSZTvfafNZzWPWGazfCyKoPT+KE7pW/uOlz33/JtZd9/8JcV1eNm1H/t/9+cusPX/SmD73tJ6MLo8Vht6NImFyiNSzR3NajWBw/zjFwkbJI6NIa7EG0fwbmvoqM15JSMV0IVj7kRJeMc98xg/4yM+dLqDkOQjJwpy0cwPP7ejC9axxho4jXHjuA9YssvOLYQdijMwTFORdNn1vyRPnRF70uMlT1EP7OSboZFnzmY7HMjcd5NGtODRRzOuAtKZjnIiTUG4L4BKw5AYWBHfjoN2Zwzgc/iQ++92+aKFfNVQU3DDvi3ZtDVOMmEkUDaM4z/C/CwQ0bNgiq4bxVd3f3s2qsOC/Fj+Yi/+hHP4rvfve7uOaaa/Ce97xHwsDm5xUKBcllZTIZhf537RLDNDo6iptvvllyaoy8vve97+GUU07Bpz/9GTGA3PrFxYjmt+wmY3DF5d/Cdz59A+bt7MfDlz2AyXvGyJikodtpyf+YcvnCNtWG/5qCwcoGPIVJlDF07teMZy/ydBpuLp7XiUSJjMKOaUFSvK6ZqW5zz2y9IV0HXiOUwb3nHEVrcmkCp6/rwGy9hil6z6tWdePEjiwae6soOyH6yaEuGaXP2VfkLhglPDDpIWKSqS56FDC3U8jJ8w6X0D0jp8uCk7JPmCMZj7yT78fDW0I1rFWj89yWra4788Kzb3vgwbuP+F8Vh5giRCe3YPGSsR9dffN5133kG689HL0b6hMzKGu+5TVc61k3WNMzhe7psZnEOc8//du3X3XrGae/6nV3PluLdeOmh5e/+xPvvaqyMNNh5LOilSVRTxB7Laspr6y8ZKboydQOvsr1/iwigsXWUwSly1xCpXekeHJuDZkJHxZB/ETBxwrNRtopIntgBodPuXjTyUvwmpcdjg0PTmHbeAFLFhLsXrcQRy4dwryAaQ85mawT0caokreC7dBCtGCP1KFNVBAN5VHLkkfzDEE54rHCeP7fn6pcHyt2+ok6GkEKl34beOGZH8T7Ln5XbASiOU7Ss/Dvy1/+Mk488UScdtppeC4mLzWNFVMlONy89tpr8bKXveygvJYkYU1TjNuBAwdw++234xWveAU6Ozvxs5/9TMJAkfuNE/NnnHEG9u/fh1qt9jRKhrTP0OMlL3sRbr3hFnzx/V+As9XGQ5dvQuG3hADqZOCThFz1imzkKLLpXvuCUH6f0bLZWLFEYKSawTl9wbSJjKs04L2sDXeoE5nd00rqmBwIS+H4BhmPWqiULmplrLANrBtcgNceM4AeWt9P7ihgF0UFr37Ncpzz/PlYsreAzEwR890QyyMHTqmEhN+AVawIyTlMcUGBB/X6MHZOQOtNwe9OSjWYW9yyxUhE+ETi3ZhTPjNE0wuSFw4JaR3IBYsuuORv/mPP8N6eZ+Me87CO897w5p/+8urbXvrCNSf8vLR/Yn6pXMo96wZrbGK8d/3a9b/49r9d9Y5cMtt4thbp2ORo7q1/91fXjOfcobDHFuUELVTtCtyz11nTZWahSvnoojTq76cQkIX2uR7G3K6eDlFgNLn9gPuZErSgaYFoO0sYcDJYktCRmC1h7cJBvOXkVbjw5DXopAW9ZL6J1Ws6cf/G3Uha81HeB3z/mrswQItuWWeAjiqPJavIaHruidIJshsHCnAcG43ehBR/nCp538f2i2iZsDijP0F5sO1OmuS9LdPBT+/SMN5xLC79x48dVB17tv499dRTuPfee3HRRRc9N19FV4qmbKy++MUv4hvf+EbLWB0aMrIWFqOoyy67DB/4wAdw7rnn4oYbbkBvb2/LsDUrlvfcc4/kvxKJxDNyTVmTTRjntJHOOucNuOMHv8K3Lr4M8zbpePJr/4ny1gpCWkOMShwOl8K4LP+0e6wudoMltS20FD55TZiFBvTNw7AbkAEmjXk5GYeV2l9QTQkGq5ymYEyGyPvAymwW3bMBGe274RfJ5Zh53PvwE3j+cUPoTScwYNq46JTD8Dfrj8CKbgoz3Dr6c3n0G0mYFE3wdBtQlBHaNuyxGtIUJQQLcnAdRVA1nhhDMFpQDdXxGklVA+QJ6PCwioalKDNh4EFbmMWWcGT9X3/47VfUqpVnrZdpft9A8dqvfv+Ni3oXPTAzM939rBssy0pMXvbZb74vncr6z2LCApf8/Qf+ZdPMjhNFJyuWrAhaInAEl7n1ZfuUmqsXrxGjM4PUvlmZ1sxJpVpPSvoAE9NF0a726Ia5NQrfxktYRnH+II/kpgU2lOnB4jTQmaihxlz1sIGTjhvAgdE6bv7ZDlx9/V3ooGO94riVOJGg+MpkFtpUiZCeL3wlbjvSyYgFnRQOpnjcGAVa2+j8ePIvV3DCWIs+wp9EnUGklsmwV0o6rrw7h3dfchHyCUedq9Yujfy//3fXXXchnU7jmGOOOaiCd+jxfx+94L/7x+EcVxw5N/a1r30Nr33ta5+Gvto/75JLLsEtt9yCn//855JX45Cx/XVCdN6/HzfddBPOPvtsQWVPP69IHFyzM4E9kE3O6IyzzqD33Yx/esPHMPudvRj52T44kS10EVdUJp55CzUHr7XUqqHoDKy+GfE8S1rHjMa9jIVqZwJ6qSGESl/ew7MFp3EkPX/iUAavPGEtGokUvvEf/4lbf/M4Kp6LY9auQtDwRSGkO0VOldZgTy+Fh2RIl2e7sdzqgHWAEBaLANaqck6JqbpUDhudqsnbGp6VqrfRlRWjasT61Nb2SbgHJqUgJB0UgZqSw5xHY3EX7nz8ntd98vP/cMmzuX7n9S+c+dw/X/aB6v9j7zrApaqu7rp97vR5vXfg0TsoRVDAAmoQKfYaa4xGjcbEqDHRP8YSuzHRaGLD3ntBVLp0UHp5vdfpM3fu/GefeQ+f0hEQiOf7RvAxb+bO3HPWWXufvdcKB839XtYwcfykuZqq7lfq8NKbL0x8Zc7bl2t90yj5xikql+hQE7JKEVI/cFohr6tFLIntQOlORI0oIml2qNZWONY1wptih88lI1mSYPpCXIsrhcX1pFiTKhowmmqhu23cQskqhBE3qNRBZBtQiM0lD5wODxpqv0aMMaRjTuwPiy2OaFBmNDwLm7eUw8KALzktCeVtEfY7AldRjJHzCeWuawPQKr0ID8iAqZi8p+r7ejIHdgiGCsFp4OOv2KTPGI6Txx/L1iD7XILCrVT35xUsXboUmZmZcLDdf0/COkrMr169mifGV6xYgbKysoQwILtPpBhKjIf+n5hQRUUFFi1axBnSG2+8geHDh293WrijUVJSssvnUUEr5dp2VoG/TUm0IxyKdwj20RrWrBb88tdXYmD/4bjsygvR6P0W+ul9+eeidprodt9uYmlQ0TI1JwudPoiMvfntEix5SdDXNUBPZ/OV5I5cDEBa/XD44/AF/Eh26Gip9cPqD2AAnfoJEaRlZyG/0IMvvvyWMWkJukeE4aPd3Mag08c2XcbqNZm8XpAcNBBsbEKeHkeARRQqiyj8JDrgi3ADFVIukX0G7OubEEq2IcDCQ6rB4qVJLGoQ2PyO5yYlGrApqBW/K36mE1CtIBkPvvGvP5x4/Mnvjxk+dr/Z0I8fO2FRKBwS9ztg7W+wamyodd3+wK33RfNdIgcoMyE6y+V4SXpJFhN9fCRyVm+Dne0AYZcVYXecW9CHMtmkJ6liL/VHsRiebQsB6husacZwjxt9etiRk+bGZsaAFi7eDD3JQjpobKLJXHBOZ3F/gE2W59+Zh159MjByaCGbqGxX8jE2ZhfwzfIa5Of3eX3i5Se+5/W3e257819/k3RFEmMyomwXVtis1qhhm+2CgUzG8Eg6VVSgBY1thp37s+N5R4l7gQFyNCrihcVWnHLmJOiylR9Rx8Qf0X+1k1FdXc0BZbenyWxBP/XUU/jvf/+L5uZmrvZQXFzMHwROlPymOiliVPQn/YyAh04DJ02axMJtbY8ZWtfn/RC01q1bhxdffJGXOVByfkevmVBXSNiVkTKH2XEcIXOtdpMnyQcfMxjPPzsTEy+ajti8JugjkhAgWeyYtMMarAiBMJ1ysge5ndMmTK9F7Vu2dU1QWBgopuoQKbfFpkzYH4YjEPNdc+kfrzUN2Vj+2pMXNdX7R3crYCFsrB2edBtyThuKz77agOdfnYOpEwbBwjbehO8BAysyRYlGWZRQiTHDe2JMhhtlDAgXV9aguqIBUWJuRPrZfSB5Gc0bgbdHaqI7gk4oGaClrG1FICMZEY/OO1d4mQLVb0UTBrmGGEPEyoA9RbPdcvct93zy7EcTNas1ur/mlkWz7H+Gtb/Hw088eMk6b2VpPD+HMxO6sWFLolyBmqhJXZQ8BsOayZN/9uW1QF2AgZOTWyVJjOWQJrgUJgNTBYKiw8olavwYzWL70lyB6zUVDC9gzMCCjz/dhGoKEdPJUCIFCDjwzDtzkZntwvjRpYxVeWHSUbNFQosQxPKNLe2/e/iPfxk2dsxyr7dNfv7dNy6qaKjuJVjkhGMwtWwxRhdK0iCQVAt5tLQx+s9ALCEVLGzTRe90w9pbAOPlsWZCXyjEEFIzJN5yYSgdc0U2sa5axpZgGu49+fiO3xF3cfD+I5KlLKSiMoFdlSJQopuKST/++GOe6xo7diwHKgol97asYXfsqiub29Fzn3jiCZ67oqT7D5PtO0g9cT66vVWjwNUOegzsjT9e93vcevdtSOnp5m7fUmwHL8SNMs2OV2P3q9yLaG4KYprBjXoNO/v+KAowTJ7CsLGNL1TVikHFQ2ZfeclvnqRXecvhqp95/9Uje3bPEjUzcd12u4nTTi7Fex9sxKtvL8aE47pDob48KY6qmiYiEzjplN4ozPDAYNFVHotEJDmCBSs3wyWykJELFka4WmhE0hC1qYm6MPYh9XI/TyEEc3VeQPrdFyLwrpJows0gMXXZ2pm3csH4F1/675TzL7zipYN2uPRTg1VdXY3rvx+9dJnJaDI6jByjvGGZnGRjsDeGeYI9yu26GGA5LYhbNUgNDLBItkNOSG3QiQZpwcejBpypaUjW3IhVtiecbtjrKWxrkdluNKRPKmZM7YPNVY1oLGf0loV9Hy9cjdQ0J06dUMpuPgvnFEbbVQv7NwWby+qQ1fPo9wis6HodDpcx4ajj3jTaAshmNJ3U67hmUTTGm0x5nyyj7CKpTpDQmiigK8kC9qjEaZc3rNMjgo6lqeLfpGwt+3xfrpZR3G0oChjwJ1gXDsg5ZY8ePXZbJEq1Uq+//jo/3bv66qvRr1+/vQKrrsCyN7m3Hz6XTgQp2T5t2jTex7Zb6vrDv3Z2sHDlg8S3P+P0ychNooMZEnCUsbN2Eu4NTcf4QoepaHNCvoZej/cumjEuSkYnuJnZOYg1+DH1hCmvdv7+CadP+0hy5yyoaWiBzjYIhYGaxEJ8mxrC1Cn9uOv1/MVVbJ6q2LylGe2MpZ5zxhD0Lvaw54UYMMags+eTrnusKogcTxacNg9RX+6hSrNDTTQ7QmSbvcJIQDjJyqMKyiGTxhX1IKqkpkKtWiI6FIJFXodmZtjxz1eeuiocCon/M4D17OvPzCjz15aQHxs1ixpSQmojzh19GRCVNUP3MmzXpQQlpbvv0GBpCXG3ZaLclFhMqCawydHsY4u2R2NOSlHNhHGTXly9sTIoSOy1WSwvU89SPIK+PWw4c8pR2LSpGnOW1qIh2IYpE/tAI7bGQEdjz1PZQ7bY8e2GFpw45awXul7zySdPed2h2Jv6FPSdbfgMXmNDip0SqVUk3DW5lxxtsOZ+Oifc5k1IxX+8J4mMMaiqnl2nqXDNt8+/UTDuuPEd7Cp2wLJnffr02WlI2AkYr7zyCo466ij++GHIdjAHARa15uTk5OzzayScCjuvP8bYpR2D+g5E+9Z6rnm+s8Fz2GKiMZ5yXRby3TQk3veasGpN2G6p3jh6F/b51OVIqT9+7ITPtoVHuiV2zElTZn6zvga6ToKJLJSzkLGFCLsljFNOG8I21GYsXFaNCvba5545At2zRT7vFFWDTg5WbE1trQg2Thp94qt5afn1BRkFLQJ5CipkQGxw5kR9yTI1+LP1FHXr3FqOoypt3K0hqFubEiedvKUpoc9F7B7JdiyqXDvy/Y/fPe5/ArCCfr/6zLsv/lIkjWl2Q3UW9pGqAu8BjLEQ0KUhwliOdUsL1wyKqgmjRjJwJLcXst3m0ilhg2tcU4+WuLklPv34aRc++NdHhj7+8LPnwZq2qLamne1Q7IZrAnvY2XspOHZwErKK3Xjns03onp+CrBQHZIlussBlejWrghYv23GE5DUjJkz6out1H9V/6Io//+7OK84+7cKbpPaYD9GEGagWTKhKCmF2bd4wr7sxxe8AR/yROfhYR++X1FH7E48nan0kKYpNtRZsCmdg3PhjtiWRE8dUxn6/b9Te0nlCuKNBAEGJ+WOPPTax4H9C5QZK6mdlZfGTzZ3lvPYkHP+hwunQ/oMRqWpP2FMLu15cdPJI1d9Ca5DnFfmcoIQ9RY1eA27DUn7x2Vdcf+fv77qyqLBHZdfXGHfytLcYwWqJssjBorM5xoBKV52MtWnIK5SQkm7Hp59sRd9BpejZy8Gb3m2KziIEDTa7hk0V65BcOOSdJx6fefb/3X7fwAlHTfiduakBFjpwIudnkmYiRRIfCxMpx+bUtrngKsGEV6iuW1lYqXIyQUzT0hbhRsWU9zKTVeGpl5++LBYzhCMesL5esrDf2soNA7m7MgOjQDAArbqdN4qKHb57URaDkyOPlYVYnFuTPIZdgcF2CDEYg8bYhcoYWLInFeEN9ZjQbcTrMyZOf7+kuKTK5fJEh4+b/PK6TbVsV9Sg6oBVUeHw2PH5vE3YsLqR7ZTZWLSkHOs3NsPpYrSbXQdpWlstEuoaGpBd1H+xJznV2/W6dYtu/PK8S1456cRTF57c/7iZ8XX1EDWdVysHyIWa7Vp2H2N9ipyw8e7q8YcuZqd7VfbxXTOt0CEmp0bYjhuLEWrhkxUy8vr2RnFRPq/8N7k9lYn4AagD6969OwejnS16ao2hJHtn315nXdVPMSh0veiii/Daa69xEO0E0L0BrM6Gla6hfGpyCuSAyY/7dwpYZocpByXdOxxuiAmLbH7rjNZY4hYENtTh9OOn/mvMMcetvPCsC1/74WsUde9d4UgpWNHa2gYrizLoIEJhmOJ027FsSSW2bG5EbzaHFy9YiRWrqmHz6AzU4mz+xnkI/O1Wb3zsSdNfdrnckcLC4upLzrv0+b7OovlCZRtcyWkw/DFeBB0PJIwv4hYeq/KSC52tRXKu9mU4thnsyhH2GerbYAZIg07k0jHzv100YePmjTlHPGAtXLzgaBZOyaaaKGGQnDb2hZCMcoBPctKsitsSLEuqbOWCZ/TEmFXlVcG6j32BNQGUOLKWDxww9Eut0Qj/6bd33qao6rYtfdiYkz6razCCsiRDYzuUx6Fg+ZpqPPP6GhTl5aBPfhKSU9Pw9Ctz4WcAaGevbWHU28oYltfbhuyskl1Ktt7269/f7W6I+bNcmZsK0vOWxpp8XBNMIuNIuvlxYL/wCyGhg53oqBe4XhL18wssfG43kvHGSgkzJk9N+DILRodxTJzbsO9vyKLTPirY3Nmir6qq4qUK2dnZP2k42DmoUZoA9tJLL+UV8TS39qZGLAFW39dFdbpdvAyAygHiO+snFBKgxctzbGzOso1MDbNnM2bWr6DfV1bR0ZgnpGy5/vLrH9vpAmXsLDU9f0uLLwAbmTzIVljtMmobvHjt5dXIy85F925WZCcn4z/PLcGG+nbYXAKsKjlfsygh7KwdOuqYhZ2v53Z7An/51W23hhlgjR8x7u10075JbQhza7uQReJFpoTMZBajVJPrlI6QS+WRDNUaqnU+LtcUt9t4RENqwy1xr2vp8q8HHfGA9c2abwbIjPlQLsraTAakInxpDLTYl05tMFxTiH2JvnQb4AtDbQlxek25Kom7cbCYe3ND9NYrbr4+NSVr/mUzLrtnUP/h33R9j8ycoipRcdYEQ2HYHSqa2+N44aXl6Fmai/RCAqcoBubnIRC34vX3F8OmW3gjpsbeN8iuK8mTUburz9Cr98CNl57zqzs9or3smmmX/Un7tpGLqfnYjeQnMLF4V8XebSxrb0eHiA63O6PqmBi5CpPttV3Ce0vi8Lp7YNKEUzqYGOkJGImWigNwizsX+85YU0tLC9/dKRzblxBsfw861aQ6LLfbzaviqdaLmNeesr7OAtCuBye6zQpZlBKihzvLfQmdC4x9V7rKj+Spmd5aG2i+6rxr/ijHtNpbL/vd77NTM1t29f42R2pNgFiZhbTu2JxS7Xjp5aVs03Ahv9ABi6She5EHKZmFeHrmCkRYzOm2WtHeGoI9KaksJTW9revr/WL81E9PHT/5uZ7FvT+88eyrbo2urY6DvActUucJA9AWhOaLIkbV80LitF5rj8JazyKdJBuCmsjXpGkabN3Gseab1f2OaMCKxaIob9paTNrumpfdDIbcYRbUG0lW6BHShfYmvrh4FIZLQZTdFHudwX8kco9sEaHqRhxfPPq9kyeeMat3cZ+Fv/3V7x784fskJSf7BI9nkxEMwsNu4gfzl8Jic7CwJgV2WYTdZoFmj2LEgCwsWdKI9WV+OBwhqNSCw/DAmppat7vPcvWl1z/Gbv68GdPOf+eEwtFvG2tauCYWr3AQhP2WdCeVCjoJpfwdaQuChbhltR488L4fl191LZvANl4vJJLGFZ0PSgqvu9nfwdjuKucDpCnGWFjnqeD+rLLfV4AlsKIGaGJ+J598MpYtW7YdAO8y6d4h89N5NwM+PxUIUMy5iy3I5BsGSc6obJMNSgwAVtbg3JHTnj5+/KT5o4Yc89a5M85/ZXfX70hNr6WWGxubr7pTw9ffbEZ5RSsGD0hnTEqG7mAbGYseBvROhukNYf6CBliTJYR8NWz+dlupqsp2JP+W397+J09qZvll51z1wgBn8ZJokxcapRDkRPGNpT7ILfOCbpV/N0qYQkQffDaZ/Yxx+0gYzhofKfTwMqLKqq3FRzRgedu91pa2lqw46VWTwkPUgMIQndrMDbfOvdooN8UnE+lUWxgtZbSYO9mw56V6MloyUnNqLzzz4kfp9c4774K3MzMzG7f7gFTS4Eqvame/K8V1rF/rQ69eOSBhUQdjQDYW+ulWxsRSrcjITMbcrzczyu2Gpmi87UKQld0KeqempLZd8+trnpDZDb703EvvU6IS3BYnd7zdEVrs09KNJxaAJBgJoULqUQtbccMLEfQeexHOnzr1u1O6beaHP77dmYo7O5uF9+ZkLi0tbae1Wgd7dNZy0TVRqQWVWJx22mlYvHjxPjNAb3s7C7fJy1HczW2L83wQSXO7rG44BZv/4rMveZwBeuyG6256TFHU3WYMeC0i24AUtgYURrPmzq9AUUk2ktwWuCzUXqbDzia0yxlCaY90fPNNLSTNgtY2A0kpueU7POnt1W/TlFMnf0Lh8Vmnn/eP3JScuiSLyx8PGpCpvaw9hICHsbmOHY9ah5TmACcU1MKk0uEYiQWyOU92XTUt9QVGzDjg9/InKxwNBgNWfyDIvmm2A8kSp9wOFkq1srAt7LHA0uiDVs++IIc74X5D2vH0MwZWwa1tmHHq1bfLguyfMPaEOfR6mqbFuiR93R63p01RFT4LU9JzqrzetfCF2A7HqHVWKmNrOuUl5I7TNpFtJiLyCl2oqvVBNDzQVAaOagQ/LDcKhUIK26W3q+zt3bMPnxjjjj1+zinjTnnRsJrZ77w3a3Tcru4flYSOBlouz0HhmKjh5ldF1NgG4a277+CM80CEXZ9++il69+69V2UBJJ7XWc5wKIxOqRr6foj1kfrDFVdcwRul33zzTfTt23e37HabF2LHvfS2+xDTEhXiO6urSzT7JEwfwi0hnDjpxM/tpv7NgH6DuBBet+7dq3d8yhpULRY90oVWxEkaSbIKCAfDaG6KYWD/ZOhU6iOzp8XtMEgyVA8jM9OKFcsaEDJMtHojSO+VWdP5Mn6/TwuHgpak5FQeItptNv4eU06e9q7fFzSrasv7/HPpG9c7GFCR9ltrtgpDTZi5kCoJiVUa1EbEPpdKrs/k5s4elMppCXjtRiQiy7p8QFFL/OkAK6QHggEbJRWpKzxODamBEHe/iTDmQ4l1gd1kJZrQZxclGWnuFBhbm9Fby1r2qwuv+s8Vl1z1ksPm2E6dsHzz5qwrp4x/8cPX/zs5Go0gN7N4kzcQhzfm5UYRqWxbcugyAy16qOzvKmNcMmNtMkLhMAyDvaQeg0wU3KIFvV6f8slrz0y+5uKzHtq8adenIRaL1bzmsutuvuGXN56R7kjdEItGO5xats+H7DVm8aZcEaIljsc+suCjmhI88eS/kJSUxBZjbJ/Cr12BHLXg0OKmBPveDJJ32ZG6wk/JsDof9Hkpf/XII49wUCV5ZTrV3NV31nmo2/WbKqvYCsmdkM3e1fIiXcpIOIRuWd3m3HjJ76ddduGv79vd9S5ZNGfADZed8eicD98eGwlHqEQhzGteGVZEQ37e4+dJZnPNJsBil6DbLHDaRF7OkOpOQjgWQgRBtkGbyM8r3Bzw+eRXn31y+uXnTH6yraVpu5uZl5VXf+VFV716zaXXP5DsVyqlugBS3OlcVJAcnKWQAb0piohDh8nWDFXKUPQDMnDlPU0C2oJ+ezQSUY/gHJYhRWOG3KnEQLZfZiSacJlhcXnMbuH1TFI7o57UwCzolVdcfN3v5Kpw61+u/fPvUlLT2pLcSd4dvfaQYcPWCELI9YdLL3jj6ukT31u96ItjQqYH/rjGQkQTSS4KBVnsb6XTQHI3ToSGKfZUBlYRBqDNgNXDJnZqfOZjj1xx6WljZt18yflvtNWWlfYo7Vm2u882aPDQzQP6DK4+d/q5D4cCgW1TPf5jsu4dg3bZ51fa8I+F6fjno0+itLBbAqyEfSsd6Kp9vmHDBi45TMoG8+fPx7nnnstF7/YGsAgQ6HcGDhx4SAHWD8NDOhQg0CL2dc899+xBPP79ApGVa1dDyXR2ODXvjF8hYaPFQOfy8y+9u3ePvk39+g7YurvrHTh46KrVy+eOu+GCyZ+zuffJZ6/PnC6rZPiXijBJJcWj8LgYQFlFWBwWqE6BsS0qJrUjyengoWosRsoNOuZ++Mq0ayYfO/vWKy95KTsj3V9YUlqxw03G7fb1KOlRedMF1/9JaDDqr7jyhutsbaZPYhGJ0hbmdVchj8YlcORgjLu6h3SVn1gTYEWiYTUWix1wAbifLCRkE0WMm4w7CR2ysVYNjiY/guEoV/RUGOMqys7HxnZGb2saMe34K544+/QLH2qrb/f/4uSpn+wahsX4jCtuuLdq7VkniE2bJy5fXY3m7GQEGXtzOxxISZLh5Y3J0rawUJQYkEVkbs9eWSfjs2fm4MtFGwRFUqfmsYnZnqrinEuvvpftzntcpZCTk1tLhXadp0s/KmCLJ8Li99fZcdfbAm57+B84+uhBvDWI+gvFfQw8iV389a9/5a00xDxI/5wKP9vb27myAYVOe9LL13WkpKTgUB2djJKAipjgLbfcwmWUSYI5IyNj92lE9k0zxoKK6ipoo50wdli0Et/GB4jRy6oSz87KbtjTa7Ta3MEzz//NXW89csvTHmPr+IpmP97+gExVVfTs3Y0XcSY57LAysDTiZERqQotZEGPUx0Vu0Lod772xFd98y+Z9YP2V+enpyM9xBc699OoHd/fev7rgV88019c7Lzrr0gfmzvt84MsbPj/XJlhRlFuAZUoz/2wW0tRif5JoZWe+1IwaciweF49YwCLTCVPo8E8iXSCLxC27FLZYhJgNpi8Su+Dyi/76f/+6+/ICW87WG6+68YGkpOTQH2/+86N78vqjJxz/1fN5xUsdcnDQmKOLUF0TxkfvrERWGmNahojkFAtIeifOhWNFqJrBWUojA80/3vYBdFVH3wH5SHVoaKlpgTu7dMGo40/9fC9RmWt3712js5AQJ9zmNCzy+itFE/B1rQ23P2fgxj8/jWkTj2OLJcYikjg3/ewqx7yno6GhAdOnT0djYyPXRqdktN/v57VKVJIwcuTI7RjKnoLCT3kquDesq5MJkuTNzgFL+N5/q1ioXNNSB0taD/ji5m6+9TgPC2mD3pvrO2nKOW+8+8Tdt2UlKwWF+T3Q2BbFR5+sxmvvroLbboPT7YE9FoZBDjxqGz8ZVnQratk8b2r04523FqKwWwF6ZeaifEs1eg4a8kHvgcPX7O59Nc0S/fPNf72fkvG333THrbPPGDs2Kz09cNqkae/Mff6e3yqZKiR/hAtqm5aEBhvvsmTr+WCUrvxkgEUK1lFSt+Xn9aRDzuJgnVoVYhCiPvZF9/zq4rN+dcvieSu0yy6+bGZyWkb73ry+qjjDx0y5+JH3nr75qWPzu8OZm4bCrCSsK9uKux6ch7OmdcfoIXmI+sOQLAqafAqee2k+LGxH7DMwDxnJNggkIihasbRmM0bPuOJpi67vnYxGPNFL80Olhq767jvcnCl3ICROl7jNFHlQBqz47fMmTr7yNpx7wRQOCqSLRM/dG2zoaoN15513cqZBigrUvrIvr7Gr8OtQBqrvEtF+fkiwIxXSbftOR8Zd6vjVFctXI2ANw86YOvWPxnaaWUlIsgjcwGLvFnNqRnpb37GnvFy59J0bhzNMtdlllGT0RRnbZJYy5vTiGwtwyYwR8DhYyGlaELc48dHsjXj7rc1sU7aiYEg6W9xubjRR39BmXnb9ZY/tcZ6o4+SzW/e+Wx+55fFLF86b3/fC86++74HXn57cWt9aIoRivDVIIcknhbh9lDTyWcgkHnDE+slyWIIsxqCKXN1MJrSu8mFoSb+mkpQ8n6+iEZefd9n9FouOv9/74C1HHT1q2b68x8QpZ74VkzwVETZpdD0GB6Oww/sXoE9hCv797Cq8+vFqOFKcaGkRcP+jC+D1AidP7IOSArZ7qQ7Y2fMNqR3+sK3q5NNmvHlQQmWRnHlJf15NuJ6IBsIMUO98z0DBgEn4w43Xfk+nfF8T0FR64GOhDSXVCaz2dnc81IFpTwdV5VNhKQkS7jLp3kVvZun8uYhlOSAqcsIY9QCNU2Zc+Gx1S8iv6BKclHO1Ab16uDHlhEEoXxfEP/49D62mCsVagheeW4P33lyP/v2K0K9vBpwWK+zWCHyhGtjTipcfM37inH25himnTfvwDzff8qDH4TR/edr5D3nXN6Nncc+WnJzCtkhjCEpEBUkPxHQ5Kspi7IgFLIbipiKIMRK5NzbXoo+naN6jdz05pDS99M2RpcM+nnHqGe8mkoFJ+6wZn5aZ3dx78Pg3q+paYHdRf1UMmgoUFOuYeOwgzJndjBv/MgtX/u4NhI0IpkwZhCQH1bawvckRRZJHRXl1G3oMO/b1nMLC+oMC5DxEJssucjOJQGTMc/EaFZ/XFOOWu+7mFf77I49DQm9klVVUVMRrrfZlkC8h9QwezuPbb7/lLURUWLpzwIpvKxiljonlyxZCLk3jIbl4ANVk+w07enVycf9P61qakOZS2RyOwil7kOMBpp0xAGvLvbjmhlfxpztfw7qNtRh3/CDk5KqgygKbamUg50J5VQuGTJj8gkW3Rfb1OlxuD//dq8751dPdPPmrx/Qf/ch9f31odI7pWhvb0MiNNaBKBln5HbGApShK1CVoUbOsEeeNnvzwxy98OKG0e/+to4aNeffWa2+7Xd2Dgro9GcedPP2VynqfSa02pJlGtSuaYkFaqgOeFCtWrmlEco4TjQ1ebN5UC4/HCadNgdvJWJnVgk0V3vhxk8945eB9MwKUWMLDJSKTS7WM5etk9Oh7FEpys7exmx3pUf3Q0n1nf6dBJ39kRMrD871oU+nKrqjFhU4VD+exdu1aDli71crq+O5WrVyGTW0VsBQmIRaP/Shtsz0JzUadNOWVNVua4WIbqdOuw+kAkj0a1nxbgVDYgN3jxrdra5GencLmswhdC8LOwlubLaFP39iue8eePP2N/XE9SZ5k3+3X3X7z4J4D548YMnLV7OdmjZnUY+RLRmULnIo1LEuSccQClkWzhMUIhL7p3Rf/447Hr0vxpHCl/AvOvfi1cWPGzd9f7zN01NiFii17mZ9KI+wKHJqVH/0u27IOazZXYMTgbPTNT0F+fi7e+3gF6pr88CRbGGDZWMjE2J+S/M2QUWO+PojHEdQpCBMKledxlcvGYAh9exbuUV6pK6D8sCZrV7mnvWVoNOiEcePGjYc1YFHfI1XA7+6edCLTF59/Cm+aDMVBjc8mDrRwzpgTTv2kyafXsreCh72nJ01h89bLrmMLepYUoHtRCgYMKsDixRtQXdHCIgQXbDqxsRjq26uRlt/rs159+m3eX9czdeqZ7508aQo/pS/IK6r/x13/vDJDctfqbJuVVeXIBSxFVaPsP96rfvmbv1mt9m0flKRb2I6/3/Ytu9MZ6dV/xKyqiibGKhzQXSICRhirF1djYO9uSPU4GHiKKM51IDM7DbO/2gDd5mQTQ8SmTTXo0/+ENxxOV+hgfjemkNAVV2Mmb3Y2VFob0T0Ckk4wIkNR8uYjN5ny8vLvFU7ur8Q1nTJSzdbhPMiYgpji7r9cAVEjhq9mfwFLrxzGXkzecRA/wLm83Pyi+oy8gZ+U19YjPckNQbLj43kbUdQrE7lpKpyigqwMC7qV5mLxvDJq4GGRhAyrPQmbGYANGXHcLEncf8tcUdSYplm2rdfsnNzmS864+CHZFCKyrJhHLGDR2cnIQce8MfWkKe8f6PcaOGLCx+U1XlgtKhwuKzZWM4ot6+ie44LmCDPmZYFdE9CnZyoaqtsRIl0uhx1lNa04aswJnx7EaDAhY0L6RJS/pJJiBlz1ISoW1HYLVhRCkDPNxRdfzE0cLrzwQl7JTX+nHrr93YTs9Xo5yzqcx1lnnYW5c+firrvu2iFb/e7eiFi+ag3WVG2Gq9QFk4GXyMXJDrw44dCRx3+8qawOSa5k1DW3wxeMoEe3JNj1EAsRRdg0C0pL3AghisrGNrhdFigszG9sjIcHjRo360Bf34VnXvJM7+IBs+KIC0csYDGkjl572bUPuhyuwIF+r9JBI5b7opa6uBmExy6jptaP9BwHqIDbYdPh1p1sR5KQmqzAqiqoqauHZklBW1Bp7tar+4aDiOLbzKZI7UpRRSzYomLBZgknHD9ut/kOAhDSTydwIsUEcoihZDIxIfo5Wb1TCLQ/B7324TxGjx6Nv//979yoghqiKcTdHtQTAPbhux8gnKVCThZ4wSipZwgHQTWnV98BKxpbhJjgkhlbrufpilSnBrvNCp2FidTEn8L+351sR22LFx6njpC/HaLm2pDfq/8Bj9lZaFh12UVXPW4mipSOTMCy222R/gP6VxyM98otzGm0uDLXtre2wqbGEPAFkJHmhsOqw2mzsBvOaLRdQzKbCEmZbmzcGkHY1wJRTtqakp23nbxMIOC3HDDMYrc8LBuQ5Dia2xz406vA9CvvwNEjhnAF0V0NqlYnTz/qLexMylP5AznWUFX3TTfdxNkWmYlSdfveqjD8cJBhaV1d3U8qgfxjc3H0II2sTz75hKt5nnLKKVi+/IdWe6SNFsZnX3wA6+BUFq5TD10kIdDHOyX2H2qxjWa7uZVekFfti5I8pQ9lW/zIzXPzeWtnm63Dzh5OEXaHBenJTvja2mCzWlDdGIAnp3S5y7n/nNl3NQYNGliuKEdwSHgwBzVYZ3YrXVJVZ0BXXYgaBpKSNXazE7uTwy6whwynLiO/WMfWika0NvsY6/I06TYrvwkBX5v+5Ydvjb3+vMn/efvlF089kNfL/fBkEf/8OIrModNw3XVXIJHe3XVOc+HChdvJEVObDbGs8847jwMLMQjSglq1ahXPbe3rQqdBLTgUEtJ7HM6ARQ8q75g5cyZXprj//vu3e+6cz77AxuYNsPV0k1IMpHgs4ei8H7tR6Dr+/dh9l/z+ynMf/vrLWYOjoSDfdWwut1+wOVsbmtpQX9eM4kIGUjptsirXbU/MXxEZHgdXc6Bm6IpaLwp7DVpwxK1l/I+M/F7DlpXVeyGTzpVBR8PU4S6xBwMqfsMl2HQJRYVuNLf4UNdkwGLRo4115cn/uv//LrvwpMFzb7t08udLv/p48pjjjv3yAOb2oJky6poVvF3lxlXXX8t7xmLx7W9X15IFCmnILJTkU7om36mKm5jD8ccfz39GjjeUiCcxO7Lr2qdUW8drU8Kaarg6w8KfWgp57zcy8XsAT3/27NmTtyp9D9TYn08/80/YByZD0QVuy6WYIjdeje/HOix6/2PHjPvik1eeu+oPFxw/7+JJIz578anHZgR9PkXVrcHKOsb82f0syvPArokcpBw2EqGUGcMSkOa2IWLIEFUJ9U2hePe+Q1fubLM5XId8JILTN6tWFnz2xswp/YYOWNt7wIgFqZm5zf0GHrXwuQ/ujJliTDINjTEsC7/RCnmzGSZX8pTjEnJsdugWCzZVGVi/ds2Yy6eMXBVpbsjskZ8ChYWRA8af8WhmXlHtgbp2vnYYQC0tlyBl5rIF1I3NMoNLfXDxpR9McMpbXXnllfj888/5/5PSJ/1JQEKV7JTHosQyhW/EsKjRlxZl5+T9MUl4Ylj0fhQW5ufnHxHV76RY0Vmf1vn9fPLpZ5i9cT7yftUf5JBEulBRLlgt8Obm/Tn6DB2xcuyJx7/UvuXrGXq8Ycwz9/xmzBv/fniRJocyN27Q4U5xIC3ZBsUvIyr7WXgqs3lrhaQaSHHZEIxqCMXI8l5o7j9wCHfdqCnbmLF66cLhq75ZkzftvF++mJtX0PAzYB1CIy8nr2HW6y+eN/PJu/qnJKVVdB9w9KzuA0YuaG9D2NsWsiqyCo/HCrtFhMrWmMYAISySF6mGZMa6FMbCnnpxHpKcNlvfLJcto2cpohRO1QaaTznnsn8f6DAFmoENDUEUFA2ElYFnhO/oMZhks9SFZdFzyQ2GxPU+/PBDDlp//vOfOYiQxAvpPZ144okoLS3lJ4cDBgzgP+8aDu0LyHT+HjEsGof7SWHXQQ3gBL6dwzAMPHr/Q3APzUM8VYThk/miCYoqN/vl7oP7mbScct6Vjz1y3TmnDx6eJZd0s6Gm3hhWUebD88/Nw5jx+UhPcTOgMhFSQuxPBTLbgGXNjyTGsOJsbje2tCAQiIffe/3l6Qu/fOuUqm+Xj2yqaU7rNnjQF7/+3W2PHc7354gELIfH7Z9y6TUPvPLYjU/3zbTkVq+Zc/7bSz85XwxHcf8TX8MfjMDjSoHL1Y5oVOUa8VYzgpgk47+vbMCmLQ0Y0zMP2XmpMNjE1KQWrNnUipIBI9/r0WfA5gN57bQEjJiG8hYDPQf1TvxMTLjfyDsQZKCEcWfjLoV7BCQPPvggz2dR7opaZyhnRaHhY489tq2i+8eUOHT+Hik6ULjZmQs7HFQadhOP44LzzoJgsfHCdvosL740E/Prl6Hk3AGIhU0GUga3UKMcVmybof3+RaxRx02a80Rhr6+8weZjc5OtcBTYUJKXjI1by7BoUQ3y8qpx+sR02ALJECUBhhCGrKtoalfRXN+GB/61HHU1tVlvP/anp1IcGnrnubDEDOLsX137N5Jm/jmHdQiOiVNnvG6xpm6xsAXaqygLR/cvxsB+xahr9LNF3IJ/PfEFGtoVzF9ajZff2gzJno3HH1mCzz7+FuNP7Ib+fdPgskdgdfhhs1tRXteGEyaf+fzBuHbBUEAeHBlZCdcZiYodKPQQItsBRydYdeYmrrrqKnz00Uf4zW9+w5PhW7duxemnn4533nkHxcX71yeA8j/ERqgfryuQHa7DhIGsnAKkpaTy0Lyxtg73P3Q3sk4qgaiLnEyJAlUbxb/XX7i/hyTJ5rEnTX2mrKqBbQpO2HSB11sNHdAXx40pwsszv8DzL66GwDaMfz+/Ct9sCqCi3IYnn56FoDeA9rYohg3Ox7CBaehe7IbJ2Hlqbvd5o084/ZPDfV3LRypgpaRlth81fup/N375/J/6pekIx0QImg0pHg9vdN66uQy//f2H8Ab9CEfCWLq6DuGGEM6ZfjRka5RbeGuCCKtioqnWgGDNXD1q/MTZB2MHiRsSvKYOiztRLMoNW3jBD50SarsOJ9mgE69rrrlmp/++P4GlV69e3FX5cGdXlFonZ22qHJESXzj+9re/o9ntQ8HA7oiEo99jYgd6TDr1rLdnP3t/tSHHsjx2ykmq5N2DnoVJyDh9KN6dtQZLN72Hb1ZuxSfzt8DG5qozxYFjRvbgVvbxGLmiM+YlS6hd34wTL776CYtFNw73dX1EnxJOnHbBc01+00tRkFuXYCNfN9VAkkNC7wEZaGmRYLWnIoeFfl8vKcPIcfnIyg7BoThgtzngsNmR7EjG1rJG9Bk5caZud4cP/MIBr3KPwQZJdW/7oclFtCx7FKr98CRoR32GPzrP1jHI3ZmS7qT/fjgPoUM4Mca7CwR8OWsOXvr4ReRNLmUhV3CbCCP/7AcBlzOys5tzeg7/sKyuCUluFW7GsJzuENtAFXQrzMDAwcVYuKgW3XvmQGbzwm8yMOuXBzuLCuxqBA5Nhd3igmEqiEjW6hN/MePtI2FNH9GAVTpgwKa07gM/bmgJwOVQ4bAKDIhMOJ0xfLOqAjr7e1GuC5nJqSguTMXnX61hO5KOZA+74U4qe7BB1xWUNXiDYyee/tZBSqNAUMJwxX3wNSQ0CxMhSIzt/tJuwWpHuamu/7YzANor6/YurzN48GAeetLp2mE9SKCPUSyZfbTW9jbccevNSBmbCjlHBumaf2efdvDGyJNOf2VDeSvcTgcLCRX2YHMySUTQCGLhnPUYUJqKNLuCHgWZiEREbNxYyea5HTZrnAFXjAGcjKr6OvQYfvzLqVk5zT8D1qG+a7JJNvLEqa9srmmHgwGWTRe52Wgri/FrKqLoWeqBTQmRHylKCj2oa5KxeEkzb9FxOEy4kwS0ewMwrWlr+g0YvPagxemSiZH5ISz5/J2Oz0Gxu5wQkdvf67QjlNtX5kXSLAUFBZg3b95hPlkSIn0i+57vvf9ebMB6pB+bi1gklJCs/gkuaeiocfPbg3qVGaV5a4HHyphWsgez5q9j901HYTbbUNkepjGA6tk9FxvXVSMakWF1WqGxMNKqC6ipC0THnnL2y0fKmj7iC0fHHn/KJ76oVhk1DbZDabDZXVi7oQWpGUlIcroYxbawGxtm4aIDxT3TMXf+FraKXfC4Rbg9AsrK2pHXfejnmsVyUE5XOJdiO/qUES5sWvQ2nn7+FXCLCaocFfZ/RXlnzVZn4nyvwVWWOcuilqDDtUVnG8USBcz/cileeP5pFE0vRVgL8do34QCcBO7JSM/IbEvKKJ1bXdMCT5IdyS47fD62kS1rQvfeqdAVFaqSCslqICNNZuxKx5YtjSw68MBhd8PvNaDZCpYMHTFm0c+AdZiMzOyc5pTifl/UNrbB49QQjRuorPOipMAOXQ1DsbI9VXfAogLd0y0IBgQs3VwJh8cDi82OiuZGFPUesfCgbfRUlBjXkOVsxe+PlfCPv/0Vja013BE7ju9yWPsTHKhC/sc0RVNtFwnhHQ7qo3FeNxXnPgKJ3GBnOCwg4A/gj7fdiJSRKdBLZMTMAAsTZfYcCsU7vm9qxYl3OBUK8QMOZBmlwxdUNjXC6pFhYexq6ZJqWDQBqWkq+RXCbjFgp01XU5BfkIGNFY2QFAPpugXldRXIHzzqQ5tNj/0MWIfRGD5q/Idby5t5U3BlZQ3blQSkpyVDUyVYLGwiWCRoGmC32lHS3YNPPlgNk2RfRQUNTb5YQbce6w7egopDZmwwGjYxvF8IyXIdbv7L3Viy5GuEgiH+IOMEcT9pHM2ePZsXnw4dOnSfX4MKUglAV6xYcXhMeaHTCMRMlIt0gNED9z2ANcYKFE7IA4IC9LANZHsck6I/2dUWFnVfU1/bAEgmfN4ou1/r0LtXGqyyzoCLzVs9zh4KFCWO/JwUhENBNDaGYPNIqKgKmCOPOX7WkbSW/ycAq/+gkYsbW6NBU5JRvrUeuVkpDJwUdsMV6Oym65rIjShldtN7ljpQWxnBipW13NU3GjVjFuvBPA4mpTCT2wnZJT/S3QJefukdTD71VAwfNgznX3A+ZzP7Y5BaA7XqjBs3bvcSwbvJY1G1/YIFh36vrdDh40yuRDF0loxIWL5oMZ6Y+U/0md4dAZeX4ZTITUDIbo1cb36qgg3daosEwhGQddLs+ZsRNAQU5bFwUGKAaolD1WWoFqrHAwsJJWSkulBW1oaw6Ic/aq3q1X/YqiNpLcv/C4BV0rPfRlNLW9PQFhjU2GSgX79UWBjLMqleRRD5/pooAjTYwrWiuDAHn8xah4FD09nmq0QURQ0fxBXFFxNVW/lCOspbFDxyz33Iy/agqb0RpSW9eKvNj4LEjkQ7qRNQ4zLJzezt73fNgZGUzZAhQ7B48eLt3uNQTFURa+Itm6aU6CyIxHDLHbcheYgTnkIn2mPtjMFSOUCAPVWCHFMQln6a/JyqWcIGFCAi4/Mv16O0TwbsmgOm1Mr/PSaoMLnMjQlFiqEgNwM1NW2obfXDllKyJD0rvfVnwDrMhsVqMdJyeqxesaZsEE3WtBSNxf/EZCRuUUSSxARYtJuqbAL06JmE2XPXoLmxHRZBi0miFDuIeAWyd4Uq48NltFBycerEcXC47PtnvXYACTk7P/TQQ7wKPj09fZ9epytoUeKd+hmpGdvhcBzymSyxw2uQtHz+/cxTWFL9NcaeMQTRSBQqLAgJUURlExIDq4SEzE8DWJLAuJ5kMWsr28TmpgBGjsiHRnaUssRltM24yjsgBLaUFXaZmekWlFU0YfXaFhR0m7BSEIUjai3/z8jL5JYOnvfthmaIjFq7nDIPAy08HKTQUE08GK9W2WaWnqkjwqatv02GRYwroiRHYoaB6sqKdDMWEw/wWuJa4c2mFf9ZYOKCX17MwSpuxhHH/tNjJ3ZFSfLLL798OwDa09foKs1SUlLCG4XJQbnrcw7FYZIPJngNA+qqq3HfU3eg36RimO4AxBiZn4q8lESLWPkGElXCB/X6opGIXFNZltHxPZo2RRYbGsPQFDtS3XboeoAxLx2Knkhp2NnmZlEt0NmfbrcIw4xg/cYoinsPXXSkreMjjmEF/H7tlpuuvz3d4/IefdSwRb0GDF2WnJXX2HfI0UtnvflgPFUXBVVmIZeiIE4nQLwGifEsyleIcbbhRtg8Vnh42OK1IhARpYf+ctOfWhuqS/Wk1PLHX3jzPFGSDuyuyu7KxjrGgmxFmHH21G25FwKtfdlifhie0YkgsatLLrmE11DtbfjW+XzyJfzyyy+5tDDlsGiQzT01YR+qIWGMVyiI3BGZUOnBxx9FzN2GzIF90G60MkYj80S8EJcZeCmIilHERAOCsX+VRXc1QqGQdPX5U5/zWHVDEJXmArsl3uqzCIxtwcY2VdFsRjzqQJRFAwK54ZEZMZvDGpu3miEixliiL6oG+g09ikun1m5dm7Nm2bK+c+fOHR2TVd/Nd9z9V1mW4z8D1iEwrDZbOM3jaH/pwbvvnD1ThOpIL+s7ctLLxcUlGwMBOSzoUYuqSlCtjK8YMi8jEAWDh4dgYYCqu1BZF4e/1Y87/v4mjGhU02o+vSTg9SOn5Mx/ywdaBlZI3JWKpjjKa9vx7yefxrTpk5GTndORMP5ukAID5aDoQbIouzo57Kxmp+c8+uijvH7q17/+9T6xoc7X+eqrr3DHHXdwWWE6gaWfkQbXoR0M0oGbyYtEt5Rtxcvvv43BZ5UirIYhhSwM0GI88BAZqEXlCHd2lg0FBmXnD9ISdzidYafVbrasm3uCpMmYLypYsrIGDlVDLO6E0xVBLMC+Z/b3iKAgJrOA0JTYRheDFI7BZB8hZFj8C2e/N/7Bu39/zKavZ58itDenVjcA193/8LmHK1gdsTmscy7+1ZML3pp5eUmeLVcUgvkVy16/4ZuvYjB84XhFewyBoILMbAURX4ifBpEHoMRuuiBlYs6Czfjw4xWQRRuSPG42eRi4WQxsWF+D/Pyig2PCx0C0oinE2E8xXnrlVTz2r4cxYvBRyC7I5gBLipjUv0chHYVht9xyCy8t2FUI1wkypN7w5JNP4s4779yl2/GeDAr/rFbr917/UC8e5VlLrgoj4eUXX4aS3IrUoiw0Rfzsh+ohc505eXlbKutXIDc3DT7GmkJtLWho9uKRf36M004ejEGDkmCG/dCjjGWZCmNabA47LFiztZK7QmmqkfL6Y3/8j8OpoUdBBiIBJ+w52tJTzjj31Z9DwkNsZOcX1A87dtLMdfNfuXFADzeykz2IS06EgqZQWd6MJ//zJSYcW4xxo0uhyiSMF0GIbabPPjcPy1ZUoaA4HR63I5HXicfYcxRQs35et9KVBwWvTBVra8KYMn0GLrrgbHz88YeYPesLrFq9CtFQlIMCKYlSOcKMGTP26tSQwI2kkadPn77viU8GTK2trVxmmQQC6ZSQXHoIPEk88FAeQpzs0xT4A2G898EH6HaMBwEtxJiJiEMJavOKu63YND8IXWOhtSIhxZKEzCw36uq9+O/zX6C8vCemnd4LSrwVCmNXbSwMfOetcnyxYAO6d89BbrYiOASNhY4iwrE4FpU14YTzbnjK7nCFfgasQ3CcdOY5z837bObVFPUr5PEnxWBL0pCelYOGNg9mf16B5V/X4JdXDYOsR/Ds0+uwZUszhh3dnYVLpNttJGp04jLI1lVULZGcwpKKA7+ggBgDrIZgHC7GgMjKacppU/iDJ4wZWBGQSnuRR+vMJ7399tv47LPP8MYbb3Bg2Zs8U1dpGgpFr7jiCv6zThkbAiz6/059rkMYsvhj7oL5qPaWoVevArSbERYCKjiUMm65xd23UMpS0ySIDEkJlERGDe15SUhPS8HchesQMUOYMWUYymqb8OhTc6HIIkYdnc+iArbBso0tGlHZ70YgRAMIiXrtCaef9erhvq6PWMDqO3TE6syS/rMaWhsnFuU6GcOKMiAitz8JORl2FJ1WgqWLa/B/d82Fzx9gE8OBMWN7MXrdxkiVTvVXCY9A0UA47INksdbl5uaVH4zlFGWT0xd3bJMgJrt6oaPzeV8q3DvLGG6//XZurjp8+PC9Z31dwO3ee+/liqYkCki5Kxr0+vTvxPwO7RwWL2jAa6+/guRe7PvklvMKtunHHCKjoKhkvSlYApqqWtXOOquYghibB6ongpFjihnr3oCFiyqhsunarXsB+pSmIx72IhpkCCfaAEsYEgO8DRVt6HPU+Ndz8ovrDvd1fcSWNUiiFD/xFzOeraqr4U4nqsZ2K0WFTVbhgMF4l4jikgI0NgVgdTgRMLxoa2yDk0xV1TisFgMWPQ7dqiEUNpCUlrWePdoO+A0hX8JwBBH2l6QkT+cq+/6f+zDIRJUq26+99trvMaa9CQMJkMia/qmnnuLJdrLE6nydpuYmXgpA/oedIHlI8itBQn1VDRYsnIuio1yIxEOQGaM1xQgOpUx0Vn5JpcXmKWdEH7pu4S1kik2AZjVgt1rQUEOMljEottF6vQb6FXrY3GabMgsHVE2DysJIu2yCTsRrWqLRiVPOeu5IWNdHdB3W6JNO/zAoOrbSMa9VVaGpIqyayW9+LObAZ5+vRG6uC8UFScjPcmLx4g1o9wNWpwarzui3xYTNJqPFayK7ZOCyg7IG2XsEDRb2RRQE/Qk9LKGTVQnfsZ29AZxwOMzdoEn/nZxufoykzFtvvQWHw4ZfTP5FIufTcRktDOzZ8tjGuH5KOyl6Z97b3NmbTDKi5ndmEW9/8B4MvRXpeQqivEzXZKHToXVwZnM4wkl5pat9/hDcVpPNRxm6RYGNhXu1jVGsWFmBovw0dM9PRbLDgllfrIGsKuw59LwYLGye099bfSycTMpZMXTUuMVHwpo+oivdU9MzW4v6Hv1RXc2iy9LTCmDGo1AkEzIDpAVzt8KImcgrcJPVMrLTPDAiAhYsWYdTTu4Hi0KSLiwU02Q0MRTr3WvwwVFsEKgCTEAkJODSyy9Bz5JSFBbnIspYXrsvgMKCXNx44++4AcSeDjpVJGZ07LHH/ij2QzI0BHwnTJgIm9XGlnmwA0w11NZW8gXSCVg/bZYqyiFLEChPlwB7asHi4XYoiudenYmSo1MRpzxgLAFYCfvaQ4kJCsjp1ndx/aIVU+26B0HqbWT8wh9VsHjJchQUZyI5SSfHEnQrSccSBmBrNzagf2kGogzkJCkCU9CxtWoTBow8803NokePhDV9xFe6Dx993KzK+nbu7mIhWy+dGpoNrF9Ty280hX66TrpCCkq6pSMYiGLLZtIUkmFjVFwUVQRDpn/g4CHLDhZghRnD0m12XP2b61BUXILWlhZG+33ISE/HBRdcyMFqb8oHKElOjx8LJqSZRcqivzjttEQ2yNQ4q6KxtWIrCrKTtp0S/rQhYUKhlf6kPjujs1+U/f2tN15Deetq5A51ImDSgUqcL4LYIRjCDh42Yn5TW9BUdR02thnY3BK+WV0HTZGRn+eCqgqwMOZltWkoYExr1cpKCIrBQkKZP0eWNDS0BIIjjpv0wZGyno/4XsJBI4/76tV/qE0RI5LstApQrRLKN7HwJaoiM4OxlHgDiCRQu7FgCbGJkIstW+sxeng6JFlEW3MUFntqeX5Rt4qDhFcwWPgSZSHKWWefg1Tn9klsAqu9AQR6LuWgqOygM1zbF0B5+eWXucHFoKEDCQa5ZHOCYQlYs34Ligq7fwcZP2Wlu0kgqnZsxzFeBEpV4r6Wdjzw6N/Qb2w64u4gY1sCT2SbIDYiHXJzt7hXv7VRSW+KxZFK6iJhIYrK8iZ2D3LY5mvwzZR/1+xz5uZ6sLCiDU2tXuQmOdlns6O1uR6iNX1T3yHDVx4p6/mIZ1gZuQV1enLWGr8vyHcpTddQtrUVSSky7Fbqw7IylsUYDeUIVBNZmU60t4fZ4hbgtIuM2QTgzshfbXM4Igcr/yKKAiQxjpbmps5gbNu/dQWCTpa1u3wRlRpQgSfpaP2Q/XTmw3b0Gp0lFDSqqqp43RWdMmqygmhcgCAbXA31iSf+g9mffoaiHj2/B5I/ZQ4r8V1FGYMyOFjRuOPWu+BTG9BjRApj2RGIVNUe11i4yICci/QdWiwrPTOzSXelbQxEDLgcCpmjIsI2nfR0F5urYPOWJGZELujncUnsHsuorvZCt5NckhVN3kakZvVYardajSNlPR/xDEtRVDM5p8fqltaVo6ylHoTYzltT7UNOvovdcEIHygUZMAgkYIGaKjPAkNHcGEFRjg2tXi882cPXHszVZpGpZSjKHp3zTNrGvtAFCAgUiDXtribLZrPx07sPPvgAtbW1bLFGeVhJfYSdRac7A73OKvYbbriBexBOnzaN54cUQYWXAfudv7sJH777b6Q7bIx5DTpktuGEXFAiPG1oaMSd99yOD+a/ihOu7AtDbodsJFT8YmKMsl281u5QW9WKZonZkrK3eP31R7udyahd3gLdIcPtESEYGosAtEQjtxRgm4iMjCwHqirboMhFkKxAY3MAeYV9Vx5J6/l/Ql4mMyevrH3tHNh1C9paWWjgZ0wqJ4nF+iaDAjej1H4YVKcVs0HU4/C4nahloGYd6UAgHERqWt5B87Ai3CAFiXgsgjvv/DPOmnYWBg0eiJSUNP7vhhFFXV09155atWoVzj77bBQWFu4WsFJTU/H4449zpsU5WyzGHyeccAK3t8/Ly9sOOSmMpFKI6667FvPnz8f7778PveP3N2zagCsvvRr2yHz8/V4LHnxQgaa5Don7TZDu9wexasUqfPrRl3jjwxcRz6jCxN/kQ8hoQTQAsFvPOwqicpj9qXHRxEONYdFITkut8we3wMooVWW5F+lZNlgZgxICbK7GqYVbQlxm2zALaXNzk7F0yRYeqmt6BG3eGHrk51f8DFiHW1iYnl22fpnIFquK+k2NiOsmUpJtUEw2WRVqIrXRuRwMFiLoioDCXDvW1tZBs3VHzGsgKTv5oAKWg12D2xLHiuUbMW/BNbCYBlKzc6BKTjQ113DGQMyHCjh3B1Y0qI2GGqSfffZZXjtFg5LwZIB63333YfLkybz6nRjUdyGngKXLVuDG665HZc0WPM/CwZ49EyHf+19+ht9feTVO6laDm2+Iwy424G5RQ3NT4wEK8IwEmMRJX70jLyXGvzd9m5rbsebbdfjm2+VYvGQF1m9ehdbwJjgzgcEzUpBd2gth+BAMxbk9TpTS8lKMa13RS8V4c/OhB1hJyYUV5qYFkFjoV8W+38GD8mFXImxXkzmVjHNFNyuLaFmomKEjFBXR5DNQkiMiFJbNpMzMyp8B6zAbnoyiCl/QhIUBVWtDDZx2G1x2C+Ihiecv4txEU2OTNgidxQZ52Sn4ZlMlItE4ooYYT08rLD+oN0WIQDVjuO76G3DsmKH4avZnqK2vZmxHQntbE9LS0nDSSSdtA5DdJbjnzJnDT+8mTJjwvfCRrOupH5H6AakKngpCE1Xxbbj3b4/iqf88hHEnjMbTz/4HuR3yMU8+NxMP/OEPuHi6F9ecyVhYtJ0kUlkY4kNjfeAA4FWH/xbQoQcW3zZ1/f4APvzwc7zPQt3lqxexDacadncUud1tGHaaipTMLEh2IMgAL8Cu0yAxPiTE+OJCh4kEL3s4dMULXClZW1o2sOv3+RENhZCdlg6r7GWXrXSY7hq8IZ5SBZqNtN1iaGlijKsgiQGWEvKk59T9DFiH2bDY9UiULWsJVqGtwY+MFBccNrZvxy0w2Q2PixEIdLIUdzGwCCEzQ2UL0YLWdgMhMRqx6PaD0zAqcDUTxqRMJFuAmtoa5GRl48yzztsJG4t/7+87A613330XRx999Daw6kyy0/OJVVHV+tVXX41bb72VP4d6DluaWnD3PXfjrC7v/X/33IUXHr4Dd19hxcQT2S7f7kuU5lsEeGx+1DcegM2cg4rU4VBj8BYlqlb/8INP8Ne//gltwa0o7C1g4vkupOU4oVklGKKEUAwIxwIIGWzTYc83RamjhlQ6lPFpu2F1ufw1jBs2NcVhU+1IT9YgmUE2UdgGKzLgpUZD0u4y3VCsfqR7BLQ1+djnTSYsNqxs7v8MWIf4CIX82sx/P3peVnp2Xd+jR83XFM0rKnpQ1N3WNn8EqbkaLNYwYqaNs6u4xBhWTE2sCUq9Oxyw6zoLhVoo2RH2eJKaI+GQVFG2OWfpgnnDBg4ftbikR+mWAxH9JBykDBR6ZJRt3bgtKIrHQ+zfLCx8+a4Juas1/Q/BqvNnJEGzbNkyPPDAA99hQMfvdgIeJeBJ1njlypU8VCQmdsklFzEG9l2Zwh/uvANvPXMf/vNHF4YOaAB8UbZoGBAIbLHIYWS6RTQckJAw9t005cWfEhYtXIpfX3sejj1ZxqgJqZDtbQgzNhwMW1hIFGEAFWYhn4IYAR235ZJ48BRnoTVXGsWhq4a6cvGiPpvXr+o1aNjRC3KKSss9SZ7mGFSUVUXhSVLgZgwyFqTPIjBgJk8COfH5zChjVzakeNLg9bVAtWdCVfU2xr7CVZvX5CyaP3dkMGKYZ5x3yauiJP2sh3UoDU3TIxtWLh308Eu/uzyrMLXWZk+vtETb5TVb2uE1FPRMT+IFd7FYvCPqYKECNyRgPEyOsjAigpR0GRvXx+Ft1fGPu274c3P1pj6bN2/pY8i25ldmfT30QF17AndM5HtMfLn5W5hmnJc5CIKl6xN+8Ds7X4Bk40WJdjKJ2NHv0SnjPffcw9UXOpUXtg0zYS5616MP4r0nHsKLt4no27MBMb8GkrknPGARM0/45qWLWFp1IPwOvmukpHDOiJi4/c9/wFFjFUyc6oE/EEU4oCFCTTZk28VYM6G+KEUgGoxVxRV+AkgXGzfFBCM8xBqduw5FVsJ/ueHypzMctmhu917zJZunLiUSj22saJdSc6zQ7Rb2ScM8DCeGRUuYFEXighe67kBSugu19Y3YsFZCTUWb+7ZLp77vbS4rXl/W7r70ht/fdDiD1RELWCxsiJ9x8XUPr/7igwu6Z4kZgWBTRigUxp1/ewEt3jiyc7MxfGA32F3s1kfa+SQX2U6uSipj2k5sbWpHdX0rFi6qgs1lcyreTy9LZSzEbxcwYMIpj2dkZTcdyKQ7owYoTLdg/byVGH3sMThm8DCUDhmEZIcTkWgUW7ZsQVZWFtfC2p16A5mkUo6KKv13NKjVxu/z4+KLL94eKNjifunlmXj23jvwr5tM9O3ewsAqThEIQyormz3UgCtzgChIk/HuvG8PABSIXYBLxJtvvYuKhnk44+puCAZbGKYypijEOfMiFmWK5HTD7qfhTGhfdYSVJuWtDoOqw54DBm4YNW7s+4E1q6c6QpUn1jSvRsAvYcmKSvTtl8PYk4oMdxoi4QCbsf6EQYapQrGlscjCRDmbt3PmbsGqJbVwWq0OTWkYnJ6ZDEOyNEw754Jnfg4JD9HRa+CgNVnFpV/FwlsmFGXl8MkcFgKobxUwd84GbFq7CTMmD0b/AWmIGSyAYLtVc0sILz6/AovZ5HAnOTBybDpsNglSVGKLI4J15Y3hk6af98IBTmNxup/uUeGySBgwdBAqt5ThzVmfIdzaxr0SR44Ywa25dgVWxJ6WLFnCPQyJQfElT0YWQgfJYO/kD/rw2KOP4IqrruSyMPH4d0ltyhV9/OXX+NNNN+L+iwyM7E1N1ApkFq7KLPyAkLBOJqBHJI6sVD/a22rh84ZYeGnhjsoCaaPz0z1xL1HM7AJUUsfvigxYA3jwob/hhFOy2UbSgKCfWGc48RxT65AEYv8vRhLOQ3Gzw+Q5wbTiMSnBUOOHNsk4aeoZzz1903VTBw8oQCFjTVo0DU2hZmze2oK77nkDo4d1w+RJA2Gz0wmnwT6gA3MWb8Lbr65Bc1hD7/45SLVZ2OJmUQS74es31aLP0GPezinsXvMzYB2qH0yR46MnTZ/5zpM3TSA1BsRsUBUdSW4RvQp6YEt1Ff7+z7k4emgeW/ylqCkL4JH/LoDH48YpJ/SG1QZ4wzG2k4WgmDIa2huRXjT4s76DRhzQQjw6vWJBKbL0FmSqEUw4cRomjx/FwLQeNXXNcLDwbvuaqR2Pp59+GqNGjUqUK/CDfNImN3moJ4oSnn3hGdgY85o8fQo/gRNMk/fUSQzR6uqbcNM1V+KSie04cQwDAX8MMV3lleOEJyZFFmYif0UjN1WEGfahprwGjt6FvBgzUTwg8GrybWi8Q1YZTWAIC83FDnCqrmlCS0sT7E4HMtKS+KHIrX/8CzTHNxh5TBGiodYECCGRwyGLNlMkA1ox0fDMgUnqqGAXu5wGHvoR0aix0z747/+z9x1gUlRp16equjp3T0/OCRjyDDmDoKKoiIuIGRAjilnMyq4ZFXNAxCygElQQUUERBElKzgMzpAEm5+lY6X/vrR7AXdxPv1/Q3edrn3KG7p7uqlv3nnvedN6EZ7YGIqH8RGcMzw3MSbCgTYu2qPfX4ae1+7FhUzluGt8PNruIT2Ytw9bCChS0ykaX5HiEpUYE1SAEujV2TUBNQ71x2fDLP/qvWNf4L36ccf7IL+e/+3SpqgupbofA2YlFUmCzhNCxQxxat8nA4q924LulRbC57Tj/vNbokJ2EMJmNoUgYmjUASbBClGXs31CLgZeN/0yUTq7vg/vcCTgsdL5Z8SrWrFjOASsuNoGOpN/8OUxvnXW0eeedd6PPBHnjWAtvYSVyMJgx7TP8feKDcEl2Xk/HIMYQzGjaY489hVxnMcaNIJaiRqDYDdg03p4hGrFjOGCYv9LzsT47fU45ig4UonWHLP5ZIvMnsTeIZosy4VcqwcyukBqBlcGlcJ5/5nXMn/cxHI4QmewisVwf3TdWS7cJ19yeQfexlDcW/W99uL3eSPe+Z31esnF2fk5mAmGsCtnqgJOAKDbJi1aj2mPThgY89sRiNPhDSElPxrALepIlEISmNEFXaUexODkDr632wxmfta3vwLNW/R9g/cUfqVnZlS06DlxYXr32uqTWDr7zWkUnz3MCMYvaxjBYF3C3NxWNWpWpgeVQaWeifZtutkgmhkysrMnfgDrdUTqQAPDkn7VhRgLpXNun2LB095ajzxvGCX3uJ3y8//77yMvLQ/fu3Tip0OEAq0axMYZFoPT61CnIyEjB4HPPMH3rDDToeQu957MvF2DllzMw40kDLk2Hwp3rgFUxwLMCOACJRzso8040Dh2t0wxs3VGM884bbJqKmoXbnzx1BOKvCrjohlkOxZqw3nDtNdh/4BvcMD4T6anEtKrriF2WcNOmZdtU2liaEFEYY3Kgucbyv3Kz/dvlcycvm3m3ZNedDho4SXLDI9J4WwGZzEQrMfBQSIY33omGkB8KWQNOlwRNDEGyOGiMiA0TC968swoF/S//zOn2hv4bxuW/vvi535Dh8w6VN8FGd90VVR11OOPoBjuwYsk2pCQ40a6NGy1SvZg7ewOO1EiwJxCwuQP0fhk+p5fMo3qktem2JDP35EvMGs00i1hWmyQLaksPQlFMvaZmsGKpCiz94Nce7PV58+ZxR7oZQdS4f8f0Bwk4VF6K99+ejTOGDYTYnOLENM0JXGqaqvHiY0/ilguJhWbTd2gq7dwu2BXzxHiWAJfs5YkCOJp2KanIz1GxZWMh3wd5kqdJF6OGmHgCU9BkaiKZck1N9bhh1G1orP8eTz3vRtduRxAbcwSt80T07O1Czz7EMBx+6CFiDjptPkLwv3reduzee5s9LndDXaMfXjfNXStTGpHh8sWguDiEhQt2Iq+tG23zkmiTVfDD0q20N8TA7rDBSRaB2846QemoqI+ETzvv4nn/LePy36+HNfDMlYoYc4Ctb6Y0anfpsHoErP1pFxw2F1rkxMIlNyE3OQHx8SmYu2AjDKad5QFc7OaTabZ/fy16DRr25ak652alq3SXgery/bj62uvwzOTJ+ODd97hawtNPP/0vxcrHKy6wyJ/X68WZZw6OwkmANw61GKYz+8P33kfk8G5s37Ez6mDXo0504L2pHyM+XIwrhgisswRCMpmKYgBixE67t2D6mnTxmCPdiIIRMbE+HVUc2LMStTUNtHiIXUlmZE/4VWOwGbRE3HvbPfR38/DwRB9ibQEofhU60zBXG6AEDTp42IQ+M8ATfY+W6/yXPmTZYuT3Grxw3/4GuNxOYk8CbD4dITLtF8xfR/M2B8mJTPJbRYeWGQiHwti0+SC9Lw4OO5nntEE3+YNwxuasL+ja4//kZf5THklpqXUZLfJ/qKho4EJnDrrx1XV1OLi/Hu3yc2BjWv2OGMg2MsE6xqChJojtW8rAquOdLgs0qY5MR6mmT78zlp+SE2YKAjwZEPDQZLRbdai0qL/97ju8OeV13m15/PjxJ0xTYGwqFApx/fZRo0bRe6wcECLMD8fUKAQRRYdLsGD2dEy42I5tG9Yg4A+YpS90HCqrwcx338CNl0fgtDZBIVYm6QJ/WZUNqJIWbfJu8KTRZlcW6+tIJ4k2LYiZWgqxbuVqDiZa1MEtmt6xEwIsO+cpr72FtT/Pw30TvfDZyiAERB75UiyamUjLEnyZ455MeUMIR53t9qMOdEE08MuAqXECzyDwH5XiTo++p537zZEjIVW22Dlg+bwe/LyyhPsgc1s7YLO6ucgkS3Jul5+NnbsOIBimOWMnK8LFpGZq0KFgwLdOh13/P8D6DY8lS5Z0+/TTT8/4sy+y58Bzvjl8pJpXvLtcHhTvrUFskg9pcXRj7WQCOu10gyW4iVW1zErCjg2lBGAO+rcdVVW1cCe2WZmdm3dqQsLcjBJM0V5Zg12Q8Phjj+O7RYuweMkSXjbT3F7+eLOq+cFeZ/IxTL+9eYnqsKFZPOXNN95Gl5RSXHe+jkBlIVat33T0b197ZQpapO3F6T2DMMIaNxFlAiyDzFPWu5G3PePOc3aKZhs0XsZmaKbKhEfDGV10fDT7c5iiLfpRNxOXITaaC5kVM82LUGbx0h8wbcqDuPdeJ1LjDWjhZqc+i1qSaak7aSCa6Gg4mrXOzVfNzisCWGsrncz7CIEc89kYXIhP5iapHjVYWWG7+ZH2X2Flf00ga9+1207VFrujIUBmocdGhNWBXdtqkZeXCK/FSkBlITORKekCmWkuWF0yDhBIeQisbDQMh6qCWq8zzvnuz76ODz744Pz169e3+ssD1uHDh9vceeedX0+YMOGh0tJS5581YK0Kum1tCKmsEQ3dSCvKKgNIyfIg1qrBayP67DTgsTvgkL3IpOcrKuoR0CJ8khwpqUd2fs/VouXUkVHmdOdaBHIYDlpgpaVl/Hn3P+m4Hw9ajKkwoHrzzTe574qV2pivszbmpkLBtq2b8P6Hn2BwZwOuGAOD2mt4+qkX+GcUlxThy8/fwh3DJdgIpHSDpTBEzOxxBp6aAdlo9kfR/1kmuWGqTklchZ5hUQijThew4+dvsWbLVppcTF1BhULnoXIzUuOigCo/HQHbNm/H3bffiOtGy+jTQYQW8kMlwNEEs0xK0jWeEApB4dncAjEt/pMBkBQkBulC2SEdU58sw6zXQxA1Kyz2Bm7iSgRsjKiyqK5EQMWK3FW5kX7qZrLlLzaJv2a6gycmJpyYV7D2cFk5Yold1TcGUR1sQHp6LGIkBxegdNAm6yFGFUcbb0JKDA6XB+BwMkocQdCw1+R07Lj7zzr/nTt3Jo0bN+6FiRMnzq+vr0/6ywMWmScaLR5rx44dnxg9evT8NWvWtDxVg1V66GDK2hXfd2O/Z2TnHghLnlqwlAQjzBVFs1ITyRS0wumUiW5bucaQh8zClBQvL54tLw3C7rOgsiqEFu3zN5+q8xZYk1Ra2EwMM9bK2jSFUVpV3oxQvzD/mktymn8y+RimcXXFFVf84gYzxU1NEzB50nO0oB3YuM/FX5swglhR5SI89MgkPP/i2zgtw4/+BGJqNH3B+Lc85ARMhYhTTlsFfzutFk/c8xQaIo0QZQsBjwGLEOARQ0EkUBFkbN6+FeOvGotLzy7DsKEiApEaOtEQDxAwQGT5YEyPHaKfF/eyllaMIbG8K5FMRSttND9+G8K0pzUMG/wg4l35mPFSDUIVcbBofsK4IJRaA4FqFjeg98tMatoRLdb8zzENs3M6bamu0iD7nNh7sIbmqhNxcU7YvDocbgEeFkwiZmVzOJGdloD68iBdq4gIzXOHPflwWnp2BfucFUu+6V1bU+U7Vef99ddfd7n55pu/HDJkyJ3Dhw8Xg8Gg8ZcHrJKSkkx6cEfxvffeO/iOO+6YXVRUlHgqBszf1OC+Z+zwhfdefclbNRVlMbI9rl62SARWTfyyMxJdvCGFk3YjF+1ODgfbqUTExVrgS3CjeDcrfDbQ0GQxUrNyTpmmEM93jKocMc0nn6MJ+0sOHXsx+ti/fz9vCNHMspiS6GuvvcaVQVntYDO7gqk8gukz3kfRwWK8+coLWFnsQHW1ggRHA16+VcLKxZPw/cyPcecFNnMxsx59wu+PgjMsYC3Vbr5Khr3pK9xyw0NcllmUiBUJLmgEXDt37cajTzyKay6+EkPOOoBrRxEwharMDHWOUBb+OUY0EGCyIZ2fDxsTgcxkRZMx/c0G/PiNAw/f9wKGjzgTMz58H5nxAzDtsSOY/kwYM542MOcFFV+9IWD2pDqsmVcCd0SChQUO/oN89Qkp2UW1dbSD2CPYWVSBDAIln5sAiqwCsxWdRD/p33YB2ekuHqwIhiO06epweZP27N25udVNFw784pG7x79n6KcmxX/58uVtH3744YUvvfRSjxEjRnDxSMKC9D/is09aHlZ5eblj7dq1Qy+//HK+65999tksmbErmYeT586de7Usyyd18DKzsg/mpiRVrVs857otG9eeZYc/3mVvj+K9lYjxyUiJEaHoZoxeZ8MgMMVR4hUEUi1bxKCo+AgQ6UiLTAokJCZVVJUdTtixqzC7X//T1kuWk5e+xktJmBQKmUbME9Mlx4IlS7/Buj490dTQgM2bN+L775fy1IVp06YdLc9hQnws72ro0KHHfZbZMXrP7q2YNGkynnv2RQw75wzMeL8v5iz7HDcO19EiIYB3bnVhfWEQLVoFYARUJsjF6/PE36tpx4qOQxbE2Crx2t+TcfvT03Hx8PXo0G0IgYwfh3Zuw/69G5ASG8CEW+w4fSCZi02smYXMgUlgLCqqVwWus25wB7vA5H9YEbO1jsxJF957rQL+qi6Y/+nHWLLkO1x40QWYM2s2Ppr+ETZv3IlAoBG1DeVQw3RvFQM2qwVvfPACFr+5G73GpkJwmmD+V8WtcDgsrV7xQ/fuPbptT81MrShU6CJCAWHfwVL07Z7PUxwU2crzCiXdAjPdJAw7MS67VUNNowDZHY/CbesG3H3FecvrqkpT2/UbvDA2PuGkNwKura21/uMf/3j1scceSy0oKOAugH79+uHll18ePnbs2Lmsv8BfDrAYQBGjeoxOdBBjWEzt0kKLnMn5Ll26dMyUKVMW3H777Z+ezIGzOT2RxLTcIi1Y0UH26tm1R5owZ97PIDqFxHg34r0i6hWJNnEGWlaeDMmcvBa64a2yY7FrRxnqm+zEDiTt/ZeffnDt8sXndxt07sLTBp2x/mQ73RlYMJcxq/07N9+C6VMX44KLCiEbftjJFOrSpQtXG20W8GNyyaxt/Jw5c37h2+ISx4EAbrnlXlx08eUYdsE5nEHddPNYTBz3LYb0B3Lj/WjhaULLfio0MulY6oJGJpjNUM3ym9+OVmZlId1nSVWQnlyG9152Yt5Xe7B+UyE8sQIuGORB3jgLstJE2GU/gk26WbzM/FS8iNpCJMuI+plMHSxOKg2zVlCmuf75zDpUl3TGvPlzkUps40hpGUoOHcHIS0aie7deSElOpEVTT5vjYQT9dRh75WiMHj0Os7/4DJt+KkJjg4IYt4Wzub9qSaHNZtM+fO3le18u35WX17HLGp/s1mqq7JamsIacDCe8NjKhBQsvtbKwuAbLi2O/uyR44+zYWuhH0YEiuoeNKWlxibDqDqRntyg8FY1BnnrqqZtofg6mByoqKvhcZPM1Kyvriuuvv75+8uTJD6SkpDT8ZQDrwMGS+FtuueVZt8s56qqrrkJp6RECMP2oPjgBlXDfffc9duGFF35LF9FwMgcvs1W7bQd2//i3zDgHMr2tsKO4AjvLi3HDxV3hc1kQUugmq5KZNc0i6YKVlk4ALdPjCDgcmPXFZhQWlXjrtnx6ayTQhAF9eq846XecOZuZtgDtnqwpTisffW/bGGzSO2Laa48iPj6V1zs2P+rr62lM7+CbQX5+/i/ysdgEfWrS0xBsNjz8AJOOCcJQidkMGIQeQ8biyRlT8OY9hALBCKQGCZrDQqxKgciy2628Su93eHsEHhUUDfoOptMUssIjhTB6eBijL2Sp8szZXk1My0A45EYkItOc8JvsigvRqdGmp1GhPnqe9T1U2fO0kVgdYWz42YnlXzrx4cxXOVgZRoSu+wps3roOa1evxaKvl8Pu1JGYFIcOHQpww/X3QxadGHLhmTCSynHpxBQIXiIrynEW9l8UtAb07LnyvZe/GlFdVpLP2nbNme9DjCcBGSk0Z0Ma7bEsCGEnMFJ5Iw1Jd8JGQOzx2fDJnJ+Rk+dDp3ZpZDhIOFyuo2WrvJPeSGX9+vXZdDz4xhtv0Lov5Sk2OrF8m9XGUnGEq6++evyEO+9S35g69R5vjPd/JSz4h/qw9h08nHDDqGHzDm9bcc2Afn2sgUCQt9UOVpv90sqIaSWRPXvmmWe2nzRp0p0newDT2+dvUSIGYiQBDrdKkzgNXXJzsGrlAZQTeMYxqWTW6sulweYS4bFr8PnchF82AoIAPv14NbyeGGSnJsIVFxtsmd/15DvfaRFZNDOZMyBZacIRIxqgoWH/T9hbXs/BSuGZ6ya6PXT/vYhxOYjR3nPsprKyIjoY65o/fx6mvPoSnM4YrrnarHzw8MR7UNhYgLe/ckFyCWYiPDPJBFN/SyRgEzT5qHwMk14SWfQQ1mhiw4lXuqSDO9kFRE26JmIAZPYpfg1KwAIlaKGzJzNQVGgyy9xtxboDibxLkMaLmKOJE7y8RyZQssoG6mpj8cE7Fbjl1sfQq3cBB1/2yMpMxyczZ+HLL7/BvC/mcrnkH5Ytx6xPZqOyqgGjbroc6X0OY+hNcRBiQlBUU2VCiJY6HXW+/cUMxBadu26weSW0Zc1paZxmzVmFIJ274GHZ7jbEyh54nApcZAb6bFbExbixr6wRP2+pROeCdHRukQCr1QXRLtJGIRg5bQu2nszzZVbVk5Mm/f2yyy5LsooSaiuq0FBbRwet/fIKvjuce965+HL54tuuueW6N8KhkPCnAlY4ouDxhyc8eU7s1v7tcpJooBxoLDuI2qb9qGioQbD2MBrralBWXo7zzz+f+bPu++ijjwae1AhLq1b7JNmq260sigKer9KjUxpsdhlvvr2ZfsbB4bXD45URY/cglkzFihoRzzz7PTGBMAo6tiSAiKcVWA93UvLunFZt9558hiVwYGHpBBa2sInt5CWouLJnLR65+y5U1deyZAF+56a89SG+XbIIz778PJkR9l9EEXfv3s112omi86xosw6RAFAylUbj4+Lw9AvP442v7Ph2k4v77iQtxJPYBZEVIkfIJFR58qYuGtHlTD9FBfh3DRuEKE0kZmSmC+imqSgiGvkTmuHC9L2w5wwXzxXj+uQ6Yw5Os3ezGOQKDoIs4KP3y5GXPQzjbx0FLimj2fn1RJcLOrRvi9NP749uXbsRC03C29M+wd0Tb8Sw63zoNSQLIWLSumKL5txHwUr4NxHPP/nROr/TVtntK7ORWZ6SGINOnVug6nA1nn9uLeppXGPirIhxxMPhscIW50OInntn2k/IzEhBx3Y+OGwqzzEUJTu9x1uVkX1y+xK88MILlzlstmsG9O3HA0C1jQRUDXU0X+uYWgTqyqsIYN1wdMrFgsi+a158+YWb/1TA+nHV2oLA9kXXjuthhRisR6DJQE19E/zErhrpqKyLoK6+kZswrCL/xhtvdLz44otvLV26tN3JGsScFq32CDZ3mSBJPGmUNZ2U5TD69U9DYzCMt6dvxONPr8WPP9bClepFWbWCp5//ihaRDW3b58BFZqPLZYWqBdGyXf46u9OlnII4IZlBMscDOzOjaMEa4QBu6K8iK7IT/3joUe67+OnndXjimYmYPOl5mqAFPBveiJqBjI6PGTOGJ4+yzeGorXncgztD+/bE3U++hLvfdWJ7cSwkOwEGIYvK/EiiwYGKed5Z4TPzbbHETVETo00P/jgTmHWv0SSzXtJsHR8xQYXMctEVg28WWrBnezyee/5ZrjlvaJbjsNmIqonq3ERkj5kz5uLxF27DRTe1QE5XOxoUP/cJStwv9p8RHUxKS69Jz261neWwORwCYgmYunbIRlWFgEnPr4SfQNue7MIXC0rw5KvLMe2jNXDb3eiZnwqZSLGF5rvHRWNJzMfpS96blplddrLOdcaMGafP/+KLV8Zdex3qampR09iAagZYDKzqalFVW0sMuQ7+QABBK21E53TCG9/MuffI7uLEPw2wVq7+eVDXxLDktKhIkoPYtncLqgkUGmoCqCKwqmwkekgX0dTUxCIJyMjIYP6svPvvv/+zxYsXF5yMgYxLSKuLS80qDEYiHHhYXaBLdiHW7UVum1h8tmA9Cg/5MXXGD/j+mz147dWVcHucKOjshFuW4KUdykMYFfaLaN+l/ykpzTGFWFTQBkm8wcaZCWNbLl3FE5fI2PbVDDzx7Gu45e5bcP3osbjgoot48jhzwTKwYn5C5jvs1KkT7r777mMweJz+u/lv89aPuvgiXDnmIYx+2YJNB8j8sNGuzLrLkK0mKVbIETuZeBJ3wDPxhWYT8Y9b+ey8gwSUzAx1EmQxDa0gRPoamxtYupxM85kqnntuGnJbpJsyNZLI67gNriiq8VMxm1NYMe/zBZj41B0YfkMccgpENIYtfAy5I59n3/9nIBYBs5HXsceqQFiFhxU/23Tu1ujVKw1KI1PbWI35C7bik0+3o3BHPb75fi/a5sfDS+a90+rgRdBul4RAsAGp2a0LWUPhk3Ge06dPP/PVV1/9+P777kt0Ol2oJZCq9zdxYuKvqUOgmg762UBgdaRoH3QCUs1jQ5kXmWtWrer/pwGWpipOt1Xg4eiz2ynY/OMq7DpciBpiB5WNpdDqShFobOKtmZgzjoFW165dMWHChLYTJ078fNasWf1Pwk1HduuCtfWNAbhYWQ4xLJ9PQkWpgp9WHUTHzrlo0ykZSbnxePK5ZcS6JPTo2QIOiwVe2QmPg+1uKjTdESjo2vunUzJTRdOcYnrkYWIduqByxcwwoUWrpGo8cLEFjz31MLrld8ejf3+UV76wJrBcBlg3uDY7Uw995ZVXjjKpfwFFnhkPrFr9I8ZeNQbzZs5EvZiM69+y4dstLlhctPgtBneGiyqL+sncumMa4joT7BP+wKajbMpoppKpSMDF0zlo0YUUL95/U8f0t4Annn4Rg4cM5OalWbTE0jXMomkOwGKAf85XXy3HhInX4rwxdrTs7EMwQuNiqTX9YpqDO/j/kx6dewxY4Y/ohtNj4VntVocddquB0/vnYM+uCF558ye06JCEzu3T0bZ1JpZ+vxtNgTA8MRa+OTudNtQ1BtGiY9fVJ+P8CKj+NnXq1FmPP/54MhOJrCMTMBAJwx/0I9hIR00DmohxBUJB7Nm5A2t3bYbeMY27LqxuJxq1iPNPA6zYuJjSqpBJuc/IFDAmpRLfffQhdm35GUp9DQIBG0JhBRG6ICaNwspIGAr37tWLSfi2eOONN2ZNmTLl/D96UNt07LqJSXS4XKyUwQ5NUPD9jxuRmZaBFmkeeMnkykmhG94+hQa7HpKF7WY+PkFcbgtCZJa54hOL2rTvUHxKZqnR/EPmjndeg6exDPEQmWY+/FRUjzNO64Vnn3icOzLDzHyKAsiECXdh7969XAuLFUczR+gJb7ooYuXKlbj8oitQX+XHDffegoVzP8ad97+KCe848conMhqFOIB1GLY2cX8Wb9LBOgvp0knAaIP3hRSdMlTaWH5ck4T77mrCgaK+mDn9K1w08uIoM1RNdsccbVwaWeBmJODEjytX4dZ7rsPgixPQoY8LoUiIv0fSCO7ZeQuhqDih9B8DWB279N4kys5KBrhup5MYv5VYk0wzwoMIMa9O+WlITbbDYQ2hXY4XMTFp+H7lbljtgJfVGdqYVpaqtv2Dg0WscclDDz00jiyjD15//fX4Vq1aoaGhAaqi8XWt0DpXQmGEiZhUkXm4fPN6TPtuLoq7xULL8tH901j1gZHkjq360wArMzen+HCAXQzzJwRxa68a/L1nNcK7fsSyZSuwoXAHaonp6DRprHYHbHRYaVFFFBU9evTEnLlz09asWTPn3nvvvTscDv9hXtBO3Xr9FIqITWya+rw2FBXXEHMR0bZtKmIkGYmOAHxyAPl5KVDDDuzbV42YeI3ot8JlPWrqI8hoU7DK4f79/ivhhP/+95cmROVaFFmBVTVVpCwiKy2xkd2v4ouDvTD19Xfh8cVy9uRgFXvEvm679S6sWrWK+RO4tIz+K30Km59btGgRjU0B5s6fhbGjr0DbDu1xxYgR+PCDr/HV/kEY/Q8N361MhmqJBVxM6UEzI4W/alL9u0RM44SDwhutE5tkJVK6aMPqtVZMvD+Cd99y4bIx/8BnCz9BVzpHXdN5Yu/R4mfRBPTmPoVbN+3HDTfdgH7DVHQ/3UU7ukrgFDHLktRYbtLyZBGp0fyc/xBZmtSMjMrEtNwNfn+IWLMLsVYCLGJPm4p3w+mV0JE2Xa/kgt1jh1uyoW0XFyrrFRw53Aifxw0lQnfL7i3p2KX7HyYvU1Ndbb/xxhsnNzY2Tp09a3YMa8bL5qHVZoXdxrS4bLzu1F9Xjy07tuHL1Uvx46FdqDmrDZReubSFMOuBGFZDJJyRnfW7g1h/WB5W13atij+Br+xIWElJFWuhIIBzs23omVmBjQersLD4EH4+sBbbHAQUSVlIzGE/ExHvTYLXHQt3og8Xjb7a/sxjj0y++OJL2p977nlLCMltQb/fGQ75HeFIWI6EQvZAUyRVsMiKxyWXSkzm0qIbcYne2sSk7MMpaS33pSTH18TGeJuSUxPq2cXldeyyz+nL3aWp/u5etweHj1QgOyUJcURGNVmHIri52qVMLKVtQSyKd1aiT6dU2rQNWMgkqykL49wR5y1qvs5IOGSx2uzqbzJJWSd0JvsriXyJWFWm3Gnh0TCRaVMJJwoSClAFlrhpSrnYFPpbYh4z1lnx1k+xeH/mZORkpkOh12VakQoRrDvvvBObC7dh3ufzkZqWwqSp+NqWWDcZ/cR70oABA3DhhReiOWuf+4aIvXTuno/MrDQCMh+Kp1vR6Zt63DgiDr3zI7BYacFHzK7J7BAMnQv5QTN9XNxPFBVb4CVGgnk9R6GMpUzoGm/4wZQVNNlHJouKRStFzJ0XQMifg6HD7sHY60YiIz3tKNbxbH4mKcPHLGwm+jI9eYlJQZdg7I2Xon3/Bpx2nofAys815AVuSgt8rPVoIwxRZ4mpzblepwC0DFM9grfh+h3UIBwKyrShKwJdd37vM78p+f79c3wdzSYiLIes5EAduvXOgstq+hQDxLCsigUWbwiJyQ4cPhRCj24yAgcOIy2904a4+AQ/dw8QAyovK4tramhwlZeXJRwqK8s5VF6aUltTE8vuVEiLWBqC/nSLrosOV0yJTbaqdqst5LDZQzEudyPbBWfN/PjK+LjYIdffNQHrfliBmro61Af8qKipQlldNUoOHkRZZTmOhGpRE29FaCARgRYJ0GULBGJmsImQSpvQSvBuz2qVe+hPA6zc3Jal3pQu60rKvj/f29IJJ9mtkaAFCUYYZ2Vq6NtCRVVdLcrqK1BUvwP7tmmoDoo4FIpA530N7CyCjR5umpjBxqv3zVt6Nf0KKy12L01ut+AgU41AxE7sg96v1Om8oQLriVC7TsVmRcAixaKoEVuDLMTVB5JzCxOyU3Z3yO+zoURxSLsrFSRnZqK2YTM6dWXhYBbmttDCN9WaWLc3S2Y8iraUoK6pEQkZsfA3RKBKlvKOXXutXv71/NNnfzLjygkPP/Fobl6bkt9EnVmDVrajMCe2EUTYwhzMCmcJvEUe9BO6sFwRDUEno80W2rUk/LBXxiOLZDz5whR07d2DKyDIBGpV1VUYf/Pt+OK7b7Fy0QIOVmHWrowvUJ37viQ9GtETfunDYi3qj++6I0TrDlmJz4Iv5mH6tPeR3ykfr095BbdNW4D8rAhGDhLQt4MV8bEs3SAQlY7R+VWwhjQagYGdSzE061RF0zToXC0EUjIhOJOmboy4sG2/gQU/6PhulQN2IRFXjb4eF112GRISyRRFE0FKE320I8oIzeanTOFB5x+tEFhZafGVY8yYa5HashRDL4lHKBw2c804sAlHgfjYxZ9aZiUax75V+B2+/m0b1nWc8dYr40ePu2lar/5nLtm08J2QYdPtTruEokI/Z9u5KXHEPMN8Q0pS4mG10Fy1x6NNqhPlJZX0nfEoKdtHplrE885rU65bu31Tp71VR1ofCNa2rVaDXl2G17DbRCXGRotM5s2EZZoPMgGs303n6yfyQ6adQSAn0nyUFJ3XiVqTRXjEGgx99k7OrMxCBIFbS6rLAjXeiXCeD5GkdBjeqGaZwvIGVa7naKE5rR2qQo/ctqtjEuKDfxpgcSdh/2Gzv/988fm9cxVecy+IZMfSdFaIktsCBBhOMq88fvRiZZC80NVqZhqKTP+7ntk+5oFoxxNWc8BQjDl6WWzdYph/xxQnaSGHwk4aUAEOOw26wTaRoNyoGPG1obr4w3UbW+yuqT13z+efIYUG6YeVKpasPYJDlfQZVQQGNgHpXgfiHBIfdE0lug0XvMkxOFihoVcHFzYe8aOqyaY+c9eN72xdv2xoasu2W9Mys36zTHJE0C0MDK2804yIiEw3lmeDG9B/xYbkhc8s85vMPJkIZFG1CxM+FXHH/c/j0gvPpQVLpo5gRdH+Ylw75nq0FtZjXF8rbr/rfrz/zjS0apVHY8/yqBSewKlLzZ1oTmwaHv8IBAJYuHAhXnnlVZz/t3P5c88++yw2jBmFS4ZfiSXrAkjPBIbkhzGgeyLatbYi2VMJ2cakXchIYyjMhJhE1ZxZjFnSIRIrq613ofiQG+t3NWDpTwYqGtPQq+/5aNuqHFUV5Rh3602mkUjXx/13htVMnxCjSbJisxigjY9Tdc0hjB17LeyxO3HpdV6EtNDRNmWCYPnLmH1HA6r6b+dYLVu2OLhj1Zcjb1827+q2+X2/rfXr4Yhhs6fHxeJQ6RZkZriR4hAQYczNbkAKi6ihJVFereFAtYJ1Bxux9q01KBVsKPf5z35748dnS8k+SO180BMzoTgs/D6p0YYqZkIwWQJ0ntaIwLXMWA4eD9g0t0UzTD2zIF1QPYsUa9oxaVzDiAZPmNvA4O4I9lOImLJDuhG15JkKCP2NvK1CP++GcZ/9b8bzDwWsi6+49LOr5rx5987SXQVtEw2oqkaLlBYuQSsLqspELhSDLWRwes4uRmURHGYi0KlIrFwjRBOVF/8S1ElhTv2ZozfCcnXAmiIQ2tOE3ltvwz3v1aNPGyduPscJa5ANlI82CxWpMdXIctvQJ5sJIln59l+l2FBcLeBgZRz2lFRjfXElvidwdHlt6JDlo8ON9AQdBbnx2FMaxs7SCOZ/VQh/TX16rVqaHueW0Lv/wG+Iqv/mkgKX3eFXmQCdUcdVOZm+FFcfEHRz/Qn/6urhFhYdDjrKm5y4/kMRZ/ztZtwybgxnMwys1qzeiNtuuQOnJW3B46M1wnEN989ajyuGX4wp73yM7r3acYVOVQxHF7n8mwCLPXfHHXfgggsu4GOt0ufaaPEv+nIhfHEinvtgJirKFSyY/QlWz9gBTSlDYowFaYk2pKfY4HUxfSZ2cyUEQyr8AQFHKlQcOSyhsj6GFkkGWrRqjZFXDcVpZ/RDcmISgdUR9Os/ENNnTsfoK8dwc09sbrbBzl+3cokZ7ixnyaL0o66uAdeMmYCwuB7X3JxG41VLbNlpllgx5zrTuYENf3bSFTfLFd6Q1rDarL953viS06u79Bj0za6fl19WsW/bOX5/AxbO34aRw7uhrrwB3fqmQU6woPEgsH1XED+X1WC35ketxYOG9CQE+9KmleKDJYGYDrEeQ2J6ZBrPVROYxhgDImI8DJx43JWAy8Ky6HXmvoiec5Q98Z+6WQgvRDcEhQV6uJiGwZ8zojmALM1EMzWzeW9Nxv44LWGbNXMBWMne2FeO0+TU784+97zlfzpgpSTF+gdfesvk5z+6efpbw2lxsUFRiV3RYMi6WRzLKDvvfcdKUGgBMz+MbmHqkXZ6jrmGQhywVZY+KDjpPTLsisIjVazWTXKKKK3z4a4PGpi5hv7dk+k7qsyGklxbnMn6Ovh3aMRSdF3ivhWfNYheaSJ6ZdDiJfu+SbHiUK2KTYcCWL6rCYt+tiAn3Yu8PDc27tuDbTv3Ed+SkZ2URt9joLquFD0GnPnt73L4t2u3uUm315dHhJgkWsxWnQw25tNggGW2+jyho95Kg9MYsuHGDw1k9LkUk5565GiMZNq06Xh58gO4ekAT7hxIQB8O8zF79jIrJn+xD2OuuBxPTnkGFw4ZQhPPQZM1jH9Gx18rgnU4HBysTHcT3RsWhSSzYP68Bbhp3HgM6meKx14yYgiq6xtRcvAADuw7hF2FO1F8pBj15QQc28k00VR4Ypxwe9xIa52HoKcKX3z4Pq66qgtee+nlo9/HNugEGt/efQZi9aoNJmAxERlJir5qNkI1W01rJljV1OPqa0ehLrwBN9zdAoK1EpGIgwsKkk1kNlQVwn8+teKAS+y6hkw4QaxJTk87/Hv+vMtpw77cuHTpZZnZVni9cTh4MIwXXv0WMXYXwgEn3vj8IDaVyyjNTkDV4GRImbQOvCkIO6w8YMMAKaIykzEEQTVdBLy+gMnr0IYiyDZO/wQ/mXmsNpE2b4VVUguc39JmYGmuRTDVW5uTbjmb0o8a2/yfvHTLMGtIWbDHtNu524Ntvir3XepcB01fWaxdf9VDz9tcDu1PByz2uHHslXMu++aTSz7dvWzYpS0JMMIqgpLAT9zG0JrTdSst3DCT1ER5yIWyMlq+Rpj7pFhFfobPSpTXDjlIg27x0w2QEVQTMG0h0EQMo7q+GhWSDU8N96LAV8sbfyoWF32myttUiYIUzWUyuMqlxi1QG5mmBJSsa7EYhI2YV5skCW3TZAzv4cTeihC+2FaHlUsaUFYuICHWgkRvKgdCptfkjk863LF739+l1NAiN/ewOyW1eNWBpq6dEkI8QBWSmHInmUmCflxF3tFcBlhpeCq1BEyYEYSl/UWYNuU5SLKE0vJKPPLoU9j59Sw8fpkfIzoGoUYUujyaoCIzC0K4fwQBQMIBPHTjaNQ++iyxkLH0Hbbf4SM+prPOmJzBzDxiv/179UCnAjO3N8ic/XT+8TEexOd3RGc6/oZzjoFQdD4L/5Q9MGhgAe6981asIUDt3bM3mR8K37QY+5PJ1M+mBWeCadTO4A1QHbyVmNnRx4ZDhw7h2mvHIkxm8A33psNiqyZAtXPXA7hkcuSo6sPvchqdpAcXuzhQhRSX72BGVubvyjTv2KvPz6Ld0WREQm7Bboc7IRElNQZ21zuwZH0EDd07IHRtEoSEDCK0jYjQRh0xQnTtQdOMoS2fRUdZEbnG2rIxYs9qamm8xSoar31HIG3aC237IaCCGOwVfRA5px3sTbTh2DRuDXErkLkoJCPqO4wGVLSoX1Q0zUUhyrB4JyUj2gauuQjfMOeVaCFL6YdCjEjq+OGwi4b/r2Wb/3DA8njt4YefnHT3A+Mu6tjdV5fb0seASOW7JbOZWR2cS2uCQIi+P+TFnTMVfFmi8fB2stUFN2soQAv0ygFW3NbfgF0zeNRHdCpYU9aETzcH4KHdoW+uhtumB+GjK3hyWCIGtAzyiEklmX77GzUk+2zIYbVUAi18TaENR6OFbeXd8UTNzbJKESHwksiUtAs1aB/vQfszE1DbM4Kv97owe1Mt1lU2IJOFa+n+tu3d8/vE1PSa3zMWbrdLGTZy5Hsfvz6x6yUddMQSQJvMyoyysYnEvS26lffus7p0HKIJecfH9UC7S/DRR+8RywE+mD0Lbzz7FLKtRXjrdhFtXEForKiYecgMM4tbYRMxGMZ1gxTkxBADffRB7DpUjkkP3E3AIB3vBuKz7tcUoZqVTPkeyppOSCoefuIx3lCWs7CoEij3UxxfkCeYUU++WUjHmbg89UDAyBFXYM3a7bQRmNUYNrYY2HkRAKZmZmDo+cOiO7jMQYpdE+OhPBIpyti1owjXXDUOsRnbce0taWTpNyAUiV5LtFSIuQ/M9IdmH5ZxCoiUmTvP3W26GXDQowXmbG4Ftx3AsHPGfOaw/z5G0aZD/p7UVm23NJbs7tsUUnBYq0RNXktEzihAbfdEGG66D3qQCAF9j0LXK+v8FvDkWMZQLWFuYUAROJBLZGq7DjUC81dAXbcXRrkfUpdcuPt0gP/7TVC+XgfraXmmD5nWXEQ2jtFgPQpUepRVceXeKL3ShaOt6TR+H0Rudjb7ttirDKysRZXI3BfY+MKUJx6w2Wz/66x76ZFHHvnDb2Jmalq1YYsvfnPOwovPau2UYhDkESSBa/hY+M6q0AJw0cDmJHvx2W6Fa1C/f3UKxp/pxIo9KqatKkNWsh09UmwI0ri7bEyuWMJXhQFcP9CH98Z4cFaHeHyxqRHrj4i4pI+NV/Zv3a/huuk1mLU2iI07q1FDO3VichpirH5EGEW3NDcjVhGwStx8VGk7UVgKgKLzLjWd0hWMbGdDeoIPe6pAn1mDPkOveHPAwAHrfu9YZGe33PfGJ3MvtepqTN8cYnhhVlSsm92QRVOTgIxFyHRi2+vtuOGzeLQ4/XZMfflR/LByFW66+1Es++Ql3NarCn8/30ASXYcaXRjcH8qaawpMgpgxSTZBdbTKCqF3WyveeX8Jlq8vIXbTn5t7zCdlxvTM4mVWiCyeAKyOWjS8342Fa3DZrPJxSzT6vl8c4r+m9QnNJUDm86cN6Iek5CTTmSuaPRLZ7turTx9kpKdzcGt25DWDOgPbH5auxg1Xj0G7zoW4anw8AViApgsxB0j8fTqLunJtB8MsHI+mh/D1xLeIaFEOX19RMObXH33NEKPNOoSjP4/+XTQvTj/6ecLR140oE1SiZU7MNFJ5tyAGGDZIW2uRuL689tknnrolPiWp7ndFGGmuLlu64owVm3YWHOjSElVXDEDTpV0QbhmDiIPGJSLyhFjdpvJIsE4EU7K5yPy0wNsYRny9AkuEwNNl4TWhIgu+bC9FZPFWqLsriJm5IT1zCeq7pSPW50WwTRIsyfFkqdD5S0dzUo5GaJsL1c39SfiX9DrTAS/wTUwyTFDjc4QA0FYfgm/O9oZpjzx/Sace3f6/NOZPCmDxiGGnTrtXFTUqG39cMfj0FiLfMR2aDqvOomBWhCx22NFIgKVi3UEJdWUKJp3nRFraIYQjLizYZiCemNbwAoObdBaa4It3WLG02I/RXYC+HTxwWCTkJQC7yxsxuIODR+Cy0mLQ2CDj442V8Dkd2FgcwfxV5UhJTkC7FBFFtXZoBA5u1lmEZUErATo3F401Azyu60Jmj5O+0IKONMfOb+9AQkYCFq38ucfqTUW+Nu06bYz1eX6zfnCs1xVw2+TS5977ZmTfXAMZ8US5WcSTJpGddkZdskB1hbBurxd3fWyHo8Vg9OyRhWefew1ff/ASzovdgCfPt+K0PIVM3KDZwEHAsVSF6MHFB5nfj3ZG4prIjglgaGcfPl+2AzNm7USfHp2QQGPAJl1zE1S+FIVT11yDiTjyUPhxwMgWJpOP4fYHjwCb4i9cIoden/HuZ7h3wngMvrARw0fFEFiHiDkYvNyGCQ2aACMeBRgORKcQsLiUddR0YsEk5qNkASQhoCLyyU8Yd97Ipy8eO2r+7xmnwi3bMu5/8J6nF1Zuubjh2n62wKU90dg2nq5X405wFoRl3YxUpkNoMb/ft7sGjq93I/LFehifrERk1iroCzdAJCblaJeDkJuuIcMHzyAy7Tfuh7qvEkL3lsQu4iHP34Dwhb2gyFw2ktelHm3oK/xTWswveglEN7nmF8lEZA72ZvrE0lDctFKUeT/hwYuuu3H05Vd+9f9tZp8swGKX0H/A6Stf/WJjJ1QXte2SxcRSmNgYSzI0Hc9sR5IkJ1YekPFTqYEbBnnglmW8tkrHpoMNGNHTjYEtyYxjpXJ2GQsKRawqbkBWRhKshg8TPynBpX18OKudl8ytBi4by3xgS4pEYmnVmH9vO9w41IeZqxvx9ooyDOmciMmfl+PZxQ1kOsYiO9YJrztC7EThLdjZYeEmjMFD6wYNvk2MoFOmDf3a21wlWzac9tq0+edXN2iNBV0Ktsryb7OoCzp3275+5+64L77f2etcAla3NcJLfCW6fuaILFMcuGuegcOyDzlGERqLvsXp8Xvw4GAJ53UJE7g2QCWz1jhuovwzYPGKFQurx6NJo8gQCNncXj+G9LKhZP9BPDplNiRnGnp07sAnkhD1VZ0KFcpm/9iJnP78dy3qP+NFyjJvmsE6Qf/9gYl4750ncPWtIgadQ0wmrENVZK5Kyg6NqTT8yYBl+u0M2oDBC8Y562PZ3t/uRKdK+8bX3nrzervL+ZuqJOqra+3PPvvsTfe+PumdNQW2wYEbBtga2ibRJkXfpjD3CC1+C4uXity9wp3cDhuszA/1wBw0LN4MvfAIrEN7Qh/dD/r2EgSX7ITF44LRPZvGi1agx8rdI/ixCJI/jJj9tYh8vQlq1wwYqT5+P4zodnaC0oR/cSM05+81/4vfQ842WVmXFZaFm3BJYsFrk598dtIf4hc8WYDFHlaig5269vzhiQ+/HtzWF0jJ8bJuHnY+KFa9CWGLAxZCmO0HAgRGIRTX2zB7pYZv6PdRvb146EwDNp4tzCimjrd+CmHnYRWHKhrx6Zoy7KyXMa6fEznxorkvEFuRtCAeWtiEFI+OBwbZYHFImLWuEVtKAriiZyLik2RMWVKKpdsrsKG4Eafl5yLOKXM9KIvVw1Y9N4W4LS6Y3Y01VUesECLQikXPDD1p3sLFF74759uu3viEfW1a5/2P2boMRPoP6Pfj1Dlfnn2wuCatfwcnJDLlNNoqZcY6NQ39WllwffdGjMj348LOArpnhOG1NiIg0E5tcM/bUaWBEwEWX8C0GVh0sz1WyG5wjSSvEkL/XipaxgXx8tsL8dXyrWiV1xppqSm/UHA42cDVDI7Hg+RR5Qg+3nSFosRZ1YoVGzB+3DjsO7gQEx7yon2+HeFwA3RN5OkaJtCIUTD58xlWhJlc9BkMQDWaz9adVZC/2Nr0/JOTx3bs0XXPbxmfWXNmDbnx/jvfXhjZO6729kExWv88hMm2ElQtyoIFrpYhyHQuLMGTTE4bbdBiKMwKB2Hv0hrGjhIY1U1Q7xgM/eyOsCSR+UzsSXPRLn52e1gUFQp9pl0kK+O77VD2lEH3BxFxiry/o9KrBZxHGvnYaDbpV5Ntj+NU5m/NktxsfJgLjUUNCayEzQfQdY/y3buvvnW9y+2O/BHz6KTbAx3a5pbdNfH5G5/7yVrfQMDuFJpYpRxY0ziRbjBLWnPxG65i15F6fL6rEgkeAY+d70ScPYwQ63pnJdCiG3OolLEhK964PAd3X5CDrFgdcR6Nh/V5OJZMuYpqN3aVNJCZ4UNVOBOb9jqwdmct4p025CS58dO+AD+vK3r58PxVeUh3NvApOntVE174tg77GhjNkmBCoMhbS6kC2Z1qDPRwBK0yIph2TSxubrd/2NSHrl46/tqxzxUX7sj8n8YhKT6x6a2p08YsqnLsnbyYJo3B7yzRehYZVZCdoCDNGoZTCkOJhBAhhqSQ6WiLiBzUBPpdVOVfzYcUDBOs2GRWrKwMRSIgZGItNFmbNJzbScGiuxR0Vr7C2MuH4Y77HsDuvcX/Ns3hpDusm8HL3B+wbes2jL/uZtx2/Uh0zN+FR55hfSJDCAebzE7TLBrIexSazVH/Cg8egCCwtUXA/US2KjJZZ67GLWPG/eOckcOX/U9/X7RjZ9q1V4965aZpTy7cMaZd//CD50GgeaozIBLANyq2VbEEXEMWaC5IkG0EinurIb+2GLbHPycQInZ2Rg60we04GHtW7yUiYDGz05m10CMLiovWkSUKurkJENun8+w8+6UDYX3xGlhS42CjpSHNJYAjk1GwyebOKB5vGgrHKghE8/5xMiGaz3PxR+aEp3OVagJIWL6v9OV/PH1bYkpy0x8WeT2ZDOtoxKN1q8Mrt5Xa92//eVDvbBsMJhInMj3qIDEbOz4rBH7aq2DhzXlok6rj45/qcbBawjkF8XBzp7SCBjKbnl6m0i5h4MkRScjPlNA2UUC7VCfmb4kgI1nkPq0FhTJmrC1HVYOCuWtr8cnaSpT7Ndw+JAcDWltx18yD0MisePuaLHRrzUTqiOVJDqzYXY/bZx7GZ6uqkeazon2uizu0JTu9jkZeesKmDxO4YzkleZl2Or8ky/7CrX1fnjp9ZIMiVuZ36rqFtRL7tUd6WnpVqw6d1z7+5lfnkK3v7ZGnwxLReFKkSjNAEZiLW+MTlEnNh2SRNxK1EGCxiJ0ua8dSqv7Zh8U+hTdtEHiAg3l3ZM2M9LHEUtZiy+5WMagbsblcK9auXIWp78zGlj21SEiIpXNL+XPAih4rV23AE08+jtdfegQJcZsx/nYZAwc1cDMoHLHypmessSuTZ9Z58TLTvLdwdvPnMCzx6HtVNtaKQJsES3oWEHz/RwzN7jHjmVdeud/C8jV+5RFo8EtvvPL66DtffnTaqo72oZG7zhSVlrFmUEZsDljQd7H5RIDAJMA0+l1iZU5Tl8J4aC4aVxfDPbADjNPaEQvXYCfkEr/ZDK2R1hVLT5i6GO42WZDvPpfXnrJURUYSFGJkMjGp0E/FsNplhP/WCaG8JMgNRBBe/xqOEH3ZgDxijPoxkiX8k2loHM+wjrEfzr5kGcaCDZjYZ+Q9I0dd8c0fOW9Omcf19ltve/XbI6kHj9TT7kFUVpGYYzXM9bOqgxKvgasLN+Kusz0Y2zsGczbW4d7Pq3mOkUB2+rZKGyoammCzhXnYPN3XhAv7ePFTuQNvrq6jmePhofWvN++Hx2fHnNvzcOf5LozpSwB2QwtMujAJ8zfWEBCGMbjAjc5ZdB5NUTprqUdBfjKstKvk57vhdLI6RS+e+bwUd35aiVI/gabVMFmhynKprPATcMXTlnTPBQl45vLszO2zH5l+5YgRn65Y9XPbfzcO55x51tpJr7xxwxMr5eq3l9MuRt/JM6LFEKyGYvqdeYawxv/Nag8VmcZHFv99y61oLz+2w7GEXNbpmDUnEKN6WMwvpxDwRZQIOrUqwxu3KZgyLgS57DncM+4CjLjoCrzz4ec4UlpxYh8UmsUFtWOZzccdv3ijWV1I/zebop6oO82hQ2V4970PcMHwv+FO+n6hcTb+/pANd99nICu9ApFGglxF5JnrPPvGEI6dB79tp0YmhhWvS9F2WiqzBFiunx7hY61yX6CZ0MoUMxo+3YD2etLa59+ceqvNaf/V0P2yb77t/rfLR3x2/+a5Hxy578x24av6IEKsWAro/CdLd2EmmcXhgORywHDZEPE5yDyx82CElOCB0drcYCLltdEALcF562ToaTEI7zgC9cWvENlbBeVgOYQfC2Gx0N/KVpMVaQrkbum0lgT41++BdX8di91Dmr0G4mHanEtKoQVDvOLEZFnRQ4qyYR6hjs4I3qLbPJiiKxsLvaoBLSuw46prrvnoD89tOxUMi0fLYn3BTYUHYvbvXjeofw6rHQzRIHpwMJKAJxc3oapRQZJVx1m5DvTOk/B1oYKvtzbhQI0NojcBLy84jMJKVu5joHuaFx67hJ/3GLjpoxIkx0q4enAs9pRZcf+cw+jfJgn/GGpHjxYenN4+BgVZMu0WIh6afQT7CLAmX5GH1kls13byMKxoteGVhVVE6xXMm9AZHdIY6wrgQF0s7pu5A4u2aGibloSWWTbomsoXoE1nyYpOmjEa0mKCGNyjNSR/UbvX35l18dYDlWqXLt03Oh32E+beFLRvU5SRk7vpidcWnO1XXe6+rcksVBREuKqDndicyhmS2bVG4NX+sq7zIL7xKz6so/lVrGDruOhOc38FIborMn8arw2m60iN82NIF2BIZ1pwgR34asG3eGf6TKxYvQ0BGguWChET6zsusC1wf5MZGfrXrz/m8jDD4YJpzPDvVsIatm0rxLz58/DC86/g7deex+HdCzCw+y6MuyYGZ5/lQJyviusoqSqZ4cSoWIoAY0HRXGszJSiawmAqhZ18hsWrLgTRTFWgfygiF8XhyZPs9YiFVTBYEZi9ASl7InvefW/6yFat846c6L5XHD7ifeDB+x9+ZO7U1wtH5HUSrh2AcIwMXY3wukvej5JVk8nsfsvwfrsT2lvfwf7eKlgX7URMXQhSdjLCZ7SDtWUqIovIfCuqhHxWRxgMxOw0azaXAIXl8N16PqTe2Qh/vx3h77bCRetGa58Gwe0AU4GwEXVU5q+HWhuCbcN+WLaXQAwEIF3UE+KFPRGJdZhRZCPqkzIzcfgc0sVjuVl8Vhhm4xT+NMt9XLQdt7Y/+6lz/zbsD1fpFYxT2Jxt647d6fddO+znWeccTvXYwygMxuP5ZTo27qkj+98Dq8eKQalB3HC6G+UhD95c1oC9lRG0jlPQOtWDuoATFbWNaPCHUUGM41BpECW1fky8MBcFXh0PfVuHjfvq8ejQPPz9Ylr4QcEsg6HJsKdCQ/6je5Gf7sSqB9pDNmoRsMTAiQb+uf2e2omHL8rA5f0SoPkVSG4Rrywqx+3vFfPF1yJJxtSr2uGsAg+aVBmuSBl0yZQ5kVgCH4ve2K2orgvghUV+bGpss3j8fQ88PPScM3/+tfH47PP5Z9x60x0fXN1OzfjHBay5hIKgxML+mgmkBKjcP0DgaeF+G4Hv8kJzfbh4FBuOOePFo8h0TDUhmibF/yUJx3K4onlYgsXKZT90VUThIRXLtviwfLcd1SEJ8Ym5yGrZBdk5LZGV2wpJSSlITnDD7nSaWupR9sbliuloCobR1BhBoDHMtJNw5GAxdhduo3u/GXW1+5Ae14BeXQSc1juC3CwHz6Rv0MII6govo9J0JxTdztLJyLSN8BItlpDIDoV5P5lzm40DMUn2OwMflZk5zHHA3keriWVzMbOYyewo/DWRm9zs3wx8mP49e58imKa4yr4XMD/bMPh3qoaFR3JZzhsz1VW2XWgSgmwbIXZNewqa7GR2qy5UfLYJnq21B2e9/fHQHqf133bCez3z4zMff+vFSTu7enqIF/eDSmPIGp0wnmjVWKUGTMZmkckkozF9eDYiP+6A97QOcDldKP9hMyIH6uA+uwPUyZchTEzKdvtMqB+thW3cmVAeGMI/wzVtBZoeWwDvdYOhPHYRrF9tQGTSAkSKyyC0iIOvT3uEzmoHo7IJ2jvfEytLgd4lB0KrDOg5cQiyHK8gsXo1Ym6PvF4wym113VTf0EXeCo7J3ZjF3QaPSrOhEWub0Hra5j2LP/ysb0aLnKr/aMBij1tuvWlylyPT7762r4SAn266ztQW7DRxNRagQyggcie8zeGEagvRTZW4XLDVbuM1ZmzS0WaNcFgl80ZAHYGXKsVi5S4DS+iGErtBnM2GN69NQ7sUYlCRIEvPxtcbdZz3ShEeviAdj1+WDa2phui3DQ4yyT5aEcGk+bux7LECxMs6N0F2lVow4Km1BI4RTB/flSZvCI9+vA+L7muFrCQ3RKLMTE+LsR9TH4d5m0ImelglLC0K4cUf6htzCka8fO9DE5/OSEvyn2g8vvrmywG3jp/wbo+k+lbPX9KEdALySJiVoqicLbHCVS0qsSKZ/Wf+MMDSuGCnGM3H4g0RIbFMZxoXg8a8ssHArgMWbN1vIyALoaRGRkCJ44ChMYe+akGEBQOYdIxFNQ8udWzhAGuTGxEb14iMnFh0yBPQpVU9YhMJ2C1kToVZX0im6kH3mBVq68wnJdPvFl5Zwl5RweWpOTv+MwGLgRX7O65QQNdbL8uIyA44aHzKP94E1yFl9/tvfXDxaX37/4tQXlHh7uR/TH7y8a9Lt16ljOljjXTNoM9lvljmkyKWyBQ8wsTUmE4UE2y0u2B79HOIKwshvHIVQh2zaEyJqZZVQ7hzJhqX7YJtVE8Yz18Jz+p9qBozBU7ZDcu8G9HQNg6xy/ah4bLXYUuIA14dBUtaHOQasgY+XYXGrfvgTo2FeEZ7NOUmAG474HPRumNjQ2PNmJ6qc5+patbUmIDVDFp61LzXhaOqDEazM4sVSBMztBKAPpQ26J6Hn37quZPi+zzVgLVz/+GU60YN/eHN3iWtO2awaeKmiw0ReGiwBtmSZAW7waimEWv95CQmY/pCLEwWV2BNBRx88WrEcGRer6RwnSVW2V/fJGLFQaK2tDuf3jaeqG8TBIcLi7eFMWTyVrx8WS5uG5YBLUC7mxSBYk3FeY9vQq88N54YnUJI2ISA4MSIZ3Zh0bZq3HNBAZ4dn4B9W1W0uH8dnhwZhweH5dBipcVpayKT0EsmjJ9TZl13mRFQRMjM1FCriHj/u1osOxS/YeRNDzx4+aiRiywncBtu3Lapxdib7nw7qXrz6S9eZEXHtCqyNM18GJbcyuLZQQf7ocCuHks+/iMYFnPUR2waL/A2a88MjmESBzD6hdUGydH8AY3YRkhHRdhDJiPdB3q/yrroECtkyZ8yAbjNpsJuJ3OSgNfOO8/LvCkt8/gqSgAa0yCjvwvT+QUE1sFYpt1a4p/NimQVYpcMeBSDzHhNhspLPvAnApbOzVONf1cYfrom1UIAUWKgdOY6dLLkfvnq1Kk3t2vf7hdttFRimh++9fYlT8//4InDA9PzIn/rQnOCPp9McXYPWHSc/dQILHgKAKuHpY3as6sKwctegv2ZUdAu7IZgYxO/v5LNCt/uBtTTa1pFPeI+vAk1Q9tCvuZDaLN/hv3e8xB64HykztmAmhvehmYXIHfJhNanBdn83WDkJBEboHsg6xxkLEEiCGzMLaZelT1kavYrkqnOwMDTiAIUV3mIqjUYWlRyRtOiQo5mgig7jO3lKJi3b/Pij+YNTEpNqT8Z+HHKfFjNj0Sft8kem7Hz6elLBheV1HsO+VnVuJMnUMpM5dMR4LRYEGIZNvHcHPM/Vlcm8/C9pJkSGWyiR6KKngZb4EYIDgKKNokO5CWYRbOaJHPJrQSfgG+2BLF2fz3OyY9DfLKdg9zURYewbFcFXhqTCq+T6brE4+Wvy/DGt+WceXTK8vGM4kc/2YOisnqcWZCIAZ3d+Gyzjve+O4L26R74YqzwG3Y6wybOgFTBxRmKi0C3T1sr8pMDqZ98Mv/yud9vzW6Z12ZjSnLiLzpepyal1F4yfNicFetLY6bM3dqDAFlomQ3E2MJccjpsMSsEZCY/zU3GE/uwhF9kJgu/eP5okEcUjvq0TBSjsaMFa6GZZzXMMh9wVieZ3afZJFV1PmnZeFgsAo1TGPExISTEBJAU56cjgHhvED53CB5XBA7ZLEI3nU6sAUSYJ74y/SZWxqLwilILr/208DIjFmzQoj4lU9VDZ7UmmpPXWJrPCcd8UdzvJJwSHxaXmuZOdzIHHXYCLie0H0tR9fZaDG7Z/4P3Zky/Jisn+xemz7pVa9rccd+dL71yaPnjwXED4/1n5LFKWt4BnTuyWdSPN2ujcZetcK4ogrZwI6QeLSF9vQPhr7fAfllfGJk+LgvDNg2mN6amxsBLm1f4O7I6vXZIQzrCSYxMnbcRQmEpnH3aInSoDHrHTDiuOwv2kb0R7NsS4UQ7VIXMa2LAAhPkIxNFJXASNINvtEK0yEDjPivBbOXGVEVYYir3q9G9ktkh8Y7TBotcaqzkJgJnqR+27WUwVuxCxsbKPc/d/vdxXbp123Oy8OOUM6zmx7bdO7NXLl/Za+2aVWfWHSjKF/wl2QQvsWnOoCPRqcHrjkGaR4DPIRJzjcBHOwPTjPZY2UJm5qOVGBLdTIlJi9jMKnVIZj0dE7lnchY8HM0YAGMNMjaU2XDXu/vg1xrQq50P9UGCmPIA7ru0NXp38tJNsP4/9r4DPoo6ff+Z7S29EkoICYQeWugEDL23gCKcCKjY70RFPc9+Nuxd0J+oiPSidETpvfcWIPT0stls353/+343k4uR4zz/ynnnfvOZz2Z3Z2dnZud95nne71uwfP1VjJl+ABZjCCZm1sZXRLGvWsnECBS7tAjDF7c3RUKUi2SSB91eOIJ6oTLemNgamU1of5x5omCej+7IGp7xkwMtqNRaH1zEvhZsKsPcY9L59LH3vDjlrns+CzH/2CnPBfw/nzV32JuvvPpSPe2lJvf0MaJXqhUWNRt8oMqTVvb/igwr8FGvSkz9iJtGYB1PwHmv+ofTXpQ6lgJOe6lydqgS7yqBUS2+hAsHKqAomqFqAozIL/oG0s2FzJQ9N+xC55sMG4eLQIlf9/otdIyy6AzNYRh+HzMxLXcu/o8xLNGVSKMSYRSeM17krjkL1Rn3lYfuefDJO++dPMtQrUxKaXGx4f3X37h7+sZlj+cPaxEn9W8swgm4EQYnqgemg9Wi7Aw3qwWxJvNHm1Hx9goY2icDc+6H/M4P8Ly2DPqnhsD+yABIVrsAf5ZtHpMXkSedsPd6FXKjKKgX3itmkLXDp8O58xRUDWNgmNwT8pB2sJvoV3LYRfFEBmeud0WEVQgXDbeQ09FrPpUIOJaJAPi4KqiQvGQrFSQN7XTWHG6obS7oy+l5qR0eawVgdcJQSte2020PV+uLEywRZ5vGJx7sld5ldecOnXfVTU4q/C1x4z8GWNWHzenE1dyCmCtX8qMunDvTsCjvUnxxQX4UXQAxtvLS+h633eyyl4W5nHaL5HHp6RKM0+g1xlB1uTaMrgEOCq1l8aN2mBd1o1WIi9AhzGIRmpp/DD9XQiSDl3RGODwm7M8pxum8MoRYtOieWpfs04ftl724UOzDSwuP4UJJGT64sznuzUrFu7NP48kVZ7Dq0bZok0B3Q1Up+Ao6mK1D95f3oazCgTidATPuTsWQdnoCHW9lI1C6NulO5iEw5ZktPUsBYh6XC914doMDeeqWS/7y+JNPZ2Z0/omT9mxOTvSrf3/lb5t+WDUiKbyo7sSOZgJEByJDuAKily46n2AdzPxkkZYoiUBXMWXNs01qf+X0M8/eyIFZHSVlohKwZFW11Bh1IEFR+QuwuB8F1wRayquqzThWBQ3K/0hyrpruVj4XSLD2CZDwi0hw7hQvAKESRLwKADHYVAKSR9RDk8RNx8OliH4RYEkBwBIhpqrAOnIg6Zv3wy22B/GdLD39fg2cKl/AyS8YoFaUvnG6nCjOcSJvQz682cXObk27LHnqmWefatG25Y+6KK3+dlmnl96Z9tL+Wv4evnFd4GFm7nGKIrkiOZnOu5eYkpoYVeB80k2QZwLn7oH36x3QD2iL4uf6Qzd9E1yPzIUqvT60cx+CT8/VDzwic0HWkeRm4p/5KtRJEVB9fSccBGS62z+Ha/MphA5Ig3NcRzibxlUWq6jsG0DHaua4NacHLgIdKc8K0+VSaAscBEIO+G1O6Ox+GJ1+j97lt5n9qnydRusOMRjLQ42mMrPWYIsKDTsXER5ZVCs6trBOdPzVxKTE7Jj4+GKSfkVave7Gxe/9HgDrunEwfOfzcgChW+V2e7Qul0tdUEhgVlIcVVZSGlZUWBRRXFgUWZifn1xceDnBWpIf53Y769Xy5ie3iHYauqdq0ahuKFR6riRWWdaVGy/wzBhf0f4KlJN0nLu+HI99cQIldJlmda6LeVNShfvlnUUVeGjWVmx6pjm6NoznLhSwSgYMnXYIG47lYUS7BIzPiEJKuJvkoVZMyXPkM0fI63Qk4902+hoD7JwS4WMeQevodNi0vxDvb1MX1+8+4a2pjz34Rnxc5E/qW584frzuF1/MGbN0zfIJ0c7jjYeTvLypjYTUejIBpw1E2wI1i5gp8N2Tnd9C6qgFK+DZRk774QYR1wMsqYqpydWimPEjwJKvAVjC11o5axkAMPkan5MEeDCr8craSie2KuDIFtUNEAAyWapiOQorYsDiAI9/F7A8kj/wncTQOEHa59eIbfroMza9U7Alya0XaVjs3HdJAUBTce0ouixchKollyuQv7cMRYfKEeLUXerVpduCW8aO/6p7Rvd91eM4Lpw5F/Xuiy//bc65XXcWjW1j9jNTIqYs/D4cT6WtzPnTasFtYqUdpJaOn4d/XAY8dE3qQiKgJ8BybToK1ye3QXuuCN5Bb8FbUIHwV25B+f094XNUQM3lhs06WLZcgn/Q67BNGwrVpAxIZ/NhXEC71LEx3K0T4VaT9HS7BRPW0zFp6RqxZV+FYftpWE4Ue+Ml87EYnflq3fDYy7Wj4i7HxcRlR0VFlUZFRpaEh4ZZoyKjCqOjo4s1Oq1Pq9N5dHqdLGl+P63RfveA9UsALje/yJR96lTS5i3buh3evHZ4mPVM5871KywdWiagUZxeNIbwSCa6cB3Q+TnVwyCC8lYcd+CZWSeQkRKCOwen4tzZEtwzMxuXiJbvfKYJ2iWHCUOcMq8Ab31zAun1wrD0r22QEENGUE73ajsxK4OegKwIM1bbMKxXHIY200LvL4Gd79iiGqMGei+xNKMGJbYQzFxfhM2F8TsG3PnIixNuu3W55hqhvJdyr4atXLWi7+LFy0afP7m7R5swd9SIdh50aqFBQng5t0MRTnoOM2DAEnFPxOYCklAKBPr9gQDLLZKjJTEhENi2SlQ6YBDxifguHZz8GTXnAfpECRQvnb+KKypcPVSAq3uLoSoylDRJarZ58ODBc/r26bWhQUryjwrwEfNSfTnri6zX533y7NVWcU28g9vAFc5o5w7UMSdqxc1AuFSwN9wIS24FVNM3wDV7O8Jv6YqiacPg4ZQjknT6s3Rje2kZ3O+NhSY8BJYZm2F9diGkEJKMb9wG1YBW4gakzi2G567/o99QB8/MSfCa6Uw6vbQJEwGVHyqXV4CgnmSgOrsI7h2nEHegsLy5OmZL55Ztv8vo0HlDi9atjkfGRjv/W+37fw6wag6H04Utuw+0+GHNsv7ZOzcPifJmt+/dzKLNaFEXMZyH6KkgOcCpMMSI9A5cIRD5YNlFLN9ehEP57Bv34oF+iXjj5jrQhgBrDtkw5JWjMKk1WDO1Cdqn0ibs7IvRi0oDGnURznvD0P3p4zifV4Ex6ZF4eUQ4EsO5Lw9pf4IulddIW+VKmw5an2t4qfHWD3a5LKHTrAcefXxaj47pR6+Zt0bGvn//4eTZ8xbfsmn92uGy9XTbXk3LMTDdhC4Jdqh1gdLAoiS3wAxNIE2HG6FW+qMEYOF/G7C4cq3wPfm5Qog2wK5EKAZf8F6R9sQNQViquwq1yD3sxLk9hbBf9Ltq16m7rV9m/8WD+w1a3bJVy2yV+qd3kF0bNzd74v1XXtouFwyRbkmHm0MESP7zuRBNexT/ocWA0Ar63o1HoJ67E3JOMRwkxzQNY2H5yyDY+jaE0+RDzCX67F9nw/XwIDiaJkBN32n+eAPK314JlY3OQJcG8NeKgPpgNjTxsZDfnIDy2nTjddkDclOnFb5C3VUb1JtOwbj9nK+JzbyrT5tOizL791/boU27wzdStgUB61caZTanat3GjR1XLJkzruj41sGd49V1hrUNJYnlF/E1Mi2Sni+ASBw6W4zNdJeKski4pW0cVCYTtp2y49a39+N8gQ3vj2+C+3oSS3NybqFbpBi5CPT0+gp8t9eFwe+fp9d16FI/FFN7m9C7S2jAqcmlQmGAlz6n8VaIFBouw+H1aTF/tw2f7DcUdxx88yuPPvzIe5ERUf/0TlhSUqxfvmp95vLFi0cd37djWJ3osogB6WqMaOZEQlS5cHz7PBy24BepHlWSUPO/D1i+ytfdEgciyOI9EZ1OnIebojjLCKROuHF2VyGKTlfIscY6hzO79F4+dMiQxR26tt+r0V+7bFDepSsh77zx+l++OvD9fbn9U+O0nVNh13tFWAAnmot8U87347KHdDDmXRdR/s0OqPNKYL5vKIFOKHzbjsI2ewtUuTaETe4Bx32ZQHgYdH+dBSk9FSVD0kR3cp3aiKhN51G2+yTks5eBEBOkFonQ9m+FsigCH6dbJChzMd+Q41fhX30EMWdKcjJrpy0f03/E7PY9uu62hIX4/tds+A8FWD+Kuj95OmHpwjlZWzasv7mhqqjzXRl+tKwXSVd/iXBoq7gxhkaHcpKDW47LyPdYMH3tKWzPLsSkrvUxY3Ik3eE8hEExZLROMqtiYbhOXzhGTjuDVbTe4/1q4eVbGwH2Mmy7aMf2S2bonE40inGjc2MJISQbPG7OW+T65iRPNSbkFQEfb3XgkL/ZhkG3TH4ta+TQ1SEW43VLyh45cDRpwdI1g5evXjnOVXIovUeKAzenm5GeYoPBzN1bXTxxGgAp1f++JGT2yrFbHlUg71SCGR6bHlcvluHwbhfOHylGqDfidLd2mSv6Dxi4PKNHt62R0RH/9OZQmJdvnjdv7pBPvls05UhDTTttbwKVMBPdZNwEVLKIMOcKqjzrJlt0COHQg3lb4Zi5EXKRA4bkGKi/uBe2WAMM3LvxwCU4XloCz/5LMHROhuXF8XAv3kLH4YbjsX7Q2tyih6VGa4SaANDo9AeS4Ykd+z2BpiIG+g7vsSvQLNyHZsXSztEden8+OuvmRXUbpxT8L9vtHxawqi7GMpt+wbwvhq38Zs69SZqCjPu6aZFaJwaw8Uyfiy5GH9YcAP7y5TGcKXGjU9PaWHZ3Q0SFXoZT1tOFYxaRjTIBjmTU4pOV5bhrTj6a1HFjzxPNUOaS8dDcHHy7twgZ9cNEy/G9Z0qQEKPDG7fWRceECsITDilQid6Kfg23ANPi5FUJnx/wI1vVaE3/Ubd/MCIra3W45fqF4MrLbdofNmzoNnf+8tH7d28cUNdwvu6g9iEY3LoMDWpxM4pyEQzoF81NA055MTuormRflSAmq+WqkujSDQEsjaik6hNsqBKw5ABg+aoAKwBKbgFsUmC2UUg9fyVgaQKAxcfGXajZz+PWoeCCDyf2l+PUfjrPpWEFac1T1w/qN2j+gP4D18UnXD+48dzp7JjZX88Zs2Tr9+OzE/xtnH2aw1c3HBI71WW/mJEV6StctkWjgd7hh37eNugJMK1dG0HrUkN+ag4qrpbA8nB/eCZ1hctrh4HYk6GQtvHuCpQt2oOQWsTgm9WCHK2B/cVhJP19UHklETSr9geq04qyxSoNjHRe3KdzEPX1frl1UeiasSPHfDBy5IhVpv9BNhUErOuMUmu5es6ipQPWff3hExnhBZ3+1CsekWY7fNz1VmvCEQKQBz47ieZ1ovH67bWhl0vFhZRbGgp3RQXqRdtxuYxDHbKRU+DC4skN0KWlBv1ey8eenEI8NCARbwxhB7gBZ61GPLcoDztPFWPun+shLbIMV0vDhPM3PpzM2VMRmMHkGlG5Embu9+OynLS+aafBy7t07/596zatj0SGmq97gZ7IPpuwYOmiYauXrxiZe+Vgj5vqa1RZnezo0NSACLNLxKpxhgGHD3BokGg6JvpBSoE276rKBGeuViBiqjQiPIKzDkSK0K8IWH6enSMA4H4JLvoeN5eS4QB/OdBm3kfS2kfreEUOgZ+kXoBdcY0sBjovhyOI2vYmYryhKMp34fCxAhzb6oHtksaZlNRiXd++/ZYO6TdgbWrT63ftLs7NN+7ctq396h/WDPj2+I6b8xLNiZquzeBMiqDvorPlDWT9imIRak3gmLmShkoLo9UD/0Oz4Dqei5CB6VC9OBLOJdvgfeZbqBMiYPxsMsoa6KEvo/VIzolg6Xl7UP7Wcmgq6Iz0bg7p9TFw6Lyi+QbLSj65DFZqvR66Sw44529F23OeTVOyJrw8dOTItYYQs/+PZKdBwKoxruTmmd545ZVHTm/5+tEHb4q29GpBQOIsFX05rTYL3lxzFRdKHMhsokeBVY2l20rw3LBY9OigxZ8/LcK7G8qR1SoEX92XjLtnnMDnu8swLDUCMx9KgQV2aJxW0TLG6QxF+xcvok6SBssmROHJrwqw5CwwvLkWgzqY0SG+AiqnisDSLjIBTuQasfYUGeIVuKzGpP3xaR1+aNax+46mjVNOptavnxNqNLr11/K90EW//oe1HWctWJm1Y9P3o+poT9br3xro0j0W6bGlkDQVXHdXgIdKLco4BCYXVVJlTJW2spddZbq+OoCTvx5gSaJTtQjqJMbKYMXrMYB5CZ4cDArcX1IEdLoD0pEbhzCAqYiPaWhdMvySYi1OHHbhwM4SXDin9sZEpOzqndF7+dBRI5d2atXseM3T4nWT7HK6tDar1XDu7LnkC+dz6m7cs737luxDvc9o7S3cSVGSoWV9uONDRbpKVc6cHKimwJHfxgoPTDYPdIReJbXMQrJFXbYjZP8F5K/cAc+bt4oSxtLkmfAcvAjTvT3hvr8HvE4HAnMfOsBkROjWc3A9vwB2emr8/F5UhKsFMHKBPbdJAx0xK9OiwwhfcrhodK/Brz/+wJS3I2L+e2f6goD1G4xlK9Z0/HDaSy90jT7f68/942Hxu+lO54Fk0GDpFicenJ+Hy8UlGHNTHJ4d2gDbdjlxz5yD0NGFvPXRZKjCVOj29EmUOGWsuS8JvVv44XJzvp5fNIyVNCaMnVmC5QeKcPCF1rhSXIZe71yAg9aJMajx7pBQZHWykLHytHWeyKv0kszx0/Yu5Gqx7ZwLh4p8KPJHlPt0sTlSRGyBxhhRYjJHnw+PSMiPTYjNS6gbdaFhavLppimpFzUaNRnypZhFq78ZtHbRsuE5OQd6tqpXZhrW2YLMVpwyVcpRlpBJh3BeJ+tEkdjNspEDSVVeUVmAK5kyeEmVlQR/LR9WIAodItI9EH3O6Tkq2NUGEZIgAEsOpOBwiziurFpmJbZ6SsLebeU4fsQBs77OwS6deqwcPmTEN106dtxtCtH7S4sLjFs2ru926NTpFrbCitCK8pLYErs1uqi8LCrPaQ0v9TkiyvVSbbtJo/XUj4Q6JR6euBBRV54DdF26QKqS3imJ5iU+AiBDkQ26rdlw7jwJLbFnF3d+T20A1bhOKG9VB5GfboSnsAiO+/oSAplg/u4krE9+BU1MKMwf3YGyJIsoUxRoQKqCymhEyJliODcfgH9oOpwRWp6chkZLLMzmhvajDehRYJ7/9NS/Pdsuo8vxP7JdBgHrOqOo1KZ/8YlHnsk/tvDhNwfF6GKjCEC8BWQwodh3xYR5GwtwR08dZn5/CS+v49LLfozvEIfP77Bg73kJ3V49i+ToEGx5tA5C1Q4ywHICnTARjyWrnLjpjXKSi1Ycer4xSU8V2k07BQu9N21EOLol+VCvlhbnC03YctqPtDpONImWYdA4KrtJktF6tARwOtgd3AuzHGVOJ/JtPvqfjNlnQonDiKIyrfWqKeHYqDuffPFPY4YtFySB0GH7lu1pc5euHPbD9ytGGz0XmvZpA4zopkJaA6uIqeWZL68/4KBXiRlGv6gXIRELkjWuQGrJrwFYzJgkCIDiAFt+7ql6zmEZgQh5ruTB9cJtDj1yzuiwZ4cNh/bYWQKeT2ve5bvBgwcv6tUrY0tMTGxVOd5PP/x47OtffvxMgdnXsDjJTODBZXQMoiCk1kCPJr3IyZNC9PDTjcgtEoErW7MraUdc1UsK5LTqXfT++qPwLz9En9fANaQN/KFmqFfvh2dzNtS1QqF7Yhi8PiI/DePhCucgYmJIxAB9f50L34aTME7sCv8jA+CvsEMI3kBuuyjxY+A0Jb9otkgS0ADdyXyETN9Y8kD6oGceffLJ97Umwx/eWIOA9TPGezM+y1r38fPv/7WXPq5DkxBwXRxZR1xAbRStty7YtPhymxcffF+ArJYGvHu7AWdyLWj/XDY6NI7EynvjIdvziUFoAhUYNF7svKRHxpsXUS/Uh2OPJuGF9Ta8sDofd3WMxPTbLbB5K2B2e7H3jAa9P3WIEjZT+kSjTz0XiunCbhjtQr0QP3TcLMBrDQRfVTUQDaTDsFTiHL49Vz14eXN8/psLvmuV2qjR1erHdjW3wLJqzXc95y1aPi7n2L4eLeLyokdmaNGrtRUxsbw9hyg5IqrlqtUiIFI0N/21JCEDFkk7lng+b5goa+JS2UjuuUTirVoKg4sk66WrKuzepcKObWUoLjIXpKa0Xj9o0KClffr0+a5+UuJP8td2b9/WpMcjt+/yD0q3SAlRcOpc0MhOwVLlqsTKyoqz6kDuo5jx4240msA5DEyacmcaNbQFBOTTVsNxJBchTepBmjYaNmJC3B3b5CL5PGMdXAt3Q9c2Ed5Xx8BpYT3nDeQN6kn27TgP+8OzRAWM6GHtUB5HYNmtGRwJIQIQuRaWmkuHa7l3JgHq+uMIW3703Ht3PzlpRFbW+qAVBoYmeAr+9XjgrokLU5JTsqe+8Lf37s473XVMRpiwY8mXR/dIC+rp3HhykBbD0hLEDKC9xIiEEDUaxWlRaGedVSZM1AcDtCjnnmX4cIsNbrqg+zYywk4SZ+4eK12oOtzaNZxohA16b6B8R5u6WiTW9iKBLKx1igqL9lvx+iYNYk3Ehuiib9FAhQGNQtCplpgnEzJGMDjx5xTG0LWuGpkJF2OXrVzdjwBrZvVjqxUfY5s4/tZveNm/72DDRXPnjZq2dtOQ1xZmd+jZWsaAm9RIb6KBRcsTAZ7KksuVdbx/ld4VcsCXw15slQMqYqIGAmGnNwF5uTrsOmTFzi0OXDxrtMfGNdo5sF/GN0OGDF7esmXamettdfGixbc6W0VakGKgG4wdMtE2lrsqlUdEwTNwyJX5jpIv8Mh5h2LiVA4wR554EG49+qzWLkEfG03Alw9HXiEMF4sAQyR0Lg/sRi20E3tAfyIP7r3n4d96EqpeTem3cIsZZMnjhty4DrSJMXCcz4c9zwpV9/awxlsC+ZeMmXTD8Zq4mQXt59eb0C1bveDNN2c93KRl84tBC/zHuOHlZf5bR8MGibkZPfp889HiA/UPHj/WvHnjWDJizoqx0F3bJVIk4ix+tEogOUGMRK8uR0SYheRiPpon+ZFaNxRaH3ELurgXHVTjhSWXoVFr8ebN9bDjoh//t6UQvVM0eDSDaxER++DYLo0fB3MN2JLjw8yJarSLtyO7WIcVRz1oXcuI7mnEJM6V4dV1OtQyadGqvpFklEckvQbKqXDirFoYnsohYUth/ZIBQwf+06aetWrFF2f27rn5ltEjZkXWb7Rj/QmXZ9bCgrobtvpN5XY/IknehoVrodI6A9X/AoFdQtKgqt+mOnAfZEtX3lcFIu/ZMN0irDIAeF4E3ueATpXeyziOYls4du0OxddfuTFvjs2Tc6bx3k6dRr7/8NTHpz722MOvZWZm7oyLiy+53m/lJzn71qefPZXdxJykItnHHW24j5/aFygtI1C8WqMqMZ8g5K3yuupHXWIkrrYQZoQzsxm0FS5gbw4kkt9Sx0ZidtLPs5lmPSSLCe6Nx0SNNl2nVCK93sDmOFq+tByaglKE3JYJ2+1d4SL5KHkDVTv5VPkNeliu2KH5YL3zVk2jd2e89/F9deonlgQtL8iwfvFIrl+7ePr8BWNeePb5/Y9+/unfnxkZqWkQWkgXL5dlccPjEaX8hbE6/SqMbKXH1SFxeHBOKTZnVyA1zIyT+Va8s9kGnVaPZ/rHoHWSF6+uyRONW//UIUzIARcHetJziRjSqsMy/tSYwERPFu5yoKgkRBjVqJYyHhxIxtPDjKyZXmw+68dtXUJFuzQu/+KpNDY1SUm1Tw1ThB/evLw47pqsVl+fGoVHhLv+NHr0Cl72HT7cYNk36/p9vnjZbZ8sPd6uXfNy9bABCejZkgxQ44DkkkXjC9ZPnCcZqKUViNlSeTUi1oud9H6vQaSRgPsxcmlmYmt6OkoPATi3cjt6PAyr11qxay/vu+lMm3Y91/79jaFzMjMytlssId5/53eqsJfrrM6iKJUmNpB+owkUfVIrXW/8UqV0lSorJ1QGmvmkyu7slQWi5AB2cassyG5oHDI0w9rCu+cM5A2noLupJXwd6kJyOzkHDPqGCfARqBPqklQkVqWXRGVRlZcAjWSl556b4NIb4HU7xG8kvkZLstiog2XvFRi/3l36zMg77rn3gQfmBq0tCFi/ygg16uTXXv37q29+kHzp/i+eePe5DG9keiMV3HYLMSM73FqvaBCrc2nx5b587L2sR4XVh9dWF6FxrE90lr6jTSjGdzCjfbIT2bkubMt2o268AV2a08/Bd3BdGTR+Ey5VRGBfsR13tCcpZvehQheDoyVFYsawQwMTrpx1Y99lP+4lYDx8xUV3a0eAyoiAT5Xo7CJsTvZBrzXA7XEYvHRXV6t/fvZ9mxYtztLy4UMPTP5k88bNHRfMWzDq4Ze/y2rQyF1r8vAYDGhlDZSG9gXCHjhOyx/QWKLkjEQSTF1ZbI9rL6kJ2LnZhkoyE5DqsZHY5rwlLhw7LJW1bDlk4Z8fGvZNz76dNickJJT+0t/I6/Wpfeyx16iEX01VqWLdaqXDT2Vn45ruW1muCvGXKgkk++7UlZ1/RB4it8ga3g62N9cgfP4uGJrFCQbJTWu58CR3tVEZ9YJVadzeyp9DEt3OWfVK7gpRA4zlPpec0cka6BYdQMrOgu0vPf7KQ/369d8ZtLIgYP3qY8p9E2a3adboyDNTH/2/IVdy2k7q7KNrlJiRVwsD18XWehBBF27dCB16tojA/D35aJmow7tZZsSZSSbRXdbvK4faGQm/XUKbJhISQyrgK+EGACQPtG4s3qdGvRA1YqL9InbHbjXjwEVSCbIdT35LnMxAUor+nz1Gi2b1yDg87qpmFQxJflmq8pFYndyw1VCh0/6yUiGhYSbPwCF9N/NycN/Rdz746OO77ntt/oQOSSExLz+gR4NEO4GtGypXmIjtkrlahMojmnSIIEi4RIdkLiYXKhmR7w7BS28bsG5jmaNDRt+vPvrszx90797p4K/x2xAjc4aHhhb6PB5R4FFyy4GqmirU6E0mV7Gof0xDicnef7RUqzx/kmgPz2EfLqg7pkCXdggVB3Ng3HgK9iFN6QZD7686BE+ZFfqePVDBcfvcqEGqBGpGLkdggkIwNp0Oehux4a82obczdt6bH3/1YP2GKflBy7r+UAVPwS8fPXp0Ofj+wsV9d6h6vnf/IiuulGmhVbuhl60EOnYMaKrD84P8mDNWwhO94jF/ZyGmzLHiaj57chxQOdVIqmXD8HZmHDriwfdnjJAtBFYkG3KKozF3TwWyGsvw+ipE0vL5ghJcKPGhrkmLBrUjse6sE3FGGSF6G0IMbiEH5cpKn5X39aqKoUU8SaAPK5J+hV88rU2zMzM+ee+xJfNXd7Wa0+dnPuzC4h9CAbMR0FoDs4ieQG9FEXQqcvvYV2SAhSRvbl4oHnzch9X7LGenffTZkLkL5t71a4EVD61eJ0eFhJ+R7K4qxqS63mQ4l2n2BcIZAg0XKhswiHppcmWFUna6calOLxwmkv49Wgiscy7cDuPpUhjXH4e8Zh/Md/aBvVuyKDPDoSBaN4E1t9hSVYIm0TatTg/T0TyoX1km/6V218fnzl4wJghWQaf7DRkRYRbHwCFDV2WXhJx5e+GBdK3aG9aojg46L/uxXMwrROPNjMYqFFRoMHOnFeuOuxEZq0OoKRyXrU7cRJIu12bEJ985sfOkBt+dc+OzjS50TVVhXCsvPFw/m6TG8uNqLDnqxsg0Cz7NciL3qgdtG4QhvbZdZNoozECWqkphBWi0VsL6HILIpCFze2d23/prHXuthFpFo0YMW2y3mQtfentvR4JqY+eO7CgioPBqRXCpX+0VhssOdo1ORn5BOCY8bEcx0r6fO/fj0Zndu+/9LX6XA9t3tt5ivdADCRHi+3/OkKpNe/7jv2onUh1ozsCTKqqIUPj2nIZ0uRy6k5dEoT7/2G5wtU6C7PaIJrb8tVzBgYGKcwN9Bm1gFnDFfqSsPn/01TsfnfTQo4/NVGuDQicIWDfyJBKYdO7c/lCD9JuWTV99OnrXrmMtmieYEG2gu6nXAa9fJxzQmU25DE0IVh52Y85uB1YeJKMmqTaoSQWGNvahXXIoyQ4HtCo7+rQyYWI6YHRXkNHTHZ1nFL/34UiBjMe6A83jnGhVz4hutX349pQWDpIqdUICJYGFjAGqeBZHuS89qJIbDJj8YdsWTU/8qj4FjVbu3r3zrgZJybufev2HfhGyztKmE0/L0Z749CKVh8soc6N5txyN+1/xoljVfsXSb7/OSklKzvutfhNHqVWau3vdeE1KLRF8yrCj9v8rwEJll2q52guBfwKB/X7BHiW1CoYKH1S7zkGdGA1tVmd4M5vDGUHH6/aL/oxiPtJf2dRBzSlWehhOl0CavVW+RZPy4aevvXdH11499wWtJ+jD+o+Nzq2bZ8+ZPWfsu++8vf72OR8927+ep/bYVlGoFUGMw22Fxe3D33ubMbhxFA5eKkCkyYPeSRLUTEiIIrWPLUb7OHaY6EQHIBfdqV0EVifKNJizx435x1zCeJyVcQS1Q7zYlafD39f58MIAIxEAbyBxmWSHTg44aph4Vbi1OOWIqBjZovGB3+rYh2YNWS/p5KyH7r1zsSk8PGbMIBsZrAOSVw+/1gnJpMPHX/iw9UC9i6vWfXhvfLWI9N9iNGjU6FxEuVxe7PGESNqAJGQfllzpnJJQ1aOjUkbX8MFX9uRTUEwEmzJL4hxLet3htEGXlQ65ZV2UhKpFtVnJzowyoLmFo5/LVNONRsotg2/jXjQ8bs+eesf9j912x6TFUEtBg/kFIxjp/huNvYeP1/1qxoxJJ7cundStXnmd21r6CGC4pRYxDxX3XTSDM5P9xMDcAljUgZZLXMpXGAl3lOYgUD8KnRpszwnFngtqfF/ghopYV8vYMJS5XVhzrBz1YgxYOVlCPJdKVnlFDSm1cL7L0JCMOVmkwRMHW+/9cul3XcPDQn/TpNk5C5b0fHbKvfM+ecoZldHRRkTLD7VRxr6jBox5SO199sWvht46fujK3/r8O+wOVcatg7fs7xrVyR9rIZDxBUCpshBYdVee/0dsKvCewsY4FIJnAT0aqVqjjoA/SqvTiprwHPXGEe2BwHgOTqXzr1KLZg/YfALJF92nRnXvP+OO8ZO+rJvSoCBoHUHA+t2Og4ePJH7x+fSJB7atmdg5zFpnZLIdjUgumjkn0OMQSbDcZovjhcRsmmgH7hc1572SGlrY6eInY9PpSF0ZYaX1rRUOnDofis3lFuzOsaF/qhP3pbvhdvkrCYEaTs5PI9AL1frw+T4Ju8PHv/fhJ588eCOO+emX3r73+7lPf7DiHSA0mns1huDPz6hw3jlw/tKVs27+lULk/+WY8vgjz39g3feUt3MKZK8n0K1YUlVNDMqoPhsY8DUpkxRSNbMIVGoIzCjyVIJcWUNMFAcU3dBU8HKlUTUtDpKDZwogHbuI5Dzp+MjMftMnjBs/OzEluTBoDUHA+q8Z2adO1F6ydMXA7ZtWDQ8pPNq1a508S6eGYWgYIkHPcUwEVC6/S+QAyqIVDt3B/ZJgSmxATlVgal1LxsOv+7R6+HSB+kyyUx9oBaX1gDsdciAndyjW+9TQ62RMXqFHl3s+HzB+3KhVN+JYK5wV6t4DR63sUG9bn7ce8eHoUQ1GPGEq+WTm4u4ZGR0O36hzvuzbb3rc9tFz6yvGpBMTcgvAkiubplbpwmqPAUCr9nplt2NJwFSgqWpVg1rRHlsl0jd1TmLCV8shH72M8NyKotYRiZuGZ/ReOHjQkFW1EusGo9WDgPXfO5wk4zbt2Z/2/fIVA7J3rB0R5c1OaxpZom0ZZ0KTaDVijS6oNC4uGiDKq3AzUQYg7peskgLNVLkiKTcslUT1TS38pCXZ2JwaP8weBCLduYk1/bSX3RpMWpdw8b0F29o0rF/7ht3lf9i9s+WE0aM3rn3VHT53mxu7Lvabu2LR7DE38lxfvXoltN+4rH0nhyQnu6J0UHl8AcCq3jG7SgZKlZHwsnjfX00vckNeSa0JtFJjVkUAZSyogP9yMeQrxQixepwNtJH7B7TrunjYwKGLW7ZqdVZSByOGgoD1PzYKiq3affsPtjy4Y2en7H07u9guHusQpc1PbFVXUjWIVCHRZEeciYxDy+VOAh1xHGQHdmJhZqcaOtkFF/tKVNwolpsuqKDjOujsR6HnBrLAWSfNWIvBn8/6es6EG318t46d8KnetWrSuXwPRt789z89cN89X93ofbjrnsnvfqnJecDVuT5ULrfwo1flCSpkqlLqcWR+oDms4oUn8PL6oCl3wVDshFxig6bQDkNBhS1RbT7dNDFlV9cW7Ta3SEs72KR12nGLxeILXtVBwPrDjDPnr0a+/sYrD29cu/6vdeMs8DnyYEI5aht9SAwlAItQo6HFjtomG4x6HdQGLwwqkoOSERrJLhJpJZmloRpat0r4vsYvMzsHPvJl/9FZgzfc6ONZuXpVl0mT79wYApVz4bcr01qmNT9zo/dhzerV7bLe++tmx+i2Bq3HK8BcsCdZFhJPyERiXpLTDX05SWyHG5oKN6RiO3TFDhjL3bAQiw3VGBETHoWrORcx9pYxE++cfNdX5shwT/CqvbEjGNbwOxrJibWKmzVqeLK4sBCDhwxGQVExSkvKUJiXi0P02sbcIjhtpdB4yqCTKhCicyOCWFSoXoMIHRmVzoswowMm2SVyCXMRhxyrJ691qyYH/hPHk9njpu31aiUegs8bVT+p3g0rk2J32HHk0JEGW7du6bxlx/ZM46liVdycY3D6vaI+mHBB+WRRM13t80Pnk6BTq6HX6uhGYIBJp0doSF1EN4hEbFQUQkPDYA4JQVR0FBYsWojYxDqXg2AVBKzgoOFyuXRmAxmMyQQdgU7tmBhIqQ2FQvF43fASS3C4/Si3OWC32+G02uCosOGiIxc2lxNWjxZ6Df2sbhu27dyJ5GZtaz3zzDNrIsLCNrZMS9vWrl27/U2bNj1vNBp/82MxGAz+2glxeaWlpY6QEIv7t/yuK1eumHbv3t1s27ZtPU+eOpVJL6U3Tk0N/9OtY+kil3Ds9CncMf42of88xKa4Wala4kkMtThfaq1WBAAz0IvZPk5WVpzxnNBMz7llu95gQEFBQa3glRoErOCgYbVaTdHR0TARYPHw+wPuX5bueq0RklGFUJUa8QkaqDSSmKySiGWZOQdETdKQZIu9vAQz3n4VY4eNxPMvvKjLKytrf/jo4fZ79+zF66+/XlJRUXGgQYMGP3Tu3HlL+/btD9SvX7/0tzqepKSkAyUlJaGS9Os6oRmsDx8+nEwAlb5///7eDocjPS4urmnbtm3Vt44biwbJyQgxmcW6Pbpl4J7Jd2P72h9w/333wUBgbbWVw8MhJcSwvMS8fKJNz49D4RmouJKqAmAM8hEREcjNzU0JXqlBH1Zw0Lj55pvnZ2ZmjmrWrBmzLSi/T/XfSRLlpyTRKIF7GuvZSRwSCrekwZ6tO/DN/DnoldkdU59+Ci6JG3yS7CHJyMZHho3s7Gxs3rwZO4mBETPJJiPc2qZNm00ZGRmbUlNTL0RFRf1qbIi+T0P7riIA/v/aJh//6dOno2mf2+3atavj2bNne2q12sbNmzePpv1G69atEUNslIfX5yM2yqlBgSRmvV4Pm82GKQ9PwYH9B3DLmDGg4xUnks8HZxnI1W4M1QFLVcm4+NwRY8SJEyewdu3axTRGBq/WIGD9ocfKlStbT58+fePTTz8d4iOjq86uAvWYfKI5AkcsqlRaaHUGAiIjSUIHdu7dSJ//Fhq1CXdOugN9Bw6Ew8dtsTzQef+R1ssGqGX5w5KHNkqAhQMHDmDHjh04cuRIGRnwWTL8nWlpaVsIDE4QE7tQu3btAjbWf6eO1i8dXq8XRUVF+gsXLtS9fPlyDIFrw5ycnBbE0hIJwDsR+6yTnp4OYoZISUmBIm09Hu7C7RPHpMz8iQcOUaDX1HqteGn2V7Mxc+ZM6EgGDqZz1K5NWxhEUT03XL6Aj0v4uUR/RulHgMWPfO6ef/75sokTJ/YfPnz49uBVGwSsP+QoLy/XZmVlLZk0adLAdu3aiTu/AlgaMi5xt5dUonsLM6xSazFOn83G9p0ENCeOIkYfgbG3jEbv/r2gM+lhd3mh8qqgkQMNDv7RHUJhaVLVtnnh4XQ6cenSJQFghw4dAgGFt7S0tIj24ywBVmloaGiexWK5QtLrTEhIiJPAozg8PLyEHgsI5IppHS+xGRctHgXcdDqd2HfettvtVtFx6UnO6QiQEvLz8+OLi4sj6djN9H8cLc3o+2oT+NQ2m811aNshiYmJaNq0KZo0aQICTtD3VoG4R3RgvgYDrQQspc8Ex1YxaLF/ykzgVFhchEWLFmHB/AXwEFC1apkGBsH6DZJ+tH1FkisApshCPj8fffTRxm+//bYvnRNX8OoNAtYfbkybNm0csYlZL774IioqKoTBsLHz48WLF5Gfl4fisjL6/xLOnTmLK5cuQk8yr316e/Tq1RNp7TqRZFHD7fAIf4xoRQ+u8OmrSu5VgIq3ySAi2Eglk1BeY6NUBWicMFSWUsRuUFhYKBYCGHY6i8cy2h+r1cpgayf2U0SfcxJoldNio896CaQkMvAK2qaP1gmn49HTZpk9WgjUosnYzQwQYWFhQs4lJCSIpVatWgI4WMrVZF+8T8p+15SMNYGrxgqBOFGuoa7VEDvVif3funUrVq9eLQCat5+UlAQGyXr16iEyMhKxsbGoU6dO1fczuBNo48knn5QbNmx429SpU78KXr1BwPpDDQIo9ejRozc89dRTXRXfFRsGMRy88cYbAhTYoPnuTkYumAYzAmYdbDwshYi9VBlrTWNmEGLwq2ngzFCqy5+fXByVryuS6F/4qhQWJfafH3lhI1fAl/edwYnY03W3x+srwFT9+qx5rSr7Xv195XnNda/1nI9LAUUG48OHD2PTpk0sScV+MzAT6xMA+uijjwoQ43PNEyLHjx8HSff133zzTSbL5eAIAtYfZhCDsjz44INHZ8+eXU+RZ2wwEyZMQNu2bTFx4kRh7Aro8G9WHaQUtnQtsOL3mEls2bJFACAbW/369dGoUSPBJNhole1UB65rGX7N92qC4r8z1qxZg/feew/vvvuuYDV8PNf6zn92ffK6yrmqOfh4FDl9PdCqCV7sn1LYJQ9mlyRR8dprr4EkLL744ouqGUP+fW677baCl19+uVlqamqwAsMNGsGwht/BkAOW5GeD4YXH5cuXWWrh/vvvF4bJBsKMqDoQ1ZRB0jX8VLweGxsDxIwZM8TrLHOYFZCh4b777sPQoUPFtq8HAjwUp/a1wEMBiJqgc63nzE7+8pe/CCbz1ltvCeCqLlF/DvgxKJ0+fRrnz58XQMzHyCyJP/vCCy8I5snn7Gec+6pjq3l8vC2WqI8//jiysrKQR7KcHf28j/z9vBv0f/COHwSsP9YgueckYzl99uzZ+gwiPJgJscGwP4v9OdeSNNeTVcp7bIQ8hf/RRx8JlsVAuHz5ciHLFi9ejEmTJmH//v3gyrPsl3ruuedw7NgxYezM6Bo0aCCkEBvq4MGDqwC1JhjVBJmaUq36699//z2Hb2DUqFF47LHHhI+ubt26Yl8ZODnGih/52JkdMhAxuDHbYemZlpaG9evX44MPPhD73LJlS3Tv3h3btm3DwYMHQfIa3bp1+wlgKb66f8W4qrNYXliSM6CynFWO69y5cyx9TxJLDZaNCQLWH2sYjUZf165dv/jss896v/rqq1UsiMFizpw5ILkojPeXDsVw2djY/8UGz2DEs2/sF3vkkUeEP2zEiBFo3ry5kGk8nn76acHEPv/8c8EuOH6Lg1rZiGvKQX6NJC2HZoh9zczMxMiRI7Fr1y7xqMjN3Nxc7N27V4AUx4Gxv4ud3nfccYfYztdff42pU6eKfWb/ErNM3h47vpk1HT16FLfccovwKTEAM3BNmzYNffv25fgobN++XaxD5/Of+rN+lq+kcn8ZoJmZMijyb6IMPift27efX3NiIDh+ezkSXH4HCzEJbf/+/Rd+8cUXsjKuXLkikyHK33zzjXhus9mqFjLinyzETKoWYiJVC8kXmbYvJycny8Q8xLYIKGSScfLJkydlAiU5PT29aj0yTLlx48ZV+0HsRr7pppvkM2fOiOcEJmIhkBLPr169Kvfr108mgJVJ6snPP/+8TMcinrdt21Z2Op1ivQ0bNshJSUniu95++2153rx58lNPPSUTw5THjRsn9onAUiYmIxNwyXv27JEJSEXdBGJP4v1Zs2bJBIBie9OnTxfvvfLKK+I5PxKDlAsKCsS6/L3VzwMv1c/Rtc5h9XPMg1icTOAnE9BWnY8lS5bIPXv2XJKfn28JXrs3dgmehN/RQjIjgqTNajZmZZDEESCzdetWARC/BLD4c8SOZJKWMklAsV02ZgYsNvC4uDgBWsR6hLFHRUXJxL7EemvWrBELsSKZDFR8RgEs/p+3T2xKJskkHzp0SK4+xowZI5PUE0DIoEbSUjxnAKw+GKQZeP72t7/JH374ofzSSy9VvdenTx/xHjE18ZyPjRiP+O5ly5aJ90jyCgDs1KlTFajy8f3/ABaPhQsXysRG5SNHjvxoXzt37rzn1KlTccFrNghYf/jl/PnzEcQg3r/rrrv8hYWFwkiYYTHDKS4uFkZ4LUOrCVjVQUthN2zc77zzTpVB8yD5JJPUEoDF4JWTkyOHhobKJBnlrKwsOSUlRb777rvFugwSHo9HLAq7Iskqtjt48OAqo1be420PHDhQ/E+yTaxHx/UjlsaDj4ukqkzyVP7uu+/EvinbGDt2rPjcihUrxHP+bn6fHxnMGYT5fWZzvI19+/ZV7YMCWDXPy7XASrkJ8CMDLAMfg/by5cvF9qxWqzxlyhR5wIABXxIrjQ5eq/+ZJVgW8Xc2iIWUzJ8///74+Pi7Ro0adYFkE4YMGYJWrVpx4rLw69SMT/o5Y/fu3VW+seqDZ9l4+p59WOyf4v85nor9Rexk5jgkDqn4Z7Nr7H/ioQRXKjNtPGvI4RPs1OfB/iYe7LyvOfPICcW8LjvUecaPj1GZdVT2l53rPPh1JSmZv5MnD9hhz7mR7ENj3xj7xXg71wpt+FfuESV/kKQqevXqBQJcEIhi2LBhnCA+hVjX7Y0aNQo62v9DIwhYv8cfhQzmueee+/SVV17pQeA18/bbb/f0798fxB7www8/CCP9udtRghpJPikzkuJRme1jQ+dx6623Cke8EvTJjvlPP/1UOPwJPIUxs/O75swkp/IoQFLT+NmhT5JO/F8ZBiBA8FqzdMr+KMCkvKeAJc8S1vwcb58BjWcReb9IElY55nm/+Tv/nfgwZZ+//PJLkWM5fvx4EVby5ptvLpo6dWqPN9544y163x+8QoOAFRzXGO3btz+3YMGCiXSn7/P++++vYh/Tk08+KSKwFdCqHt9UnXkxWDFbYobGsVYcwc2D5IwIG+C4peeffx4vv/yySCS+8847A9PGlXFYDCC8rSeeeAIPPfSQCIXgGTwlaVr5Ho5T4sFAV30SR9mnjz/+WDAnDg6tDmzVAY7X533ioYR1KNtQgIxBqSYzY3DhwFrePh8XAy7PTjKb49lCDkeoGV5xreh5hVkx2HGMGM/UVrKsPcTexi5ZsiSrb9++B4NXZBCwguNnsKRx48ZtILkzmIBjOMm1TRz5zmkkbLAcr1U9iLQmc+GIdpY106dPF6EAzNIefvhhAVBcteCee+4BgaJgPgwinFvHQzF23j6DG8dLKYGr1QNF+/XrJx737NkjgIMBT4nL4lIsnGTMLI/lFQ/O2au+DV7v1KlTghVx5D2zpOpgptQF45AK5XwoAMPfd+ZMoOoyA/nbb7+NsWPHirAI3i6HRNQE8p/4RGg7ynesW7cOd911F4dUHKf9eGTGjBk30XF/HUy9CYY1BJdfuJBkMpA0uZUAYDvP+LEzmgyzytHMTubqTnjFsa0MdkSzMz8vL0+EMFT/3MaNG3kGTDjc2ZlNwChPnjxZJkkoHNschqCERPDCjm/+Dg5p4Pdpv6q+h7fXu3fvqllCfs4OeN624shWQjWGDRsmPs8hC8o+8vZ5cJgEv8cOdQ5tYAe98v3ffvut2N8ePXrII0aMEOsSoxPn5NixY8JRrpyPmiEhyvb5HBBgs3O/dMKECR/QMd50/vz5mOC19vtcgrmE/6WDQEe/ePHiPmScYwlwBmdkZJjIcEUwKEsbxW+kJBErrEZxWFdnHsq6zEjY4c6PHGHODneWesy22LfEkekNGzasSmjmwTKMJerdd98NAhCRwsIOfK6vxd/BUfosC9mxzlUfpkyZgqVLl4pJhKioKMHCWO5xlQp20Cu+Lt6Pd955RzjSmS3xuhz0yj6lDh06CHbF+8jsh9lh9Qh8RTIqOZK8KGV0eFvMFJk1sj9w1apVhfT52cRiZ/Ts2fNY8Mr6fY8gYP2XDzZMMry0NWvW9CXj76XX69unpaWFsVEzeHGlAUWmMdDwosix6v4dJYdPKTFzraHkMyoJwsq1w7N6/B4D1pIlSxAeHi7SY7gSKKf58Cwer6PU9WJHP4MW70Pjxo0xYMAAsQ6DlLJNBs2rV6+KmUuWvtUTv5X9VIBXibyv7r9TwEl5n8GXcw95tpTkp4tA8iDJ5UXDhw9f0qVLl9PBKykIWMFxgwezoUOHDiWRUbamxwySfV2J4TQkUAjllBtmR5wXqDjs2ZAVtnQtAKt5bfyz3EWFwdRkOUqZnOqMjLdRM52l+n5UBx3ensIQqzvrq/ufFICtXuWCZzN59vLs2bPCiX748GEGqFza3kEC83Xdu3ff2KZNmyORkZHBGb8gYAXH72UQqzBkZ2fXJnnWiZhO29zc3I4EGKmJiYkRnBvHS3JyspBUCoNRKmwqoFBdUl4LuGrWoPpnhfV+cuHVcIYrz/8ZKCqMqnrJYgY6lpkMTuyU55lCTkomcMqh9S4Ru9xCIH2sRYsW++g4r9Bxl/yrul7BEQSs4PidDJJZKjLsOgcOHGhBS1sy7g7ESFqShItNSkrSMQPjmTr2FymBozyDxoyoep2o33rUnPFkpsYhGkr1U2ZOPLPIEo/A6RJJxv0kKY/UqVPnYO3atfOJPR0ksCr+ufFqwREErOD4LxjMns6cOROTk5NT68iRIy0IzFoUFRXFO53OZLouIuj9CGJeWoPBEEKgYGAQYxBQmlgofiJl+XeASGFVvA+Kb40XZk3sy2KneuXip+ecfFhOwFlI+3OSZO7lhISE840aNTpE7OlUSkpK4Y0E1OAIAlZw/I4GA4bVajUSozETu1GTtIyk59wsIoQeQ91ut5aARe3xeHSVjxp+/HeK2dF1J7QZAZ2fgM9LIOihxU3/+wggnQSMFbTYieFZ4+Pj84jtOUJDQ8vpMeh3CgJWcARHcATH73/8PwEGAH5YqtYnbLfpAAAAAElFTkSuQmCC"
\ No newline at end of file
@@ -28,7 +28,7 @@ if [ -z "$VIRTUAL_ENV" ]; then
 fi
 
 echo "🚀 Démarrage de Celery Worker..."
-celery -A ediligence worker --loglevel=info --detach --pidfile=/tmp/celery_worker.pid --logfile=/tmp/celery_worker.log
+celery -A ediligence worker -Q celery,push --loglevel=info --detach --pidfile=/tmp/celery_worker.pid --logfile=/tmp/celery_worker.log
 
 echo "🚀 Démarrage de Celery Beat..."
 celery -A ediligence beat --loglevel=info --detach --pidfile=/tmp/celery_beat.pid --logfile=/tmp/celery_beat.log
@@ -25,7 +25,7 @@ pkill -f "celery.*worker" 2>/dev/null || echo "Aucun processus worker à arrête
 sleep 2
 
 echo "🚀 Démarrage de Celery Worker..."
-nohup celery -A ediligence worker --loglevel=info > logs/celery_worker.log 2>&1 &
+nohup celery -A ediligence worker -Q celery,push --loglevel=info > logs/celery_worker.log 2>&1 &
 WORKER_PID=$!
 echo "Worker PID: $WORKER_PID"
 